@@ -0,0 +1,99 @@
+#  Copyright (c) 2025 by ESA DTE-S2GOS team and contributors
+#  Permissions are hereby granted under the terms of the Apache 2.0 License:
+#  https://opensource.org/license/apache-2-0.
+
+"""Measures the cost of `get_job_context()` followed by
+`report_progress()` in user functions at different stack depths,
+and compares it with the former lookup that walked the stack.
+Also measures `report_progress()` with and without the progress
+updates being throttled as by the local service.
+
+Usage:
+
+    python -m benchmarks.bench_job_context [--calls N]
+"""
+
+import argparse
+import inspect
+import time
+from typing import Callable
+
+from s2gos.server.defaults import DEFAULT_PROGRESS_DELTA, DEFAULT_PROGRESS_INTERVAL
+from s2gos.server.services.local import Job, JobContext, get_job_context
+
+
+def get_job_context_by_frames() -> JobContext:
+    """The former lookup of the job context."""
+    frame = inspect.currentframe()
+    try:
+        while frame:
+            job_context = frame.f_locals.get("__job_context__")
+            if isinstance(job_context, JobContext):
+                return job_context
+            frame = frame.f_back
+    finally:
+        del frame
+    raise RuntimeError("no job context")
+
+
+def call_at_depth(depth: int, function: Callable[[], None]):
+    if depth <= 0:
+        function()
+    else:
+        call_at_depth(depth - 1, function)
+
+
+def measure(
+    get_context: Callable[[], JobContext], calls: int, depth: int, **job_kwargs
+) -> float:
+    def loop():
+        t0 = time.perf_counter()
+        for i in range(calls):
+            get_context().report_progress(progress=i % 100)
+        durations.append(time.perf_counter() - t0)
+
+    def run():
+        # Provides the job context to the former lookup
+        __job_context__ = job  # noqa: F841
+        call_at_depth(depth, loop)
+
+    durations: list[float] = []
+    job = Job(
+        process_id="bench",
+        job_id="job_1",
+        function=run,
+        function_kwargs={},
+        **job_kwargs,
+    )
+    job.run()
+    return 1e6 * durations[0] / calls
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--calls", type=int, default=100_000)
+    args = parser.parse_args()
+
+    print("Microseconds per get_job_context() + report_progress()")
+    print(f"{'depth':>6} {'frames':>10} {'contextvar':>10}")
+    for depth in (0, 10, 50, 200):
+        by_frames = measure(get_job_context_by_frames, args.calls, depth)
+        by_contextvar = measure(get_job_context, args.calls, depth)
+        print(f"{depth:>6} {by_frames:10.3f} {by_contextvar:10.3f}")
+
+    print()
+    print("Microseconds per get_job_context() + report_progress()")
+    print(f"{'unthrottled':>12} {'throttled':>10}")
+    unthrottled = measure(get_job_context, args.calls, 0)
+    throttled = measure(
+        get_job_context,
+        args.calls,
+        0,
+        progress_interval=DEFAULT_PROGRESS_INTERVAL,
+        progress_delta=DEFAULT_PROGRESS_DELTA,
+    )
+    print(f"{unthrottled:12.3f} {throttled:10.3f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,124 @@
+#  Copyright (c) 2025 by ESA DTE-S2GOS team and contributors
+#  Permissions are hereby granted under the terms of the Apache 2.0 License:
+#  https://opensource.org/license/apache-2-0.
+
+"""Simulates a mixed load of several tenants and compares the queue
+latencies of the `JobScheduler` with the former FIFO execution.
+
+The simulation runs the actual scheduler on a virtual clock, so it
+finishes instantly. Tenant "bulk" submits many long jobs at once,
+the "interactive" tenants submit short jobs at a steady rate, and
+tenant "urgent" submits a few jobs of high priority.
+
+Usage:
+
+    python -m benchmarks.bench_scheduler [--workers N] [--bulk-jobs N]
+"""
+
+import argparse
+import heapq
+import itertools
+import statistics
+from concurrent.futures import Executor, Future
+from typing import Callable
+
+from s2gos.server.services.local.job_scheduler import JobScheduler
+
+
+class SimulatedExecutor(Executor):
+    """An executor whose submitted functions return the duration of
+    the job they represent in virtual seconds.
+    """
+
+    def __init__(self, simulation: "Simulation", max_workers: int):
+        self._simulation = simulation
+        self._max_workers = max_workers
+
+    def submit(self, fn, /, *args, **kwargs) -> Future:
+        future: Future = Future()
+        future.set_running_or_notify_cancel()
+        duration = fn(*args, **kwargs)
+        self._simulation.schedule(duration, lambda: future.set_result(None))
+        return future
+
+
+class Simulation:
+    def __init__(self):
+        self.now = 0.0
+        self._events: list[tuple[float, int, Callable[[], None]]] = []
+        self._counter = itertools.count()
+
+    def schedule(self, delay: float, action: Callable[[], None]):
+        heapq.heappush(self._events, (self.now + delay, next(self._counter), action))
+
+    def run(self):
+        while self._events:
+            self.now, _, action = heapq.heappop(self._events)
+            action()
+
+
+def simulate(workers: int, bulk_jobs: int, fair: bool) -> dict[str, list[float]]:
+    simulation = Simulation()
+    scheduler = JobScheduler(SimulatedExecutor(simulation, workers))
+    latencies: dict[str, list[float]] = {}
+
+    def submit(tenant: str, duration: float, priority: int = 0):
+        submit_time = simulation.now
+
+        def run() -> float:
+            latencies.setdefault(tenant, []).append(simulation.now - submit_time)
+            return duration
+
+        scheduler.submit(
+            run,
+            priority=priority if fair else 0,
+            user=tenant if fair else None,
+        )
+
+    # A bulk submission of long jobs
+    simulation.schedule(0.0, lambda: [submit("bulk", 10.0) for _ in range(bulk_jobs)])
+    # Steady streams of short jobs
+    for i in range(3):
+        for k in range(50):
+            simulation.schedule(
+                1.0 + i + 20.0 * k, lambda t=f"interactive-{i}": submit(t, 2.0)
+            )
+    # Few urgent jobs
+    for k in range(10):
+        simulation.schedule(5.0 + 100.0 * k, lambda: submit("urgent", 1.0, priority=10))
+    simulation.run()
+    return latencies
+
+
+def percentile(values: list[float], p: float) -> float:
+    if len(values) == 1:
+        return values[0]
+    return statistics.quantiles(values, n=100, method="inclusive")[int(p) - 1]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--workers", type=int, default=3)
+    parser.add_argument("--bulk-jobs", type=int, default=500)
+    args = parser.parse_args()
+
+    print(
+        f"Queue latency in seconds, {args.workers} worker(s),"
+        f" {args.bulk_jobs} bulk jobs"
+    )
+    print(
+        f"{'scheduler':<10} {'tenant':<14} {'jobs':>5} {'p50':>8} {'p90':>8} {'p99':>8}"
+    )
+    for name, fair in (("fifo", False), ("fair", True)):
+        latencies = simulate(args.workers, args.bulk_jobs, fair)
+        for tenant, values in sorted(latencies.items()):
+            print(
+                f"{name:<10} {tenant:<14} {len(values):>5}"
+                f" {percentile(values, 50):8.1f}"
+                f" {percentile(values, 90):8.1f}"
+                f" {percentile(values, 99):8.1f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
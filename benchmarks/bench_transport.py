@@ -0,0 +1,57 @@
+#  Copyright (c) 2025 by ESA DTE-S2GOS team and contributors
+#  Permissions are hereby granted under the terms of the Apache 2.0 License:
+#  https://opensource.org/license/apache-2-0.
+
+"""Compares the request throughput of the pooled `DefaultTransport`
+with the former behaviour of opening a new connection per call.
+
+Usage:
+
+    python -m benchmarks.bench_transport [--calls N] [--threads N]
+"""
+
+import argparse
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable
+
+import requests
+
+from benchmarks.common import run_test_server
+from s2gos.client import Client
+
+
+def measure(name: str, call: Callable[[], None], calls: int, threads: int):
+    t0 = time.perf_counter()
+    if threads <= 1:
+        for _ in range(calls):
+            call()
+    else:
+        with ThreadPoolExecutor(max_workers=threads) as executor:
+            for future in [executor.submit(call) for _ in range(calls)]:
+                future.result()
+    duration = time.perf_counter() - t0
+    print(f"{name:<10} {calls / duration:10.1f} requests/s")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--calls", type=int, default=2000)
+    parser.add_argument("--threads", type=int, default=1)
+    args = parser.parse_args()
+
+    with run_test_server() as server_url:
+        url = f"{server_url}/conformance"
+
+        def per_call():
+            # A new connection for each call
+            requests.request("GET", url).json()
+
+        with Client(server_url=server_url, pool_maxsize=args.threads) as client:
+            print(f"{args.calls} calls of GET /conformance, {args.threads} thread(s)")
+            measure("per-call", per_call, args.calls, args.threads)
+            measure("pooled", client.get_conformance, args.calls, args.threads)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,42 @@
+#  Copyright (c) 2025 by ESA DTE-S2GOS team and contributors
+#  Permissions are hereby granted under the terms of the Apache 2.0 License:
+#  https://opensource.org/license/apache-2-0.
+
+import contextlib
+import os
+import socket
+import threading
+import time
+from typing import Iterator
+
+from s2gos.server.constants import S2GOS_SERVICE_ENV_VAR
+
+TEST_SERVICE = "s2gos.server.services.local.testing:service"
+
+
+@contextlib.contextmanager
+def run_test_server(service: str = TEST_SERVICE) -> Iterator[str]:
+    """Run the local test server in a background thread
+    and yield its base URL.
+    """
+    import uvicorn
+
+    os.environ[S2GOS_SERVICE_ENV_VAR] = service
+
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        port = s.getsockname()[1]
+
+    config = uvicorn.Config(
+        "s2gos.server.main:app", host="127.0.0.1", port=port, log_level="warning"
+    )
+    server = uvicorn.Server(config)
+    thread = threading.Thread(target=server.run, daemon=True)
+    thread.start()
+    while not server.started:
+        time.sleep(0.01)
+    try:
+        yield f"http://127.0.0.1:{port}"
+    finally:
+        server.should_exit = True
+        thread.join()
@@ -13,6 +13,8 @@ from .openapi import OAMethod
 S2GOS_PATH: Final = (Path(__file__).parent / ".." / "s2gos").resolve()
 OPEN_API_PATH: Final = S2GOS_PATH / "common" / "openapi.yaml"
 
+EVENT_STREAM_MEDIA_TYPE: Final = "text/event-stream"
+
 C_TAB: Final = "    "
 D_TAB: Final = "  "
 
@@ -69,6 +71,18 @@ def parse_responses(
     return return_types, error_types
 
 
+def parse_stream_response(method: OAMethod, models: set[str]) -> str | None:
+    """Get the type of the items of a successful response
+    that is a stream of server-sent events, if any.
+    """
+    for key, response in (method.responses or {}).items():
+        if 200 <= int(key) < 300 and response.content:
+            stream_content = response.content.get(EVENT_STREAM_MEDIA_TYPE)
+            if stream_content and stream_content.schema_:
+                return to_py_type(stream_content.schema_, "responses", models)
+    return None
+
+
 def to_py_type(
     schema: dict[str, Any],
     path: str,
@@ -144,8 +158,8 @@ def camel_to_snake(name: str) -> str:
     name = re.sub(r"(?<=[a-z0-9])([A-Z])", r"_\1", name)
     # Add underscore between adjacent capitals and followed by lowercase (e.g., "HTTPServer" -> "http_server")
     name = re.sub(r"([A-Z]+)([A-Z][a-z])", r"\1_\2", name)
-    # Convert to lowercase
-    snake = name.lower()
+    # Convert to lowercase, dashes, e.g., of header names, to underscores
+    snake = name.lower().replace("-", "_")
     # If it starts with a digit, prepend an underscore to make it a valid identifier
     if snake and snake[0].isdigit():
         snake = "_" + snake
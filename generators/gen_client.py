@@ -12,6 +12,7 @@ from generators.common import (
     S2GOS_PATH,
     camel_to_snake,
     parse_responses,
+    parse_stream_response,
     to_py_type,
     write_file,
 )
@@ -20,28 +21,45 @@ from generators.openapi import OAMethod, OASchema, load_openapi_schema
 GENERATOR_NAME = str(Path(__file__).name)
 
 CLIENT_PATH = S2GOS_PATH / "client" / "client.py"
+ASYNC_CLIENT_PATH = S2GOS_PATH / "client" / "async_client.py"
 
 
 code_header = """
 
-from typing import Optional
+from typing import AsyncIterator, Iterable, Iterator, Optional
 
 from s2gos.common.models import {{ model_imports }}
 
+from .bulk import ExecutionItem, ExecutionResult, {{ execute_many_function }}
 from .config import ClientConfig
-from .defaults import DEFAULT_SERVER_URL
-from .transport import DefaultTransport, Transport
+from .defaults import (
+    DEFAULT_BULK_MAX_CONCURRENCY,
+    DEFAULT_BULK_MAX_RETRIES,
+    DEFAULT_BULK_RETRY_DELAY,
+){{ extra_imports }}
+from .pagination import get_next_page_kwargs
+from .transport import {{ transport_imports }}
 
 
-class Client:
+class {{ class_name }}:
     \"\"\"    
-    The S2GOS Client API.
+    {{ client_title }}
+
+    The client reuses its HTTP connections across calls, hence
+    it should be closed if no longer needed, either explicitly
+    using `close()` or by using it as {{ context_manager }}.
 
     Args:
       config_path: Optional path of the configuration file to be loaded
       server_url: Optional server URL
       user_name: Optional username
       user_name: Optional user access token
+      pool_connections: Optional number of per-host connection pools to cache
+      pool_maxsize: Optional maximum number of connections kept per host
+      connect_timeout: Optional timeout in seconds for establishing a connection
+      read_timeout: Optional timeout in seconds for reading a response
+      keep_alive: Optional flag whether to keep connections open between calls
+      http2: Optional flag whether to use HTTP/2 (asynchronous client only)
       debug: Whether to output debug logs
       _transport: Optional web API transport (for testing only).
     \"\"\"
@@ -53,26 +71,48 @@ class Client:
         server_url: Optional[str] = None,
         user_name: Optional[str] = None,
         access_token: Optional[str] = None,
+        pool_connections: Optional[int] = None,
+        pool_maxsize: Optional[int] = None,
+        connect_timeout: Optional[float] = None,
+        read_timeout: Optional[float] = None,
+        keep_alive: Optional[bool] = None,
+        http2: Optional[bool] = None,
         debug: bool = False,
-        _transport: Optional[Transport] = None,
+        _transport: Optional[{{ transport_class }}] = None,
     ):
-        default_config = ClientConfig.read(config_path=config_path)
-        config = ClientConfig(
-            user_name=user_name or default_config.user_name,
-            access_token=access_token or default_config.access_token,
-            server_url=server_url or default_config.server_url or DEFAULT_SERVER_URL,
+        config = ClientConfig.create(
+            config_path=config_path,
+            user_name=user_name,
+            access_token=access_token,
+            server_url=server_url,
+            pool_connections=pool_connections,
+            pool_maxsize=pool_maxsize,
+            connect_timeout=connect_timeout,
+            read_timeout=read_timeout,
+            keep_alive=keep_alive,
+            http2=http2,
         )
         self._config = config
         self._transport = (
-            DefaultTransport(server_url=config.server_url, debug=debug)
+            {{ default_transport_class }}(
+                server_url=config.server_url,
+                debug=debug,
+                pool_connections=config.pool_connections,
+                pool_maxsize=config.pool_maxsize,
+                connect_timeout=config.connect_timeout,
+                read_timeout=config.read_timeout,
+                keep_alive=config.keep_alive,{{ extra_transport_args }}
+            )
             if _transport is None
             else _transport
-        )
+        ){{ extra_init }}
 
     @property
     def config(self) -> ClientConfig:
         return self._config
 
+{{ helper_methods }}
+
     def _repr_json_(self):
         # noinspection PyProtectedMember
         return self._config._repr_json_()
@@ -80,30 +120,296 @@ class Client:
 {{ client_methods }}        
 """
 
+sync_helper_methods = """
+    def close(self):
+        \"\"\"Close this client and release its pooled connections.\"\"\"
+        if self._job_poller is not None:
+            self._job_poller.close()
+            self._job_poller = None
+        self._transport.close()
+
+    def __enter__(self) -> "Client":
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def execute_many(
+        self,
+        items: Iterable[ExecutionItem],
+        *,
+        max_concurrency: int = DEFAULT_BULK_MAX_CONCURRENCY,
+        max_retries: int = DEFAULT_BULK_MAX_RETRIES,
+        retry_delay: float = DEFAULT_BULK_RETRY_DELAY,
+    ) -> list[ExecutionResult]:
+        \"\"\"
+        Submit many process requests at once.
+
+        The requests are submitted using at most `max_concurrency`
+        concurrent calls. If the server signals that it is overloaded
+        (status 429 or 503), all submissions pause for the time given
+        by the server's "Retry-After" header, or using an exponential
+        backoff, and the affected request is retried up to `max_retries`
+        times. Each request is sent with its own idempotency key, which
+        is kept for its retries, so that the server creates one job per
+        request only. If the server is still processing a previous attempt
+        of a request (status 409 with a "Retry-After" header), the request
+        is retried after the given time, too. Errors are captured per
+        request rather than raised.
+
+        Params:
+          items: Iterable of pairs comprising a process identifier
+            and a process request.
+          max_concurrency: Maximum number of concurrent calls.
+          max_retries: Maximum number of retries per request after
+            the server signalled back-pressure.
+          retry_delay: Initial retry delay in seconds used if the server
+            did not provide a "Retry-After" header.
+
+        Returns:
+          list[JobInfo | Exception]: The created jobs or the errors that
+            occurred, in the order of the given items.
+        \"\"\"
+        return execute_many(
+            self,
+            items,
+            max_concurrency=max_concurrency,
+            max_retries=max_retries,
+            retry_delay=retry_delay,
+        )
+
+    def submit(self, process_id: str, request: ProcessRequest) -> JobFuture:
+        \"\"\"
+        Create a new job and return a future that represents its outcome.
+
+        The future is compatible with the `concurrent.futures` API,
+        so it can be used with `s2gos.client.futures.wait()` and
+        `s2gos.client.futures.as_completed()`. All futures of this
+        client are observed by a single background poller.
+
+        Params:
+          process_id: The process identifier.
+          request: The process request.
+
+        Returns:
+          JobFuture: A future whose result is the job's `JobResults`.
+        \"\"\"
+        # The poller needs a job, even if the process prefers to run synchronously
+        job_info = self.execute_process(process_id, request, prefer="respond-async")
+        return self._get_job_poller().add(job_info)
+
+    def get_job_future(self, job_id: str) -> JobFuture:
+        \"\"\"
+        Get a future that represents the outcome of an existing job.
+
+        Params:
+          job_id: The job identifier.
+
+        Returns:
+          JobFuture: A future whose result is the job's `JobResults`.
+        \"\"\"
+        return self._get_job_poller().add(self.get_job(job_id))
+
+    def iter_jobs(
+        self,
+        *,
+        page_size: Optional[int] = None,
+        status: Optional[str] = None,
+        process_id: Optional[str] = None,
+        created: Optional[str] = None,
+        updated: Optional[str] = None,
+    ) -> Iterator[JobInfo]:
+        \"\"\"
+        Iterate over all jobs that match the given filters.
+
+        Pages of the job list are fetched lazily by following
+        the list's "next" links.
+
+        Params:
+          page_size: Optional maximum number of jobs per page
+          status: Optional comma-separated list of status codes
+          process_id: Optional comma-separated list of process identifiers
+          created: Optional creation time interval `start/end`, `..` denotes an open end
+          updated: Optional update time interval `start/end`, `..` denotes an open end
+
+        Returns:
+          Iterator[JobInfo]: An iterator over the jobs' status information.
+        \"\"\"
+        kwargs = dict(
+            status=status, process_id=process_id, created=created, updated=updated
+        )
+        if page_size is not None:
+            kwargs.update(limit=page_size)
+        while kwargs is not None:
+            job_list = self.get_jobs(**kwargs)
+            yield from job_list.jobs
+            kwargs = get_next_page_kwargs(job_list)
+
+    def _get_job_poller(self) -> JobPoller:
+        if self._job_poller is None:
+            self._job_poller = JobPoller(self)
+        return self._job_poller
+"""
+
+async_helper_methods = """
+    async def close(self):
+        \"\"\"Close this client and release its pooled connections.\"\"\"
+        await self._transport.close()
+
+    async def __aenter__(self) -> "AsyncClient":
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.close()
+
+    async def execute_many(
+        self,
+        items: Iterable[ExecutionItem],
+        *,
+        max_concurrency: int = DEFAULT_BULK_MAX_CONCURRENCY,
+        max_retries: int = DEFAULT_BULK_MAX_RETRIES,
+        retry_delay: float = DEFAULT_BULK_RETRY_DELAY,
+    ) -> list[ExecutionResult]:
+        \"\"\"
+        Submit many process requests at once.
+
+        The requests are submitted using at most `max_concurrency`
+        concurrent calls. If the server signals that it is overloaded
+        (status 429 or 503), all submissions pause for the time given
+        by the server's "Retry-After" header, or using an exponential
+        backoff, and the affected request is retried up to `max_retries`
+        times. Each request is sent with its own idempotency key, which
+        is kept for its retries, so that the server creates one job per
+        request only. If the server is still processing a previous attempt
+        of a request (status 409 with a "Retry-After" header), the request
+        is retried after the given time, too. Errors are captured per
+        request rather than raised.
+
+        Params:
+          items: Iterable of pairs comprising a process identifier
+            and a process request.
+          max_concurrency: Maximum number of concurrent calls.
+          max_retries: Maximum number of retries per request after
+            the server signalled back-pressure.
+          retry_delay: Initial retry delay in seconds used if the server
+            did not provide a "Retry-After" header.
+
+        Returns:
+          list[JobInfo | Exception]: The created jobs or the errors that
+            occurred, in the order of the given items.
+        \"\"\"
+        return await async_execute_many(
+            self,
+            items,
+            max_concurrency=max_concurrency,
+            max_retries=max_retries,
+            retry_delay=retry_delay,
+        )
+
+    async def iter_jobs(
+        self,
+        *,
+        page_size: Optional[int] = None,
+        status: Optional[str] = None,
+        process_id: Optional[str] = None,
+        created: Optional[str] = None,
+        updated: Optional[str] = None,
+    ) -> AsyncIterator[JobInfo]:
+        \"\"\"
+        Iterate over all jobs that match the given filters.
+
+        Pages of the job list are fetched lazily by following
+        the list's "next" links.
+
+        Params:
+          page_size: Optional maximum number of jobs per page
+          status: Optional comma-separated list of status codes
+          process_id: Optional comma-separated list of process identifiers
+          created: Optional creation time interval `start/end`, `..` denotes an open end
+          updated: Optional update time interval `start/end`, `..` denotes an open end
+
+        Returns:
+          AsyncIterator[JobInfo]: An iterator over the jobs' status information.
+        \"\"\"
+        kwargs = dict(
+            status=status, process_id=process_id, created=created, updated=updated
+        )
+        if page_size is not None:
+            kwargs.update(limit=page_size)
+        while kwargs is not None:
+            job_list = await self.get_jobs(**kwargs)
+            for job_info in job_list.jobs:
+                yield job_info
+            kwargs = get_next_page_kwargs(job_list)
+"""
+
 
 def main():
     schema = load_openapi_schema(OPEN_API_PATH)
+    generate_client(schema, CLIENT_PATH, is_async=False)
+    generate_client(schema, ASYNC_CLIENT_PATH, is_async=True)
+
+
+def generate_client(schema: OASchema, client_path: Path, is_async: bool):
     models: set[str] = set()
-    client_methods = generate_api_code(schema, models)
+    client_methods = generate_api_code(schema, models, is_async)
     model_list = ", ".join(sorted(models))
 
+    placeholders = {
+        "model_imports": model_list,
+        "client_methods": client_methods,
+        "class_name": "AsyncClient" if is_async else "Client",
+        "client_title": (
+            "The asynchronous S2GOS Client API."
+            if is_async
+            else "The S2GOS Client API."
+        ),
+        "context_manager": (
+            "an asynchronous context manager" if is_async else "a context manager"
+        ),
+        "transport_class": "AsyncTransport" if is_async else "Transport",
+        "default_transport_class": (
+            "DefaultAsyncTransport" if is_async else "DefaultTransport"
+        ),
+        "transport_imports": (
+            "AsyncTransport, DefaultAsyncTransport"
+            if is_async
+            else "DefaultTransport, Transport"
+        ),
+        "extra_transport_args": (
+            f"\n{4 * C_TAB}http2=config.http2," if is_async else ""
+        ),
+        "execute_many_function": ("async_execute_many" if is_async else "execute_many"),
+        "helper_methods": async_helper_methods if is_async else sync_helper_methods,
+        "extra_imports": (
+            "" if is_async else "\nfrom .futures import JobFuture, JobPoller"
+        ),
+        "extra_init": (
+            ""
+            if is_async
+            else f"\n{2 * C_TAB}self._job_poller: Optional[JobPoller] = None"
+        ),
+    }
+
     code = code_header
-    code = code.replace("{{ model_imports }}", model_list)
-    code = code.replace("{{ client_methods }}", client_methods)
+    for name, value in placeholders.items():
+        code = code.replace("{{ " + name + " }}", value)
 
     write_file(
         GENERATOR_NAME,
-        CLIENT_PATH,
+        client_path,
         [code],
     )
 
 
-def generate_api_code(schema: OASchema, models: set[str]) -> str:
+def generate_api_code(schema: OASchema, models: set[str], is_async: bool) -> str:
     functions: list[str] = []
     for path, endpoint in schema.paths.items():
         for method_name, method in endpoint.items():
             # noinspection PyTypeChecker
-            function_code = generate_function_code(path, method_name, method, models)
+            function_code = generate_function_code(
+                path, method_name, method, models, is_async
+            )
             functions.append(function_code)
     return "\n\n".join(functions)
 
@@ -113,11 +419,13 @@ def generate_function_code(
     method_name: Literal["get", "post", "put", "delete"],
     method: OAMethod,
     models: set[str],
+    is_async: bool = False,
 ) -> str:
     param_args: list[str] = ["self"]
     param_kwargs: list[str] = []
     path_param_mappings: list[str] = []
     query_param_mappings: list[str] = []
+    header_param_mappings: list[str] = []
     for parameter in method.parameters:
         param_name = camel_to_snake(parameter.name)
         param_type = "Any"
@@ -131,14 +439,18 @@ def generate_function_code(
             default_value = parameter.schema_.get("default", ...)
             if default_value is not ...:
                 param_default = repr(default_value)
-        if param_default is None:
-            param_args.append(f"{param_name}: {param_type}")
-        else:
+        if param_default is not None:
             param_kwargs.append(f"{param_name}: {param_type} = {param_default}")
+        elif not parameter.required:
+            param_kwargs.append(f"{param_name}: Optional[{param_type}] = None")
+        else:
+            param_args.append(f"{param_name}: {param_type}")
         if parameter.in_ == "path":
             path_param_mappings.append(f"{parameter.name!r}: {param_name}")
         elif parameter.in_ == "query":
             query_param_mappings.append(f"{parameter.name!r}: {param_name}")
+        elif parameter.in_ == "header":
+            header_param_mappings.append(f"{parameter.name!r}: {param_name}")
         else:
             print(
                 f"⚠️ Error: parameter {parameter.name!r}"
@@ -161,29 +473,48 @@ def generate_function_code(
     param_list = ", ".join([*param_args, *param_kwargs])
     path_param_dict = "{" + ", ".join(path_param_mappings) + "}"
     query_param_dict = "{" + ", ".join(query_param_mappings) + "}"
+    # Only passed if given, so that transports need not support them
+    header_param_arg = (
+        "header_params={" + ", ".join(header_param_mappings) + "}, "
+        if header_param_mappings
+        else ""
+    )
 
     return_types, error_types = parse_responses(method, models)
+    stream_type = parse_stream_response(method, models)
 
-    if not return_types:
-        return_types = {"200": "None"}
+    if stream_type:
+        return_types = {"200": (stream_type, [])}
+    elif not return_types:
+        return_types = {"200": ("None", [])}
 
     function_doc = generate_function_doc(method)
-    return_type_union = " | ".join(set(v[0] for v in return_types.values()))
+    return_type_union = " | ".join(dict.fromkeys(v[0] for v in return_types.values()))
     return_type_dict = (
         "{" + ", ".join([f"{k!r}: {v[0]}" for k, v in return_types.items()]) + "}"
     )
     error_type_dict = (
         "{" + ", ".join([f"{k!r}: {v[0]}" for k, v in error_types.items()]) + "}"
     )
+    if stream_type:
+        # Streams are iterated, hence never awaited
+        iterator_type = "AsyncIterator" if is_async else "Iterator"
+        def_kw, await_kw = "def", ""
+        return_type_union = f"{iterator_type}[{stream_type}]"
+        transport_function = "stream"
+    else:
+        def_kw, await_kw = ("async def", "await ") if is_async else ("def", "")
+        transport_function = "call"
     return (
-        f"{C_TAB}def {camel_to_snake(method.operationId)}({param_list})"
+        f"{C_TAB}{def_kw} {camel_to_snake(method.operationId)}({param_list})"
         f" -> {return_type_union}:\n"
         f"{function_doc}"
-        f"{C_TAB}{C_TAB}return self._transport.call("
+        f"{C_TAB}{C_TAB}return {await_kw}self._transport.{transport_function}("
         f"path={path!r}, "
         f"method={method_name!r}, "
         f"path_params={path_param_dict}, "
         f"query_params={query_param_dict}, "
+        f"{header_param_arg}"
         f"request={'request' if request_type else 'None'}, "
         f"return_types={return_type_dict}, "
         f"error_types={error_type_dict}"
@@ -214,6 +545,10 @@ def generate_function_doc(method: OAMethod) -> str:
     if method.requestBody:
         json_content = method.requestBody.content.get("application/json")
         if json_content:
+            if not method.parameters:
+                if doc_lines and doc_lines[-1] != "":
+                    doc_lines.append("")
+                doc_lines.append("Params:")
             if method.requestBody.description:
                 param_desc_lines = method.requestBody.description.split("\n")
                 doc_lines.append(f"{D_TAB}request: {param_desc_lines[0]}")
@@ -224,6 +559,15 @@ def generate_function_doc(method: OAMethod) -> str:
                 doc_lines.append("  request:")
 
     return_types, error_types = parse_responses(method, set())
+    stream_type = parse_stream_response(method, set())
+    if stream_type:
+        description = method.responses["200"].description
+        return_types = {
+            "200": (
+                f"Iterator[{stream_type}]",
+                description.split("\n") if description else [],
+            )
+        }
 
     def append_responses(
         resp_title: str, resp_types: dict[str, tuple[str, list[str]]], lines: list[str]
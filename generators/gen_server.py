@@ -12,6 +12,7 @@ from generators.common import (
     S2GOS_PATH,
     camel_to_snake,
     parse_responses,
+    parse_stream_response,
     to_py_type,
     write_file,
 )
@@ -28,14 +29,21 @@ def main():
     models: set[str] = set()
     routes_code, service_code = generate_code_for_paths(schema, models)
     model_list = ", ".join(sorted(models))
+    has_headers = "Header(" in routes_code
 
     write_file(
         GENERATOR_NAME,
         ROUTES_PATH,
         [
+            "from typing import Annotated, Optional\n"
+            if has_headers
+            else "from typing import Optional\n",
+            "\n",
+            "from fastapi import Header\n" if has_headers else "",
             "from fastapi.responses import JSONResponse\n",
             "\n",
             f"from s2gos.common.models import {model_list}\n",
+            "\n",
             "from .app import app\n",
             "from .provider import ServiceProvider\n",
             "\n",
@@ -48,8 +56,9 @@ def main():
         SERVICE_PATH,
         [
             "from abc import ABC, abstractmethod\n",
+            "from typing import Optional\n",
             "\n",
-            "from fastapi.responses import JSONResponse\n",
+            "from fastapi.responses import JSONResponse, StreamingResponse\n",
             "\n",
             f"from s2gos.common.models import {model_list}\n",
             "\n",
@@ -98,14 +107,26 @@ def generate_method_code(
             default_value = parameter.schema_.get("default", ...)
             if default_value is not ...:
                 param_default = repr(default_value)
-        if param_default is None:
-            pos_params.append(f"{parameter.name}: {param_type}")
-            pos_service_params.append(f"{param_name}: {param_type}")
-            service_args.append(f"{param_name}={parameter.name}")
-        else:
+        if parameter.in_ == "header":
+            # Header names are no identifiers, e.g., "Idempotency-Key"
+            kw_params.append(
+                f"{param_name}: Annotated[Optional[{param_type}],"
+                f" Header(alias={parameter.name!r})] = None"
+            )
+            kw_service_params.append(f"{param_name}: Optional[{param_type}]")
+            service_kwargs.append(f"{param_name}={param_name}")
+        elif param_default is not None:
             kw_params.append(f"{parameter.name}: {param_type} = {param_default}")
             kw_service_params.append(f"{param_name}: {param_type}")
             service_kwargs.append(f"{param_name}={parameter.name}")
+        elif not parameter.required:
+            kw_params.append(f"{parameter.name}: Optional[{param_type}] = None")
+            kw_service_params.append(f"{param_name}: Optional[{param_type}]")
+            service_kwargs.append(f"{param_name}={parameter.name}")
+        else:
+            pos_params.append(f"{parameter.name}: {param_type}")
+            pos_service_params.append(f"{param_name}: {param_type}")
+            service_args.append(f"{param_name}={parameter.name}")
 
     if method.requestBody:
         request_type = "Any"
@@ -131,12 +152,13 @@ def generate_method_code(
     return_types_, error_types = parse_responses(method, models, skip_errors=True)
 
     return_types = list(v[0] for v in return_types_.values())
-    if not return_types:
+    if parse_stream_response(method, models):
+        return_types = ["StreamingResponse"]
+    elif not return_types:
         return_types = ["None"]
     return_types.append("JSONResponse")
-    return_types = sorted(return_types)
 
-    return_type_union = " | ".join(set(return_types))
+    return_type_union = " | ".join(dict.fromkeys(return_types))
     py_op_name = camel_to_snake(method.operationId)
     return (
         (
@@ -2,8 +2,17 @@
 #  Permissions are hereby granted under the terms of the Apache 2.0 License:
 #  https://opensource.org/license/apache-2-0.
 
+from .async_client import AsyncClient
 from .client import Client
 from .config import ClientConfig
-from .exceptions import ClientException
+from .exceptions import ClientException, JobFailedException
+from .futures import JobFuture
 
-__all__ = ["Client", "ClientConfig", "ClientException"]
+__all__ = [
+    "AsyncClient",
+    "Client",
+    "ClientConfig",
+    "ClientException",
+    "JobFailedException",
+    "JobFuture",
+]
@@ -0,0 +1,570 @@
+# generated by gen_client.py:
+#   filename:  async_client.py:
+#   timestamp: 2026-10-18T11:25:25.553579
+
+
+from typing import AsyncIterator, Iterable, Optional
+
+from s2gos.common.models import (
+    ApiError,
+    Capabilities,
+    ConformanceDeclaration,
+    JobBatchResponse,
+    JobIdList,
+    JobInfo,
+    JobList,
+    JobResults,
+    ProcessDescription,
+    ProcessList,
+    ProcessRequest,
+)
+
+from .bulk import ExecutionItem, ExecutionResult, async_execute_many
+from .config import ClientConfig
+from .defaults import (
+    DEFAULT_BULK_MAX_CONCURRENCY,
+    DEFAULT_BULK_MAX_RETRIES,
+    DEFAULT_BULK_RETRY_DELAY,
+)
+from .pagination import get_next_page_kwargs
+from .transport import AsyncTransport, DefaultAsyncTransport
+
+
+class AsyncClient:
+    """
+    The asynchronous S2GOS Client API.
+
+    The client reuses its HTTP connections across calls, hence
+    it should be closed if no longer needed, either explicitly
+    using `close()` or by using it as an asynchronous context manager.
+
+    Args:
+      config_path: Optional path of the configuration file to be loaded
+      server_url: Optional server URL
+      user_name: Optional username
+      user_name: Optional user access token
+      pool_connections: Optional number of per-host connection pools to cache
+      pool_maxsize: Optional maximum number of connections kept per host
+      connect_timeout: Optional timeout in seconds for establishing a connection
+      read_timeout: Optional timeout in seconds for reading a response
+      keep_alive: Optional flag whether to keep connections open between calls
+      http2: Optional flag whether to use HTTP/2 (asynchronous client only)
+      debug: Whether to output debug logs
+      _transport: Optional web API transport (for testing only).
+    """
+
+    def __init__(
+        self,
+        *,
+        config_path: Optional[str] = None,
+        server_url: Optional[str] = None,
+        user_name: Optional[str] = None,
+        access_token: Optional[str] = None,
+        pool_connections: Optional[int] = None,
+        pool_maxsize: Optional[int] = None,
+        connect_timeout: Optional[float] = None,
+        read_timeout: Optional[float] = None,
+        keep_alive: Optional[bool] = None,
+        http2: Optional[bool] = None,
+        debug: bool = False,
+        _transport: Optional[AsyncTransport] = None,
+    ):
+        config = ClientConfig.create(
+            config_path=config_path,
+            user_name=user_name,
+            access_token=access_token,
+            server_url=server_url,
+            pool_connections=pool_connections,
+            pool_maxsize=pool_maxsize,
+            connect_timeout=connect_timeout,
+            read_timeout=read_timeout,
+            keep_alive=keep_alive,
+            http2=http2,
+        )
+        self._config = config
+        self._transport = (
+            DefaultAsyncTransport(
+                server_url=config.server_url,
+                debug=debug,
+                pool_connections=config.pool_connections,
+                pool_maxsize=config.pool_maxsize,
+                connect_timeout=config.connect_timeout,
+                read_timeout=config.read_timeout,
+                keep_alive=config.keep_alive,
+                http2=config.http2,
+            )
+            if _transport is None
+            else _transport
+        )
+
+    @property
+    def config(self) -> ClientConfig:
+        return self._config
+
+    async def close(self):
+        """Close this client and release its pooled connections."""
+        await self._transport.close()
+
+    async def __aenter__(self) -> "AsyncClient":
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.close()
+
+    async def execute_many(
+        self,
+        items: Iterable[ExecutionItem],
+        *,
+        max_concurrency: int = DEFAULT_BULK_MAX_CONCURRENCY,
+        max_retries: int = DEFAULT_BULK_MAX_RETRIES,
+        retry_delay: float = DEFAULT_BULK_RETRY_DELAY,
+    ) -> list[ExecutionResult]:
+        """
+        Submit many process requests at once.
+
+        The requests are submitted using at most `max_concurrency`
+        concurrent calls. If the server signals that it is overloaded
+        (status 429 or 503), all submissions pause for the time given
+        by the server's "Retry-After" header, or using an exponential
+        backoff, and the affected request is retried up to `max_retries`
+        times. Each request is sent with its own idempotency key, which
+        is kept for its retries, so that the server creates one job per
+        request only. If the server is still processing a previous attempt
+        of a request (status 409 with a "Retry-After" header), the request
+        is retried after the given time, too. Errors are captured per
+        request rather than raised.
+
+        Params:
+          items: Iterable of pairs comprising a process identifier
+            and a process request.
+          max_concurrency: Maximum number of concurrent calls.
+          max_retries: Maximum number of retries per request after
+            the server signalled back-pressure.
+          retry_delay: Initial retry delay in seconds used if the server
+            did not provide a "Retry-After" header.
+
+        Returns:
+          list[JobInfo | Exception]: The created jobs or the errors that
+            occurred, in the order of the given items.
+        """
+        return await async_execute_many(
+            self,
+            items,
+            max_concurrency=max_concurrency,
+            max_retries=max_retries,
+            retry_delay=retry_delay,
+        )
+
+    async def iter_jobs(
+        self,
+        *,
+        page_size: Optional[int] = None,
+        status: Optional[str] = None,
+        process_id: Optional[str] = None,
+        created: Optional[str] = None,
+        updated: Optional[str] = None,
+    ) -> AsyncIterator[JobInfo]:
+        """
+        Iterate over all jobs that match the given filters.
+
+        Pages of the job list are fetched lazily by following
+        the list's "next" links.
+
+        Params:
+          page_size: Optional maximum number of jobs per page
+          status: Optional comma-separated list of status codes
+          process_id: Optional comma-separated list of process identifiers
+          created: Optional creation time interval `start/end`, `..` denotes an open end
+          updated: Optional update time interval `start/end`, `..` denotes an open end
+
+        Returns:
+          AsyncIterator[JobInfo]: An iterator over the jobs' status information.
+        """
+        kwargs = dict(
+            status=status, process_id=process_id, created=created, updated=updated
+        )
+        if page_size is not None:
+            kwargs.update(limit=page_size)
+        while kwargs is not None:
+            job_list = await self.get_jobs(**kwargs)
+            for job_info in job_list.jobs:
+                yield job_info
+            kwargs = get_next_page_kwargs(job_list)
+
+    def _repr_json_(self):
+        # noinspection PyProtectedMember
+        return self._config._repr_json_()
+
+    async def get_capabilities(self) -> Capabilities:
+        """
+        The landing page provides links to the:
+          * The APIDefinition (no fixed path),
+          * The Conformance statements (path /conformance),
+          * The processes metadata (path /processes),
+          * The endpoint for job monitoring (path /jobs).
+
+        For more information, see [Section 7.2](https://docs.ogc.org/is/18-062/18-062.html#sc_landing_page).
+
+        Returns:
+          Capabilities: The landing page provides links to the API definition
+            (link relations `service-desc` and `service-doc`),
+            the Conformance declaration (path `/conformance`,
+            link relation `http://www.opengis.net/def/rel/ogc/1.0/conformance`), and to other resources.
+
+        Raises:
+          ApiError: A server error occurred.
+        """
+        return await self._transport.call(
+            path="/",
+            method="get",
+            path_params={},
+            query_params={},
+            request=None,
+            return_types={"200": Capabilities},
+            error_types={"500": ApiError},
+        )
+
+    async def get_conformance(self) -> ConformanceDeclaration:
+        """
+        A list of all conformance classes, specified in a standard, that the server conforms to.
+
+        | Conformance class | URI |
+        |-----------|-------|
+        |Core|http://www.opengis.net/spec/ogcapi-processes-1/1.0/conf/core|
+        |OGC Process Description|http://www.opengis.net/spec/ogcapi-processes-1/1.0/conf/ogc-process-description|
+        |JSON|http://www.opengis.net/spec/ogcapi-processes-1/1.0/conf/json|
+        |HTML|http://www.opengis.net/spec/ogcapi-processes-1/1.0/conf/html|
+        |OpenAPI Specification 3.0|http://www.opengis.net/spec/ogcapi-processes-1/1.0/conf/oas30|
+        |Job list|http://www.opengis.net/spec/ogcapi-processes-1/1.0/conf/job-list|
+        |Callback|http://www.opengis.net/spec/ogcapi-processes-1/1.0/conf/callback|
+        |Dismiss|http://www.opengis.net/spec/ogcapi-processes-1/1.0/conf/dismiss|
+
+        For more information, see [Section 7.4](https://docs.ogc.org/is/18-062/18-062.html#sc_conformance_classes).
+
+
+        Returns:
+          ConformanceDeclaration: The URIs of all conformance classes supported by the server.
+
+            To support "generic" clients that want to access multiple
+            OGC API - Processes implementations - and not "just" a specific
+            API / server, the server declares the conformance
+            classes it implements and conforms to.
+
+        Raises:
+          ApiError: A server error occurred.
+        """
+        return await self._transport.call(
+            path="/conformance",
+            method="get",
+            path_params={},
+            query_params={},
+            request=None,
+            return_types={"200": ConformanceDeclaration},
+            error_types={"500": ApiError},
+        )
+
+    async def get_processes(self) -> ProcessList:
+        """
+        The list of processes contains a summary of each process the OGC API - Processes offers, including the link to a more detailed description of the process.
+
+        For more information, see [Section 7.9](https://docs.ogc.org/is/18-062/18-062.html#sc_process_list).
+
+
+        Returns:
+          ProcessList: Information about the available processes
+        """
+        return await self._transport.call(
+            path="/processes",
+            method="get",
+            path_params={},
+            query_params={},
+            request=None,
+            return_types={"200": ProcessList},
+            error_types={},
+        )
+
+    async def get_process(self, process_id: str) -> ProcessDescription:
+        """
+        The process description contains information about inputs and outputs and a link to the execution-endpoint for the process. The Core does not mandate the use of a specific process description to specify the interface of a process. That said, the Core requirements class makes the following recommendation:
+
+        Implementations SHOULD consider supporting the OGC process description.
+
+        For more information, see [Section 7.10](https://docs.ogc.org/is/18-062/18-062.html#sc_process_description).
+
+        Params:
+          process_id:
+
+        Returns:
+          ProcessDescription: A process description.
+
+        Raises:
+          ApiError: The requested URI was not found.
+        """
+        return await self._transport.call(
+            path="/processes/{processID}",
+            method="get",
+            path_params={"processID": process_id},
+            query_params={},
+            request=None,
+            return_types={"200": ProcessDescription},
+            error_types={"404": ApiError},
+        )
+
+    async def execute_process(
+        self,
+        process_id: str,
+        request: ProcessRequest,
+        prefer: Optional[str] = None,
+        idempotency_key: Optional[str] = None,
+    ) -> JobResults | JobInfo:
+        """
+        Create a new job.
+
+        For more information, see [Section 7.11](https://docs.ogc.org/is/18-062/18-062.html#sc_create_job).
+
+        Params:
+          process_id:
+          prefer: Optional preferences of the client, see RFC 7240. With
+            `respond-sync`, the results are returned directly, if the job
+            finishes in time, `wait=<seconds>` shortens the time to wait.
+            Processes that only support synchronous execution are executed
+            synchronously unless `respond-async` is given.
+          idempotency_key: Optional unique key of the request. If a request with the same
+            key has been received before, the job created by it is returned
+            instead of creating a new one.
+          request: Mandatory request JSON
+
+        Returns:
+          JobResults: Result of synchronous execution
+          JobInfo: Started asynchronous execution. Created job.
+
+        Raises:
+          ApiError: The requested URI was not found.
+          ApiError: A request with the same idempotency key is still being processed. The Retry-After header gives the number of seconds after which the request may be repeated.
+          ApiError: The idempotency key has been used for a different request.
+          ApiError: A server error occurred.
+          ApiError: The job queue is full. The Retry-After header gives the number of seconds after which the request may be repeated.
+        """
+        return await self._transport.call(
+            path="/processes/{processID}/execution",
+            method="post",
+            path_params={"processID": process_id},
+            query_params={},
+            header_params={"Prefer": prefer, "Idempotency-Key": idempotency_key},
+            request=request,
+            return_types={"200": JobResults, "201": JobInfo},
+            error_types={
+                "404": ApiError,
+                "409": ApiError,
+                "422": ApiError,
+                "500": ApiError,
+                "503": ApiError,
+            },
+        )
+
+    async def get_jobs(
+        self,
+        limit: int = 10,
+        offset: int = 0,
+        status: Optional[str] = None,
+        process_id: Optional[str] = None,
+        created: Optional[str] = None,
+        updated: Optional[str] = None,
+    ) -> JobList:
+        """
+        Lists available jobs.
+
+        The list is sorted by creation time and paged. Use the links
+        with relation types `next` and `prev` to navigate the pages.
+
+        For more information, see [Section 11](https://docs.ogc.org/is/18-062/18-062.html#sc_job_list).
+
+        Params:
+          limit: Maximum number of jobs per page
+          offset: Number of jobs to skip
+          status: Optional comma-separated list of status codes
+          process_id: Optional comma-separated list of process identifiers
+          created: Optional creation time interval `start/end`, `..` denotes an open end
+          updated: Optional update time interval `start/end`, `..` denotes an open end
+
+        Returns:
+          JobList: A list of jobs for this process.
+
+        Raises:
+          ApiError: The requested URI was not found.
+        """
+        return await self._transport.call(
+            path="/jobs",
+            method="get",
+            path_params={},
+            query_params={
+                "limit": limit,
+                "offset": offset,
+                "status": status,
+                "processID": process_id,
+                "created": created,
+                "updated": updated,
+            },
+            request=None,
+            return_types={"200": JobList},
+            error_types={"404": ApiError},
+        )
+
+    async def dismiss_jobs(self, request: JobIdList) -> JobBatchResponse:
+        """
+        Cancel running jobs and remove finished jobs
+        given by a list of job identifiers.
+        The result is reported per job, including errors.
+
+        This is an S2GOS extension of the OGC API - Processes.
+
+        Params:
+          request: Identifiers of the jobs to be dismissed
+
+        Returns:
+          JobBatchResponse: Information about the jobs or errors per job.
+
+        Raises:
+          ApiError: A server error occurred.
+        """
+        return await self._transport.call(
+            path="/jobs",
+            method="delete",
+            path_params={},
+            query_params={},
+            request=request,
+            return_types={"200": JobBatchResponse},
+            error_types={"500": ApiError},
+        )
+
+    async def get_job_statuses(self, request: JobIdList) -> JobBatchResponse:
+        """
+        Shows the status of jobs given by a list of job identifiers.
+        The result is reported per job, including errors.
+
+        This is an S2GOS extension of the OGC API - Processes.
+
+        Params:
+          request: Identifiers of the jobs of interest
+
+        Returns:
+          JobBatchResponse: Information about the jobs or errors per job.
+
+        Raises:
+          ApiError: A server error occurred.
+        """
+        return await self._transport.call(
+            path="/jobs/status",
+            method="post",
+            path_params={},
+            query_params={},
+            request=request,
+            return_types={"200": JobBatchResponse},
+            error_types={"500": ApiError},
+        )
+
+    def get_job_events(
+        self, job_ids: Optional[str] = None, process_id: Optional[str] = None
+    ) -> AsyncIterator[JobInfo]:
+        """
+        Streams the status of jobs as server-sent events.
+        First, the current status of all matching jobs is sent,
+        then an event is sent whenever the status of a matching job changes.
+        If `jobIds` is given, the stream ends once all given jobs are finished.
+
+        This is an S2GOS extension of the OGC API - Processes.
+
+        Params:
+          job_ids: Optional comma-separated list of job identifiers
+          process_id: Optional process identifier
+
+        Returns:
+          Iterator[JobInfo]: A stream of job status events.
+        """
+        return self._transport.stream(
+            path="/jobs/events",
+            method="get",
+            path_params={},
+            query_params={"jobIds": job_ids, "processID": process_id},
+            request=None,
+            return_types={"200": JobInfo},
+            error_types={},
+        )
+
+    async def get_job(self, job_id: str) -> JobInfo:
+        """
+        Shows the status of a job.
+
+        For more information, see [Section 7.12](https://docs.ogc.org/is/18-062/18-062.html#sc_retrieve_status_info).
+
+        Params:
+          job_id: local identifier of a job
+
+        Returns:
+          JobInfo: The status of a job.
+
+        Raises:
+          ApiError: The requested URI was not found.
+          ApiError: A server error occurred.
+        """
+        return await self._transport.call(
+            path="/jobs/{jobId}",
+            method="get",
+            path_params={"jobId": job_id},
+            query_params={},
+            request=None,
+            return_types={"200": JobInfo},
+            error_types={"404": ApiError, "500": ApiError},
+        )
+
+    async def dismiss_job(self, job_id: str) -> JobInfo:
+        """
+        Cancel a job execution and remove it from the jobs list.
+
+        For more information, see [Section 13](https://docs.ogc.org/is/18-062/18-062.html#Dismiss).
+
+        Params:
+          job_id: local identifier of a job
+
+        Returns:
+          JobInfo: Information about the job.
+
+        Raises:
+          ApiError: The requested URI was not found.
+          ApiError: A server error occurred.
+        """
+        return await self._transport.call(
+            path="/jobs/{jobId}",
+            method="delete",
+            path_params={"jobId": job_id},
+            query_params={},
+            request=None,
+            return_types={"200": JobInfo},
+            error_types={"404": ApiError, "500": ApiError},
+        )
+
+    async def get_job_results(self, job_id: str) -> JobResults:
+        """
+        Lists available results of a job. In case of a failure, lists errors instead.
+
+        For more information, see [Section 7.13](https://docs.ogc.org/is/18-062/18-062.html#sc_retrieve_job_results).
+
+        Params:
+          job_id: local identifier of a job
+
+        Returns:
+          JobResults: The results of a job.
+
+        Raises:
+          ApiError: The requested URI was not found.
+          ApiError: A server error occurred.
+        """
+        return await self._transport.call(
+            path="/jobs/{jobId}/results",
+            method="get",
+            path_params={"jobId": job_id},
+            query_params={},
+            request=None,
+            return_types={"200": JobResults},
+            error_types={"404": ApiError, "500": ApiError},
+        )
@@ -0,0 +1,176 @@
+#  Copyright (c) 2025 by ESA DTE-S2GOS team and contributors
+#  Permissions are hereby granted under the terms of the Apache 2.0 License:
+#  https://opensource.org/license/apache-2-0.
+
+import asyncio
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, Iterable, TypeAlias
+
+from s2gos.common.models import JobInfo, ProcessRequest
+
+from .defaults import (
+    DEFAULT_BULK_MAX_CONCURRENCY,
+    DEFAULT_BULK_MAX_RETRIES,
+    DEFAULT_BULK_RETRY_DELAY,
+)
+from .exceptions import ClientException
+
+if TYPE_CHECKING:
+    from .async_client import AsyncClient
+    from .client import Client
+
+ExecutionItem: TypeAlias = tuple[str, ProcessRequest]
+"""A pair comprising a process identifier and a process request."""
+
+ExecutionResult: TypeAlias = JobInfo | Exception
+"""Either the created job or the error that occurred."""
+
+BACK_PRESSURE_STATUS_CODES = frozenset({429, 503})
+"""Status codes used by servers to signal that they are overloaded."""
+
+IN_PROGRESS_STATUS_CODE = 409
+"""Status code used by servers to signal that a request with the same
+idempotency key is still in progress."""
+
+_MAX_RETRY_DELAY = 60.0
+
+
+class BackPressure:
+    """Tracks the time until which a server asked
+    its clients to stop sending requests.
+    Shared by all concurrent submitters of a bulk submission,
+    so that a single back-pressure response pauses all of them.
+
+    Args:
+        retry_delay: Initial delay in seconds used if the server
+            did not provide a "Retry-After" header.
+            It doubles with every retry.
+    """
+
+    def __init__(self, retry_delay: float = DEFAULT_BULK_RETRY_DELAY):
+        self.retry_delay = retry_delay
+        self._resume_time = 0.0
+        self._lock = threading.Lock()
+
+    def get_delay(self) -> float:
+        """Get the delay in seconds to wait before sending the next request."""
+        return max(0.0, self._resume_time - time.monotonic())
+
+    def pause(self, exception: ClientException, attempt: int):
+        """Pause all submitters after the server responded
+        with a back-pressure status code.
+        """
+        delay = exception.retry_after
+        if delay is None:
+            delay = min(_MAX_RETRY_DELAY, self.retry_delay * 2**attempt)
+        with self._lock:
+            self._resume_time = max(self._resume_time, time.monotonic() + delay)
+
+
+def execute_many(
+    client: "Client",
+    items: Iterable[ExecutionItem],
+    max_concurrency: int = DEFAULT_BULK_MAX_CONCURRENCY,
+    max_retries: int = DEFAULT_BULK_MAX_RETRIES,
+    retry_delay: float = DEFAULT_BULK_RETRY_DELAY,
+) -> list[ExecutionResult]:
+    """Submit many process requests using at most
+    `max_concurrency` concurrent calls.
+
+    See `Client.execute_many()` for details.
+    """
+    back_pressure = BackPressure(retry_delay)
+
+    def execute(item: ExecutionItem) -> ExecutionResult:
+        process_id, request = item
+        # Retries are recognized by the server, should the response
+        # of a request that has been received got lost. Jobs are
+        # requested even for processes that prefer to run synchronously.
+        idempotency_key = uuid.uuid4().hex
+        attempt = 0
+        while True:
+            delay = back_pressure.get_delay()
+            if delay > 0:
+                time.sleep(delay)
+            try:
+                return client.execute_process(
+                    process_id,
+                    request,
+                    prefer="respond-async",
+                    idempotency_key=idempotency_key,
+                )
+            except ClientException as e:
+                if not _is_retryable(e, attempt, max_retries):
+                    return e
+                if e.status_code == IN_PROGRESS_STATUS_CODE:
+                    # Only this request is affected, so others go on
+                    time.sleep(e.retry_after)
+                else:
+                    back_pressure.pause(e, attempt)
+                attempt += 1
+            except Exception as e:
+                return e
+
+    with ThreadPoolExecutor(
+        max_workers=max_concurrency, thread_name_prefix="s2gos-execute-many"
+    ) as executor:
+        return list(executor.map(execute, items))
+
+
+async def async_execute_many(
+    client: "AsyncClient",
+    items: Iterable[ExecutionItem],
+    max_concurrency: int = DEFAULT_BULK_MAX_CONCURRENCY,
+    max_retries: int = DEFAULT_BULK_MAX_RETRIES,
+    retry_delay: float = DEFAULT_BULK_RETRY_DELAY,
+) -> list[ExecutionResult]:
+    """Submit many process requests using at most
+    `max_concurrency` concurrent calls.
+
+    See `AsyncClient.execute_many()` for details.
+    """
+    back_pressure = BackPressure(retry_delay)
+    semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def execute(item: ExecutionItem) -> ExecutionResult:
+        process_id, request = item
+        idempotency_key = uuid.uuid4().hex
+        attempt = 0
+        async with semaphore:
+            while True:
+                delay = back_pressure.get_delay()
+                if delay > 0:
+                    await asyncio.sleep(delay)
+                try:
+                    return await client.execute_process(
+                        process_id,
+                        request,
+                        prefer="respond-async",
+                        idempotency_key=idempotency_key,
+                    )
+                except ClientException as e:
+                    if not _is_retryable(e, attempt, max_retries):
+                        return e
+                    if e.status_code == IN_PROGRESS_STATUS_CODE:
+                        # Only this request is affected, so others go on
+                        await asyncio.sleep(e.retry_after)
+                    else:
+                        back_pressure.pause(e, attempt)
+                    attempt += 1
+                except Exception as e:
+                    return e
+
+    return list(await asyncio.gather(*(execute(item) for item in items)))
+
+
+def _is_retryable(exception: ClientException, attempt: int, max_retries: int):
+    if attempt >= max_retries:
+        return False
+    if exception.status_code == IN_PROGRESS_STATUS_CODE:
+        # A previous attempt has been received, but its job
+        # has not yet been created
+        return exception.retry_after is not None
+    return exception.status_code in BACK_PRESSURE_STATUS_CODES
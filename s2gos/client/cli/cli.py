@@ -58,6 +58,8 @@ instead of "validate-request", or "lt" instead of "list-templates".
 
 cli = typer.Typer(name="s2gos", cls=AliasedGroup, help=HELP)
 
+_JOB_LIST_PAGE_SIZE = 100
+
 
 @cli.command()
 def configure(
@@ -127,25 +129,47 @@ def submit_request(name: str = typer.Option(DEFAULT_REQUEST_FILE)):
 
 
 @cli.command()
-def cancel_jobs(job_ids: list[str]):
+def cancel_jobs(job_ids: Optional[list[str]] = typer.Argument(None)):
     """Cancel running processing jobs."""
+    from s2gos.common.models import JobIdList
+
     config = _get_config()
+    client = _get_client()
     click.echo(
         f"Cancelling all jobs of {config.user_name}"
         if not job_ids
         else f"Cancelling jobs {job_ids} of {config.user_name}"
     )
+    with client:
+        if not job_ids:
+            job_ids = [
+                job_info.jobID
+                for job_info in client.iter_jobs(
+                    page_size=_JOB_LIST_PAGE_SIZE, status="accepted,running"
+                )
+            ]
+        if job_ids:
+            _echo_job_batch_response(client.dismiss_jobs(JobIdList(jobIds=job_ids)))
 
 
 @cli.command()
-def poll_jobs(job_ids: list[str]):
+def poll_jobs(job_ids: Optional[list[str]] = typer.Argument(None)):
     """Poll the status of processing jobs."""
+    from s2gos.common.models import JobIdList
+
     config = _get_config()
+    client = _get_client()
     click.echo(
         f"Polling all jobs of user {config.user_name}"
         if not job_ids
         else f"Polling jobs {job_ids} of {config.user_name}"
     )
+    with client:
+        if not job_ids:
+            for job_info in client.iter_jobs(page_size=_JOB_LIST_PAGE_SIZE):
+                _echo_job_info(job_info)
+        else:
+            _echo_job_batch_response(client.get_job_statuses(JobIdList(jobIds=job_ids)))
 
 
 @cli.command()
@@ -155,6 +179,26 @@ def get_results(job_ids: list[str]):
     click.echo(f"Getting result of job {job_ids!r} for {config.user_name}")
 
 
+def _get_client():
+    from s2gos.client import Client
+
+    return Client()
+
+
+def _echo_job_batch_response(response):
+    for item in response.jobs:
+        if item.jobInfo is not None:
+            _echo_job_info(item.jobInfo)
+        elif item.error is not None:
+            click.echo(f"{item.jobID}: error: {item.error.detail}")
+
+
+def _echo_job_info(job_info):
+    progress = f" ({job_info.progress}%)" if job_info.progress is not None else ""
+    message = f": {job_info.message}" if job_info.message else ""
+    click.echo(f"{job_info.jobID}: {job_info.status.value}{progress}{message}")
+
+
 def _get_config():
     from s2gos.client.config import ClientConfig
 
@@ -9,7 +9,16 @@ from typing import Optional
 import yaml
 from pydantic import BaseModel
 
-from .defaults import DEFAULT_CONFIG_PATH
+from .defaults import (
+    DEFAULT_CONFIG_PATH,
+    DEFAULT_CONNECT_TIMEOUT,
+    DEFAULT_HTTP2,
+    DEFAULT_KEEP_ALIVE,
+    DEFAULT_POOL_CONNECTIONS,
+    DEFAULT_POOL_MAXSIZE,
+    DEFAULT_READ_TIMEOUT,
+    DEFAULT_SERVER_URL,
+)
 
 
 class ClientConfig(BaseModel):
@@ -19,17 +28,49 @@ class ClientConfig(BaseModel):
         user_name: name of the registered S2GOS user
         access_token: API access token
         server_url: server API URL
+        pool_connections: number of per-host connection pools to cache
+        pool_maxsize: maximum number of connections kept per host
+        connect_timeout: timeout in seconds for establishing a connection
+        read_timeout: timeout in seconds for reading a response
+        keep_alive: whether to keep connections open between calls
+        http2: whether to use HTTP/2, only used by the asynchronous client
     """
 
     user_name: Optional[str] = None
     access_token: Optional[str] = None
     server_url: Optional[str] = None
+    pool_connections: Optional[int] = None
+    pool_maxsize: Optional[int] = None
+    connect_timeout: Optional[float] = None
+    read_timeout: Optional[float] = None
+    keep_alive: Optional[bool] = None
+    http2: Optional[bool] = None
 
     def _repr_json_(self):
         return self.model_dump(
             mode="json", by_alias=True, exclude_none=True, exclude_defaults=False
         ), dict(root="Configuration:")
 
+    @classmethod
+    def create(
+        cls, config_path: Optional[str | Path] = None, **kwargs
+    ) -> "ClientConfig":
+        """Create a configuration from the given keyword arguments.
+        Values not given or `None` are taken from the configuration
+        read from `config_path`, and if not specified there either,
+        from the defaults.
+        """
+        default_config = cls.read(config_path=config_path)
+        config_dict = {}
+        for field_name in cls.model_fields.keys():
+            value = kwargs.get(field_name)
+            if value is None:
+                value = getattr(default_config, field_name)
+            if value is None:
+                value = _DEFAULTS.get(field_name)
+            config_dict[field_name] = value
+        return ClientConfig(**config_dict)
+
     @classmethod
     def read(cls, config_path: Optional[str | Path] = None) -> Optional["ClientConfig"]:
         config_path = cls.normalize_config_path(config_path)
@@ -67,3 +108,14 @@ class ClientConfig(BaseModel):
         if not config_path:
             return DEFAULT_CONFIG_PATH
         return Path(config_path)
+
+
+_DEFAULTS = dict(
+    server_url=DEFAULT_SERVER_URL,
+    pool_connections=DEFAULT_POOL_CONNECTIONS,
+    pool_maxsize=DEFAULT_POOL_MAXSIZE,
+    connect_timeout=DEFAULT_CONNECT_TIMEOUT,
+    read_timeout=DEFAULT_READ_TIMEOUT,
+    keep_alive=DEFAULT_KEEP_ALIVE,
+    http2=DEFAULT_HTTP2,
+)
@@ -12,3 +12,22 @@ DEFAULT_CONFIG_PATH: Final = DEFAULT_USER_PATH / "config"
 
 DEFAULT_REQUEST_FILE: Final = "s2gos-request.yaml"
 DEFAULT_SERVER_URL: Final = "http://127.0.0.1:8008"
+
+DEFAULT_POOL_CONNECTIONS: Final = 10
+DEFAULT_POOL_MAXSIZE: Final = 10
+DEFAULT_CONNECT_TIMEOUT: Final = 10.0
+DEFAULT_READ_TIMEOUT: Final = None
+# Must exceed the server's keep-alive interval of event streams
+DEFAULT_STREAM_READ_TIMEOUT: Final = 60.0
+DEFAULT_KEEP_ALIVE: Final = True
+DEFAULT_HTTP2: Final = False
+DEFAULT_VALIDATOR_CACHE_SIZE: Final = 256
+
+DEFAULT_BULK_MAX_CONCURRENCY: Final = 8
+DEFAULT_BULK_MAX_RETRIES: Final = 5
+DEFAULT_BULK_RETRY_DELAY: Final = 1.0
+
+DEFAULT_POLL_RATE: Final = 10.0
+DEFAULT_POLL_MIN_INTERVAL: Final = 0.5
+DEFAULT_POLL_MAX_INTERVAL: Final = 30.0
+DEFAULT_POLL_BACKOFF: Final = 1.5
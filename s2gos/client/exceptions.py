@@ -4,16 +4,47 @@
 
 from typing import Optional
 
+from s2gos.common.models import JobInfo
+
 
 class ClientException(Exception):
+    """Raised if a call to the S2GOS web API failed.
+
+    Args:
+        status_code: The HTTP status code.
+        reason: The HTTP reason phrase.
+        title: Optional error title.
+        detail: Optional error detail.
+        retry_after: Optional number of seconds after which
+            the server suggests to retry the call.
+            Usually given with status codes 429 and 503.
+    """
+
     def __init__(
         self,
         status_code: int,
         reason: str,
         title: Optional[str] = None,
         detail: Optional[str] = None,
+        retry_after: Optional[float] = None,
     ):
         super().__init__(reason)
         self.status_code = status_code
         self.title = title
         self.detail = detail
+        self.retry_after = retry_after
+
+
+class JobFailedException(Exception):
+    """Raised if a job has failed on the server.
+
+    Args:
+        job_info: The status information of the failed job.
+    """
+
+    def __init__(self, job_info: JobInfo):
+        message = f"Job {job_info.jobID!r} failed"
+        if job_info.message:
+            message += f": {job_info.message}"
+        super().__init__(message)
+        self.job_info = job_info
@@ -0,0 +1,313 @@
+#  Copyright (c) 2025 by ESA DTE-S2GOS team and contributors
+#  Permissions are hereby granted under the terms of the Apache 2.0 License:
+#  https://opensource.org/license/apache-2-0.
+
+import concurrent.futures
+import heapq
+import threading
+import time
+from logging import getLogger
+from typing import (
+    TYPE_CHECKING,
+    Final,
+    Iterable,
+    Iterator,
+    Literal,
+    NamedTuple,
+    Optional,
+)
+
+from s2gos.common.models import JobInfo, JobResults, StatusCode
+
+from .defaults import (
+    DEFAULT_POLL_BACKOFF,
+    DEFAULT_POLL_MAX_INTERVAL,
+    DEFAULT_POLL_MIN_INTERVAL,
+    DEFAULT_POLL_RATE,
+)
+from .exceptions import ClientException, JobFailedException
+
+if TYPE_CHECKING:
+    from .client import Client
+
+logger = getLogger("s2gos")
+
+FIRST_COMPLETED: Final = concurrent.futures.FIRST_COMPLETED
+FIRST_EXCEPTION: Final = concurrent.futures.FIRST_EXCEPTION
+ALL_COMPLETED: Final = concurrent.futures.ALL_COMPLETED
+
+
+class JobFuture(concurrent.futures.Future):
+    """A future representing the outcome of a job on the server.
+
+    Job futures are compatible with the `concurrent.futures` API:
+    `result()` returns the job's results once it succeeded,
+    and raises a `JobFailedException` if it failed.
+    If the job has been dismissed, the future is cancelled.
+
+    Instances should not be created directly, use
+    `Client.submit()` or `Client.get_job_future()` instead.
+
+    Args:
+        job_info: The job's initial status information.
+        poller: The poller that observes the job.
+    """
+
+    def __init__(self, job_info: JobInfo, poller: "JobPoller"):
+        super().__init__()
+        self._job_info = job_info
+        self._poller = poller
+
+    @property
+    def job_id(self) -> str:
+        """The job's identifier."""
+        return self._job_info.jobID
+
+    @property
+    def job_info(self) -> JobInfo:
+        """The most recently observed status information of the job."""
+        return self._job_info
+
+    def cancel(self) -> bool:
+        """Cancel the job by dismissing it on the server.
+
+        Returns:
+            `True` if the future has been cancelled,
+            `False` if the job has already completed.
+        """
+        if self.done():
+            return self.cancelled()
+        try:
+            self._poller.client.dismiss_job(self.job_id)
+        except ClientException as e:
+            logger.warning(f"Failed to dismiss job {self.job_id!r}: {e}")
+            return False
+        self._poller.remove(self)
+        return super().cancel()
+
+    def _set_job_info(self, job_info: JobInfo):
+        self._job_info = job_info
+
+
+class _Entry(NamedTuple):
+    next_poll_time: float
+    seq: int
+    future: JobFuture
+    interval: float
+
+
+class JobPoller:
+    """Observes the jobs of all outstanding job futures of a client
+    using a single background thread.
+
+    The poller issues at most `rate` requests per second, no matter
+    how many jobs are in flight. Each job is polled again after an
+    interval that starts at `min_interval` and grows by the factor
+    `backoff` up to `max_interval` as long as the job's status
+    does not change.
+
+    Args:
+        client: The client used to poll jobs.
+        rate: Maximum number of requests per second.
+        min_interval: Minimum polling interval per job in seconds.
+        max_interval: Maximum polling interval per job in seconds.
+        backoff: Factor by which the polling interval per job grows.
+    """
+
+    def __init__(
+        self,
+        client: "Client",
+        rate: float = DEFAULT_POLL_RATE,
+        min_interval: float = DEFAULT_POLL_MIN_INTERVAL,
+        max_interval: float = DEFAULT_POLL_MAX_INTERVAL,
+        backoff: float = DEFAULT_POLL_BACKOFF,
+    ):
+        self.client = client
+        self.rate = rate
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.backoff = backoff
+        self._queue: list[_Entry] = []
+        self._futures: dict[str, JobFuture] = {}
+        self._seq = 0
+        self._condition = threading.Condition()
+        self._thread: Optional[threading.Thread] = None
+        self._closed = False
+
+    def add(self, job_info: JobInfo) -> JobFuture:
+        """Get a future for the job given by `job_info`.
+        If the job is already observed, its future is returned.
+        """
+        with self._condition:
+            if self._closed:
+                raise RuntimeError("job poller has been closed")
+            future = self._futures.get(job_info.jobID)
+            if future is not None:
+                return future
+            future = JobFuture(job_info, self)
+            self._futures[job_info.jobID] = future
+            self._push(future, self.min_interval, 0.0)
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run, name="s2gos-job-poller", daemon=True
+                )
+                self._thread.start()
+            self._condition.notify()
+            return future
+
+    def remove(self, future: JobFuture):
+        """Stop observing the job of the given future."""
+        with self._condition:
+            if self._is_pending(future):
+                del self._futures[future.job_id]
+
+    def close(self):
+        """Stop polling. Outstanding futures remain pending."""
+        with self._condition:
+            self._closed = True
+            self._futures.clear()
+            self._queue.clear()
+            self._condition.notify()
+            thread = self._thread
+        if thread is not None and thread is not threading.current_thread():
+            thread.join()
+
+    @property
+    def num_pending(self) -> int:
+        """The number of jobs currently observed."""
+        return len(self._futures)
+
+    def _is_pending(self, future: JobFuture) -> bool:
+        return self._futures.get(future.job_id) is future
+
+    def _push(self, future: JobFuture, interval: float, delay: float):
+        self._seq += 1
+        heapq.heappush(
+            self._queue,
+            _Entry(time.monotonic() + delay, self._seq, future, interval),
+        )
+
+    def _run(self):
+        try:
+            self._poll_jobs()
+        finally:
+            with self._condition:
+                # Allow add() to start a new poller
+                if self._thread is threading.current_thread():
+                    self._thread = None
+
+    def _poll_jobs(self):
+        min_request_interval = 1.0 / self.rate
+        while True:
+            with self._condition:
+                while True:
+                    if self._closed or not self._futures:
+                        return
+                    entry = self._queue[0]
+                    if not self._is_pending(entry.future):
+                        heapq.heappop(self._queue)
+                        continue
+                    delay = entry.next_poll_time - time.monotonic()
+                    if delay <= 0:
+                        heapq.heappop(self._queue)
+                        break
+                    self._condition.wait(delay)
+
+            t0 = time.monotonic()
+            interval = self._poll(entry.future, entry.interval)
+            if interval is not None:
+                with self._condition:
+                    if self._is_pending(entry.future):
+                        self._push(entry.future, interval, interval)
+
+            # Keep request volume constant, independent of number of jobs
+            delay = min_request_interval - (time.monotonic() - t0)
+            if delay > 0:
+                time.sleep(delay)
+
+    def _poll(self, future: JobFuture, interval: float) -> Optional[float]:
+        """Poll the job of given future and return the next
+        polling interval or `None`, if the job is done.
+        """
+        try:
+            job_info = self.client.get_job(future.job_id)
+            return self._update(future, job_info, interval)
+        except ClientException as e:
+            if e.status_code == 404:
+                self._complete(future, exception=e)
+                return None
+            logger.warning(f"Failed to poll job {future.job_id!r}: {e}")
+        except Exception as e:
+            # E.g., connection errors, the job is polled again later
+            logger.warning(f"Failed to poll job {future.job_id!r}: {e}")
+        return min(self.max_interval, interval * self.backoff)
+
+    def _update(
+        self, future: JobFuture, job_info: JobInfo, interval: float
+    ) -> Optional[float]:
+        prev_job_info = future.job_info
+        future._set_job_info(job_info)
+        status = job_info.status
+        if status == StatusCode.successful:
+            try:
+                results = self.client.get_job_results(future.job_id)
+            except ClientException as e:
+                self._complete(future, exception=e)
+            else:
+                self._complete(future, result=results)
+            return None
+        if status == StatusCode.failed:
+            self._complete(future, exception=JobFailedException(job_info))
+            return None
+        if status == StatusCode.dismissed:
+            self._complete(future, cancel=True)
+            return None
+        if (status, job_info.progress) != (
+            prev_job_info.status,
+            prev_job_info.progress,
+        ):
+            return self.min_interval
+        return min(self.max_interval, interval * self.backoff)
+
+    def _complete(
+        self,
+        future: JobFuture,
+        result: Optional[JobResults] = None,
+        exception: Optional[Exception] = None,
+        cancel: bool = False,
+    ):
+        self.remove(future)
+        if cancel:
+            concurrent.futures.Future.cancel(future)
+        elif exception is not None:
+            future.set_exception(exception)
+        else:
+            future.set_result(result)
+
+
+def wait(
+    futures: Iterable[JobFuture],
+    timeout: Optional[float] = None,
+    return_when: Literal[
+        "FIRST_COMPLETED", "FIRST_EXCEPTION", "ALL_COMPLETED"
+    ] = ALL_COMPLETED,
+) -> tuple[set[JobFuture], set[JobFuture]]:
+    """Wait for the given job futures to complete.
+    Same as `concurrent.futures.wait()`.
+
+    Returns:
+        A pair of sets, the completed futures and the
+        not-completed futures.
+    """
+    # noinspection PyTypeChecker
+    return concurrent.futures.wait(futures, timeout=timeout, return_when=return_when)
+
+
+def as_completed(
+    futures: Iterable[JobFuture], timeout: Optional[float] = None
+) -> Iterator[JobFuture]:
+    """Iterate over the given job futures as they complete.
+    Same as `concurrent.futures.as_completed()`.
+    """
+    # noinspection PyTypeChecker
+    return concurrent.futures.as_completed(futures, timeout=timeout)
@@ -3,15 +3,30 @@
 #  https://opensource.org/license/apache-2-0.
 
 import threading
-import time
 from typing import Optional
 
+import requests
+
 from s2gos.client import Client as GeneratedClient
 from s2gos.client import ClientException
 from s2gos.client.gui.jobs_form import JobsForm
 from s2gos.client.gui.processes_form import ProcessesForm
-from s2gos.client.transport import Transport
-from s2gos.common.models import JobList, ProcessList
+from s2gos.client.transport import DefaultTransport, Transport
+from s2gos.common.models import (
+    JobBatchResponse,
+    JobIdList,
+    JobInfo,
+    JobList,
+    ProcessList,
+    StatusCode,
+)
+
+_JOB_LIST_PAGE_SIZE = 100
+
+# Shorter than the server's keep-alive interval, so that an idle
+# event stream times out regularly and the updater notices when
+# it is stopped. The updater then reconnects.
+_EVENT_READ_TIMEOUT = 10.0
 
 
 class Client(GeneratedClient):
@@ -23,10 +38,16 @@ class Client(GeneratedClient):
         **config,
     ):
         super().__init__(_transport=_transport, **config)
+        if isinstance(self._transport, DefaultTransport):
+            self._transport.stream_read_timeout = _EVENT_READ_TIMEOUT
         self._update_interval = update_interval
         self._update_thread: Optional[threading.Thread] = None
+        self._stop_event = threading.Event()
         self._processes_form: Optional[ProcessesForm] = None
         self._jobs_form: Optional[JobsForm] = None
+        # Updated by the updater thread and the UI thread
+        self._job_infos: dict[str, JobInfo] = {}
+        self._job_infos_lock = threading.Lock()
 
     def show_processes(self):
         if self._processes_form is None:
@@ -41,28 +62,37 @@ class Client(GeneratedClient):
         if self._jobs_form is None:
             self._jobs_form = JobsForm(
                 *self._get_jobs(),
-                on_cancel_job=self._cancel_job,
-                on_delete_job=self._delete_job,
+                on_cancel_jobs=self._cancel_jobs,
+                on_delete_jobs=self._delete_jobs,
                 on_restart_job=self._restart_job,
                 on_get_job_results=self.get_job_results,
             )
 
         if self._update_thread is None or not self._update_thread.is_alive():
+            # Each updater gets its own stop event, so that a stopped
+            # updater which has not yet exited cannot be revived
+            self._stop_event = threading.Event()
             self._update_thread = threading.Thread(
-                target=self._run_updater, daemon=True
+                target=self._run_updater, args=(self._stop_event,), daemon=True
             )
             self._update_thread.start()
 
         return self._jobs_form
 
     def stop_updating(self):
+        self._stop_event.set()
         self._update_thread = None
 
-    def _cancel_job(self, job_id: str):
-        return self.dismiss_job(job_id)
+    def _cancel_jobs(self, job_ids: list[str]) -> JobBatchResponse:
+        return self.dismiss_jobs(JobIdList(jobIds=job_ids))
 
-    def _delete_job(self, job_id: str):
-        return self.dismiss_job(job_id)
+    def _delete_jobs(self, job_ids: list[str]) -> JobBatchResponse:
+        response = self.dismiss_jobs(JobIdList(jobIds=job_ids))
+        with self._job_infos_lock:
+            for item in response.jobs:
+                if item.error is None:
+                    self._job_infos.pop(item.jobID, None)
+        return response
 
     # noinspection PyMethodMayBeStatic
     def _restart_job(self, _job_id: str):
@@ -70,14 +100,44 @@ class Client(GeneratedClient):
         print("Not implemented.")
 
     def __delete__(self, instance):
-        self._update_thread = None
+        self.stop_updating()
         self._jobs_form = None
 
-    def _run_updater(self):
-        while self._update_thread is not None:
-            time.sleep(self._update_interval)
-            if self._jobs_form is not None:
-                self._jobs_form.set_job_list(*self._get_jobs())
+    def _run_updater(self, stop_event: threading.Event):
+        while not stop_event.is_set():
+            try:
+                self._run_event_updater(stop_event)
+            except (ClientException, NotImplementedError):
+                # Server or transport doesn't support job events
+                self._run_polling_updater(stop_event)
+                return
+            except (requests.RequestException, OSError):
+                # The stream timed out or the connection was lost,
+                # so reconnect
+                stop_event.wait(self._update_interval)
+
+    def _run_event_updater(self, stop_event: threading.Event):
+        job_list, _ = self._get_jobs()
+        with self._job_infos_lock:
+            self._job_infos = {job_info.jobID: job_info for job_info in job_list.jobs}
+        for job_info in self.get_job_events():
+            if stop_event.is_set():
+                break
+            with self._job_infos_lock:
+                if job_info.status == StatusCode.dismissed:
+                    self._job_infos.pop(job_info.jobID, None)
+                else:
+                    self._job_infos[job_info.jobID] = job_info
+                job_infos = list(self._job_infos.values())
+            jobs_form = self._jobs_form
+            if jobs_form is not None:
+                jobs_form.set_job_list(JobList(jobs=job_infos, links=[]), None)
+
+    def _run_polling_updater(self, stop_event: threading.Event):
+        while not stop_event.wait(self._update_interval):
+            jobs_form = self._jobs_form
+            if jobs_form is not None:
+                jobs_form.set_job_list(*self._get_jobs())
 
     def _get_processes(self) -> tuple[ProcessList, ClientException | None]:
         try:
@@ -87,6 +147,7 @@ class Client(GeneratedClient):
 
     def _get_jobs(self) -> tuple[JobList, ClientException | None]:
         try:
-            return self.get_jobs(), None
+            jobs = list(self.iter_jobs(page_size=_JOB_LIST_PAGE_SIZE))
+            return JobList(jobs=jobs, links=[]), None
         except ClientException as e:
             return JobList(jobs=[], links=[]), e
@@ -11,6 +11,7 @@ from pydantic import BaseModel
 
 from s2gos.client import ClientException
 from s2gos.common.models import (
+    JobBatchResponse,
     JobInfo,
     JobList,
     JobResults,
@@ -18,6 +19,7 @@ from s2gos.common.models import (
 )
 
 JobAction: TypeAlias = Callable[[str], Any]
+JobBatchAction: TypeAlias = Callable[[list[str]], JobBatchResponse]
 
 
 class JobsForm(pn.viewable.Viewer):
@@ -27,16 +29,16 @@ class JobsForm(pn.viewable.Viewer):
         self,
         job_list: JobList,
         job_list_error: ClientException | None,
-        on_delete_job: Optional[JobAction] = None,
-        on_cancel_job: Optional[JobAction] = None,
+        on_delete_jobs: Optional[JobBatchAction] = None,
+        on_cancel_jobs: Optional[JobBatchAction] = None,
         on_restart_job: Optional[JobAction] = None,
         on_get_job_results: Optional[JobAction] = None,
     ):
         super().__init__()
         # TODO: Report job_list_error if not None
         self._job_list_error = job_list_error
-        self._on_delete_job = on_delete_job
-        self._on_cancel_job = on_cancel_job
+        self._on_delete_jobs = on_delete_jobs
+        self._on_cancel_jobs = on_cancel_jobs
         self._on_restart_job = on_restart_job
         self._on_get_job_results = on_get_job_results
         self._tabulator = self._new_tabulator(job_list)
@@ -104,10 +106,10 @@ class JobsForm(pn.viewable.Viewer):
 
         selected_jobs = self.selected_jobs
 
-        self._cancel_button.disabled = self._on_cancel_job is None or self.is_disabled(
+        self._cancel_button.disabled = self._on_cancel_jobs is None or self.is_disabled(
             selected_jobs, {StatusCode.accepted, StatusCode.running}
         )
-        self._delete_button.disabled = self._on_delete_job is None or self.is_disabled(
+        self._delete_button.disabled = self._on_delete_jobs is None or self.is_disabled(
             selected_jobs,
             {StatusCode.successful, StatusCode.dismissed, StatusCode.failed},
         )
@@ -140,15 +142,15 @@ class JobsForm(pn.viewable.Viewer):
         return [job for job in self._jobs if job.jobID in selected_ids]
 
     def _on_cancel_jobs_clicked(self, _event: Any):
-        self._run_action_on_selected_jobs(
-            self._on_cancel_job,
+        self._run_batch_action_on_selected_jobs(
+            self._on_cancel_jobs,
             "✅ Cancelled {job}",
             "⚠️ Failed cancelling {job}: {message}",
         )
 
     def _on_delete_jobs_clicked(self, _event: Any):
-        self._run_action_on_selected_jobs(
-            self._on_delete_job,
+        self._run_batch_action_on_selected_jobs(
+            self._on_delete_jobs,
             "✅ Deleted {job}",
             "⚠️ Failed deleting {job}: {message}",
         )
@@ -204,11 +206,47 @@ class JobsForm(pn.viewable.Viewer):
                 messages.append(
                     error_format.format(
                         job=job_text,
-                        message=f"{e.title} (status `{e.status_code}`): {e.detail}",
+                        message=_format_error(e.title, e.status_code, e.detail),
                     )
                 )
         self._message_md.object = " \n".join(messages)
 
+    def _run_batch_action_on_selected_jobs(
+        self,
+        action: JobBatchAction,
+        success_format: str,
+        error_format: str,
+    ):
+        """Run the given action on all selected jobs
+        using a single request.
+        """
+        job_ids = [job.jobID for job in self.selected_jobs]
+        messages = []
+        try:
+            response = action(job_ids)
+        except ClientException as e:
+            message = _format_error(e.title, e.status_code, e.detail)
+            for job_id in job_ids:
+                messages.append(
+                    error_format.format(job=f"job `{job_id}`", message=message)
+                )
+        else:
+            for item in response.jobs:
+                job_text = f"job `{item.jobID}`"
+                if item.error is None:
+                    messages.append(success_format.format(job=job_text))
+                else:
+                    error = item.error
+                    messages.append(
+                        error_format.format(
+                            job=job_text,
+                            message=_format_error(
+                                error.title, error.status, error.detail
+                            ),
+                        )
+                    )
+        self._message_md.object = " \n".join(messages)
+
     @classmethod
     def _new_tabulator(cls, job_list: JobList) -> pn.widgets.Tabulator:
         dataframe = cls._jobs_to_dataframe(job_list.jobs)
@@ -276,3 +314,9 @@ class JobsForm(pn.viewable.Viewer):
 class JsonDict(dict):
     def _repr_json_(self):
         return self, {"root": "Results:"}
+
+
+def _format_error(
+    title: Optional[str], status: Optional[int], detail: Optional[str]
+) -> str:
+    return f"{title} (status `{status}`): {detail}"
@@ -0,0 +1,38 @@
+#  Copyright (c) 2025 by ESA DTE-S2GOS team and contributors
+#  Permissions are hereby granted under the terms of the Apache 2.0 License:
+#  https://opensource.org/license/apache-2-0.
+
+from typing import Any, Callable, Optional
+from urllib.parse import parse_qsl, urlsplit
+
+from s2gos.common.models import JobList
+
+# Maps query parameters of GET /jobs to
+# keyword arguments of Client.get_jobs()
+_JOB_LIST_PARAMS: dict[str, tuple[str, Callable[[str], Any]]] = {
+    "limit": ("limit", int),
+    "offset": ("offset", int),
+    "status": ("status", str),
+    "processID": ("process_id", str),
+    "created": ("created", str),
+    "updated": ("updated", str),
+}
+
+
+def get_next_page_kwargs(job_list: JobList) -> Optional[dict[str, Any]]:
+    """Get the keyword arguments for `Client.get_jobs()` that fetch
+    the page referred to by the "next" link of the given job list.
+
+    Returns:
+        The keyword arguments or `None`, if there is no next page.
+    """
+    next_link = next((link for link in job_list.links if link.rel == "next"), None)
+    if next_link is None:
+        return None
+    kwargs: dict[str, Any] = {}
+    for name, value in parse_qsl(urlsplit(next_link.href).query):
+        param = _JOB_LIST_PARAMS.get(name)
+        if param is not None:
+            kwarg_name, kwarg_type = param
+            kwargs[kwarg_name] = kwarg_type(value)
+    return kwargs
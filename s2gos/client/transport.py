@@ -2,20 +2,46 @@
 #  Permissions are hereby granted under the terms of the Apache 2.0 License:
 #  https://opensource.org/license/apache-2-0.
 
+import datetime
+import email.utils
 import inspect
+import json
+import threading
 import time
 from abc import ABC, abstractmethod
+from collections import OrderedDict
 from logging import getLogger
-from typing import Any, Literal
+from typing import (
+    Any,
+    AsyncIterator,
+    Iterable,
+    Iterator,
+    Literal,
+    Mapping,
+    NamedTuple,
+    Optional,
+)
 
+import httpx
 import requests
 import uri_template
 from pydantic import BaseModel
+from requests.adapters import HTTPAdapter
 
+from s2gos.client.defaults import (
+    DEFAULT_CONNECT_TIMEOUT,
+    DEFAULT_POOL_CONNECTIONS,
+    DEFAULT_POOL_MAXSIZE,
+    DEFAULT_READ_TIMEOUT,
+    DEFAULT_STREAM_READ_TIMEOUT,
+    DEFAULT_VALIDATOR_CACHE_SIZE,
+)
 from s2gos.client.exceptions import ClientException
 
 logger = getLogger("s2gos")
 
+EVENT_STREAM_MEDIA_TYPE = "text/event-stream"
+
 
 class Transport(ABC):
     """Abstraction of the transport that calls the S2GOS web API."""
@@ -30,21 +56,133 @@ class Transport(ABC):
         request: BaseModel | None,
         return_types: dict[str, type | None],
         error_types: dict[str, type | None],
+        header_params: Optional[dict[str, Any]] = None,
     ) -> Any:
         """
         Call the S2GOS web API with the given endpoint
         `path`, `method`, `params`, etc. Then validate the response
         and return an instance of one of the types given by
+        `return_types`. Header parameters whose value is `None`
+        are not sent.
+        """
+
+    def stream(
+        self,
+        path: str,
+        method: Literal["get", "post", "put", "delete"],
+        path_params: dict[str, Any],
+        query_params: dict[str, Any],
+        request: BaseModel | None,
+        return_types: dict[str, type | None],
+        error_types: dict[str, type | None],
+    ) -> Iterator[Any]:
+        """
+        Call the S2GOS web API endpoint that responds with a
+        stream of server-sent events and return an iterator over
+        the event data, each validated against the type given by
         `return_types`.
+        The default implementation raises `NotImplementedError`.
+        """
+        raise NotImplementedError("streaming is not supported by this transport")
+
+    def close(self) -> None:
+        """Release any resources held by this transport.
+        The default implementation does nothing.
         """
 
 
 class DefaultTransport(Transport):
-    """The concrete S2GOS web API transport."""
+    """The concrete S2GOS web API transport.
+
+    The transport keeps a long-lived pool of HTTP connections
+    that is shared by all threads using it, so that subsequent
+    calls to the same server reuse already established
+    (keep-alive) connections instead of paying for a new
+    TCP (and TLS) handshake each time.
 
-    def __init__(self, server_url: str, debug: bool = False):
+    Responses of GET calls that carry an `ETag` or `Last-Modified`
+    header are kept in a small cache. Subsequent calls send them
+    as `If-None-Match` and `If-Modified-Since` headers, so that
+    unchanged resources are answered by status 304 without body
+    and are not validated again.
+
+    Args:
+        server_url: The server's base URL.
+        debug: Whether to output debug logs.
+        pool_connections: Number of per-host connection pools to cache.
+        pool_maxsize: Maximum number of connections kept per host.
+            Threads exceeding this limit wait for a free connection.
+        connect_timeout: Timeout in seconds for establishing a connection.
+        read_timeout: Timeout in seconds for reading a response,
+            `None` means wait forever.
+        stream_read_timeout: Timeout in seconds for reading the next
+            line of an event stream. Servers send keep-alive comments
+            while no events occur, so a stream that stays silent for
+            longer is considered lost. `None` means wait forever.
+        keep_alive: Whether to keep connections open between calls.
+        validator_cache_size: Maximum number of responses kept for
+            conditional requests, zero disables conditional requests.
+    """
+
+    def __init__(
+        self,
+        server_url: str,
+        debug: bool = False,
+        pool_connections: int = DEFAULT_POOL_CONNECTIONS,
+        pool_maxsize: int = DEFAULT_POOL_MAXSIZE,
+        connect_timeout: Optional[float] = DEFAULT_CONNECT_TIMEOUT,
+        read_timeout: Optional[float] = DEFAULT_READ_TIMEOUT,
+        stream_read_timeout: Optional[float] = DEFAULT_STREAM_READ_TIMEOUT,
+        keep_alive: bool = True,
+        validator_cache_size: int = DEFAULT_VALIDATOR_CACHE_SIZE,
+    ):
         self.server_url = server_url
         self.debug = debug
+        self.pool_connections = pool_connections
+        self.pool_maxsize = pool_maxsize
+        self.timeout = (connect_timeout, read_timeout)
+        self.stream_read_timeout = stream_read_timeout
+        self.keep_alive = keep_alive
+        self.validator_cache = ValidatorCache(validator_cache_size)
+        self._adapter: Optional[HTTPAdapter] = None
+        self._adapter_lock = threading.Lock()
+        # requests' sessions are not guaranteed to be thread-safe,
+        # therefore each thread gets its own session, but all
+        # sessions share the same connection pool (adapter),
+        # which is thread-safe.
+        self._local = threading.local()
+
+    @property
+    def session(self) -> requests.Session:
+        """The HTTP session of the current thread."""
+        session: Optional[requests.Session] = getattr(self._local, "session", None)
+        if session is None:
+            session = requests.Session()
+            adapter = self._get_adapter()
+            session.mount("http://", adapter)
+            session.mount("https://", adapter)
+            if not self.keep_alive:
+                session.headers["Connection"] = "close"
+            self._local.session = session
+        return session
+
+    def close(self) -> None:
+        """Close all pooled connections."""
+        with self._adapter_lock:
+            if self._adapter is not None:
+                self._adapter.close()
+                self._adapter = None
+        self._local = threading.local()
+
+    def _get_adapter(self) -> HTTPAdapter:
+        with self._adapter_lock:
+            if self._adapter is None:
+                self._adapter = HTTPAdapter(
+                    pool_connections=self.pool_connections,
+                    pool_maxsize=self.pool_maxsize,
+                    pool_block=True,
+                )
+            return self._adapter
 
     def call(
         self,
@@ -55,52 +193,462 @@ class DefaultTransport(Transport):
         request: BaseModel | None,
         return_types: dict[str, type | None],
         error_types: dict[str, type | None],
+        header_params: Optional[dict[str, Any]] = None,
     ) -> Any:
-        url = f"{self.server_url}{uri_template.expand(path, **path_params)}"
+        url = _get_url(self.server_url, path, path_params)
 
         t0 = time.time()
         try:
             return _call(
+                self.session,
                 url,
                 method,
                 query_params,
                 request,
                 return_types,
                 error_types,
+                self.timeout,
+                self.validator_cache,
+                header_params,
+            )
+        finally:
+            if self.debug:
+                _log_call(t0, url, path, method, path_params, query_params, request)
+
+    def stream(
+        self,
+        path,
+        method: Literal["get", "post", "put", "delete"],
+        path_params: dict[str, Any],
+        query_params: dict[str, Any],
+        request: BaseModel | None,
+        return_types: dict[str, type | None],
+        error_types: dict[str, type | None],
+    ) -> Iterator[Any]:
+        url = _get_url(self.server_url, path, path_params)
+        if self.debug:
+            _log_call(
+                time.time(), url, path, method, path_params, query_params, request
+            )
+        connect_timeout, _ = self.timeout
+        with self.session.request(
+            method.upper(),
+            url,
+            params=query_params,
+            json=_get_request_data(request),
+            headers={"Accept": EVENT_STREAM_MEDIA_TYPE},
+            # Events may arrive with arbitrary delays
+            timeout=(connect_timeout, self.stream_read_timeout),
+            stream=True,
+        ) as response:
+            if not response.ok:
+                _get_response_value(
+                    response.status_code,
+                    response.ok,
+                    response.reason,
+                    response.headers,
+                    _get_json_or_none(response.content),
+                    return_types,
+                )
+            return_type = return_types.get(str(response.status_code))
+            for data in _parse_events(
+                response.iter_lines(decode_unicode=True, delimiter="\n")
+            ):
+                yield _validate_event_data(data, return_type)
+
+
+class AsyncTransport(ABC):
+    """Abstraction of the asynchronous transport
+    that calls the S2GOS web API.
+    """
+
+    @abstractmethod
+    async def call(
+        self,
+        path: str,
+        method: Literal["get", "post", "put", "delete"],
+        path_params: dict[str, Any],
+        query_params: dict[str, Any],
+        request: BaseModel | None,
+        return_types: dict[str, type | None],
+        error_types: dict[str, type | None],
+        header_params: Optional[dict[str, Any]] = None,
+    ) -> Any:
+        """
+        Call the S2GOS web API with the given endpoint
+        `path`, `method`, `params`, etc. Then validate the response
+        and return an instance of one of the types given by
+        `return_types`. Header parameters whose value is `None`
+        are not sent.
+        """
+
+    def stream(
+        self,
+        path: str,
+        method: Literal["get", "post", "put", "delete"],
+        path_params: dict[str, Any],
+        query_params: dict[str, Any],
+        request: BaseModel | None,
+        return_types: dict[str, type | None],
+        error_types: dict[str, type | None],
+    ) -> AsyncIterator[Any]:
+        """
+        Call the S2GOS web API endpoint that responds with a
+        stream of server-sent events and return an asynchronous
+        iterator over the event data, each validated against
+        the type given by `return_types`.
+        The default implementation raises `NotImplementedError`.
+        """
+        raise NotImplementedError("streaming is not supported by this transport")
+
+    async def close(self) -> None:
+        """Release any resources held by this transport.
+        The default implementation does nothing.
+        """
+
+
+class DefaultAsyncTransport(AsyncTransport):
+    """The concrete asynchronous S2GOS web API transport.
+
+    All calls share a single pool of keep-alive connections.
+    If `http2` is enabled, concurrent calls are multiplexed
+    over the same connection, which allows a single event loop
+    to drive many concurrent calls using few connections.
+
+    The transport should be used from a single event loop only.
+    Like `DefaultTransport`, it sends conditional GET requests
+    for resources it has received before.
+
+    Args:
+        server_url: The server's base URL.
+        debug: Whether to output debug logs.
+        pool_connections: Number of per-host connection pools to cache.
+            Unused, as the pool of the underlying HTTP client
+            is not partitioned by host.
+        pool_maxsize: Maximum number of connections kept alive.
+        connect_timeout: Timeout in seconds for establishing a connection.
+        read_timeout: Timeout in seconds for reading a response,
+            `None` means wait forever.
+        stream_read_timeout: Timeout in seconds for reading the next
+            line of an event stream. Servers send keep-alive comments
+            while no events occur, so a stream that stays silent for
+            longer is considered lost. `None` means wait forever.
+        keep_alive: Whether to keep connections open between calls.
+        http2: Whether to enable HTTP/2. Requires the `h2` package.
+        validator_cache_size: Maximum number of responses kept for
+            conditional requests, zero disables conditional requests.
+    """
+
+    def __init__(
+        self,
+        server_url: str,
+        debug: bool = False,
+        pool_connections: int = DEFAULT_POOL_CONNECTIONS,
+        pool_maxsize: int = DEFAULT_POOL_MAXSIZE,
+        connect_timeout: Optional[float] = DEFAULT_CONNECT_TIMEOUT,
+        read_timeout: Optional[float] = DEFAULT_READ_TIMEOUT,
+        stream_read_timeout: Optional[float] = DEFAULT_STREAM_READ_TIMEOUT,
+        keep_alive: bool = True,
+        http2: bool = False,
+        validator_cache_size: int = DEFAULT_VALIDATOR_CACHE_SIZE,
+    ):
+        self.server_url = server_url
+        self.debug = debug
+        self.pool_connections = pool_connections
+        self.pool_maxsize = pool_maxsize
+        self.timeout = (connect_timeout, read_timeout)
+        self.stream_read_timeout = stream_read_timeout
+        self.keep_alive = keep_alive
+        self.http2 = http2
+        self.validator_cache = ValidatorCache(validator_cache_size)
+        self._client: Optional[httpx.AsyncClient] = None
+
+    @property
+    def client(self) -> httpx.AsyncClient:
+        """The HTTP client of this transport."""
+        if self._client is None:
+            connect_timeout, read_timeout = self.timeout
+            self._client = httpx.AsyncClient(
+                http2=self.http2,
+                limits=httpx.Limits(
+                    max_connections=None,
+                    max_keepalive_connections=(
+                        self.pool_maxsize if self.keep_alive else 0
+                    ),
+                ),
+                timeout=httpx.Timeout(None, connect=connect_timeout, read=read_timeout),
+            )
+        return self._client
+
+    async def close(self) -> None:
+        """Close all pooled connections."""
+        if self._client is not None:
+            client = self._client
+            self._client = None
+            await client.aclose()
+
+    async def call(
+        self,
+        path,
+        method: Literal["get", "post", "put", "delete"],
+        path_params: dict[str, Any],
+        query_params: dict[str, Any],
+        request: BaseModel | None,
+        return_types: dict[str, type | None],
+        error_types: dict[str, type | None],
+        header_params: Optional[dict[str, Any]] = None,
+    ) -> Any:
+        url = _get_url(self.server_url, path, path_params)
+
+        t0 = time.time()
+        try:
+            cache_key, cache_entry = self.validator_cache.lookup(
+                method, url, query_params
+            )
+            response = await self.client.request(
+                method.upper(),
+                url,
+                # Unlike requests, httpx sends None values as empty strings
+                params={k: v for k, v in query_params.items() if v is not None},
+                json=_get_request_data(request),
+                **_get_header_kwargs(header_params, cache_entry),
             )
+            if response.status_code == 304 and cache_entry is not None:
+                return cache_entry.get_value()
+            value = _get_response_value(
+                response.status_code,
+                response.is_success,
+                response.reason_phrase,
+                response.headers,
+                response.json(),
+                return_types,
+            )
+            self.validator_cache.update(cache_key, response.headers, value)
+            return value
         finally:
             if self.debug:
-                logger.debug(
-                    "Calling service API took "
-                    f"{round(1000 * (time.time() - t0))} milliseconds:\n"
-                    "  url: %s\n"
-                    "  path: %s\n"
-                    "  method: %s\n"
-                    "  path_params: %s\n"
-                    "  query_params: %s\n"
-                    "  request: %s\n"
-                    "  return_types: %s\n",
-                    # "  error_types: %s",
-                    url,
-                    path,
-                    method,
-                    path_params,
-                    query_params,
-                    request,
+                _log_call(t0, url, path, method, path_params, query_params, request)
+
+    async def stream(
+        self,
+        path,
+        method: Literal["get", "post", "put", "delete"],
+        path_params: dict[str, Any],
+        query_params: dict[str, Any],
+        request: BaseModel | None,
+        return_types: dict[str, type | None],
+        error_types: dict[str, type | None],
+    ) -> AsyncIterator[Any]:
+        url = _get_url(self.server_url, path, path_params)
+        if self.debug:
+            _log_call(
+                time.time(), url, path, method, path_params, query_params, request
+            )
+        connect_timeout, _ = self.timeout
+        async with self.client.stream(
+            method.upper(),
+            url,
+            params={k: v for k, v in query_params.items() if v is not None},
+            json=_get_request_data(request),
+            headers={"Accept": EVENT_STREAM_MEDIA_TYPE},
+            # Events may arrive with arbitrary delays
+            timeout=httpx.Timeout(
+                None, connect=connect_timeout, read=self.stream_read_timeout
+            ),
+        ) as response:
+            if not response.is_success:
+                await response.aread()
+                _get_response_value(
+                    response.status_code,
+                    response.is_success,
+                    response.reason_phrase,
+                    response.headers,
+                    _get_json_or_none(response.content),
                     return_types,
-                    # error_types,
                 )
+            return_type = return_types.get(str(response.status_code))
+            lines: list[str] = []
+            async for line in response.aiter_lines():
+                lines.append(line)
+                if line == "":
+                    for data in _parse_events(lines):
+                        yield _validate_event_data(data, return_type)
+                    lines = []
+            for data in _parse_events(lines):
+                yield _validate_event_data(data, return_type)
+
+
+class ValidatorCache:
+    """A thread-safe, size-limited cache of GET responses and their
+    validators `ETag` and `Last-Modified`, used to send conditional
+    requests. The least recently used responses are evicted first.
+
+    Args:
+        max_size: Maximum number of cached responses,
+            zero disables the cache.
+    """
+
+    class Entry(NamedTuple):
+        etag: Optional[str]
+        last_modified: Optional[str]
+        value: Any
+
+        def get_request_headers(self) -> dict[str, str]:
+            """Get the headers of a conditional request."""
+            headers = {}
+            if self.etag is not None:
+                headers["If-None-Match"] = self.etag
+            if self.last_modified is not None:
+                headers["If-Modified-Since"] = self.last_modified
+            return headers
+
+        def get_value(self) -> Any:
+            """Get a copy of the cached value.
+            Note, the copy is shallow.
+            """
+            return _copy_value(self.value)
+
+    def __init__(self, max_size: int = DEFAULT_VALIDATOR_CACHE_SIZE):
+        self.max_size = max_size
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[tuple, ValidatorCache.Entry] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def lookup(
+        self, method: str, url: str, query_params: dict[str, Any]
+    ) -> tuple[Optional[tuple], Optional["ValidatorCache.Entry"]]:
+        """Get the cache key for a call and the cached entry, if any.
+        The key is `None` if the call's response is not cacheable.
+        """
+        if self.max_size <= 0 or method != "get":
+            return None, None
+        key = (
+            url,
+            tuple(
+                sorted((k, str(v)) for k, v in query_params.items() if v is not None)
+            ),
+        )
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+        return key, entry
+
+    def update(self, key: Optional[tuple], headers: Mapping[str, str], value: Any):
+        """Cache the value of a successful response given its `headers`.
+        Nothing is cached if the response has no validators.
+        """
+        if key is None:
+            return
+        etag = headers.get("ETag")
+        last_modified = headers.get("Last-Modified")
+        with self._lock:
+            if etag is None and last_modified is None:
+                self._entries.pop(key, None)
+                return
+            self._entries[key] = ValidatorCache.Entry(
+                etag, last_modified, _copy_value(value)
+            )
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def clear(self):
+        """Remove all cached responses."""
+        with self._lock:
+            self._entries.clear()
+
+
+def _get_header_kwargs(
+    header_params: Optional[dict[str, Any]],
+    cache_entry: Optional[ValidatorCache.Entry],
+) -> dict[str, Any]:
+    headers = {
+        name: str(value)
+        for name, value in (header_params or {}).items()
+        if value is not None
+    }
+    if cache_entry is not None:
+        headers.update(cache_entry.get_request_headers())
+    return {"headers": headers} if headers else {}
+
+
+def _copy_value(value: Any) -> Any:
+    if isinstance(value, BaseModel):
+        return value.model_copy()
+    return value
+
+
+def _get_url(server_url: str, path: str, path_params: dict[str, Any]) -> str:
+    return f"{server_url}{uri_template.expand(path, **path_params)}"
+
+
+def _log_call(
+    t0: float,
+    url: str,
+    path: str,
+    method: str,
+    path_params: dict[str, Any],
+    query_params: dict[str, Any],
+    request: BaseModel | None,
+):
+    logger.debug(
+        "Calling service API took "
+        f"{round(1000 * (time.time() - t0))} milliseconds:\n"
+        "  url: %s\n"
+        "  path: %s\n"
+        "  method: %s\n"
+        "  path_params: %s\n"
+        "  query_params: %s\n"
+        "  request: %s\n",
+        url,
+        path,
+        method,
+        path_params,
+        query_params,
+        request,
+    )
 
 
 def _call(
+    session: requests.Session,
     url: str,
     method: Literal["get", "post", "put", "delete"],
     query_params: dict[str, Any],
     request: BaseModel | None,
     return_types: dict[str, type | None],
     _error_types: dict[str, type | None],
+    timeout: tuple[Optional[float], Optional[float]],
+    validator_cache: "ValidatorCache",
+    header_params: Optional[dict[str, Any]] = None,
 ) -> Any:
-    data = (
+    cache_key, cache_entry = validator_cache.lookup(method, url, query_params)
+    response = session.request(
+        method.upper(),
+        url,
+        params=query_params,
+        json=_get_request_data(request),
+        timeout=timeout,
+        **_get_header_kwargs(header_params, cache_entry),
+    )
+    if response.status_code == 304 and cache_entry is not None:
+        return cache_entry.get_value()
+    value = _get_response_value(
+        response.status_code,
+        response.ok,
+        response.reason,
+        response.headers,
+        response.json(),
+        return_types,
+    )
+    validator_cache.update(cache_key, response.headers, value)
+    return value
+
+
+def _get_request_data(request: BaseModel | None) -> Any:
+    return (
         request.model_dump(
             mode="json", by_alias=True, exclude_none=True, exclude_defaults=True
         )
@@ -108,17 +656,17 @@ def _call(
         else request
     )
 
-    response = requests.request(
-        method.upper(),
-        url,
-        params=query_params,
-        json=data,
-    )
-
-    response_value = response.json()
 
-    if response.ok:
-        status_key = str(response.status_code)
+def _get_response_value(
+    status_code: int,
+    ok: bool,
+    reason: str,
+    headers: Mapping[str, str],
+    response_value: Any,
+    return_types: dict[str, type | None],
+) -> Any:
+    if ok:
+        status_key = str(status_code)
         return_type = return_types.get(status_key)
         if (
             return_type is not None
@@ -135,4 +683,66 @@ def _call(
                 title=response_value.get("title"),
                 detail=response_value.get("detail"),
             )
-        raise ClientException(response.status_code, response.reason, **kwargs)
+        raise ClientException(
+            status_code,
+            reason,
+            retry_after=_parse_retry_after(headers.get("Retry-After")),
+            **kwargs,
+        )
+
+
+def _get_json_or_none(content: bytes) -> Any:
+    try:
+        return json.loads(content)
+    except ValueError:
+        return None
+
+
+def _parse_events(lines: Iterable[str]) -> Iterator[str]:
+    """Parse lines of a server-sent event stream and
+    yield the data of each event.
+    Comments (e.g., keep-alive messages) are ignored.
+    """
+    data_lines: list[str] = []
+    for line in lines:
+        line = line.rstrip("\r")
+        if not line:
+            if data_lines:
+                yield "\n".join(data_lines)
+                data_lines = []
+        elif line.startswith(":"):
+            continue
+        else:
+            field, _, value = line.partition(":")
+            if field == "data":
+                data_lines.append(value[1:] if value.startswith(" ") else value)
+    if data_lines:
+        yield "\n".join(data_lines)
+
+
+def _validate_event_data(data: str, return_type: type | None) -> Any:
+    if (
+        return_type is not None
+        and inspect.isclass(return_type)
+        and issubclass(return_type, BaseModel)
+    ):
+        return return_type.model_validate_json(data)
+    return json.loads(data)
+
+
+def _parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Parse the value of a "Retry-After" header, which is either
+    a number of seconds or an HTTP date.
+    """
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except (TypeError, ValueError):
+        pass
+    try:
+        retry_time = email.utils.parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    now = datetime.datetime.now(tz=retry_time.tzinfo or datetime.timezone.utc)
+    return max(0.0, (retry_time - now).total_seconds())
@@ -15,6 +15,7 @@ from pydantic import (
     Field,
     PositiveFloat,
     RootModel,
+    confloat,
     conint,
 )
 
@@ -55,6 +56,10 @@ class Link(BaseModel):
     title: Optional[str] = None
 
 
+class JobIdList(BaseModel):
+    jobIds: list[str]
+
+
 class MaxOccurs(Enum):
     unbounded = "unbounded"
 
@@ -186,6 +191,18 @@ class JobInfo(BaseModel):
     progress: Optional[conint(ge=0, le=100)] = None
     links: Optional[list[Link]] = None
     traceback: Optional[list[str]] = None
+    queueDepth: Optional[conint(ge=0)] = Field(
+        None,
+        description="Number of jobs queued for execution before this job, while the job has not started yet.",
+    )
+    waitTime: Optional[confloat(ge=0.0)] = Field(
+        None,
+        description="Estimated number of seconds until the job starts, while the job has not started yet, otherwise the number of seconds the job waited for its execution.",
+    )
+    eta: Optional[datetime] = Field(
+        None,
+        description="Estimated date-time at which the job finishes, while the job has not finished yet.",
+    )
 
 
 class AdditionalParameters(Metadata):
@@ -253,6 +270,20 @@ class JobList(BaseModel):
     links: list[Link]
 
 
+class JobBatchItem(BaseModel):
+    """
+    Either the job's status information or an error.
+    """
+
+    jobID: str
+    jobInfo: Optional[JobInfo] = None
+    error: Optional[ApiError] = None
+
+
+class JobBatchResponse(BaseModel):
+    jobs: list[JobBatchItem]
+
+
 class ProcessSummary(DescriptionType):
     id: str
     version: str
@@ -299,6 +330,14 @@ class ProcessRequest(BaseModel):
     outputs: Optional[dict[str, Output]] = None
     response: Optional[Response] = Response.raw
     subscriber: Optional[Subscriber] = None
+    priority: Optional[int] = Field(
+        0,
+        description="Priority of the job. Jobs of higher priority start first.",
+    )
+    userName: Optional[str] = Field(
+        None,
+        description="Name of the user who submits the job. Jobs of equal priority are shared fairly among users.",
+    )
 
 
 class JobResults(RootModel[Optional[dict[str, InlineOrRefValue]]]):
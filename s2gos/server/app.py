@@ -2,16 +2,66 @@
 #  Permissions are hereby granted under the terms of the Apache 2.0 License:
 #  https://opensource.org/license/apache-2-0.
 
+import contextlib
+import functools
 import logging
 import time
-from typing import Awaitable, Callable
+from typing import Any, AsyncIterator, Awaitable, Callable
 
 from fastapi import FastAPI, Request, Response
 from fastapi.responses import JSONResponse
+from fastapi.routing import APIRoute
+from pydantic import BaseModel
 
+from .conditional import get_not_modified_headers, is_not_modified
 from .exceptions import JSONContentException
+from .provider import ServiceProvider
+from .resource_cache import ResourceCache
 
-app = FastAPI()
+# Paths of the resources that change rarely,
+# so their JSON encodings are cached
+CACHED_RESOURCE_PATHS = frozenset(
+    {"/", "/conformance", "/processes", "/processes/{processID}"}
+)
+
+resource_cache = ResourceCache()
+
+
+class CachedResourceRoute(APIRoute):
+    """A route that sends the models returned by its endpoint
+    using their cached JSON encodings and entity tags,
+    if its path is one of `CACHED_RESOURCE_PATHS`.
+    """
+
+    def __init__(self, path: str, endpoint: Callable[..., Any], **kwargs):
+        if path in CACHED_RESOURCE_PATHS:
+            endpoint = _with_cached_encoding(endpoint)
+        super().__init__(path, endpoint, **kwargs)
+
+
+def _with_cached_encoding(
+    endpoint: Callable[..., Awaitable[Any]],
+) -> Callable[..., Awaitable[Any]]:
+    # Keeps the signature FastAPI gets the endpoint's parameters from
+    @functools.wraps(endpoint)
+    async def _endpoint(*args, **kwargs) -> Any:
+        content = await endpoint(*args, **kwargs)
+        if isinstance(content, BaseModel):
+            return resource_cache.get_response(content)
+        return content
+
+    return _endpoint
+
+
+@contextlib.asynccontextmanager
+async def lifespan(_app: FastAPI) -> AsyncIterator[None]:
+    yield
+    # Stop the service's background threads and processes
+    ServiceProvider.close()
+
+
+app = FastAPI(lifespan=lifespan)
+app.router.route_class = CachedResourceRoute
 
 
 @app.exception_handler(JSONContentException)
@@ -21,6 +71,7 @@ async def json_http_exception_handler(
     return JSONResponse(
         status_code=exc.status_code,
         content=exc.content.model_dump(mode="json"),
+        headers=exc.headers,
     )
 
 
@@ -47,6 +98,26 @@ async def log_request_duration(
     return response
 
 
+@app.middleware("http")
+async def handle_conditional_request(
+    request: Request, call_next: Callable[[Request], Awaitable[Response]]
+) -> Response:
+    response = await call_next(request)
+
+    # Send 304 without body, if the client's representation
+    # is still valid according to the response's validators
+    if (
+        request.method in ("GET", "HEAD")
+        and response.status_code == 200
+        and is_not_modified(request.headers, response.headers)
+    ):
+        return Response(
+            status_code=304, headers=get_not_modified_headers(response.headers)
+        )
+
+    return response
+
+
 class EndpointFilter(logging.Filter):
     def filter(self, record: logging.LogRecord) -> bool:
         # Suppress log if it's an access log for /jobs
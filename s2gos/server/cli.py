@@ -3,12 +3,19 @@
 #  https://opensource.org/license/apache-2-0.
 
 import os
+import tempfile
 from typing import Optional
 
 import typer
 
 from s2gos import __version__
-from s2gos.server.constants import S2GOS_SERVICE_ENV_VAR
+from s2gos.server.constants import (
+    S2GOS_CPUS_ENV_VAR,
+    S2GOS_JOB_STORE_ENV_VAR,
+    S2GOS_MEMORY_ENV_VAR,
+    S2GOS_RESULT_CACHE_DIR_ENV_VAR,
+    S2GOS_SERVICE_ENV_VAR,
+)
 from s2gos.server.defaults import DEFAULT_HOST, DEFAULT_PORT
 
 cli = typer.Typer()
@@ -25,9 +32,38 @@ def run(
     host: str = DEFAULT_HOST,
     port: int = DEFAULT_PORT,
     service: Optional[str] = None,
+    job_store: Optional[str] = None,
+    workers: int = 1,
+    cpus: Optional[float] = None,
+    memory: Optional[str] = None,
+    result_cache_dir: Optional[str] = None,
 ):
-    """Run server in production mode."""
-    run_server(host=host, port=port, service=service, reload=False)
+    """Run server in production mode.
+
+    With more than one worker process, jobs are shared through
+    an SQLite job store, which is created in the temporary
+    directory if no job store is given.
+
+    If the number of CPU cores or the memory size (e.g., "16GB")
+    of the node is given, jobs are packed according to the
+    resources their processes require.
+
+    If a result cache directory is given, the results of deterministic
+    processes are cached there too, and shared by the worker processes.
+    """
+    if workers > 1 and not job_store:
+        job_store = get_default_job_store_url(port)
+    run_server(
+        host=host,
+        port=port,
+        service=service,
+        job_store=job_store,
+        workers=workers,
+        cpus=cpus,
+        memory=memory,
+        result_cache_dir=result_cache_dir,
+        reload=False,
+    )
 
 
 @cli.command()
@@ -35,9 +71,16 @@ def dev(
     host: str = DEFAULT_HOST,
     port: int = DEFAULT_PORT,
     service: Optional[str] = None,
+    job_store: Optional[str] = None,
 ):
     """Run server in development mode."""
-    run_server(host=host, port=port, service=service, reload=True)
+    run_server(host=host, port=port, service=service, job_store=job_store, reload=True)
+
+
+def get_default_job_store_url(port: int) -> str:
+    """Get the URL of the job store shared by multiple worker processes."""
+    path = os.path.join(tempfile.gettempdir(), f"s2gos-jobs-{port}.db")
+    return f"sqlite:///{path}"
 
 
 def run_server(**kwargs):
@@ -47,6 +90,25 @@ def run_server(**kwargs):
     if isinstance(service_ref, str) and service_ref:
         os.environ[S2GOS_SERVICE_ENV_VAR] = service_ref
 
+    # Job store URL, e.g., "sqlite:///jobs.db", used by the local service
+    job_store_url = kwargs.pop("job_store", None)
+    if isinstance(job_store_url, str) and job_store_url:
+        os.environ[S2GOS_JOB_STORE_ENV_VAR] = job_store_url
+
+    # Node capacity, used by the local service to pack jobs
+    for name, env_var in (
+        ("cpus", S2GOS_CPUS_ENV_VAR),
+        ("memory", S2GOS_MEMORY_ENV_VAR),
+    ):
+        value = kwargs.pop(name, None)
+        if value is not None:
+            os.environ[env_var] = str(value)
+
+    # Directory of the on-disk tier of the local service's result cache
+    result_cache_dir = kwargs.pop("result_cache_dir", None)
+    if isinstance(result_cache_dir, str) and result_cache_dir:
+        os.environ[S2GOS_RESULT_CACHE_DIR_ENV_VAR] = result_cache_dir
+
     uvicorn.run("s2gos.server.main:app", **kwargs)
 
 
@@ -0,0 +1,80 @@
+#  Copyright (c) 2025 by ESA DTE-S2GOS team and contributors
+#  Permissions are hereby granted under the terms of the Apache 2.0 License:
+#  https://opensource.org/license/apache-2-0.
+
+import datetime
+import email.utils
+from typing import Mapping, Optional
+
+# Headers of a 200 response that are also sent with a 304 response
+NOT_MODIFIED_HEADERS = ("Cache-Control", "ETag", "Expires", "Last-Modified", "Vary")
+
+
+def format_http_date(dt: datetime.datetime) -> str:
+    """Format the given date-time as HTTP date.
+    Naive date-times are interpreted as local times.
+    """
+    return email.utils.format_datetime(
+        dt.astimezone(datetime.timezone.utc), usegmt=True
+    )
+
+
+def is_not_modified(
+    request_headers: Mapping[str, str], response_headers: Mapping[str, str]
+) -> bool:
+    """Evaluate the conditional request headers `If-None-Match` and
+    `If-Modified-Since` against the validators `ETag` and `Last-Modified`
+    of the response to a GET or HEAD request.
+
+    Returns:
+        `True` if the client's representation is up-to-date
+        and a 304 response should be sent instead.
+    """
+    if_none_match = request_headers.get("If-None-Match")
+    if if_none_match is not None:
+        # If-Modified-Since must be ignored if If-None-Match is given
+        etag = response_headers.get("ETag")
+        if etag is None:
+            return False
+        return _matches_etag(if_none_match, etag)
+    if_modified_since = _parse_http_date(request_headers.get("If-Modified-Since"))
+    last_modified = _parse_http_date(response_headers.get("Last-Modified"))
+    if if_modified_since is None or last_modified is None:
+        return False
+    return last_modified <= if_modified_since
+
+
+def get_not_modified_headers(response_headers: Mapping[str, str]) -> dict[str, str]:
+    """Get the headers of a 304 response from the headers of
+    the response it replaces.
+    """
+    return {
+        name: response_headers[name]
+        for name in NOT_MODIFIED_HEADERS
+        if name in response_headers
+    }
+
+
+def _matches_etag(if_none_match: str, etag: str) -> bool:
+    if if_none_match.strip() == "*":
+        return True
+    # If-None-Match uses the weak comparison
+    etag = _strip_weak(etag)
+    return any(_strip_weak(tag) == etag for tag in if_none_match.split(","))
+
+
+def _strip_weak(etag: str) -> str:
+    etag = etag.strip()
+    return etag[2:] if etag.startswith("W/") else etag
+
+
+def _parse_http_date(value: Optional[str]) -> Optional[datetime.datetime]:
+    if not value:
+        return None
+    try:
+        dt = email.utils.parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=datetime.timezone.utc)
+    return dt
@@ -5,3 +5,7 @@
 from typing import Final
 
 S2GOS_SERVICE_ENV_VAR: Final = "S2GOS_SERVICE"
+S2GOS_JOB_STORE_ENV_VAR: Final = "S2GOS_JOB_STORE"
+S2GOS_CPUS_ENV_VAR: Final = "S2GOS_CPUS"
+S2GOS_MEMORY_ENV_VAR: Final = "S2GOS_MEMORY"
+S2GOS_RESULT_CACHE_DIR_ENV_VAR: Final = "S2GOS_RESULT_CACHE_DIR"
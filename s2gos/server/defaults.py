@@ -5,3 +5,46 @@
 
 DEFAULT_HOST = "127.0.0.1"
 DEFAULT_PORT = 8008
+
+DEFAULT_CALLBACK_QUEUE_SIZE = 1000
+DEFAULT_CALLBACK_MAX_CONCURRENCY = 16
+DEFAULT_CALLBACK_MAX_CONCURRENCY_PER_ENDPOINT = 2
+DEFAULT_CALLBACK_MAX_RETRIES = 3
+DEFAULT_CALLBACK_RETRY_DELAY = 0.5
+DEFAULT_CALLBACK_PROGRESS_INTERVAL = 1.0
+DEFAULT_CALLBACK_TIMEOUT = 10.0
+
+DEFAULT_JOB_STORE_FLUSH_INTERVAL = 0.2
+DEFAULT_JOB_STORE_HEARTBEAT_INTERVAL = 5.0
+DEFAULT_JOB_STORE_HEARTBEAT_TIMEOUT = 30.0
+DEFAULT_JOB_STORE_MAX_CLAIMS = 100
+
+DEFAULT_MAX_QUEUE_SIZE = 1000
+DEFAULT_QUEUE_DRAIN_RATE_WINDOW = 60.0
+DEFAULT_QUEUE_RETRY_AFTER = 5
+DEFAULT_QUEUE_MAX_RETRY_AFTER = 600
+
+DEFAULT_SCHEDULING_POLICY = "fair"
+DEFAULT_DEADLINE_FACTOR = 4.0
+DEFAULT_RUNTIME_MODEL_FORGETTING_FACTOR = 0.98
+DEFAULT_RUNTIME_MODEL_SMOOTHING = 0.2
+DEFAULT_RESERVATION_TIMEOUT = 30.0
+DEFAULT_EXECUTOR_MAX_WORKERS = 32
+
+DEFAULT_PROGRESS_INTERVAL = 0.2
+DEFAULT_PROGRESS_DELTA = 1
+
+DEFAULT_RETENTION_MAX_AGE = 7 * 24 * 3600.0
+DEFAULT_RETENTION_MAX_JOBS = 10000
+DEFAULT_RETENTION_MAX_RESULT_MEMORY = 256 * 1024**2
+DEFAULT_REAPER_INTERVAL = 60.0
+
+DEFAULT_RESULT_CACHE_MAX_MEMORY = 64 * 1024**2
+DEFAULT_RESULT_CACHE_MAX_DISK_SIZE = 1024**3
+
+DEFAULT_IDEMPOTENCY_RETRY_AFTER = 1
+
+DEFAULT_SYNC_TIMEOUT = 10.0
+DEFAULT_SYNC_POLL_INTERVAL = 0.5
+
+DEFAULT_ASYNC_MAX_CONCURRENCY = 1000
@@ -2,12 +2,16 @@
 #  Permissions are hereby granted under the terms of the Apache 2.0 License:
 #  https://opensource.org/license/apache-2-0.
 
+from typing import Optional
+
 from fastapi import HTTPException
 
 from s2gos.common.models import ApiError
 
 
 class JSONContentException(HTTPException):
-    def __init__(self, status_code: int, detail: str):
-        super().__init__(status_code=status_code, detail=detail)
+    def __init__(
+        self, status_code: int, detail: str, headers: Optional[dict[str, str]] = None
+    ):
+        super().__init__(status_code=status_code, detail=detail, headers=headers)
         self.content = ApiError(type="error", status=status_code, detail=detail)
@@ -18,3 +18,10 @@ class ServiceProvider:
     def set_instance(cls, service: Service):
         assert isinstance(service, Service)
         cls._service = service
+
+    @classmethod
+    def close(cls):
+        """Close the service, if it has been set and can be closed."""
+        close = getattr(cls._service, "close", None)
+        if callable(close):
+            close()
@@ -0,0 +1,71 @@
+#  Copyright (c) 2025 by ESA DTE-S2GOS team and contributors
+#  Permissions are hereby granted under the terms of the Apache 2.0 License:
+#  https://opensource.org/license/apache-2-0.
+
+import functools
+import hashlib
+import threading
+import weakref
+from typing import NamedTuple
+
+from fastapi.responses import JSONResponse
+from pydantic import BaseModel
+
+
+class EncodedJSONResponse(JSONResponse):
+    """A JSON response whose content is already encoded as bytes,
+    so it is sent as-is without any further serialization.
+    """
+
+    def render(self, content: bytes) -> bytes:
+        return content
+
+
+class EncodedResource(NamedTuple):
+    content: bytes
+    etag: str
+
+
+class ResourceCache:
+    """Caches the JSON encodings of resource models by model identity.
+
+    Services return the same model instance as long as a resource
+    is unchanged, e.g., the description of a process until the process
+    is registered again. A cached encoding is dropped once its model
+    has been garbage-collected. Note that cached models must not be
+    modified in place.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._items: dict[int, tuple[weakref.ref, EncodedResource]] = {}
+
+    def get(self, model: BaseModel) -> EncodedResource:
+        """Get the JSON encoding of the given model and its entity tag,
+        which is a hash of the encoding.
+        """
+        model_id = id(model)
+        with self._lock:
+            item = self._items.get(model_id)
+        if item is not None and item[0]() is model:
+            return item[1]
+        content = model.model_dump_json(by_alias=True).encode("utf-8")
+        resource = EncodedResource(
+            content, '"' + hashlib.sha256(content).hexdigest()[:32] + '"'
+        )
+        model_ref = weakref.ref(model, functools.partial(self._remove, model_id))
+        with self._lock:
+            self._items[model_id] = model_ref, resource
+        return resource
+
+    def get_response(self, model: BaseModel) -> EncodedJSONResponse:
+        """Get a response for the given model with an `ETag` header."""
+        resource = self.get(model)
+        return EncodedJSONResponse(resource.content, headers={"ETag": resource.etag})
+
+    def _remove(self, model_id: int, model_ref: weakref.ref):
+        with self._lock:
+            item = self._items.get(model_id)
+            # The identifier may have been reused by a newer model
+            if item is not None and item[0] is model_ref:
+                del self._items[model_id]
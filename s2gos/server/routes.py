@@ -1,9 +1,13 @@
 # generated by gen_server.py:
 #   filename:  routes.py:
-#   timestamp: 2025-06-23T18:26:32.534138
+#   timestamp: 2026-10-18T11:08:34.614993
 
+from typing import Annotated, Optional
+
+from fastapi import Header
 
 from s2gos.common.models import (
+    JobIdList,
     ProcessRequest,
 )
 
@@ -37,16 +41,58 @@ async def get_process(processID: str):
 
 # noinspection PyPep8Naming
 @app.post("/processes/{processID}/execution")
-async def execute_process(processID: str, request: ProcessRequest):
+async def execute_process(
+    processID: str,
+    request: ProcessRequest,
+    prefer: Annotated[Optional[str], Header(alias="Prefer")] = None,
+    idempotency_key: Annotated[Optional[str], Header(alias="Idempotency-Key")] = None,
+):
     return await ServiceProvider.instance().execute_process(
-        process_id=processID, request=request
+        process_id=processID,
+        request=request,
+        prefer=prefer,
+        idempotency_key=idempotency_key,
     )
 
 
 # noinspection PyPep8Naming
 @app.get("/jobs")
-async def get_jobs():
-    return await ServiceProvider.instance().get_jobs()
+async def get_jobs(
+    limit: int = 10,
+    offset: int = 0,
+    status: Optional[str] = None,
+    processID: Optional[str] = None,
+    created: Optional[str] = None,
+    updated: Optional[str] = None,
+):
+    return await ServiceProvider.instance().get_jobs(
+        limit=limit,
+        offset=offset,
+        status=status,
+        process_id=processID,
+        created=created,
+        updated=updated,
+    )
+
+
+# noinspection PyPep8Naming
+@app.delete("/jobs")
+async def dismiss_jobs(request: JobIdList):
+    return await ServiceProvider.instance().dismiss_jobs(request=request)
+
+
+# noinspection PyPep8Naming
+@app.post("/jobs/status")
+async def get_job_statuses(request: JobIdList):
+    return await ServiceProvider.instance().get_job_statuses(request=request)
+
+
+# noinspection PyPep8Naming
+@app.get("/jobs/events")
+async def get_job_events(jobIds: Optional[str] = None, processID: Optional[str] = None):
+    return await ServiceProvider.instance().get_job_events(
+        job_ids=jobIds, process_id=processID
+    )
 
 
 # noinspection PyPep8Naming
@@ -1,14 +1,17 @@
 # generated by gen_server.py:
 #   filename:  service.py:
-#   timestamp: 2025-06-23T18:26:32.681356
+#   timestamp: 2026-10-18T10:41:29.661468
 
 from abc import ABC, abstractmethod
+from typing import Optional
 
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, StreamingResponse
 
 from s2gos.common.models import (
     Capabilities,
     ConformanceDeclaration,
+    JobBatchResponse,
+    JobIdList,
     JobInfo,
     JobList,
     JobResults,
@@ -32,17 +35,45 @@ class Service(ABC):
         pass
 
     @abstractmethod
-    async def get_process(self, process_id: str) -> JSONResponse | ProcessDescription:
+    async def get_process(self, process_id: str) -> ProcessDescription | JSONResponse:
         pass
 
     @abstractmethod
     async def execute_process(
-        self, process_id: str, request: ProcessRequest
-    ) -> JobInfo | JSONResponse:
+        self,
+        process_id: str,
+        request: ProcessRequest,
+        prefer: Optional[str],
+        idempotency_key: Optional[str],
+    ) -> JobResults | JobInfo | JSONResponse:
         pass
 
     @abstractmethod
-    async def get_jobs(self) -> JobList | JSONResponse:
+    async def get_jobs(
+        self,
+        limit: int,
+        offset: int,
+        status: Optional[str],
+        process_id: Optional[str],
+        created: Optional[str],
+        updated: Optional[str],
+    ) -> JobList | JSONResponse:
+        pass
+
+    @abstractmethod
+    async def dismiss_jobs(self, request: JobIdList) -> JobBatchResponse | JSONResponse:
+        pass
+
+    @abstractmethod
+    async def get_job_statuses(
+        self, request: JobIdList
+    ) -> JobBatchResponse | JSONResponse:
+        pass
+
+    @abstractmethod
+    async def get_job_events(
+        self, job_ids: Optional[str], process_id: Optional[str]
+    ) -> StreamingResponse | JSONResponse:
         pass
 
     @abstractmethod
@@ -54,5 +85,5 @@ class Service(ABC):
         pass
 
     @abstractmethod
-    async def get_job_results(self, job_id: str) -> JSONResponse | JobResults:
+    async def get_job_results(self, job_id: str) -> JobResults | JSONResponse:
         pass
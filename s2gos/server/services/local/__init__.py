@@ -2,7 +2,13 @@
 #  Permissions are hereby granted under the terms of the Apache 2.0 License:
 #  https://opensource.org/license/apache-2-0.
 
-from .job import Job, JobCancelledException, JobContext, get_job_context
+from .job import (
+    Job,
+    JobCancelledException,
+    JobContext,
+    get_job_context,
+    with_job_context,
+)
 from .local_service import LocalService
 from .process_registry import ProcessRegistry
 
@@ -13,4 +19,5 @@ __all__ = [
     "JobContext",
     "ProcessRegistry",
     "get_job_context",
+    "with_job_context",
 ]
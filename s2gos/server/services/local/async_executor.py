@@ -0,0 +1,104 @@
+#  Copyright (c) 2025 by ESA DTE-S2GOS team and contributors
+#  Permissions are hereby granted under the terms of the Apache 2.0 License:
+#  https://opensource.org/license/apache-2-0.
+
+import asyncio
+import threading
+from concurrent.futures import Executor, Future
+from typing import Any, Callable, Coroutine, Optional
+
+from s2gos.server.defaults import DEFAULT_ASYNC_MAX_CONCURRENCY
+
+
+class AsyncExecutor(Executor):
+    """An executor that runs coroutine functions as tasks of an
+    asyncio event loop running in a background thread.
+
+    Unlike the workers of a thread pool, a task occupies no thread
+    while it awaits I/O, so a single executor runs many I/O-bound
+    jobs concurrently. The functions passed to `submit()` must be
+    coroutine functions, their tasks must not block the event loop.
+
+    Args:
+        max_workers: Maximum number of concurrently running tasks,
+            used by the `JobScheduler` that submits jobs to this
+            executor. The executor itself does not limit them.
+    """
+
+    def __init__(self, max_workers: int = DEFAULT_ASYNC_MAX_CONCURRENCY):
+        self._max_workers = max_workers
+        self._lock = threading.Lock()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread: Optional[threading.Thread] = None
+        self._shutdown = False
+
+    def submit(
+        self, fn: Callable[..., Coroutine[Any, Any, Any]], /, *args, **kwargs
+    ) -> Future:
+        """Run the coroutine returned by `fn(*args, **kwargs)` as a task.
+        May be called from any thread.
+
+        Returns:
+            A future that represents the coroutine's return value.
+            Cancelling the future cancels the task.
+        """
+        loop = self._ensure_started()
+        return asyncio.run_coroutine_threadsafe(fn(*args, **kwargs), loop)
+
+    def shutdown(self, wait: bool = True, *, cancel_futures: bool = False):
+        """Stop the event loop, once its tasks are done if `wait` is true.
+        If `cancel_futures` is true, running tasks are cancelled first.
+        """
+        with self._lock:
+            self._shutdown = True
+            loop, thread = self._loop, self._thread
+            self._loop, self._thread = None, None
+        if loop is None or thread is None:
+            return
+        future = asyncio.run_coroutine_threadsafe(
+            self._cancel_tasks() if cancel_futures else self._join_tasks(), loop
+        )
+        if wait:
+            future.result()
+            loop.call_soon_threadsafe(loop.stop)
+            thread.join()
+        else:
+            future.add_done_callback(lambda _f: loop.call_soon_threadsafe(loop.stop))
+
+    def _ensure_started(self) -> asyncio.AbstractEventLoop:
+        with self._lock:
+            if self._shutdown:
+                raise RuntimeError("cannot schedule new tasks after shutdown")
+            if self._loop is None:
+                loop = asyncio.new_event_loop()
+                self._thread = threading.Thread(
+                    target=self._run,
+                    args=(loop,),
+                    name="s2gos-async-jobs",
+                    daemon=True,
+                )
+                self._thread.start()
+                self._loop = loop
+            return self._loop
+
+    @staticmethod
+    def _run(loop: asyncio.AbstractEventLoop):
+        asyncio.set_event_loop(loop)
+        try:
+            loop.run_forever()
+        finally:
+            loop.close()
+
+    @staticmethod
+    async def _join_tasks():
+        current_task = asyncio.current_task()
+        tasks = [t for t in asyncio.all_tasks() if t is not current_task]
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    @classmethod
+    async def _cancel_tasks(cls):
+        current_task = asyncio.current_task()
+        for task in asyncio.all_tasks():
+            if task is not current_task:
+                task.cancel()
+        await cls._join_tasks()
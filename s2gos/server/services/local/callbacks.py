@@ -0,0 +1,237 @@
+#  Copyright (c) 2025 by ESA DTE-S2GOS team and contributors
+#  Permissions are hereby granted under the terms of the Apache 2.0 License:
+#  https://opensource.org/license/apache-2-0.
+
+import asyncio
+import concurrent.futures
+import threading
+from logging import getLogger
+from typing import Optional
+from urllib.parse import urlsplit
+
+import httpx
+from pydantic import BaseModel
+
+from s2gos.common.models import JobInfo
+from s2gos.server.defaults import (
+    DEFAULT_CALLBACK_MAX_CONCURRENCY,
+    DEFAULT_CALLBACK_MAX_CONCURRENCY_PER_ENDPOINT,
+    DEFAULT_CALLBACK_MAX_RETRIES,
+    DEFAULT_CALLBACK_PROGRESS_INTERVAL,
+    DEFAULT_CALLBACK_QUEUE_SIZE,
+    DEFAULT_CALLBACK_RETRY_DELAY,
+    DEFAULT_CALLBACK_TIMEOUT,
+)
+
+logger = getLogger("s2gos")
+
+
+class CallbackDispatcher:
+    """Delivers job notifications to the callback URIs of subscribers
+    as defined by the OGC API - Processes conformance class "callback".
+
+    Notifications are sent by an asyncio event loop running in a
+    background thread, so that job worker threads never block on
+    slow or unreachable receivers. Enqueuing a notification never
+    blocks either: if the queue is full, the notification is dropped.
+
+    Progress notifications are batched: within `progress_interval`,
+    only the latest status of a job is sent to a given URI.
+
+    Args:
+        queue_size: Maximum number of outstanding notifications.
+        max_concurrency: Maximum number of concurrent deliveries.
+        max_concurrency_per_endpoint: Maximum number of concurrent
+            deliveries to the same host.
+        max_retries: Maximum number of retries of a failed delivery.
+        retry_delay: Initial delay in seconds between retries.
+            It doubles with every retry.
+        progress_interval: Interval in seconds in which
+            progress notifications are batched.
+        timeout: Timeout in seconds for a single delivery.
+    """
+
+    def __init__(
+        self,
+        queue_size: int = DEFAULT_CALLBACK_QUEUE_SIZE,
+        max_concurrency: int = DEFAULT_CALLBACK_MAX_CONCURRENCY,
+        max_concurrency_per_endpoint: int = (
+            DEFAULT_CALLBACK_MAX_CONCURRENCY_PER_ENDPOINT
+        ),
+        max_retries: int = DEFAULT_CALLBACK_MAX_RETRIES,
+        retry_delay: float = DEFAULT_CALLBACK_RETRY_DELAY,
+        progress_interval: float = DEFAULT_CALLBACK_PROGRESS_INTERVAL,
+        timeout: float = DEFAULT_CALLBACK_TIMEOUT,
+    ):
+        self.queue_size = queue_size
+        self.max_concurrency = max_concurrency
+        self.max_concurrency_per_endpoint = max_concurrency_per_endpoint
+        self.max_retries = max_retries
+        self.retry_delay = retry_delay
+        self.progress_interval = progress_interval
+        self.timeout = timeout
+        self.num_delivered = 0
+        self.num_failed = 0
+        self.num_dropped = 0
+        self._lock = threading.Lock()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread: Optional[threading.Thread] = None
+        self._queue: Optional[asyncio.Queue[tuple[str, BaseModel]]] = None
+        self._client: Optional[httpx.AsyncClient] = None
+        self._workers: list[asyncio.Task] = []
+        self._semaphores: dict[str, asyncio.Semaphore] = {}
+        self._progress: dict[tuple[str, str], JobInfo] = {}
+
+    def notify(self, job_id: str, url: str, payload: BaseModel):
+        """Send `payload` to `url`. Pending progress notifications
+        of the job given by `job_id` are discarded.
+        May be called from any thread.
+        """
+        loop = self._ensure_started()
+        with self._lock:
+            for key in [key for key in self._progress if key[1] == job_id]:
+                del self._progress[key]
+        loop.call_soon_threadsafe(self._enqueue, url, payload)
+
+    def notify_progress(self, url: str, job_info: JobInfo):
+        """Send the status `job_info` to `url` once the current
+        batching interval elapsed, unless a newer status
+        of the same job is reported until then.
+        May be called from any thread.
+        """
+        loop = self._ensure_started()
+        with self._lock:
+            schedule = not self._progress
+            self._progress[(url, job_info.jobID)] = job_info
+        if schedule:
+            loop.call_soon_threadsafe(
+                loop.call_later, self.progress_interval, self._flush_progress
+            )
+
+    def join(self, timeout: Optional[float] = None):
+        """Wait until all outstanding notifications have been delivered
+        or given up.
+        """
+        loop = self._loop
+        if loop is None:
+            return
+        future = asyncio.run_coroutine_threadsafe(self._drain(), loop)
+        try:
+            future.result(timeout)
+        except concurrent.futures.TimeoutError:
+            logger.warning("Timeout while delivering outstanding callbacks")
+
+    def close(self, timeout: Optional[float] = None):
+        """Deliver outstanding notifications and stop the dispatcher."""
+        self.join(timeout)
+        with self._lock:
+            loop, thread = self._loop, self._thread
+            self._loop, self._thread = None, None
+        if loop is not None and thread is not None:
+            asyncio.run_coroutine_threadsafe(self._shutdown(), loop).result()
+            loop.call_soon_threadsafe(loop.stop)
+            thread.join()
+
+    def _ensure_started(self) -> asyncio.AbstractEventLoop:
+        with self._lock:
+            if self._loop is None:
+                loop = asyncio.new_event_loop()
+                started = threading.Event()
+                self._thread = threading.Thread(
+                    target=self._run,
+                    args=(loop, started),
+                    name="s2gos-callbacks",
+                    daemon=True,
+                )
+                self._thread.start()
+                started.wait()
+                self._loop = loop
+            return self._loop
+
+    def _run(self, loop: asyncio.AbstractEventLoop, started: threading.Event):
+        asyncio.set_event_loop(loop)
+        self._queue = asyncio.Queue(self.queue_size)
+        self._client = httpx.AsyncClient(timeout=self.timeout)
+        self._semaphores = {}
+        self._workers = [
+            loop.create_task(self._work()) for _ in range(self.max_concurrency)
+        ]
+        started.set()
+        try:
+            loop.run_forever()
+        finally:
+            loop.close()
+
+    def _enqueue(self, url: str, payload: BaseModel):
+        try:
+            self._queue.put_nowait((url, payload))
+        except asyncio.QueueFull:
+            self.num_dropped += 1
+            logger.warning(f"Callback queue is full, dropped notification to {url}")
+
+    def _flush_progress(self):
+        with self._lock:
+            progress = self._progress
+            self._progress = {}
+        for (url, _job_id), job_info in progress.items():
+            self._enqueue(url, job_info)
+
+    async def _drain(self):
+        self._flush_progress()
+        await self._queue.join()
+
+    async def _shutdown(self):
+        for worker in self._workers:
+            worker.cancel()
+        await asyncio.gather(*self._workers, return_exceptions=True)
+        await self._client.aclose()
+
+    async def _work(self):
+        while True:
+            url, payload = await self._queue.get()
+            try:
+                await self._deliver(url, payload)
+            except Exception as e:
+                self.num_failed += 1
+                logger.error(f"Failed to deliver notification to {url}: {e}")
+            finally:
+                self._queue.task_done()
+
+    async def _deliver(self, url: str, payload: BaseModel):
+        endpoint = _get_endpoint(url)
+        semaphore = self._semaphores.get(endpoint)
+        if semaphore is None:
+            semaphore = asyncio.Semaphore(self.max_concurrency_per_endpoint)
+            self._semaphores[endpoint] = semaphore
+        content = payload.model_dump_json(by_alias=True, exclude_none=True)
+        error = None
+        for attempt in range(self.max_retries + 1):
+            if attempt > 0:
+                await asyncio.sleep(self.retry_delay * 2 ** (attempt - 1))
+            try:
+                async with semaphore:
+                    response = await self._client.post(
+                        url,
+                        content=content,
+                        headers={"Content-Type": "application/json"},
+                    )
+            except httpx.HTTPError as e:
+                error = f"{type(e).__name__}: {e}"
+                continue
+            if response.is_success:
+                self.num_delivered += 1
+                return
+            error = f"HTTP status {response.status_code}"
+            if not _is_retryable(response.status_code):
+                break
+        self.num_failed += 1
+        logger.warning(f"Failed to deliver notification to {url}: {error}")
+
+
+def _get_endpoint(url: str) -> str:
+    parts = urlsplit(url)
+    return f"{parts.scheme}://{parts.netloc}"
+
+
+def _is_retryable(status_code: int) -> bool:
+    return status_code == 429 or status_code >= 500
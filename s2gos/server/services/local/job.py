@@ -2,27 +2,39 @@
 #  Permissions are hereby granted under the terms of the Apache 2.0 License:
 #  https://opensource.org/license/apache-2-0.
 
+import asyncio
+import contextvars
 import datetime
-import inspect
+import functools
+import math
+import time
 import traceback
 import warnings
 from abc import ABC, abstractmethod
 from concurrent.futures import Future
-from typing import Any, Callable, Optional
+from typing import Any, Callable, NamedTuple, Optional, TypeVar
 
 from s2gos.common.models import (
     JobInfo,
+    JobResults,
     StatusCode,
     Type,
 )
 
+T = TypeVar("T")
+
 
 class JobCancelledException(Exception):
     """Raised if a job's cancellation has been requested."""
 
 
 class JobContext(ABC):
-    """Report task progress and check for task cancellation."""
+    """Report task progress and check for task cancellation.
+
+    The methods never block, so they may also be called by
+    user functions that are coroutine functions. The tasks of
+    such functions are cancelled too if their job is cancelled.
+    """
 
     @abstractmethod
     def report_progress(
@@ -57,14 +69,112 @@ class JobContext(ABC):
         """
 
 
+class ProgressThrottle:
+    """Coalesces progress updates, so that only some of them are
+    published, e.g., to limit the I/O caused by each of them.
+
+    An update is published if the minimum interval elapsed since the
+    last published update and if either the progress changed by at
+    least the delta threshold or the message changed. The latest
+    progress and message are kept, so nothing is lost if the pending
+    update is flushed later, e.g., once the job finished.
+
+    Args:
+        interval: Minimum time in seconds between published updates.
+        delta: Minimum change of the progress in percent,
+            unless the message changed.
+    """
+
+    __slots__ = (
+        "interval",
+        "delta",
+        "progress",
+        "message",
+        "pending",
+        "_published_time",
+        "_published_progress",
+        "_published_message",
+    )
+
+    def __init__(self, interval: float = 0.0, delta: int = 0):
+        self.interval = interval
+        self.delta = delta
+        self.progress: Optional[int] = None
+        self.message: Optional[str] = None
+        # Whether there is an update not published yet
+        self.pending = False
+        self._published_time = -math.inf
+        self._published_progress: Optional[int] = None
+        self._published_message: Optional[str] = None
+
+    def update(self, progress: Optional[int], message: Optional[str]) -> bool:
+        """Record an update.
+
+        Returns:
+            `True` if the update should be published now.
+        """
+        if progress is not None:
+            self.progress = progress
+        if message is not None:
+            self.message = message
+        now = time.monotonic()
+        if now - self._published_time < self.interval or (
+            self.message == self._published_message
+            and self._published_progress is not None
+            and abs((self.progress or 0) - self._published_progress) < self.delta
+        ):
+            self.pending = True
+            return False
+        self._published_time = now
+        self._published_progress = self.progress
+        self._published_message = self.message
+        self.pending = False
+        return True
+
+    def flush(self) -> bool:
+        """Mark a pending update as published.
+
+        Returns:
+            `True` if there was a pending update.
+        """
+        if not self.pending:
+            return False
+        self._published_time = time.monotonic()
+        self._published_progress = self.progress
+        self._published_message = self.message
+        self.pending = False
+        return True
+
+
+class JobSnapshot(NamedTuple):
+    """An immutable snapshot of a job's status information."""
+
+    status_info: JobInfo
+    """A copy of the status information, which must not be changed."""
+    version: int
+    """The job's version at the time the snapshot has been taken."""
+
+
 class Job(JobContext):
     """Represents an execution of a user function.
 
+    The job's status information is changed by the thread running
+    the job. Other threads read the job's `snapshot`, which is
+    replaced atomically on each change, so they see a consistent
+    status without taking locks.
+
+    User functions that are coroutine functions are run by
+    `run_async()` as asyncio tasks, all others by `run()`.
+
     Args:
         process_id: The process identifier.
         job_id: A job identifier.
         function: The user function.
         function_kwargs: The user function's keyword arguments.
+        progress_interval: Minimum time in seconds between
+            published progress updates.
+        progress_delta: Minimum change of the progress in percent
+            for an update to be published, unless the message changed.
     """
 
     def __init__(
@@ -74,6 +184,8 @@ class Job(JobContext):
         job_id: str,
         function: Callable[..., Any],
         function_kwargs: dict[str, Any],
+        progress_interval: float = 0.0,
+        progress_delta: int = 0,
     ):
         self.status_info = JobInfo(
             type=Type.process,
@@ -86,16 +198,58 @@ class Job(JobContext):
         self.function_kwargs = function_kwargs
         self.cancelled = False
         self.future: Optional[Future] = None
+        # The user function's return value, set before the job succeeds
+        self.result: Any = None
+        # Results taken from the result cache instead of calling
+        # the user function, if any
+        self.cached_results: Optional[JobResults] = None
+        # Key of the job's results in the result cache,
+        # if the process is deterministic
+        self.result_key: Optional[str] = None
+        # Whether the result has been released to free memory
+        self.results_released = False
+        # The name of the user who submitted the job
+        self.user_name: Optional[str] = None
+        # Incremented whenever the status information changes
+        self.version = 0
+        # Expected runtime in seconds, if known
+        self.expected_runtime: Optional[float] = None
+        # Coalesces the progress updates reported by the user function
+        self.progress_throttle = ProgressThrottle(progress_interval, progress_delta)
+        self._listeners: list[Callable[["Job"], None]] = []
+        # The task running the job, if the user function is a coroutine function
+        self._task: Optional[asyncio.Task] = None
+        # Replaced with each change, read by other threads
+        self.snapshot = JobSnapshot(self.status_info.model_copy(), self.version)
+
+    def add_listener(self, listener: Callable[["Job"], None]):
+        """Add a listener that is called with this job
+        whenever the job's status information changes.
+        Listeners may be called from any thread.
+        """
+        self._listeners.append(listener)
 
     def report_progress(
         self, progress: Optional[int] = None, message: Optional[str] = None
     ):
-        self.check_cancelled()
-        self.status_info.updated = datetime.datetime.now()
+        if self.cancelled:
+            raise JobCancelledException
+        throttle = self.progress_throttle
+        if throttle.update(progress, message):
+            self._set_progress(throttle.progress, throttle.message)
+
+    def _set_progress(
+        self,
+        progress: Optional[int],
+        message: Optional[str],
+        updated: Optional[datetime.datetime] = None,
+    ):
+        self.status_info.updated = updated or datetime.datetime.now()
         if progress is not None:
             self.status_info.progress = progress
         if message is not None:
             self.status_info.message = message
+        self._notify()
 
     def is_cancelled(self) -> bool:
         return self.cancelled
@@ -107,63 +261,170 @@ class Job(JobContext):
     def cancel(self):
         """Request job cancellation.
         Note, actual cancellation will happen
-        only from within the user function.
+        only from within the user function,
+        or at the next `await` of an async user function.
         """
         self.cancelled = True
+        task = self._task
+        if task is not None:
+            task.get_loop().call_soon_threadsafe(task.cancel)
 
     def run(self):
         """Run this job."""
 
         # Make the job (context) findable by get_job_context()
-        # through the local variable __job_context__
-        __job_context__ = self  # noqa: F841
-
-        self._start_job()
+        token = _current_job_context.set(self)
+        try:
+            self._start_job()
+
+            result = None
+            try:
+                self.check_cancelled()
+                result = self.function(**self.function_kwargs)
+                self.result = result
+                self._finish_job(StatusCode.successful)
+            except JobCancelledException:
+                self._finish_job(StatusCode.dismissed)
+            except Exception as e:
+                self._finish_job(StatusCode.failed, exception=e)
+            return result
+        finally:
+            _current_job_context.reset(token)
+
+    async def run_async(self):
+        """Run this job, whose user function is a coroutine function,
+        in the current task.
+        """
 
-        result = None
+        # Tasks created by the user function inherit the job context
+        token = _current_job_context.set(self)
+        self._task = asyncio.current_task()
         try:
-            self.check_cancelled()
-            result = self.function(**self.function_kwargs)
-            self._finish_job(StatusCode.successful)
-        except JobCancelledException:
-            self._finish_job(StatusCode.dismissed)
-        except Exception as e:
-            self._finish_job(StatusCode.failed, exception=e)
-        return result
-
-    def _start_job(self):
-        self.status_info.started = datetime.datetime.now()
+            self._start_job()
+
+            result = None
+            try:
+                self.check_cancelled()
+                result = await self.function(**self.function_kwargs)
+                self.result = result
+                self._finish_job(StatusCode.successful)
+            except (JobCancelledException, asyncio.CancelledError):
+                self._finish_job(StatusCode.dismissed)
+            except Exception as e:
+                self._finish_job(StatusCode.failed, exception=e)
+            return result
+        finally:
+            self._task = None
+            _current_job_context.reset(token)
+
+    def _start_job(self, started: Optional[datetime.datetime] = None):
+        self.status_info.started = started or datetime.datetime.now()
         self.status_info.status = StatusCode.running
+        self.status_info.queueDepth = None
+        if self.status_info.created is not None:
+            self.status_info.waitTime = max(
+                0.0,
+                (self.status_info.started - self.status_info.created).total_seconds(),
+            )
+        if self.expected_runtime is not None:
+            self.status_info.eta = self.status_info.started + datetime.timedelta(
+                seconds=self.expected_runtime
+            )
+        self._notify()
 
     def _finish_job(
-        self, status_code: StatusCode, exception: Optional[Exception] = None
+        self,
+        status_code: StatusCode,
+        exception: Optional[Exception] = None,
+        message: Optional[str] = None,
+        traceback_lines: Optional[list[str]] = None,
     ):
+        if self.progress_throttle.flush():
+            # The final progress, published with the final status
+            if self.progress_throttle.progress is not None:
+                self.status_info.progress = self.progress_throttle.progress
+            if self.progress_throttle.message is not None:
+                self.status_info.message = self.progress_throttle.message
         self.status_info.finished = datetime.datetime.now()
+        self.status_info.eta = None
         self.status_info.status = status_code
         if exception is not None:
-            self.status_info.message = f"{exception}"
-            self.status_info.traceback = traceback.format_exception(
+            message = f"{exception}"
+            traceback_lines = traceback.format_exception(
                 type(exception), exception, exception.__traceback__
             )
+        if message is not None:
+            self.status_info.message = message
+        if traceback_lines is not None:
+            self.status_info.traceback = traceback_lines
+        self._notify()
+
+    def release_results(self):
+        """Release the user function's return value to free memory.
+        The job's future is released too, as it refers to the value.
+        """
+        self.results_released = True
+        self.result = None
+        self.cached_results = None
+        self.future = None
+
+    def take_snapshot(self):
+        """Publish a new snapshot of the status information
+        after it has been changed by others than this job.
+        """
+        self.snapshot = JobSnapshot(self.status_info.model_copy(), self.version)
+
+    def _notify(self):
+        self.version += 1
+        self.take_snapshot()
+        for listener in self._listeners:
+            listener(self)
+
+
+_current_job_context: contextvars.ContextVar[Optional[JobContext]] = (
+    contextvars.ContextVar("s2gos_job_context", default=None)
+)
 
 
 def get_job_context() -> JobContext:
-    """Get the current job context."""
-    frame = inspect.currentframe()
-    try:
-        while frame:
-            job_context = frame.f_locals.get("__job_context__")
-            if isinstance(job_context, JobContext):
-                return job_context
-            frame = frame.f_back
-    finally:
-        # Always free alive frame-references
-        del frame
-    # noinspection PyUnreachableCode
+    """Get the current job context.
+
+    The job context is set while a job runs. Asyncio tasks created
+    by the job's user function inherit it, threads inherit it
+    if their target is wrapped by `with_job_context()`.
+    """
+    job_context = _current_job_context.get()
+    if job_context is not None:
+        return job_context
     warnings.warn("cannot determine current job context; using non-functional dummy")
     return NullJobContext()
 
 
+def with_job_context(function: Callable[..., T]) -> Callable[..., T]:
+    """Wrap a function so that it runs in the current job context,
+    e.g., in a thread started by a job's user function:
+
+    ```python
+    threading.Thread(target=with_job_context(download), args=(url,)).start()
+    ```
+
+    Args:
+        function: The function to be wrapped.
+
+    Returns:
+        A function that calls `function` in a copy of the current context.
+        Each call uses its own copy, so the function may be called
+        concurrently, e.g., by the workers of a thread pool.
+    """
+    context = contextvars.copy_context()
+
+    @functools.wraps(function)
+    def _run(*args, **kwargs) -> T:
+        return context.copy().run(function, *args, **kwargs)
+
+    return _run
+
+
 class NullJobContext(JobContext):
     """A job context used if a real one could not be provided."""
 
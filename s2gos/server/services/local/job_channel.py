@@ -0,0 +1,362 @@
+#  Copyright (c) 2025 by ESA DTE-S2GOS team and contributors
+#  Permissions are hereby granted under the terms of the Apache 2.0 License:
+#  https://opensource.org/license/apache-2-0.
+
+import datetime
+import functools
+import multiprocessing
+import threading
+import traceback
+from concurrent.futures import Future
+from logging import getLogger
+from typing import Any, Callable, NamedTuple, Optional
+
+from s2gos.common.models import StatusCode
+
+from .job import (
+    Job,
+    JobCancelledException,
+    JobContext,
+    ProgressThrottle,
+    _current_job_context,
+)
+
+logger = getLogger("s2gos")
+
+RemoteJobFunction = Callable[[], "JobOutcome"]
+
+
+class JobOutcome(NamedTuple):
+    """The outcome of a job that ran in a worker process."""
+
+    status: StatusCode
+    """The job's final status."""
+    started: datetime.datetime
+    """The time the job started in the worker process."""
+    result: Any = None
+    """The user function's return value, if the job succeeded."""
+    message: Optional[str] = None
+    """The error message, if the job failed."""
+    traceback: Optional[list[str]] = None
+    """The formatted traceback, if the job failed."""
+
+
+class _RemoteJob:
+    __slots__ = (
+        "job",
+        "cancel_event",
+        "future",
+        "outcome",
+        "exited",
+        "update_lock",
+        "finished",
+    )
+
+    def __init__(self, job: Job, cancel_event: Any, future: Future):
+        self.job = job
+        self.cancel_event = cancel_event
+        self.future = future
+        self.outcome: Optional[JobOutcome] = None
+        # Whether all state changes sent by the worker have been received
+        self.exited = False
+        # Serializes the updates of the job, which call its listeners
+        self.update_lock = threading.Lock()
+        # Whether the outcome has been applied, later updates are outdated
+        self.finished = False
+
+
+class JobChannel:
+    """Connects the jobs that run in the worker processes of a
+    process pool with their `Job` objects in this process.
+
+    Worker processes send the jobs' state changes and progress
+    through a queue, which is read by a thread that updates the
+    jobs here. Cancellation requests are passed to the worker
+    processes by events. Both are shared through a manager process,
+    which is started with the first job. The results are returned
+    by the pool, so they are sent only once. A job's outcome is applied
+    once both the result and the last state change have been received.
+
+    Args:
+        mp_context: Optional multiprocessing context
+            used to start the manager process.
+    """
+
+    def __init__(self, mp_context: Optional[Any] = None):
+        self._mp_context = mp_context
+        self._lock = threading.Lock()
+        self._manager: Optional[Any] = None
+        self._queue: Optional[Any] = None
+        self._thread: Optional[threading.Thread] = None
+        # The jobs not finished yet
+        self._jobs: dict[str, _RemoteJob] = {}
+
+    def submit(self, job: Job, submit: Callable[[RemoteJobFunction], Future]) -> Future:
+        """Submit a job to run in a worker process.
+
+        Args:
+            job: The job.
+            submit: A function that submits the function, which runs
+                the job in a worker process, e.g., to the process pool.
+                The function is picklable if the job's user function
+                and its keyword arguments are.
+
+        Returns:
+            A future that represents the job's result. It is done
+            once the job's status information is final.
+        """
+        job_id = job.status_info.jobID
+        future: Future = Future()
+        with self._lock:
+            self._start()
+            cancel_event = self._manager.Event()
+            if job.cancelled:
+                cancel_event.set()
+            remote_job = self._jobs[job_id] = _RemoteJob(job, cancel_event, future)
+        function = functools.partial(
+            run_job,
+            job_id,
+            job.function,
+            job.function_kwargs,
+            self._queue,
+            cancel_event,
+            job.progress_throttle.interval,
+            job.progress_throttle.delta,
+        )
+        try:
+            remote_future = submit(function)
+        except BaseException:
+            with self._lock:
+                self._jobs.pop(job_id, None)
+            raise
+        remote_future.add_done_callback(lambda f: self._on_done(remote_job, f))
+        return future
+
+    def cancel(self, job_id: str):
+        """Pass the cancellation request of a job to its worker process."""
+        with self._lock:
+            remote_job = self._jobs.get(job_id)
+        if remote_job is not None:
+            try:
+                remote_job.cancel_event.set()
+            except Exception as e:
+                logger.warning(f"Failed to cancel job {job_id!r}: {e}")
+
+    def close(self):
+        """Stop the thread that receives the jobs' state changes
+        and shut down the manager process.
+        """
+        with self._lock:
+            manager, queue, thread = self._manager, self._queue, self._thread
+            self._manager = self._queue = self._thread = None
+        if manager is None:
+            return
+        try:
+            queue.put(None)
+            thread.join(timeout=5)
+        finally:
+            manager.shutdown()
+
+    def _start(self):
+        if self._manager is not None:
+            return
+        mp_context = self._mp_context or multiprocessing.get_context()
+        self._manager = mp_context.Manager()
+        self._queue = self._manager.Queue()
+        self._thread = threading.Thread(
+            target=self._receive,
+            args=(self._queue,),
+            name="s2gos-job-channel",
+            daemon=True,
+        )
+        self._thread.start()
+
+    def _receive(self, queue: Any):
+        while True:
+            try:
+                message = queue.get()
+            except (EOFError, OSError):
+                # The manager process has gone
+                return
+            if message is None:
+                return
+            job_id, kind, args = message
+            with self._lock:
+                remote_job = self._jobs.get(job_id)
+                if remote_job is None:
+                    # The job finished already
+                    continue
+                finish = False
+                if kind == "exited":
+                    remote_job.exited = True
+                    finish = self._take_if_complete(remote_job)
+            # Jobs are updated without holding the lock, because their
+            # listeners may take a while or call back into the channel
+            try:
+                if kind == "started":
+                    self._update(remote_job, remote_job.job._start_job, *args)
+                elif kind == "progress":
+                    self._update(remote_job, remote_job.job._set_progress, *args)
+                elif finish:
+                    self._finish(remote_job)
+            except Exception as e:
+                logger.warning(f"Failed to update job {job_id!r}: {e}")
+
+    def _on_done(self, remote_job: _RemoteJob, remote_future: Future):
+        exited = False
+        try:
+            outcome = remote_future.result()
+        except BaseException as e:
+            # E.g., the pool is broken or the result is not picklable,
+            # so the worker may not send further state changes
+            outcome = JobOutcome(
+                StatusCode.failed,
+                remote_job.job.status_info.started,
+                message=f"{e}",
+                traceback=traceback.format_exception(type(e), e, e.__traceback__),
+            )
+            exited = True
+        with self._lock:
+            remote_job.outcome = outcome
+            remote_job.exited = remote_job.exited or exited
+            finish = self._take_if_complete(remote_job)
+        if finish:
+            self._finish(remote_job)
+
+    def _take_if_complete(self, remote_job: _RemoteJob) -> bool:
+        """Remove the job, if both its outcome and its last state change
+        have been received. Must be called while holding the lock.
+
+        Returns:
+            Whether the caller must finish the job.
+        """
+        if remote_job.outcome is None or not remote_job.exited:
+            return False
+        # State changes received after this point are outdated
+        return self._jobs.pop(remote_job.job.status_info.jobID, None) is not None
+
+    @staticmethod
+    def _update(remote_job: _RemoteJob, update: Callable, *args):
+        with remote_job.update_lock:
+            if not remote_job.finished:
+                update(*args)
+
+    @staticmethod
+    def _finish(remote_job: _RemoteJob):
+        job = remote_job.job
+        outcome = remote_job.outcome
+        with remote_job.update_lock:
+            remote_job.finished = True
+            if job.status_info.status == StatusCode.accepted:
+                job._start_job(outcome.started)
+            job.result = outcome.result
+            job._finish_job(
+                outcome.status,
+                message=outcome.message,
+                traceback_lines=outcome.traceback,
+            )
+        # Runs the future's done-callbacks
+        remote_job.future.set_result(job.result)
+
+
+class RemoteJobContext(JobContext):
+    """The context of a job that runs in a worker process."""
+
+    def __init__(
+        self,
+        job_id: str,
+        queue: Any,
+        cancel_event: Any,
+        progress_throttle: ProgressThrottle,
+    ):
+        self._job_id = job_id
+        self._queue = queue
+        self._cancel_event = cancel_event
+        self._progress_throttle = progress_throttle
+
+    def report_progress(
+        self, progress: Optional[int] = None, message: Optional[str] = None
+    ) -> None:
+        self.check_cancelled()
+        if self._progress_throttle.update(progress, message):
+            self._send_progress()
+
+    def flush_progress(self):
+        """Send a pending progress update."""
+        if self._progress_throttle.flush():
+            self._send_progress()
+
+    def _send_progress(self):
+        throttle = self._progress_throttle
+        self._send(
+            "progress", throttle.progress, throttle.message, datetime.datetime.now()
+        )
+
+    def is_cancelled(self) -> bool:
+        return self._cancel_event.is_set()
+
+    def check_cancelled(self) -> None:
+        if self.is_cancelled():
+            raise JobCancelledException
+
+    def _send(self, kind: str, *args: Any):
+        self._queue.put((self._job_id, kind, args))
+
+
+def run_job(
+    job_id: str,
+    function: Callable[..., Any],
+    function_kwargs: dict[str, Any],
+    queue: Any,
+    cancel_event: Any,
+    progress_interval: float = 0.0,
+    progress_delta: int = 0,
+) -> JobOutcome:
+    """Run a job in a worker process.
+
+    Args:
+        job_id: The job identifier.
+        function: The user function.
+        function_kwargs: The user function's keyword arguments.
+        queue: The queue that receives the job's state changes.
+        cancel_event: The event that is set if the job's
+            cancellation has been requested.
+        progress_interval: Minimum time in seconds between
+            progress updates sent.
+        progress_delta: Minimum change of the progress in percent
+            for an update to be sent, unless the message changed.
+
+    Returns:
+        The job's outcome.
+    """
+    job_context = RemoteJobContext(
+        job_id,
+        queue,
+        cancel_event,
+        ProgressThrottle(progress_interval, progress_delta),
+    )
+
+    # Make the job context findable by get_job_context()
+    token = _current_job_context.set(job_context)
+    try:
+        started = datetime.datetime.now()
+        job_context._send("started", started)
+        try:
+            job_context.check_cancelled()
+            result = function(**function_kwargs)
+            return JobOutcome(StatusCode.successful, started, result=result)
+        except JobCancelledException:
+            return JobOutcome(StatusCode.dismissed, started)
+        except Exception as e:
+            return JobOutcome(
+                StatusCode.failed,
+                started,
+                message=f"{e}",
+                traceback=traceback.format_exception(type(e), e, e.__traceback__),
+            )
+        finally:
+            job_context.flush_progress()
+            # Tells the channel that no further state changes follow
+            job_context._send("exited")
+    finally:
+        _current_job_context.reset(token)
@@ -0,0 +1,183 @@
+#  Copyright (c) 2025 by ESA DTE-S2GOS team and contributors
+#  Permissions are hereby granted under the terms of the Apache 2.0 License:
+#  https://opensource.org/license/apache-2-0.
+
+import asyncio
+import threading
+import time
+from typing import AsyncIterator, Callable, Iterable, Optional
+
+from s2gos.common.models import JobInfo, StatusCode
+
+EVENT_STREAM_MEDIA_TYPE = "text/event-stream"
+
+DEFAULT_KEEP_ALIVE_INTERVAL = 15.0
+DEFAULT_POLL_INTERVAL = 0.5
+
+FINISHED_STATUS_CODES = frozenset(
+    {StatusCode.successful, StatusCode.failed, StatusCode.dismissed}
+)
+
+
+class JobEventSubscription:
+    """A subscription to status changes of jobs.
+
+    Changes are published from arbitrary threads and consumed
+    by a single asyncio task. Changes to the same job that have
+    not been consumed yet are coalesced, so a slow consumer
+    only receives the latest status of each job.
+
+    Args:
+        loop: The event loop of the consuming task.
+        job_ids: Identifiers of the jobs of interest,
+            `None` for all jobs.
+        process_id: Identifier of the process of interest,
+            `None` for all processes.
+    """
+
+    def __init__(
+        self,
+        loop: asyncio.AbstractEventLoop,
+        job_ids: Optional[set[str]] = None,
+        process_id: Optional[str] = None,
+    ):
+        self.job_ids = job_ids
+        self.process_id = process_id
+        self._loop = loop
+        self._pending: dict[str, JobInfo] = {}
+        self._lock = threading.Lock()
+        self._ready = asyncio.Event()
+
+    def matches(self, job_info: JobInfo) -> bool:
+        """Test whether the given job is of interest for this subscription."""
+        return (self.job_ids is None or job_info.jobID in self.job_ids) and (
+            self.process_id is None or job_info.processID == self.process_id
+        )
+
+    def put(self, job_info: JobInfo):
+        """Enqueue the given job status. May be called from any thread."""
+        with self._lock:
+            signal = not self._pending
+            self._pending[job_info.jobID] = job_info
+        if signal:
+            self._loop.call_soon_threadsafe(self._ready.set)
+
+    async def get(self, timeout: Optional[float] = None) -> list[JobInfo]:
+        """Wait for job status changes and return them.
+        Returns an empty list, if no change occurred within `timeout`.
+        """
+        try:
+            await asyncio.wait_for(self._ready.wait(), timeout)
+        except asyncio.TimeoutError:
+            return []
+        with self._lock:
+            self._ready.clear()
+            job_infos = list(self._pending.values())
+            self._pending.clear()
+        return job_infos
+
+
+class JobEventHub:
+    """Fans out job status changes to the subscribers
+    of job event streams.
+    """
+
+    def __init__(self):
+        self._subscriptions: set[JobEventSubscription] = set()
+        self._lock = threading.Lock()
+
+    @property
+    def num_subscriptions(self) -> int:
+        """The number of active subscriptions."""
+        return len(self._subscriptions)
+
+    def subscribe(
+        self, job_ids: Optional[set[str]] = None, process_id: Optional[str] = None
+    ) -> JobEventSubscription:
+        """Subscribe to status changes of jobs.
+        Must be called from within a running event loop.
+        """
+        subscription = JobEventSubscription(
+            asyncio.get_running_loop(), job_ids=job_ids, process_id=process_id
+        )
+        with self._lock:
+            self._subscriptions.add(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription: JobEventSubscription):
+        """Remove the given subscription."""
+        with self._lock:
+            self._subscriptions.discard(subscription)
+
+    def publish(self, job_info: JobInfo):
+        """Publish a job status change. May be called from any thread."""
+        if not self._subscriptions:
+            return
+        with self._lock:
+            subscriptions = list(self._subscriptions)
+        snapshot: Optional[JobInfo] = None
+        for subscription in subscriptions:
+            if subscription.matches(job_info):
+                if snapshot is None:
+                    # The job's status is updated in place,
+                    # so subscribers receive a copy
+                    snapshot = job_info.model_copy()
+                subscription.put(snapshot)
+
+    async def stream(
+        self,
+        subscription: JobEventSubscription,
+        job_infos: Iterable[JobInfo],
+        keep_alive_interval: float = DEFAULT_KEEP_ALIVE_INTERVAL,
+        poll: Optional[Callable[[], list[JobInfo]]] = None,
+        poll_interval: float = DEFAULT_POLL_INTERVAL,
+    ) -> AsyncIterator[str]:
+        """Generate server-sent events for the given subscription,
+        starting with the given current job states.
+
+        If the subscription is restricted to given jobs,
+        the stream ends once all of them are finished.
+        Otherwise, it ends when the client disconnects.
+
+        Changes that are not published to this hub, e.g., of jobs
+        executed by other processes, are obtained by calling `poll`
+        every `poll_interval` seconds, if given. As `poll` may block,
+        e.g., on a job store query, it is called in a worker thread.
+        """
+        unfinished = (
+            set(subscription.job_ids) if subscription.job_ids is not None else None
+        )
+        timeout = (
+            keep_alive_interval
+            if poll is None
+            else min(keep_alive_interval, poll_interval)
+        )
+        try:
+            job_infos = list(job_infos)
+            sent_time = time.monotonic()
+            while True:
+                for job_info in job_infos:
+                    yield format_event(job_info)
+                    if unfinished is not None and job_info.status in (
+                        FINISHED_STATUS_CODES
+                    ):
+                        unfinished.discard(job_info.jobID)
+                if unfinished is not None and not unfinished:
+                    return
+                job_infos = await subscription.get(timeout=timeout)
+                if poll is not None:
+                    job_infos += await asyncio.to_thread(poll)
+                if job_infos:
+                    sent_time = time.monotonic()
+                elif time.monotonic() - sent_time >= keep_alive_interval:
+                    # Comment lines keep idle connections open
+                    yield ": keep-alive\n\n"
+                    sent_time = time.monotonic()
+        finally:
+            self.unsubscribe(subscription)
+
+
+def format_event(job_info: JobInfo) -> str:
+    """Format the given job status as server-sent event."""
+    data = job_info.model_dump_json(by_alias=True, exclude_none=True)
+    return f"event: job\ndata: {data}\n\n"
@@ -0,0 +1,208 @@
+#  Copyright (c) 2025 by ESA DTE-S2GOS team and contributors
+#  Permissions are hereby granted under the terms of the Apache 2.0 License:
+#  https://opensource.org/license/apache-2-0.
+
+import bisect
+import datetime
+import itertools
+import threading
+from typing import Iterable, NamedTuple, Optional
+
+from s2gos.common.models import JobInfo, StatusCode
+
+TimeInterval = tuple[Optional[datetime.datetime], Optional[datetime.datetime]]
+
+
+class _Entry(NamedTuple):
+    seq: int
+    status: StatusCode
+    process_id: Optional[str]
+    created: datetime.datetime
+    updated: datetime.datetime
+
+
+class JobIndex:
+    """Secondary indexes over the jobs of a service that allow
+    paging and filtering the job list without scanning all jobs.
+
+    Jobs are ordered by creation. The index must be updated
+    on each job state transition. It is thread-safe.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._seq = itertools.count()
+        self._entries: dict[str, _Entry] = {}
+        self._by_status: dict[StatusCode, set[str]] = {}
+        self._by_process: dict[Optional[str], set[str]] = {}
+        # Sorted list of (created, seq, job_id), entries of removed
+        # jobs are removed lazily
+        self._by_created: list[tuple[datetime.datetime, int, str]] = []
+        self._num_removed = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def update(self, job_info: JobInfo):
+        """Add the given job or update its indexes."""
+        job_id = job_info.jobID
+        with self._lock:
+            old_entry = self._entries.get(job_id)
+            if old_entry is None:
+                entry = _Entry(
+                    seq=next(self._seq),
+                    status=job_info.status,
+                    process_id=job_info.processID,
+                    created=_get_created(job_info),
+                    updated=get_update_time(job_info),
+                )
+                self._entries[job_id] = entry
+                self._by_status.setdefault(entry.status, set()).add(job_id)
+                self._by_process.setdefault(entry.process_id, set()).add(job_id)
+                bisect.insort(self._by_created, (entry.created, entry.seq, job_id))
+            else:
+                entry = old_entry._replace(
+                    status=job_info.status, updated=get_update_time(job_info)
+                )
+                self._entries[job_id] = entry
+                if entry.status != old_entry.status:
+                    self._by_status[old_entry.status].discard(job_id)
+                    self._by_status.setdefault(entry.status, set()).add(job_id)
+
+    def remove(self, job_id: str):
+        """Remove the given job from the index."""
+        with self._lock:
+            entry = self._entries.pop(job_id, None)
+            if entry is None:
+                return
+            self._by_status[entry.status].discard(job_id)
+            self._by_process[entry.process_id].discard(job_id)
+            self._num_removed += 1
+            if self._num_removed > len(self._entries):
+                self._by_created = [
+                    item for item in self._by_created if item[2] in self._entries
+                ]
+                self._num_removed = 0
+
+    def query(
+        self,
+        offset: int = 0,
+        limit: Optional[int] = None,
+        statuses: Optional[Iterable[StatusCode]] = None,
+        process_ids: Optional[Iterable[str]] = None,
+        created: Optional[TimeInterval] = None,
+        updated: Optional[TimeInterval] = None,
+    ) -> tuple[list[str], bool]:
+        """Get the identifiers of the jobs that match the given
+        filters, ordered by creation.
+
+        Returns:
+            A page of at most `limit` job identifiers starting
+            at `offset`, and whether more jobs are available.
+        """
+        with self._lock:
+            candidates: list[set[str] | list[str]] = []
+            if statuses is not None:
+                candidates.append(_union(self._by_status, statuses))
+            if process_ids is not None:
+                candidates.append(_union(self._by_process, process_ids))
+            if created is not None:
+                candidates.append(self._get_created_in(created))
+
+            if candidates:
+                # Scan the smallest candidate set only
+                candidates.sort(key=len)
+                base, *others = candidates
+                job_ids = sorted(
+                    (job_id for job_id in base if job_id in self._entries),
+                    key=lambda job_id: self._entries[job_id].seq,
+                )
+                others = [set(other) for other in others]
+            else:
+                job_ids = self._entries.keys()
+                others = []
+
+            matching = (
+                job_id
+                for job_id in job_ids
+                if all(job_id in other for other in others)
+                and (updated is None or _is_in(self._entries[job_id].updated, updated))
+            )
+            stop = None if limit is None else offset + limit + 1
+            page = list(itertools.islice(matching, offset, stop))
+
+        if limit is not None and len(page) > limit:
+            return page[:limit], True
+        return page, False
+
+    def _get_created_in(self, interval: TimeInterval) -> list[str]:
+        start, end = interval
+        lo = 0 if start is None else bisect.bisect_left(self._by_created, (start,))
+        hi = (
+            len(self._by_created)
+            if end is None
+            else bisect.bisect_left(
+                self._by_created, (end + datetime.timedelta(microseconds=1),)
+            )
+        )
+        return [item[2] for item in self._by_created[lo:hi]]
+
+
+def parse_interval(value: str) -> TimeInterval:
+    """Parse a time interval of the form `start/end`, where
+    `start` and `end` are ISO 8601 date-times or `..`
+    for an open start or end. A single date-time denotes
+    an instant.
+
+    Raises:
+        ValueError: If the value is not a valid interval.
+    """
+    if "/" in value:
+        start, end = value.split("/", maxsplit=1)
+        return _parse_time(start), _parse_time(end)
+    instant = _parse_time(value)
+    if instant is None:
+        raise ValueError(f"invalid time interval {value!r}")
+    return instant, instant
+
+
+def _parse_time(value: str) -> Optional[datetime.datetime]:
+    value = value.strip()
+    if value in ("", ".."):
+        return None
+    dt = datetime.datetime.fromisoformat(value)
+    if dt.tzinfo is not None:
+        # Job times are naive local times
+        dt = dt.astimezone().replace(tzinfo=None)
+    return dt
+
+
+def _union(index: dict, keys: Iterable) -> set[str]:
+    result: set[str] = set()
+    for key in keys:
+        result.update(index.get(key, ()))
+    return result
+
+
+def _is_in(dt: datetime.datetime, interval: TimeInterval) -> bool:
+    start, end = interval
+    return (start is None or start <= dt) and (end is None or dt <= end)
+
+
+def _get_created(job_info: JobInfo) -> datetime.datetime:
+    return job_info.created or datetime.datetime.now()
+
+
+def get_update_time(job_info: JobInfo) -> datetime.datetime:
+    """Get the time of the latest change of the given job."""
+    times = [
+        dt
+        for dt in (
+            job_info.created,
+            job_info.started,
+            job_info.updated,
+            job_info.finished,
+        )
+        if dt is not None
+    ]
+    return max(times) if times else datetime.datetime.now()
@@ -0,0 +1,195 @@
+#  Copyright (c) 2025 by ESA DTE-S2GOS team and contributors
+#  Permissions are hereby granted under the terms of the Apache 2.0 License:
+#  https://opensource.org/license/apache-2-0.
+
+import collections
+import itertools
+import math
+import threading
+import time
+from typing import NamedTuple, Optional
+
+from s2gos.server.defaults import (
+    DEFAULT_QUEUE_DRAIN_RATE_WINDOW,
+    DEFAULT_QUEUE_MAX_RETRY_AFTER,
+    DEFAULT_QUEUE_RETRY_AFTER,
+)
+
+
+class QueueFullError(Exception):
+    """Raised if a job is rejected because its queue is full.
+
+    Args:
+        message: The error message.
+        retry_after: Number of seconds after which
+            the queue is expected to accept jobs again.
+    """
+
+    def __init__(self, message: str, retry_after: int):
+        super().__init__(message)
+        self.retry_after = retry_after
+
+
+class QueuePosition(NamedTuple):
+    """The position of a job in its queue."""
+
+    depth: int
+    """Number of jobs queued before the job."""
+    wait_time: Optional[float]
+    """Estimated number of seconds until the job starts, if known."""
+
+
+class DrainRate:
+    """Estimates the rate in which jobs leave a queue
+    from the times the most recent jobs left it.
+
+    Args:
+        window: Time window in seconds that is considered.
+        max_samples: Maximum number of samples kept.
+    """
+
+    def __init__(
+        self, window: float = DEFAULT_QUEUE_DRAIN_RATE_WINDOW, max_samples: int = 100
+    ):
+        self.window = window
+        self._times: collections.deque[float] = collections.deque(maxlen=max_samples)
+
+    def record(self, t: Optional[float] = None):
+        """Record that a job left the queue at time `t`."""
+        self._times.append(time.monotonic() if t is None else t)
+
+    def get(self, now: Optional[float] = None) -> Optional[float]:
+        """Get the rate in jobs per second, or `None`
+        if no job left the queue within the time window.
+        """
+        now = time.monotonic() if now is None else now
+        times = self._times
+        while times and now - times[0] > self.window:
+            times.popleft()
+        if not times:
+            return None
+        # Decays while no jobs leave the queue
+        return len(times) / max(now - times[0], 1e-3)
+
+
+class JobQueue:
+    """Tracks the jobs accepted but not started yet and controls
+    the admission of new jobs.
+
+    Queue positions assume that jobs start in the order they have
+    been added. As the scheduler may prefer other jobs, e.g., jobs of
+    higher priority, they are estimates.
+
+    Args:
+        max_size: Maximum number of queued jobs,
+            `None` for an unbounded queue.
+    """
+
+    def __init__(self, max_size: Optional[int] = None):
+        self.max_size = max_size
+        self._lock = threading.Lock()
+        self._counter = itertools.count()
+        # job ID --> (sequence number, process ID) in order of addition
+        self._jobs: dict[str, tuple[int, str]] = {}
+        self._process_sizes: collections.Counter[str] = collections.Counter()
+        self._drain_rate = DrainRate()
+        self._process_drain_rates: dict[str, DrainRate] = {}
+
+    def __len__(self) -> int:
+        return len(self._jobs)
+
+    def get_size(self, process_id: str) -> int:
+        """Get the number of queued jobs of the given process."""
+        return self._process_sizes[process_id]
+
+    def put(
+        self,
+        job_id: str,
+        process_id: str,
+        max_process_size: Optional[int] = None,
+        force: bool = False,
+    ) -> QueuePosition:
+        """Add a job to the queue.
+
+        Args:
+            job_id: The job identifier.
+            process_id: The job's process identifier.
+            max_process_size: Maximum number of queued jobs of the
+                given process, `None` for no limit.
+            force: Whether to add the job even if the queue is full,
+                e.g., because the job has been accepted already.
+
+        Returns:
+            The position of the job in the queue.
+
+        Raises:
+            QueueFullError: If the queue or the queue
+                of the job's process is full.
+        """
+        with self._lock:
+            if not force:
+                self._check_size(
+                    len(self._jobs), self.max_size, self._drain_rate, "the service"
+                )
+                self._check_size(
+                    self._process_sizes[process_id],
+                    max_process_size,
+                    self._process_drain_rates.get(process_id),
+                    f"process {process_id!r}",
+                )
+            self._jobs[job_id] = (next(self._counter), process_id)
+            self._process_sizes[process_id] += 1
+            return self._get_position(job_id)
+
+    def remove(self, job_id: str):
+        """Remove a job from the queue, because it started."""
+        with self._lock:
+            item = self._jobs.pop(job_id, None)
+            if item is None:
+                return
+            process_id = item[1]
+            self._process_sizes[process_id] -= 1
+            if self._process_sizes[process_id] <= 0:
+                del self._process_sizes[process_id]
+            now = time.monotonic()
+            self._drain_rate.record(now)
+            drain_rate = self._process_drain_rates.get(process_id)
+            if drain_rate is None:
+                drain_rate = self._process_drain_rates[process_id] = DrainRate()
+            drain_rate.record(now)
+
+    def get_position(self, job_id: str) -> Optional[QueuePosition]:
+        """Get the position of a queued job, or `None`
+        if the job is not queued.
+        """
+        with self._lock:
+            return self._get_position(job_id)
+
+    def _get_position(self, job_id: str) -> Optional[QueuePosition]:
+        item = self._jobs.get(job_id)
+        if item is None:
+            return None
+        head_seq = next(iter(self._jobs.values()))[0]
+        depth = min(item[0] - head_seq, len(self._jobs) - 1)
+        rate = self._drain_rate.get()
+        return QueuePosition(depth, (depth + 1) / rate if rate else None)
+
+    @staticmethod
+    def _check_size(
+        size: int,
+        max_size: Optional[int],
+        drain_rate: Optional[DrainRate],
+        name: str,
+    ):
+        if max_size is None or size < max_size:
+            return
+        rate = drain_rate.get() if drain_rate is not None else None
+        if rate:
+            # Time until enough jobs left the queue to accept one more
+            retry_after = math.ceil((size - max_size + 1) / rate)
+        else:
+            retry_after = DEFAULT_QUEUE_RETRY_AFTER
+        raise QueueFullError(
+            f"Too many jobs queued for {name}, {size} of {max_size}",
+            max(1, min(retry_after, DEFAULT_QUEUE_MAX_RETRY_AFTER)),
+        )
@@ -0,0 +1,301 @@
+#  Copyright (c) 2025 by ESA DTE-S2GOS team and contributors
+#  Permissions are hereby granted under the terms of the Apache 2.0 License:
+#  https://opensource.org/license/apache-2-0.
+
+import collections
+import dataclasses
+import threading
+import time
+from logging import getLogger
+from pathlib import Path
+from typing import Callable, NamedTuple, Optional
+
+from s2gos.server.defaults import (
+    DEFAULT_REAPER_INTERVAL,
+    DEFAULT_RETENTION_MAX_AGE,
+    DEFAULT_RETENTION_MAX_JOBS,
+    DEFAULT_RETENTION_MAX_RESULT_MEMORY,
+)
+
+logger = getLogger("s2gos")
+
+
+@dataclasses.dataclass
+class RetentionPolicy:
+    """Limits the finished jobs and their results retained
+    by the local service, `None` means no limit.
+    """
+
+    max_age: Optional[float] = DEFAULT_RETENTION_MAX_AGE
+    """Time in seconds after which finished jobs are removed."""
+    max_jobs: Optional[int] = DEFAULT_RETENTION_MAX_JOBS
+    """Maximum number of finished jobs, the oldest are removed first."""
+    max_jobs_per_user: Optional[int] = None
+    """Maximum number of finished jobs of each user."""
+    max_result_memory: Optional[int] = DEFAULT_RETENTION_MAX_RESULT_MEMORY
+    """Maximum size in bytes of the results kept in memory,
+    estimated by the size of their JSON encoding.
+    The results of the oldest jobs are evicted first."""
+    spill_dir: Optional[str] = None
+    """Directory to which evicted results are written. If not given,
+    evicted results are dropped, unless the job store keeps them."""
+
+
+class RetentionUsage(NamedTuple):
+    """The finished jobs and results retained by the local service."""
+
+    jobs: int
+    """Number of finished jobs."""
+    results: int
+    """Number of results kept in memory."""
+    result_memory: int
+    """Estimated size in bytes of the results kept in memory."""
+    spilled_results: int
+    """Number of results written to the spill directory."""
+    spilled_size: int
+    """Size in bytes of the results written to the spill directory."""
+
+
+class _Retained:
+    __slots__ = ("user", "finished", "result_size", "spilled_size")
+
+    def __init__(self, user: str, finished: float, result_size: int):
+        self.user = user
+        self.finished = finished
+        # Estimated size of the results in memory, zero if released
+        self.result_size = result_size
+        self.spilled_size = 0
+
+
+class JobReaper:
+    """Removes finished jobs and evicts their results
+    according to a retention policy.
+
+    Jobs are added once they finished. A background thread, started
+    with the first job, applies the age limit periodically. The count
+    limits and the memory budget are applied whenever a job is added.
+
+    Args:
+        policy: The retention policy.
+        remove_job: Removes a job and its results.
+        release_results: Releases the results of a job kept in memory.
+        get_results_json: Gets the JSON-encoded results of a job to
+            be written to the spill directory, if they are available.
+        interval: Time in seconds between the periodic runs.
+    """
+
+    def __init__(
+        self,
+        policy: RetentionPolicy,
+        remove_job: Callable[[str], None],
+        release_results: Callable[[str], None],
+        get_results_json: Callable[[str], Optional[bytes]],
+        interval: float = DEFAULT_REAPER_INTERVAL,
+    ):
+        self.policy = policy
+        self.interval = interval
+        self._remove_job = remove_job
+        self._release_results = release_results
+        self._get_results_json = get_results_json
+        self._lock = threading.Lock()
+        # job ID --> retained job, in the order the jobs finished
+        self._jobs: collections.OrderedDict[str, _Retained] = collections.OrderedDict()
+        self._user_counts: collections.Counter[str] = collections.Counter()
+        self._result_memory = 0
+        self._num_results = 0
+        self._spilled_size = 0
+        self._num_spilled = 0
+        self._thread: Optional[threading.Thread] = None
+        self._stop_event = threading.Event()
+
+    def add(self, job_id: str, user: Optional[str] = None, result_size: int = 0):
+        """Add a finished job.
+
+        Args:
+            job_id: The job identifier.
+            user: The name of the user who submitted the job.
+            result_size: Estimated size in bytes of
+                the job's results kept in memory.
+        """
+        user = user or ""
+        with self._lock:
+            if job_id in self._jobs:
+                return
+            self._jobs[job_id] = _Retained(user, time.monotonic(), result_size)
+            self._user_counts[user] += 1
+            if result_size > 0:
+                self._result_memory += result_size
+                self._num_results += 1
+            self._start()
+        self.reap(check_age=False)
+
+    def discard(self, job_id: str):
+        """Forget a job that has been removed by others."""
+        with self._lock:
+            retained = self._pop(job_id)
+        if retained is not None:
+            self._delete_spilled(job_id, retained)
+
+    def get_usage(self) -> RetentionUsage:
+        """Get the finished jobs and results retained."""
+        with self._lock:
+            return RetentionUsage(
+                jobs=len(self._jobs),
+                results=self._num_results,
+                result_memory=self._result_memory,
+                spilled_results=self._num_spilled,
+                spilled_size=self._spilled_size,
+            )
+
+    def load_spilled_results(self, job_id: str) -> Optional[bytes]:
+        """Load the JSON-encoded results of a job
+        from the spill directory, if they have been written there.
+        """
+        with self._lock:
+            retained = self._jobs.get(job_id)
+            if retained is None or not retained.spilled_size:
+                return None
+        try:
+            return self._get_spill_path(job_id).read_bytes()
+        except OSError as e:
+            logger.warning(f"Failed to read spilled results of job {job_id!r}: {e}")
+            return None
+
+    def reap(self, check_age: bool = True):
+        """Remove jobs and evict results according to the retention policy.
+
+        Args:
+            check_age: Whether to remove jobs older than the maximum age.
+        """
+        policy = self.policy
+        with self._lock:
+            removed = self._select_removed(check_age)
+            for job_id, retained in removed:
+                self._pop(job_id)
+            evicted: list[str] = []
+            if policy.max_result_memory is not None:
+                for job_id, retained in self._jobs.items():
+                    if self._result_memory <= policy.max_result_memory:
+                        break
+                    if retained.result_size > 0:
+                        self._result_memory -= retained.result_size
+                        self._num_results -= 1
+                        retained.result_size = 0
+                        evicted.append(job_id)
+        for job_id, retained in removed:
+            self._remove_job(job_id)
+            self._delete_spilled(job_id, retained)
+        for job_id in evicted:
+            self._evict(job_id)
+        if removed or evicted:
+            logger.info(
+                f"Removed {len(removed)} finished job(s),"
+                f" evicted results of {len(evicted)} job(s),"
+                f" retained: {self.get_usage()}"
+            )
+
+    def close(self):
+        """Stop the background thread."""
+        self._stop_event.set()
+        thread = self._thread
+        if thread is not None:
+            thread.join(timeout=5)
+
+    def _select_removed(self, check_age: bool) -> list[tuple[str, _Retained]]:
+        policy = self.policy
+        removed: dict[str, _Retained] = {}
+        if check_age and policy.max_age is not None:
+            min_finished = time.monotonic() - policy.max_age
+            for job_id, retained in self._jobs.items():
+                if retained.finished >= min_finished:
+                    break
+                removed[job_id] = retained
+        if policy.max_jobs is not None:
+            excess = len(self._jobs) - len(removed) - policy.max_jobs
+            for job_id, retained in self._jobs.items():
+                if excess <= 0:
+                    break
+                if job_id not in removed:
+                    removed[job_id] = retained
+                    excess -= 1
+        if policy.max_jobs_per_user is not None:
+            excesses = {
+                user: count - policy.max_jobs_per_user
+                for user, count in self._user_counts.items()
+                if count > policy.max_jobs_per_user
+            }
+            for retained in removed.values():
+                if retained.user in excesses:
+                    excesses[retained.user] -= 1
+            for job_id, retained in self._jobs.items():
+                if excesses.get(retained.user, 0) > 0 and job_id not in removed:
+                    removed[job_id] = retained
+                    excesses[retained.user] -= 1
+        return list(removed.items())
+
+    def _pop(self, job_id: str) -> Optional[_Retained]:
+        retained = self._jobs.pop(job_id, None)
+        if retained is None:
+            return None
+        self._user_counts[retained.user] -= 1
+        if self._user_counts[retained.user] <= 0:
+            del self._user_counts[retained.user]
+        if retained.result_size > 0:
+            self._result_memory -= retained.result_size
+            self._num_results -= 1
+        if retained.spilled_size > 0:
+            self._spilled_size -= retained.spilled_size
+            self._num_spilled -= 1
+        return retained
+
+    def _evict(self, job_id: str):
+        if self.policy.spill_dir:
+            data = self._get_results_json(job_id)
+            if data is not None:
+                self._spill(job_id, data)
+        self._release_results(job_id)
+
+    def _spill(self, job_id: str, data: bytes):
+        path = self._get_spill_path(job_id)
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_bytes(data)
+        except OSError as e:
+            logger.warning(f"Failed to spill results of job {job_id!r}: {e}")
+            return
+        with self._lock:
+            retained = self._jobs.get(job_id)
+            if retained is not None:
+                retained.spilled_size = len(data)
+                self._spilled_size += len(data)
+                self._num_spilled += 1
+                return
+        # Removed meanwhile
+        path.unlink(missing_ok=True)
+
+    def _delete_spilled(self, job_id: str, retained: _Retained):
+        if retained.spilled_size > 0:
+            try:
+                self._get_spill_path(job_id).unlink(missing_ok=True)
+            except OSError as e:
+                logger.warning(
+                    f"Failed to delete spilled results of job {job_id!r}: {e}"
+                )
+
+    def _get_spill_path(self, job_id: str) -> Path:
+        return Path(self.policy.spill_dir) / f"{job_id}.json"
+
+    def _start(self):
+        if self._thread is not None or self.policy.max_age is None:
+            return
+        self._thread = threading.Thread(
+            target=self._run, name="s2gos-job-reaper", daemon=True
+        )
+        self._thread.start()
+
+    def _run(self):
+        while not self._stop_event.wait(self.interval):
+            try:
+                self.reap()
+            except Exception as e:
+                logger.warning(f"Failed to reap finished jobs: {e}")
@@ -0,0 +1,351 @@
+#  Copyright (c) 2025 by ESA DTE-S2GOS team and contributors
+#  Permissions are hereby granted under the terms of the Apache 2.0 License:
+#  https://opensource.org/license/apache-2-0.
+
+import collections
+import itertools
+import math
+import os
+import threading
+import time
+from concurrent.futures import CancelledError, Executor, Future
+from typing import Any, Callable, Literal, Optional
+
+from s2gos.server.defaults import (
+    DEFAULT_DEADLINE_FACTOR,
+    DEFAULT_RESERVATION_TIMEOUT,
+    DEFAULT_SCHEDULING_POLICY,
+)
+
+from .resources import NO_RESOURCES, Resources
+
+ANONYMOUS_USER = ""
+
+SchedulingPolicy = Literal["fair", "sjf", "edf"]
+
+
+class _Item:
+    __slots__ = (
+        "function",
+        "future",
+        "priority",
+        "user",
+        "process_id",
+        "runtime",
+        "deadline",
+        "resources",
+        "blocked_since",
+    )
+
+    def __init__(
+        self,
+        function: Callable[[], Any],
+        priority: int,
+        user: str,
+        process_id: Optional[str],
+        runtime: Optional[float],
+        resources: Resources,
+    ):
+        self.function = function
+        self.future: Future = Future()
+        self.priority = priority
+        self.user = user
+        self.process_id = process_id
+        # Unknown runtimes are assumed to be short,
+        # so the runtimes of new processes are learned soon
+        self.runtime = runtime or 0.0
+        self.deadline = time.monotonic() + DEFAULT_DEADLINE_FACTOR * self.runtime
+        self.resources = resources
+        # Since when the job waits for resources, if it does
+        self.blocked_since: Optional[float] = None
+
+
+class JobScheduler:
+    """Decides the order in which jobs are submitted to an executor.
+
+    At most `max_concurrency` jobs are submitted to the executor at
+    the same time, the others wait in the scheduler. Whenever a job
+    finishes, the next job is chosen among the jobs of the highest
+    priority according to the scheduling policy:
+
+    - `"fair"`: The next job is taken from the user with the fewest
+      running jobs, ties are broken in favour of the user served least
+      recently. So a user who submits many jobs does not starve the
+      others. Jobs of the same user start in the order of submission.
+    - `"sjf"`: Shortest job first, the job with the shortest
+      expected runtime starts first.
+    - `"edf"`: Earliest deadline first, where a job's deadline is its
+      submission time plus a multiple of its expected runtime. So short
+      jobs start first, but long jobs are not starved.
+
+    Jobs of processes that reached their concurrency cap are skipped.
+
+    If a node `capacity` is given, jobs are packed so that the sum of
+    the resources required by the running jobs never exceeds it. Jobs
+    that don't fit are skipped, so smaller jobs fill the gaps. Once a job
+    waited for resources longer than the reservation timeout, the
+    resources it requires are reserved for it: other jobs only start
+    if they fit next to it, until it started.
+
+    Args:
+        executor: The executor that runs the jobs.
+        max_concurrency: Maximum number of jobs submitted to the executor.
+            Defaults to the executor's maximum number of workers.
+        policy: The scheduling policy, `"fair"`, `"sjf"`, or `"edf"`.
+        capacity: Optional resources of the node.
+            If not given, resources are not accounted.
+        reservation_timeout: Time in seconds after which
+            the resources required by a waiting job are reserved.
+    """
+
+    def __init__(
+        self,
+        executor: Executor,
+        max_concurrency: Optional[int] = None,
+        policy: SchedulingPolicy = DEFAULT_SCHEDULING_POLICY,
+        capacity: Optional[Resources] = None,
+        reservation_timeout: float = DEFAULT_RESERVATION_TIMEOUT,
+    ):
+        if policy not in ("fair", "sjf", "edf"):
+            raise ValueError(f"unknown scheduling policy {policy!r}")
+        self.executor = executor
+        self.policy = policy
+        self.max_concurrency = max(
+            1,
+            max_concurrency
+            or getattr(executor, "_max_workers", None)
+            or os.cpu_count()
+            or 1,
+        )
+        self.capacity = capacity
+        self.reservation_timeout = reservation_timeout
+        self._lock = threading.Lock()
+        self._allocated = NO_RESOURCES
+        self._reserved: Optional[_Item] = None
+        # priority --> user --> pending items
+        self._pending: dict[int, dict[str, collections.deque[_Item]]] = {}
+        self._num_pending = 0
+        self._num_running = 0
+        self._user_running: collections.Counter[str] = collections.Counter()
+        self._process_running: collections.Counter[str] = collections.Counter()
+        self._process_caps: dict[str, int] = {}
+        # Incremented with each started job, to serve users in turn
+        self._clock = itertools.count()
+        self._user_served: dict[str, int] = {}
+        # Only one thread dispatches at a time, others request another round
+        self._dispatching = False
+        self._dispatch_requested = False
+
+    @property
+    def num_pending(self) -> int:
+        """The number of jobs waiting in the scheduler."""
+        return self._num_pending
+
+    @property
+    def num_running(self) -> int:
+        """The number of jobs submitted to the executor."""
+        return self._num_running
+
+    @property
+    def allocated(self) -> Resources:
+        """The resources required by the jobs submitted to the executor."""
+        return self._allocated
+
+    def set_process_concurrency(self, process_id: str, max_concurrency: Optional[int]):
+        """Set the maximum number of concurrently running jobs of a process,
+        `None` for no limit.
+        """
+        with self._lock:
+            if max_concurrency is None:
+                self._process_caps.pop(process_id, None)
+            else:
+                self._process_caps[process_id] = max(1, max_concurrency)
+        self._dispatch()
+
+    def submit(
+        self,
+        function: Callable[[], Any],
+        priority: int = 0,
+        user: Optional[str] = None,
+        process_id: Optional[str] = None,
+        runtime: Optional[float] = None,
+        resources: Optional[Resources] = None,
+    ) -> Future:
+        """Schedule a job.
+
+        Args:
+            function: The function that runs the job.
+            priority: The job's priority, jobs of higher priority start first.
+            user: The name of the user who submitted the job.
+            process_id: The job's process identifier.
+            runtime: The job's expected runtime in seconds, if known.
+            resources: The resources required by the job,
+                defaults to one CPU core.
+
+        Returns:
+            A future that represents the return value of `function`.
+        """
+        resources = resources or Resources()
+        if self.capacity is not None:
+            # Jobs that require more than the node provides run alone
+            resources = resources.clip(self.capacity)
+        item = _Item(
+            function,
+            priority,
+            user or ANONYMOUS_USER,
+            process_id,
+            runtime,
+            resources,
+        )
+        with self._lock:
+            self._pending.setdefault(priority, {}).setdefault(
+                item.user, collections.deque()
+            ).append(item)
+            self._num_pending += 1
+        self._dispatch()
+        return item.future
+
+    def _dispatch(self):
+        with self._lock:
+            if self._dispatching:
+                self._dispatch_requested = True
+                return
+            self._dispatching = True
+        try:
+            while True:
+                with self._lock:
+                    item = (
+                        self._pop_next()
+                        if self._num_running < self.max_concurrency
+                        else None
+                    )
+                    if item is None:
+                        if self._dispatch_requested:
+                            self._dispatch_requested = False
+                            continue
+                        self._dispatching = False
+                        return
+                    self._count_started(item)
+                self._start(item)
+        except BaseException:
+            with self._lock:
+                self._dispatching = False
+            raise
+
+    def _count_started(self, item: _Item):
+        self._num_running += 1
+        self._user_running[item.user] += 1
+        self._user_served[item.user] = next(self._clock)
+        if item.process_id is not None:
+            self._process_running[item.process_id] += 1
+        self._allocated += item.resources
+        if item is self._reserved:
+            self._reserved = None
+
+    def _pop_next(self) -> Optional[_Item]:
+        for priority in sorted(self._pending, reverse=True):
+            user_items = self._pending[priority]
+            found = (
+                self._find_fair(user_items)
+                if self.policy == "fair"
+                else self._find_first(user_items)
+            )
+            if found is not None:
+                user, index = found
+                items = user_items[user]
+                item = items[index]
+                del items[index]
+                if not items:
+                    del user_items[user]
+                    if not user_items:
+                        del self._pending[priority]
+                self._num_pending -= 1
+                return item
+        return None
+
+    def _find_fair(
+        self, user_items: dict[str, collections.deque[_Item]]
+    ) -> Optional[tuple[str, int]]:
+        for user in sorted(
+            user_items,
+            key=lambda u: (self._user_running[u], self._user_served.get(u, -1)),
+        ):
+            for i, item in enumerate(user_items[user]):
+                if self._can_start(item):
+                    return user, i
+        return None
+
+    def _find_first(
+        self, user_items: dict[str, collections.deque[_Item]]
+    ) -> Optional[tuple[str, int]]:
+        attr = "runtime" if self.policy == "sjf" else "deadline"
+        found: Optional[tuple[str, int]] = None
+        found_key = math.inf
+        for user, items in user_items.items():
+            for i, item in enumerate(items):
+                key = getattr(item, attr)
+                if key < found_key and self._can_start(item):
+                    found, found_key = (user, i), key
+        return found
+
+    def _can_start(self, item: _Item) -> bool:
+        if item.process_id is not None:
+            cap = self._process_caps.get(item.process_id)
+            if cap is not None and self._process_running[item.process_id] >= cap:
+                return False
+        return self._fits(item)
+
+    def _fits(self, item: _Item) -> bool:
+        if self.capacity is None:
+            return True
+        required = self._allocated + item.resources
+        reserved = self._reserved
+        if reserved is not None and reserved is not item:
+            required += reserved.resources
+        if required.fits(self.capacity):
+            item.blocked_since = None
+            return True
+        now = time.monotonic()
+        if item.blocked_since is None:
+            item.blocked_since = now
+        if reserved is None and now - item.blocked_since >= self.reservation_timeout:
+            self._reserved = item
+        return False
+
+    def _start(self, item: _Item):
+        if not item.future.set_running_or_notify_cancel():
+            self._on_done(item)
+            return
+        try:
+            executor_future = self.executor.submit(item.function)
+        except Exception as e:
+            item.future.set_exception(e)
+            self._on_done(item)
+            return
+        executor_future.add_done_callback(lambda f: self._on_executed(item, f))
+
+    def _on_executed(self, item: _Item, executor_future: Future):
+        # Count the job as finished before notifying the future's
+        # observers, which may submit further jobs
+        self._on_done(item)
+        if executor_future.cancelled():
+            item.future.set_exception(CancelledError())
+            return
+        exception = executor_future.exception()
+        if exception is not None:
+            item.future.set_exception(exception)
+        else:
+            item.future.set_result(executor_future.result())
+
+    def _on_done(self, item: _Item):
+        with self._lock:
+            self._num_running -= 1
+            self._user_running[item.user] -= 1
+            if self._user_running[item.user] <= 0:
+                del self._user_running[item.user]
+            if item.process_id is not None:
+                self._process_running[item.process_id] -= 1
+                if self._process_running[item.process_id] <= 0:
+                    del self._process_running[item.process_id]
+            self._allocated -= item.resources
+        self._dispatch()
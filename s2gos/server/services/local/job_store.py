@@ -0,0 +1,299 @@
+#  Copyright (c) 2025 by ESA DTE-S2GOS team and contributors
+#  Permissions are hereby granted under the terms of the Apache 2.0 License:
+#  https://opensource.org/license/apache-2-0.
+
+import itertools
+import threading
+import uuid
+from abc import ABC, abstractmethod
+from typing import Any, Callable, Iterable, NamedTuple, Optional
+
+from s2gos.common.models import JobInfo, JobResults, StatusCode, Subscriber
+
+from .job_index import JobIndex, TimeInterval
+
+
+class JobRecord(NamedTuple):
+    """A job's status information as stored in a job store."""
+
+    job_info: JobInfo
+    version: int
+
+
+class JobRequest(NamedTuple):
+    """A request to execute a job."""
+
+    job_info: JobInfo
+    function_kwargs: dict[str, Any]
+    subscriber: Optional[Subscriber] = None
+    priority: int = 0
+    user_name: Optional[str] = None
+
+
+class JobStore(ABC):
+    """Stores the status information and results of jobs.
+
+    Jobs are executed by a single designated process, the executor.
+    Other processes serving the same job table submit jobs to it
+    through the store.
+
+    The status of a job is only written by the process that executes
+    it. Each write carries the job's version, which increases with
+    every change of the job's status, submitted jobs have version 0.
+    Writes of versions that are not newer than the stored one
+    are ignored.
+    """
+
+    @property
+    @abstractmethod
+    def uid(self) -> str:
+        """A unique identifier of the stored job table."""
+
+    @property
+    def is_executor(self) -> bool:
+        """Whether the current process is the one that executes jobs.
+        The default implementation returns `True`.
+        """
+        return True
+
+    @abstractmethod
+    def new_job_id(self) -> str:
+        """Create a new, unique job identifier."""
+
+    def submit(self, request: JobRequest) -> bool:
+        """Add a new job to be executed by the executor.
+
+        Returns:
+            `True` if the current process is the executor and
+            must execute the job, `False` if the job is queued
+            for execution by the executor.
+            The default implementation adds the job's status
+            and returns `True`.
+        """
+        self.put(request.job_info, 0)
+        return True
+
+    def set_submission_handler(self, handler: Callable[[JobRequest], None]) -> None:
+        """Set the handler that is called with the jobs submitted by
+        other processes, if the current process is the executor.
+        The default implementation does nothing.
+        """
+
+    @abstractmethod
+    def put(self, job_info: JobInfo, version: int) -> None:
+        """Add a job or update its status."""
+
+    def put_progress(self, job_info: JobInfo, version: int) -> None:
+        """Update the status of a job whose status code did not change.
+        The write may be deferred and batched with other writes.
+        The default implementation calls `put()`.
+        """
+        self.put(job_info, version)
+
+    @abstractmethod
+    def get(self, job_id: str) -> Optional[JobRecord]:
+        """Get the status of the given job, if it exists."""
+
+    @abstractmethod
+    def remove(self, job_id: str) -> None:
+        """Remove the given job and its results."""
+
+    @abstractmethod
+    def query(
+        self,
+        offset: int = 0,
+        limit: Optional[int] = None,
+        statuses: Optional[Iterable[StatusCode]] = None,
+        process_ids: Optional[Iterable[str]] = None,
+        created: Optional[TimeInterval] = None,
+        updated: Optional[TimeInterval] = None,
+    ) -> tuple[list[JobInfo], bool]:
+        """Get the jobs that match the given filters, ordered by creation.
+
+        Returns:
+            A page of at most `limit` jobs starting at `offset`,
+            and whether more jobs are available.
+        """
+
+    @abstractmethod
+    def put_results(self, job_id: str, results: JobResults) -> None:
+        """Store the results of a successful job."""
+
+    @abstractmethod
+    def get_results(self, job_id: str) -> Optional[JobResults]:
+        """Get the results of the given job, if available."""
+
+    @abstractmethod
+    def claim_idempotency_key(
+        self, key: str, job_id: str, fingerprint: str
+    ) -> tuple[str, str]:
+        """Associate an idempotency key with a job, unless the key
+        is associated with a job already. Keys are removed together
+        with their jobs.
+
+        Args:
+            key: The idempotency key given by the client.
+            job_id: The job to be associated with the key.
+            fingerprint: A hash of the request that created the job.
+
+        Returns:
+            The identifier of the job associated with the key
+            and the fingerprint of the request that created it.
+        """
+
+    @abstractmethod
+    def release_idempotency_key(self, key: str, job_id: str) -> None:
+        """Remove an idempotency key if it is associated with the given
+        job, e.g., because the job could not be submitted.
+        """
+
+    def release_results(self, job_id: str) -> None:
+        """Release the results of a job kept in memory to free memory.
+        Stores that keep results elsewhere, e.g., on disk, keep them.
+        The default implementation does nothing.
+        """
+
+    def request_cancellation(self, job_id: str) -> None:
+        """Request the cancellation of a job executed by another process.
+        The default implementation does nothing, as it assumes that all
+        jobs are executed by the current process.
+        """
+
+    def set_cancellation_handler(self, handler: Callable[[str], None]) -> None:
+        """Set the handler that is called with the identifiers of jobs
+        executed by the current process, whose cancellation has been
+        requested by another process.
+        The default implementation does nothing.
+        """
+
+    def flush(self) -> None:
+        """Write deferred updates.
+        The default implementation does nothing.
+        """
+
+    def close(self) -> None:
+        """Write deferred updates and release all resources.
+        The default implementation calls `flush()`.
+        """
+        self.flush()
+
+
+class MemoryJobStore(JobStore):
+    """A job store that keeps jobs in memory of the current process.
+
+    Note, the store keeps references to the given status information,
+    which must therefore not be changed afterwards, e.g., job snapshots.
+    """
+
+    def __init__(self):
+        self._uid = uuid.uuid4().hex[:12]
+        self._lock = threading.Lock()
+        self._job_counter = itertools.count()
+        self._records: dict[str, JobRecord] = {}
+        self._results: dict[str, JobResults] = {}
+        # idempotency key --> (job ID, fingerprint)
+        self._idempotency_keys: dict[str, tuple[str, str]] = {}
+        # job ID --> idempotency keys, requests may attach to active jobs
+        self._job_idempotency_keys: dict[str, set[str]] = {}
+        self._index = JobIndex()
+
+    @property
+    def uid(self) -> str:
+        return self._uid
+
+    def new_job_id(self) -> str:
+        with self._lock:
+            return f"job_{next(self._job_counter)}"
+
+    def put(self, job_info: JobInfo, version: int) -> None:
+        with self._lock:
+            record = self._records.get(job_info.jobID)
+            if record is not None and version <= record.version:
+                return
+            self._records[job_info.jobID] = JobRecord(job_info, version)
+            # Updated in the same order as the records
+            self._index.update(job_info)
+
+    def get(self, job_id: str) -> Optional[JobRecord]:
+        return self._records.get(job_id)
+
+    def remove(self, job_id: str) -> None:
+        with self._lock:
+            self._records.pop(job_id, None)
+            self._results.pop(job_id, None)
+            for key in self._job_idempotency_keys.pop(job_id, ()):
+                self._idempotency_keys.pop(key, None)
+            self._index.remove(job_id)
+
+    def query(
+        self,
+        offset: int = 0,
+        limit: Optional[int] = None,
+        statuses: Optional[Iterable[StatusCode]] = None,
+        process_ids: Optional[Iterable[str]] = None,
+        created: Optional[TimeInterval] = None,
+        updated: Optional[TimeInterval] = None,
+    ) -> tuple[list[JobInfo], bool]:
+        job_ids, has_more = self._index.query(
+            offset=offset,
+            limit=limit,
+            statuses=statuses,
+            process_ids=process_ids,
+            created=created,
+            updated=updated,
+        )
+        records = self._records
+        return [
+            records[job_id].job_info for job_id in job_ids if job_id in records
+        ], has_more
+
+    def put_results(self, job_id: str, results: JobResults) -> None:
+        self._results[job_id] = results
+
+    def get_results(self, job_id: str) -> Optional[JobResults]:
+        return self._results.get(job_id)
+
+    def release_results(self, job_id: str) -> None:
+        self._results.pop(job_id, None)
+
+    def claim_idempotency_key(
+        self, key: str, job_id: str, fingerprint: str
+    ) -> tuple[str, str]:
+        with self._lock:
+            claimed = self._idempotency_keys.get(key)
+            if claimed is not None:
+                return claimed
+            self._idempotency_keys[key] = job_id, fingerprint
+            self._job_idempotency_keys.setdefault(job_id, set()).add(key)
+            return job_id, fingerprint
+
+    def release_idempotency_key(self, key: str, job_id: str) -> None:
+        with self._lock:
+            claimed = self._idempotency_keys.get(key)
+            if claimed is not None and claimed[0] == job_id:
+                del self._idempotency_keys[key]
+                keys = self._job_idempotency_keys.get(job_id)
+                if keys is not None:
+                    keys.discard(key)
+                    if not keys:
+                        del self._job_idempotency_keys[job_id]
+
+
+def create_job_store(url: Optional[str] = None) -> JobStore:
+    """Create a job store from the given URL.
+
+    Args:
+        url: Either `None` or `"memory"` for a `MemoryJobStore`,
+            or `"sqlite:///<path>"` for a `SQLiteJobStore`
+            that uses the database file at `<path>`.
+
+    Raises:
+        ValueError: If the URL is not supported.
+    """
+    if not url or url == "memory":
+        return MemoryJobStore()
+    if url.startswith("sqlite:///"):
+        from .sqlite_job_store import SQLiteJobStore
+
+        return SQLiteJobStore(url[len("sqlite:///") :])
+    raise ValueError(f"unsupported job store URL {url!r}")
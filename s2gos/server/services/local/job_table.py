@@ -0,0 +1,70 @@
+#  Copyright (c) 2025 by ESA DTE-S2GOS team and contributors
+#  Permissions are hereby granted under the terms of the Apache 2.0 License:
+#  https://opensource.org/license/apache-2-0.
+
+import threading
+from collections.abc import ItemsView, Iterator, KeysView, Mapping, ValuesView
+from typing import Optional
+
+from .job import Job
+
+
+class JobTable(Mapping[str, Job]):
+    """The jobs executed by this process, by job identifier.
+
+    The table is copy-on-write: adding or removing a job replaces the
+    underlying dictionary under a lock, while readers use the current
+    dictionary without locking. So readers may iterate the table while
+    jobs are added or removed, they see the jobs at the time they
+    started iterating.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        # Never changed once published
+        self._jobs: dict[str, Job] = {}
+
+    def put(self, job: Job):
+        """Add a job."""
+        with self._lock:
+            jobs = dict(self._jobs)
+            jobs[job.status_info.jobID] = job
+            self._jobs = jobs
+
+    def pop(self, job_id: str, default: Optional[Job] = None) -> Optional[Job]:
+        """Remove a job.
+
+        Returns:
+            The removed job, or `default` if the job does not exist.
+        """
+        with self._lock:
+            if job_id not in self._jobs:
+                return default
+            jobs = dict(self._jobs)
+            job = jobs.pop(job_id)
+            self._jobs = jobs
+            return job
+
+    def get(self, job_id: str, default: Optional[Job] = None) -> Optional[Job]:
+        return self._jobs.get(job_id, default)
+
+    def __getitem__(self, job_id: str) -> Job:
+        return self._jobs[job_id]
+
+    def __contains__(self, job_id: object) -> bool:
+        return job_id in self._jobs
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._jobs)
+
+    def __len__(self) -> int:
+        return len(self._jobs)
+
+    def keys(self) -> KeysView[str]:
+        return self._jobs.keys()
+
+    def values(self) -> ValuesView[Job]:
+        return self._jobs.values()
+
+    def items(self) -> ItemsView[str, Job]:
+        return self._jobs.items()
@@ -2,29 +2,84 @@
 #  Permissions are hereby granted under the terms of the Apache 2.0 License:
 #  https://opensource.org/license/apache-2-0.
 
-from concurrent.futures import ThreadPoolExecutor
+import asyncio
+import datetime
+import functools
+import os
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
 from concurrent.futures.process import ProcessPoolExecutor
-from typing import Callable, Optional
+from logging import getLogger
+from typing import Any, Callable, Optional
+from urllib.parse import urlencode
 
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, StreamingResponse
 
 from s2gos.common.models import (
     Capabilities,
     ConformanceDeclaration,
+    JobBatchItem,
+    JobBatchResponse,
+    JobControlOptions,
+    JobIdList,
     JobInfo,
     JobList,
     JobResults,
+    Link,
     ProcessDescription,
     ProcessList,
     ProcessRequest,
     ProcessSummary,
     StatusCode,
+    Subscriber,
+)
+from s2gos.server.conditional import format_http_date
+from s2gos.server.constants import (
+    S2GOS_CPUS_ENV_VAR,
+    S2GOS_JOB_STORE_ENV_VAR,
+    S2GOS_MEMORY_ENV_VAR,
+    S2GOS_RESULT_CACHE_DIR_ENV_VAR,
+)
+from s2gos.server.defaults import (
+    DEFAULT_EXECUTOR_MAX_WORKERS,
+    DEFAULT_IDEMPOTENCY_RETRY_AFTER,
+    DEFAULT_MAX_QUEUE_SIZE,
+    DEFAULT_PROGRESS_DELTA,
+    DEFAULT_PROGRESS_INTERVAL,
+    DEFAULT_QUEUE_RETRY_AFTER,
+    DEFAULT_SCHEDULING_POLICY,
+    DEFAULT_SYNC_POLL_INTERVAL,
+    DEFAULT_SYNC_TIMEOUT,
 )
 from s2gos.server.exceptions import JSONContentException
+from s2gos.server.resource_cache import EncodedJSONResponse
 from s2gos.server.service import Service
 
+from .async_executor import AsyncExecutor
+from .callbacks import CallbackDispatcher
 from .job import Job
+from .job_channel import JobChannel
+from .job_events import (
+    EVENT_STREAM_MEDIA_TYPE,
+    FINISHED_STATUS_CODES,
+    JobEventHub,
+    JobEventSubscription,
+)
+from .job_index import get_update_time, parse_interval
+from .job_queue import JobQueue, QueueFullError
+from .job_reaper import JobReaper, RetentionPolicy
+from .job_scheduler import JobScheduler, SchedulingPolicy
+from .job_store import JobRecord, JobRequest, JobStore, create_job_store
+from .job_table import JobTable
 from .process_registry import ProcessRegistry
+from .resources import Resources, get_capacity
+from .result_cache import ResultCache, get_result_key
+
+logger = getLogger("s2gos")
+
+MAX_JOB_LIST_LIMIT = 10000
+
+JOB_EVENT_POLL_LOOKBACK = datetime.timedelta(seconds=5)
 
 model_dump_config = dict(
     exclude_none=True,
@@ -39,16 +94,126 @@ class LocalService(Service):
         title: str,
         description: Optional[str] = None,
         executor: Optional[ThreadPoolExecutor | ProcessPoolExecutor] = None,
+        callbacks: Optional[CallbackDispatcher] = None,
+        job_store: Optional[JobStore] = None,
+        max_queue_size: Optional[int] = DEFAULT_MAX_QUEUE_SIZE,
+        max_concurrency: Optional[int] = None,
+        scheduling_policy: SchedulingPolicy = DEFAULT_SCHEDULING_POLICY,
+        capacity: Optional[Resources] = None,
+        progress_interval: float = DEFAULT_PROGRESS_INTERVAL,
+        progress_delta: int = DEFAULT_PROGRESS_DELTA,
+        retention: Optional[RetentionPolicy] = None,
+        result_cache: Optional[ResultCache] = None,
+        sync_timeout: float = DEFAULT_SYNC_TIMEOUT,
+        async_executor: Optional[AsyncExecutor] = None,
     ):
         self.capabilities = Capabilities(title=title, description=description, links=[])
-        self.executor = executor or ThreadPoolExecutor(max_workers=3)
+        capacity = capacity or get_capacity(
+            os.environ.get(S2GOS_CPUS_ENV_VAR), os.environ.get(S2GOS_MEMORY_ENV_VAR)
+        )
+        # With a node capacity, the resources required by the jobs
+        # rather than the number of workers limit the concurrency
+        self.executor = executor or ThreadPoolExecutor(
+            max_workers=DEFAULT_EXECUTOR_MAX_WORKERS if capacity is not None else 3
+        )
+        # Decides which jobs are submitted to the executor next
+        self.scheduler = JobScheduler(
+            self.executor,
+            max_concurrency=max_concurrency,
+            policy=scheduling_policy,
+            capacity=capacity,
+        )
+        # Decides which jobs of async processes are started next as
+        # asyncio tasks, which require no threads and no resources
+        self.async_scheduler = JobScheduler(
+            async_executor or AsyncExecutor(), policy=scheduling_policy
+        )
+        # Connects jobs that run in the workers of a process pool with
+        # their status information here, None for other executors
+        self.job_channel = (
+            JobChannel(getattr(self.executor, "_mp_context", None))
+            if isinstance(self.executor, ProcessPoolExecutor)
+            else None
+        )
+        # Limit the progress updates published per job
+        self.progress_interval = progress_interval
+        self.progress_delta = progress_delta
+        # Maximum time to wait for the results of synchronous executions
+        self.sync_timeout = sync_timeout
         self.process_registry = ProcessRegistry()
-        self.jobs: dict[str, Job] = {}
+        # The jobs executed by this process
+        self.jobs = JobTable()
+        # The jobs of this process that have not started yet
+        self.job_queue = JobQueue(max_queue_size)
+        # The jobs of all processes serving the same job table
+        self.job_store = job_store or create_job_store(
+            os.environ.get(S2GOS_JOB_STORE_ENV_VAR)
+        )
+        self.job_store.set_cancellation_handler(self._cancel_job)
+        self.job_store.set_submission_handler(self._on_job_submitted)
+        self.job_events = JobEventHub()
+        # Removes finished jobs and evicts their results
+        self.job_reaper = JobReaper(
+            retention or RetentionPolicy(),
+            remove_job=self._remove_job,
+            release_results=self._release_job_results,
+            get_results_json=self._get_job_results_json,
+        )
+        # Results of deterministic processes, by their inputs
+        self.result_cache = result_cache or ResultCache(
+            cache_dir=os.environ.get(S2GOS_RESULT_CACHE_DIR_ENV_VAR)
+        )
+        # Active jobs of deterministic processes, by their result keys
+        self._inflight_jobs: dict[str, Job] = {}
+        self.callbacks = callbacks or CallbackDispatcher()
+        # The conformance declaration and process list, recreated only
+        # when a process is registered, so the app can send the cached
+        # encodings of the models returned as long as they are unchanged
+        self._catalog: dict[str, Any] = {}
+        self._catalog_version = self.process_registry.version
+
+    def close(self):
+        """Shut down the service, e.g., when the server stops.
+
+        Jobs that have not started yet are cancelled, running jobs
+        are awaited. Then the components that track the jobs are
+        stopped, outstanding callbacks are delivered, and pending
+        updates are written to the job store.
+        """
+        # Running jobs still report to the components below
+        self.executor.shutdown(wait=True, cancel_futures=True)
+        self.async_scheduler.executor.shutdown(wait=True)
+        if self.job_channel is not None:
+            self.job_channel.close()
+        self.job_reaper.close()
+        self.callbacks.close()
+        self.job_store.close()
 
     async def get_capabilities(self) -> Capabilities:
         return self.capabilities
 
     async def get_conformance(self) -> ConformanceDeclaration:
+        return self._get_catalog_model("conformance", self._get_conformance)
+
+    async def get_processes(self) -> ProcessList:
+        return self._get_catalog_model("processes", self._get_processes)
+
+    async def get_process(self, process_id: str) -> ProcessDescription:
+        process_entry = self._get_process_entry(process_id)
+        return process_entry.process
+
+    def _get_catalog_model(self, key: str, factory: Callable[[], Any]) -> Any:
+        if self._catalog_version != self.process_registry.version:
+            self._catalog_version = self.process_registry.version
+            self._catalog.clear()
+        model = self._catalog.get(key)
+        if model is None:
+            model = factory()
+            self._catalog[key] = model
+        return model
+
+    @staticmethod
+    def _get_conformance() -> ConformanceDeclaration:
         return ConformanceDeclaration(
             conformsTo=[
                 "http://www.opengis.net/spec/ogcapi-processes-1/1.0/conf/core",
@@ -58,12 +223,12 @@ class LocalService(Service):
                 # "http://www.opengis.net/spec/ogcapi-processes-1/1.0/conf/html",
                 "http://www.opengis.net/spec/ogcapi-processes-1/1.0/conf/oas30",
                 "http://www.opengis.net/spec/ogcapi-processes-1/1.0/conf/job-list",
-                # "http://www.opengis.net/spec/ogcapi-processes-1/1.0/conf/callback",
+                "http://www.opengis.net/spec/ogcapi-processes-1/1.0/conf/callback",
                 "http://www.opengis.net/spec/ogcapi-processes-1/1.0/conf/dismiss",
             ]
         )
 
-    async def get_processes(self) -> ProcessList:
+    def _get_processes(self) -> ProcessList:
         return ProcessList(
             processes=[
                 ProcessSummary(
@@ -77,14 +242,103 @@ class LocalService(Service):
             links=[],
         )
 
-    async def get_process(self, process_id: str) -> ProcessDescription:
-        process_entry = self._get_process_entry(process_id)
-        return process_entry.process
-
     async def execute_process(
-        self, process_id: str, request: ProcessRequest
+        self,
+        process_id: str,
+        request: ProcessRequest,
+        prefer: Optional[str] = None,
+        idempotency_key: Optional[str] = None,
     ) -> JSONResponse:
         process_entry = self._get_process_entry(process_id)
+        sync_timeout = self._get_sync_timeout(process_entry, prefer)
+        if sync_timeout is None:
+            job_info, headers = self._create_job(
+                process_entry, request, idempotency_key
+            )
+        else:
+            # Subscribe before creating the job, so no change gets lost
+            subscription = self.job_events.subscribe(process_id=process_id)
+            try:
+                job_info, headers = self._create_job(
+                    process_entry, request, idempotency_key
+                )
+                job_info = await self._wait_for_job(
+                    job_info, subscription, sync_timeout
+                )
+            finally:
+                self.job_events.unsubscribe(subscription)
+            if job_info.status == StatusCode.successful:
+                data = await asyncio.to_thread(
+                    self._get_job_results_json, job_info.jobID
+                )
+                if data is not None:
+                    # 200 means, results of sync execution
+                    return EncodedJSONResponse(
+                        data, headers={**headers, "Preference-Applied": "respond-sync"}
+                    )
+        # 201 means, async execution started
+        return JSONResponse(
+            status_code=201, content=job_info.model_dump(mode="json"), headers=headers
+        )
+
+    def _get_sync_timeout(
+        self, process_entry: ProcessRegistry.Entry, prefer: Optional[str]
+    ) -> Optional[float]:
+        """Get the time to wait for the results of a job before
+        responding, or `None` if the job is executed asynchronously.
+        """
+        preferences = _parse_prefer(prefer)
+        job_control_options = process_entry.process.jobControlOptions or []
+        sync_only = (
+            JobControlOptions.sync_execute in job_control_options
+            and JobControlOptions.async_execute not in job_control_options
+        )
+        if "respond-sync" not in preferences and (
+            not sync_only or "respond-async" in preferences
+        ):
+            return None
+        try:
+            return max(0.0, min(self.sync_timeout, float(preferences["wait"])))
+        except (KeyError, TypeError, ValueError):
+            return self.sync_timeout
+
+    async def _wait_for_job(
+        self, job_info: JobInfo, subscription: JobEventSubscription, timeout: float
+    ) -> JobInfo:
+        """Wait until the given job finished or the timeout elapsed.
+
+        Returns:
+            The latest status of the job.
+        """
+        job_id = job_info.jobID
+        subscription.job_ids = {job_id}
+        deadline = time.monotonic() + timeout
+        while job_info.status not in FINISHED_STATUS_CODES:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            # Changes of jobs executed by other processes are not
+            # published here, so their status is polled. Job store reads
+            # may block and are therefore made in a worker thread.
+            await subscription.get(timeout=min(remaining, DEFAULT_SYNC_POLL_INTERVAL))
+            record = await asyncio.to_thread(self._find_job_record, job_id)
+            if record is None:
+                break
+            job_info = record.job_info
+        return job_info
+
+    def _create_job(
+        self,
+        process_entry: ProcessRegistry.Entry,
+        request: ProcessRequest,
+        idempotency_key: Optional[str],
+    ) -> tuple[JobInfo, dict[str, str]]:
+        """Create a job for the given request, unless an equal one
+        can be used.
+
+        Returns:
+            The status of the job and the headers of the response.
+        """
         process_info = process_entry.process
 
         input_params = (
@@ -106,41 +360,414 @@ class LocalService(Service):
         # print("input_default_params:", input_default_params)
         # print("params:", function_kwargs)
 
-        job_id = f"job_{len(self.jobs)}"
+        # Identifies equal requests, also the results of deterministic ones
+        request_key = get_result_key(
+            process_info.id, process_info.version, function_kwargs
+        )
+        job_id = self.job_store.new_job_id()
+        cached_data: Optional[bytes] = None
+        inflight_job: Optional[Job] = None
+        if process_entry.deterministic:
+            cached_data = self.result_cache.get(request_key)
+            if cached_data is None:
+                inflight_job = self._get_inflight_job(request_key)
+                if inflight_job is not None:
+                    job_id = inflight_job.status_info.jobID
+        if idempotency_key:
+            claimed_job_info = self._claim_idempotency_key(
+                idempotency_key, job_id, request_key
+            )
+            if claimed_job_info is not None:
+                return claimed_job_info, {"Idempotent-Replayed": "true"}
+        if inflight_job is not None:
+            return self._attach_job(inflight_job, request), {}
+
         job = Job(
             process_id=process_info.id,
             job_id=job_id,
             function=process_entry.function,
             function_kwargs=function_kwargs,
+            progress_interval=self.progress_interval,
+            progress_delta=self.progress_delta,
         )
-        self.jobs[job_id] = job
-        job.future = self.executor.submit(job.run)
-        # 201 means, async execution started
-        return JSONResponse(
-            status_code=201, content=job.status_info.model_dump(mode="json")
+        if process_entry.deterministic:
+            job.result_key = request_key
+            if cached_data is not None:
+                return self._complete_cached_job(job, request, cached_data), {}
+        job.expected_runtime = process_entry.runtime_model.estimate(function_kwargs)
+        try:
+            self._admit_job(job, process_entry)
+        except JSONContentException:
+            if idempotency_key:
+                # The request may be repeated once the queue drained
+                self.job_store.release_idempotency_key(idempotency_key, job_id)
+            raise
+        job.take_snapshot()
+        job_info = job.snapshot.status_info
+        # Jobs are executed by the executor process only,
+        # which may be another one than this process
+        job_request = JobRequest(
+            job_info,
+            function_kwargs,
+            request.subscriber,
+            request.priority or 0,
+            request.userName,
         )
+        is_executor = self.job_store.submit(job_request)
+        self.job_events.publish(job_info)
+        if is_executor:
+            self._run_job(job, job_request, process_entry)
+        return job_info, {}
+
+    def _claim_idempotency_key(
+        self, key: str, job_id: str, request_key: str
+    ) -> Optional[JobInfo]:
+        """Associate the idempotency key of a request with a job.
+
+        Returns:
+            `None` if the key has been associated with the job,
+            otherwise the status of the job created by the request
+            that used the key.
+        """
+        claimed_job_id, claimed_request_key = self.job_store.claim_idempotency_key(
+            key, job_id, request_key
+        )
+        if claimed_job_id == job_id:
+            return None
+        if claimed_request_key != request_key:
+            raise JSONContentException(
+                422, detail=f"Idempotency key {key!r} has been used for another request"
+            )
+        record = self._find_job_record(claimed_job_id)
+        if record is None:
+            # The request that used the key did not submit its job yet
+            raise JSONContentException(
+                409,
+                detail=f"A request with idempotency key {key!r} is in progress",
+                headers={"Retry-After": str(DEFAULT_IDEMPOTENCY_RETRY_AFTER)},
+            )
+        return record.job_info
+
+    def _get_inflight_job(self, result_key: str) -> Optional[Job]:
+        """Get an active job of a deterministic process
+        executed by this process, whose results have the given key.
+        """
+        job = self._inflight_jobs.get(result_key)
+        if job is None or job.cancelled:
+            return None
+        if job.snapshot.status_info.status not in (
+            StatusCode.accepted,
+            StatusCode.running,
+        ):
+            return None
+        return job
+
+    def _attach_job(self, job: Job, request: ProcessRequest) -> JobInfo:
+        """Respond to a request with an active job of equal inputs,
+        rather than running another one.
+        """
+        subscriber = request.subscriber
+        if subscriber is not None:
+            job.add_listener(lambda j: self._notify_in_progress(j, subscriber))
+            job.future.add_done_callback(
+                lambda _f: self._notify_finished(job, subscriber)
+            )
+        return self._get_status_info(job)
+
+    def _complete_cached_job(
+        self, job: Job, request: ProcessRequest, data: bytes
+    ) -> JobInfo:
+        """Complete a job with results taken from the result cache,
+        without queueing it or calling the user function.
+        """
+        job.cached_results = JobResults.model_validate_json(data)
+        job.user_name = request.userName
+        job.future = Future()
+        job.future.set_result(None)
+        self.jobs.put(job)
+        job.add_listener(self._on_job_changed)
+        job._start_job()
+        job._finish_job(StatusCode.successful, message="Results taken from cache")
+        if request.subscriber is not None:
+            self._notify_finished(job, request.subscriber)
+        return job.snapshot.status_info
 
-    async def get_jobs(self) -> JobList:
-        return JobList(jobs=[job.status_info for job in self.jobs.values()], links=[])
+    def _admit_job(self, job: Job, process_entry: ProcessRegistry.Entry):
+        job_info = job.status_info
+        try:
+            if self.job_store.is_executor:
+                position = self.job_queue.put(
+                    job_info.jobID, job_info.processID, process_entry.max_queue_size
+                )
+                job_info.queueDepth = position.depth
+                job_info.waitTime = position.wait_time
+                job_info.eta = _get_eta(job, position.wait_time)
+            else:
+                self._check_store_queue(job_info.processID, process_entry)
+        except QueueFullError as e:
+            raise JSONContentException(
+                503, detail=f"{e}", headers={"Retry-After": str(e.retry_after)}
+            )
 
-    async def get_job(self, job_id: str) -> JobInfo:
-        job = self._get_job(job_id, forbidden_status_codes={})
-        return job.status_info
+    def _check_store_queue(self, process_id: str, process_entry: ProcessRegistry.Entry):
+        """Check the queue of jobs that are waiting for the executor process,
+        whose drain rate is unknown to this process.
+        """
+        for max_size, process_ids, name in (
+            (self.job_queue.max_size, None, "the service"),
+            (process_entry.max_queue_size, [process_id], f"process {process_id!r}"),
+        ):
+            if max_size is None:
+                continue
+            job_infos, _ = self.job_store.query(
+                offset=max_size - 1,
+                limit=1,
+                statuses=[StatusCode.accepted],
+                process_ids=process_ids,
+            )
+            if job_infos:
+                raise QueueFullError(
+                    f"Too many jobs queued for {name}", DEFAULT_QUEUE_RETRY_AFTER
+                )
+
+    def _on_job_submitted(self, request: JobRequest):
+        """Run a job submitted by another process."""
+        job_info = request.job_info
+        process_entry = self.process_registry.get_entry(job_info.processID)
+        if process_entry is None:
+            job_info.status = StatusCode.failed
+            job_info.message = f"Process {job_info.processID!r} does not exist"
+            job_info.finished = datetime.datetime.now()
+            self.job_store.put(job_info, 1)
+            return
+        job = Job(
+            process_id=job_info.processID,
+            job_id=job_info.jobID,
+            function=process_entry.function,
+            function_kwargs=request.function_kwargs,
+            progress_interval=self.progress_interval,
+            progress_delta=self.progress_delta,
+        )
+        job.status_info.created = job_info.created
+        job.take_snapshot()
+        job.expected_runtime = process_entry.runtime_model.estimate(
+            request.function_kwargs
+        )
+        # The job has been accepted already
+        self.job_queue.put(job_info.jobID, job_info.processID, force=True)
+        self._run_job(job, request, process_entry)
+
+    def _run_job(
+        self, job: Job, request: JobRequest, process_entry: ProcessRegistry.Entry
+    ):
+        job.user_name = request.user_name
+        if process_entry.deterministic and job.result_key is None:
+            job.result_key = get_result_key(
+                process_entry.process.id,
+                process_entry.process.version,
+                job.function_kwargs,
+            )
+        if job.result_key is not None:
+            # Equal requests attach to the job until it finished
+            self._inflight_jobs.setdefault(job.result_key, job)
+        self.jobs.put(job)
+        job.add_listener(self._on_job_changed)
+        subscriber = request.subscriber
+        if subscriber is not None:
+            job.add_listener(lambda j: self._notify_in_progress(j, subscriber))
+        submit = functools.partial(
+            self._get_scheduler(process_entry).submit,
+            priority=request.priority,
+            user=request.user_name,
+            process_id=job.status_info.processID,
+            runtime=job.expected_runtime,
+            resources=process_entry.resources,
+        )
+        if process_entry.is_async:
+            # Runs in this process, even if the executor is a process pool
+            job.future = submit(job.run_async)
+        elif self.job_channel is not None:
+            job.future = self.job_channel.submit(job, submit)
+        else:
+            job.future = submit(job.run)
+        if subscriber is not None:
+            job.future.add_done_callback(
+                lambda _f: self._notify_finished(job, subscriber)
+            )
+
+    async def get_jobs(
+        self,
+        limit: int = 10,
+        offset: int = 0,
+        status: Optional[str] = None,
+        process_id: Optional[str] = None,
+        created: Optional[str] = None,
+        updated: Optional[str] = None,
+    ) -> JobList:
+        if not 1 <= limit <= MAX_JOB_LIST_LIMIT:
+            raise JSONContentException(
+                400, detail=f"limit must be in the range 1 to {MAX_JOB_LIST_LIMIT}"
+            )
+        if offset < 0:
+            raise JSONContentException(400, detail="offset must not be negative")
+        try:
+            job_infos, has_more = self.job_store.query(
+                offset=offset,
+                limit=limit,
+                statuses=(
+                    [StatusCode(s) for s in _split_list(status)] if status else None
+                ),
+                process_ids=_split_list(process_id) if process_id else None,
+                created=parse_interval(created) if created else None,
+                updated=parse_interval(updated) if updated else None,
+            )
+        except ValueError as e:
+            raise JSONContentException(400, detail=f"Invalid job filter: {e}")
+        # Prefer the current status of jobs executed by this process
+        jobs = [
+            self._get_status_info(job) if job is not None else job_info
+            for job, job_info in (
+                (self.jobs.get(job_info.jobID), job_info) for job_info in job_infos
+            )
+        ]
+        filters = dict(
+            status=status,
+            processID=process_id,
+            created=created,
+            updated=updated,
+        )
+        links = [_get_job_list_link("self", limit, offset, filters)]
+        if has_more:
+            links.append(_get_job_list_link("next", limit, offset + limit, filters))
+        if offset > 0:
+            links.append(
+                _get_job_list_link("prev", limit, max(0, offset - limit), filters)
+            )
+        return JobList(jobs=jobs, links=links)
+
+    async def get_job_events(
+        self, job_ids: Optional[str] = None, process_id: Optional[str] = None
+    ) -> StreamingResponse:
+        job_id_set: Optional[set[str]] = None
+        if job_ids:
+            job_id_set = {job_id.strip() for job_id in job_ids.split(",")}
+            for job_id in job_id_set:
+                self._get_job_record(job_id)
+        # Subscribe before taking the snapshot, so no change gets lost
+        subscription = self.job_events.subscribe(
+            job_ids=job_id_set, process_id=process_id
+        )
+        if job_id_set is not None:
+            records = [self._find_job_record(job_id) for job_id in job_id_set]
+            job_infos = [r.job_info.model_copy() for r in records if r is not None]
+        else:
+            job_infos = [
+                job_info
+                for job_info in (job.snapshot.status_info for job in self.jobs.values())
+                if subscription.matches(job_info)
+            ]
+        return StreamingResponse(
+            self.job_events.stream(
+                subscription,
+                job_infos,
+                poll=self._new_job_event_poll(subscription, job_infos),
+            ),
+            media_type=EVENT_STREAM_MEDIA_TYPE,
+            headers={"Cache-Control": "no-cache"},
+        )
+
+    def _new_job_event_poll(
+        self, subscription: JobEventSubscription, job_infos: list[JobInfo]
+    ) -> Callable[[], list[JobInfo]]:
+        """Create a function that gets the changes of the subscribed
+        jobs from the job store, as only the executor process publishes
+        the changes of the jobs it executes.
+        """
+        seen = {job_info.jobID: job_info for job_info in job_infos}
+        since = datetime.datetime.now()
+
+        def poll() -> list[JobInfo]:
+            nonlocal since
+            if self.job_store.is_executor:
+                return []
+            if subscription.job_ids is not None:
+                records = [self.job_store.get(j) for j in subscription.job_ids]
+                candidates = [r.job_info for r in records if r is not None]
+            else:
+                now = datetime.datetime.now()
+                candidates, _ = self.job_store.query(
+                    # Progress may be written later than it is reported
+                    updated=(since - JOB_EVENT_POLL_LOOKBACK, None),
+                    process_ids=(
+                        [subscription.process_id]
+                        if subscription.process_id is not None
+                        else None
+                    ),
+                )
+                since = now
+            changes = [j for j in candidates if seen.get(j.jobID) != j]
+            seen.update((j.jobID, j) for j in changes)
+            return changes
+
+        return poll
+
+    async def get_job(self, job_id: str) -> JobInfo | EncodedJSONResponse:
+        job_info, version = self._get_job_record(job_id)
+        etag = f"{self.job_store.uid}-j-{version}"
+        if job_info.status == StatusCode.accepted and job_info.queueDepth is not None:
+            # The queue position changes without a new job version
+            etag += f"-q{job_info.queueDepth}"
+        return EncodedJSONResponse(
+            job_info.model_dump_json(by_alias=True).encode("utf-8"),
+            headers={
+                # Job versions are shared by all processes
+                # serving the same job table
+                "ETag": f'"{etag}"',
+                "Last-Modified": format_http_date(get_update_time(job_info)),
+            },
+        )
 
     async def dismiss_job(self, job_id: str) -> JobInfo:
-        job = self._get_job(job_id, forbidden_status_codes={})
-        if job.status_info.status in (StatusCode.accepted, StatusCode.running):
-            job.cancel()
-        elif job.status_info.status in (
+        return self._dismiss_job(job_id)
+
+    async def get_job_statuses(self, request: JobIdList) -> JobBatchResponse:
+        return _run_batch(
+            request.jobIds,
+            lambda job_id: self._get_job_info(job_id, forbidden_status_codes={}),
+        )
+
+    async def dismiss_jobs(self, request: JobIdList) -> JobBatchResponse:
+        return _run_batch(request.jobIds, self._dismiss_job)
+
+    def _dismiss_job(self, job_id: str) -> JobInfo:
+        job_info = self._get_job_info(job_id, forbidden_status_codes={})
+        if job_info.status in (StatusCode.accepted, StatusCode.running):
+            if job_id in self.jobs:
+                self._cancel_job(job_id)
+            else:
+                self.job_store.request_cancellation(job_id)
+        elif job_info.status in (
             StatusCode.dismissed,
             StatusCode.successful,
             StatusCode.failed,
         ):
-            del self.jobs[job_id]
-        return job.status_info
+            self._remove_job(job_id)
+            self.job_reaper.discard(job_id)
+        return job_info
+
+    def _remove_job(self, job_id: str):
+        self.jobs.pop(job_id, None)
+        self.job_store.remove(job_id)
+
+    def _cancel_job(self, job_id: str):
+        job = self.jobs.get(job_id)
+        if job is not None:
+            job.cancel()
+            if self.job_channel is not None:
+                self.job_channel.cancel(job_id)
 
     async def get_job_results(self, job_id: str) -> JobResults:
-        job = self._get_job(
+        self._get_job_info(
             job_id,
             forbidden_status_codes={
                 StatusCode.accepted: "has not started yet",
@@ -149,7 +776,41 @@ class LocalService(Service):
                 StatusCode.failed: "has failed",
             },
         )
-        result = job.future.result()
+        results = self._find_job_results(job_id)
+        if results is None:
+            raise JSONContentException(
+                404, detail=f"Results of job {job_id!r} are not available"
+            )
+        return results
+
+    def _find_job_results(self, job_id: str) -> Optional[JobResults]:
+        job = self.jobs.get(job_id)
+        if job is not None and not job.results_released:
+            return self._get_job_results(job)
+        results = self.job_store.get_results(job_id)
+        if results is not None:
+            return results
+        data = self.job_reaper.load_spilled_results(job_id)
+        if data is not None:
+            return JobResults.model_validate_json(data)
+        return None
+
+    def _get_job_results_json(self, job_id: str) -> Optional[bytes]:
+        results = self._find_job_results(job_id)
+        if results is None:
+            return None
+        return results.model_dump_json(by_alias=True).encode("utf-8")
+
+    def _release_job_results(self, job_id: str):
+        job = self.jobs.get(job_id)
+        if job is not None:
+            job.release_results()
+        self.job_store.release_results(job_id)
+
+    def _get_job_results(self, job: Job) -> JobResults:
+        if job.cached_results is not None:
+            return job.cached_results
+        result = job.result
         entry = self.process_registry.get_entry(job.status_info.processID)
         outputs = entry.process.outputs or {}
         output_count = len(outputs)
@@ -172,7 +833,20 @@ class LocalService(Service):
 
     def register_process(self, function: Callable, **kwargs) -> ProcessRegistry.Entry:
         """Register a user function as process."""
-        return self.process_registry.register_function(function, **kwargs)
+        entry = self.process_registry.register_function(function, **kwargs)
+        scheduler = self._get_scheduler(entry)
+        capacity = scheduler.capacity
+        if capacity is not None and not entry.resources.fits(capacity):
+            logger.warning(
+                f"Process {entry.process.id!r} requires {entry.resources},"
+                f" more than the node capacity {capacity},"
+                f" its jobs will run alone"
+            )
+        scheduler.set_process_concurrency(entry.process.id, entry.max_concurrency)
+        return entry
+
+    def _get_scheduler(self, process_entry: ProcessRegistry.Entry) -> JobScheduler:
+        return self.async_scheduler if process_entry.is_async else self.scheduler
 
     def _get_process_entry(self, process_id: str) -> ProcessRegistry.Entry:
         process_entry = self.process_registry.get_entry(process_id)
@@ -182,13 +856,188 @@ class LocalService(Service):
             )
         return process_entry
 
-    def _get_job(
+    def _get_status_info(self, job: Job) -> JobInfo:
+        """Get the status of a job executed by this process, including
+        its current queue position and ETA if it has not started yet.
+        """
+        job_info = job.snapshot.status_info
+        if job_info.status != StatusCode.accepted:
+            return job_info
+        position = self.job_queue.get_position(job_info.jobID)
+        if position is None:
+            return job_info
+        return job_info.model_copy(
+            update=dict(
+                queueDepth=position.depth,
+                waitTime=position.wait_time,
+                eta=_get_eta(job, position.wait_time),
+            )
+        )
+
+    def _on_job_changed(self, job: Job):
+        job_info, version = job.snapshot
+        if job_info.status != StatusCode.accepted:
+            self.job_queue.remove(job_info.jobID)
+        # While running, only report_progress() sets the update time
+        if job_info.status == StatusCode.running and job_info.updated is not None:
+            self.job_store.put_progress(job_info, version)
+        else:
+            result_size = 0
+            if job_info.status == StatusCode.successful:
+                # Store results first, so they are available
+                # once the job is seen as successful
+                result_size = self._put_job_results(job)
+                self._update_runtime_model(job)
+            self.job_store.put(job_info, version)
+            if job_info.status in (
+                StatusCode.successful,
+                StatusCode.failed,
+                StatusCode.dismissed,
+            ):
+                if (
+                    job.result_key is not None
+                    and self._inflight_jobs.get(job.result_key) is job
+                ):
+                    del self._inflight_jobs[job.result_key]
+                self.job_reaper.add(job_info.jobID, job.user_name, result_size)
+        self.job_events.publish(job_info)
+
+    def _update_runtime_model(self, job: Job):
+        if job.cached_results is not None:
+            # The process did not run, so its runtime is unknown
+            return
+        job_info = job.status_info
+        entry = self.process_registry.get_entry(job_info.processID)
+        if entry is not None and job_info.started and job_info.finished:
+            entry.runtime_model.update(
+                job.function_kwargs,
+                (job_info.finished - job_info.started).total_seconds(),
+            )
+
+    def _put_job_results(self, job: Job) -> int:
+        """Store the results of a job.
+
+        Returns:
+            The estimated size of the results in memory.
+        """
+        job_id = job.status_info.jobID
+        if job.results_released:
+            # Stored already before they have been released
+            return 0
+        try:
+            results = self._get_job_results(job)
+            self.job_store.put_results(job_id, results)
+            data = results.model_dump_json(by_alias=True).encode("utf-8")
+            if job.result_key is not None and job.cached_results is None:
+                self.result_cache.put(job.result_key, data)
+            return len(data)
+        except Exception as e:
+            logger.warning(f"Failed to store results of job {job_id!r}: {e}")
+            return 0
+
+    def _notify_in_progress(self, job: Job, subscriber: Subscriber):
+        if (
+            subscriber.inProgressUri is not None
+            and job.status_info.status == StatusCode.running
+        ):
+            self.callbacks.notify_progress(
+                str(subscriber.inProgressUri), job.snapshot.status_info
+            )
+
+    def _notify_finished(self, job: Job, subscriber: Subscriber):
+        job_id = job.status_info.jobID
+        status = job.status_info.status
+        if status == StatusCode.successful and subscriber.successUri is not None:
+            # Results may have been evicted meanwhile
+            results = self._find_job_results(job_id)
+            if results is not None:
+                self.callbacks.notify(job_id, str(subscriber.successUri), results)
+        elif status == StatusCode.failed and subscriber.failedUri is not None:
+            self.callbacks.notify(
+                job_id, str(subscriber.failedUri), job.snapshot.status_info
+            )
+
+    def _get_job_info(
         self, job_id: str, forbidden_status_codes: dict[StatusCode, str]
-    ) -> Job:
-        job = self.jobs.get(job_id)
-        if job is None:
-            raise JSONContentException(404, detail=f"Job {job_id!r} does not exist")
-        message = forbidden_status_codes.get(job.status_info.status)
+    ) -> JobInfo:
+        job_info = self._get_job_record(job_id).job_info
+        message = forbidden_status_codes.get(job_info.status)
         if message:
             raise JSONContentException(403, detail=f"Job {job_id!r} {message}")
-        return job
+        return job_info
+
+    def _get_job_record(self, job_id: str) -> JobRecord:
+        record = self._find_job_record(job_id)
+        if record is None:
+            raise JSONContentException(404, detail=f"Job {job_id!r} does not exist")
+        return record
+
+    def _find_job_record(self, job_id: str) -> Optional[JobRecord]:
+        job = self.jobs.get(job_id)
+        snapshot = job.snapshot if job is not None else None
+        if snapshot is not None and snapshot.status_info.status in (
+            StatusCode.accepted,
+            StatusCode.running,
+        ):
+            # Progress of active jobs executed by this process
+            # may not have been written to the store yet
+            job_info = snapshot.status_info
+            if job_info.status == StatusCode.accepted:
+                job_info = self._get_status_info(job)
+            return JobRecord(job_info, snapshot.version)
+        record = self.job_store.get(job_id)
+        if record is None and job is not None:
+            # Job has been removed by another process
+            self.jobs.pop(job_id, None)
+            self.job_reaper.discard(job_id)
+        return record
+
+
+def _parse_prefer(prefer: Optional[str]) -> dict[str, Optional[str]]:
+    """Parse the preferences of a `Prefer` header, see RFC 7240.
+    Parameters of preferences are ignored.
+    """
+    preferences: dict[str, Optional[str]] = {}
+    for preference in (prefer or "").split(","):
+        name, _, value = preference.split(";")[0].partition("=")
+        name = name.strip().lower()
+        if name and name not in preferences:
+            preferences[name] = value.strip().strip('"') or None
+    return preferences
+
+
+def _run_batch(
+    job_ids: list[str], action: Callable[[str], JobInfo]
+) -> JobBatchResponse:
+    items: list[JobBatchItem] = []
+    for job_id in job_ids:
+        try:
+            items.append(JobBatchItem(jobID=job_id, jobInfo=action(job_id)))
+        except JSONContentException as e:
+            items.append(JobBatchItem(jobID=job_id, error=e.content))
+    return JobBatchResponse(jobs=items)
+
+
+def _get_eta(job: Job, wait_time: Optional[float]) -> Optional[datetime.datetime]:
+    if wait_time is None or job.expected_runtime is None:
+        return None
+    return datetime.datetime.now() + datetime.timedelta(
+        seconds=wait_time + job.expected_runtime
+    )
+
+
+def _split_list(value: str) -> list[str]:
+    return [item.strip() for item in value.split(",") if item.strip()]
+
+
+def _get_job_list_link(
+    rel: str, limit: int, offset: int, filters: dict[str, Any]
+) -> Link:
+    query = urlencode(
+        dict(
+            limit=limit,
+            offset=offset,
+            **{k: v for k, v in filters.items() if v is not None},
+        )
+    )
+    return Link(href=f"/jobs?{query}", rel=rel, type="application/json")
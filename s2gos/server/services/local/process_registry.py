@@ -18,6 +18,8 @@ from s2gos.common.models import (
     ProcessDescription,
     Schema,
 )
+from s2gos.server.services.local.resources import Resources, parse_memory
+from s2gos.server.services.local.runtime_model import RuntimeModel
 from s2gos.server.services.local.schema_factory import Annotation, SchemaFactory
 
 
@@ -27,9 +29,25 @@ class ProcessRegistry:
         function: Callable
         signature: inspect.Signature
         process: ProcessDescription
+        # Maximum number of queued jobs, None for no limit
+        max_queue_size: Optional[int] = None
+        # Maximum number of running jobs, None for no limit
+        max_concurrency: Optional[int] = None
+        # Resources required by each of the process' jobs
+        resources: Resources = Resources()
+        # Whether equal inputs always give equal results,
+        # so that results may be taken from the result cache
+        deterministic: bool = False
+        # Whether the function is a coroutine function,
+        # whose jobs run as asyncio tasks rather than in threads
+        is_async: bool = False
+        # Learns the runtimes of the process' jobs
+        runtime_model: RuntimeModel = dataclasses.field(default_factory=RuntimeModel)
 
     def __init__(self):
         self._dict: dict[str, ProcessRegistry.Entry] = {}
+        # Incremented on each registration
+        self.version = 0
 
     def get_process_list(self) -> list[ProcessDescription]:
         return [v.process for v in self._dict.values()]
@@ -54,6 +72,13 @@ class ProcessRegistry:
         input_schemas = kwargs.pop("inputs", None) or {}
         output_schemas = kwargs.pop("outputs", None) or {}
         description = kwargs.pop("description", None) or function.__doc__
+        max_queue_size = kwargs.pop("max_queue_size", None)
+        max_concurrency = kwargs.pop("max_concurrency", None)
+        runtime_features = kwargs.pop("runtime_features", None)
+        deterministic = bool(kwargs.pop("deterministic", False))
+        resources = Resources(
+            float(kwargs.pop("cpus", 1.0)), parse_memory(kwargs.pop("memory", 0))
+        )
 
         signature = inspect.signature(function)
         if not input_schemas:
@@ -77,8 +102,15 @@ class ProcessRegistry:
                 outputs=outputs,
                 **kwargs,
             ),
+            max_queue_size=max_queue_size,
+            max_concurrency=max_concurrency,
+            resources=resources,
+            deterministic=deterministic,
+            is_async=inspect.iscoroutinefunction(function),
+            runtime_model=RuntimeModel(runtime_features),
         )
         self._dict[id_] = entry
+        self.version += 1
         return entry
 
 
@@ -0,0 +1,106 @@
+#  Copyright (c) 2025 by ESA DTE-S2GOS team and contributors
+#  Permissions are hereby granted under the terms of the Apache 2.0 License:
+#  https://opensource.org/license/apache-2-0.
+
+import os
+import re
+from typing import NamedTuple, Optional
+
+MEMORY_UNITS = {
+    "": 1,
+    "K": 1000,
+    "M": 1000**2,
+    "G": 1000**3,
+    "T": 1000**4,
+    "KI": 1024,
+    "MI": 1024**2,
+    "GI": 1024**3,
+    "TI": 1024**4,
+}
+
+_MEMORY_PATTERN = re.compile(r"^\s*(\d+(?:\.\d*)?)\s*([KMGT]I?)?B?\s*$", re.IGNORECASE)
+
+
+class Resources(NamedTuple):
+    """Resources required by a job or provided by a node."""
+
+    cpus: float = 1.0
+    """Number of CPU cores."""
+    memory: int = 0
+    """Memory size in bytes."""
+
+    def __add__(self, other: "Resources") -> "Resources":
+        return Resources(self.cpus + other.cpus, self.memory + other.memory)
+
+    def __sub__(self, other: "Resources") -> "Resources":
+        return Resources(self.cpus - other.cpus, self.memory - other.memory)
+
+    def fits(self, capacity: "Resources") -> bool:
+        """Test whether these resources fit into the given capacity.
+        A memory capacity of zero means that memory is not limited.
+        """
+        return self.cpus <= capacity.cpus and (
+            capacity.memory <= 0 or self.memory <= capacity.memory
+        )
+
+    def clip(self, capacity: "Resources") -> "Resources":
+        """Limit these resources to the given capacity."""
+        return Resources(
+            min(self.cpus, capacity.cpus),
+            min(self.memory, capacity.memory) if capacity.memory > 0 else self.memory,
+        )
+
+
+NO_RESOURCES = Resources(0.0, 0)
+
+
+def parse_memory(memory: int | float | str) -> int:
+    """Parse a memory size, given either as number of bytes or as string
+    with an optional unit such as `"512MB"`, `"8G"`, or `"4GiB"`.
+
+    Raises:
+        ValueError: If the memory size is invalid.
+    """
+    if isinstance(memory, (int, float)) and not isinstance(memory, bool):
+        if memory < 0:
+            raise ValueError(f"memory size must not be negative, was {memory}")
+        return int(memory)
+    match = _MEMORY_PATTERN.match(memory) if isinstance(memory, str) else None
+    if match is None:
+        raise ValueError(f"invalid memory size {memory!r}")
+    value, unit = match.groups()
+    return int(float(value) * MEMORY_UNITS[(unit or "").upper()])
+
+
+def get_node_capacity() -> Resources:
+    """Get the resources of the current node, that is, the number of
+    CPU cores and the physical memory size, if it can be determined.
+    """
+    try:
+        cpus = len(os.sched_getaffinity(0))
+    except AttributeError:
+        cpus = os.cpu_count() or 1
+    return Resources(float(cpus), _get_physical_memory() or 0)
+
+
+def get_capacity(
+    cpus: Optional[float | str] = None, memory: Optional[int | float | str] = None
+) -> Optional[Resources]:
+    """Get the configured capacity of the node, or `None` if
+    neither the number of CPU cores nor the memory size is given.
+    The one not given defaults to the resources of the current node.
+    """
+    if cpus is None and memory is None:
+        return None
+    node_capacity = get_node_capacity()
+    return Resources(
+        float(cpus) if cpus is not None else node_capacity.cpus,
+        parse_memory(memory) if memory is not None else node_capacity.memory,
+    )
+
+
+def _get_physical_memory() -> Optional[int]:
+    try:
+        return os.sysconf("SC_PAGE_SIZE") * os.sysconf("SC_PHYS_PAGES")
+    except (AttributeError, ValueError, OSError):
+        return None
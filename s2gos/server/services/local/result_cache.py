@@ -0,0 +1,213 @@
+#  Copyright (c) 2025 by ESA DTE-S2GOS team and contributors
+#  Permissions are hereby granted under the terms of the Apache 2.0 License:
+#  https://opensource.org/license/apache-2-0.
+
+import collections
+import hashlib
+import json
+import tempfile
+import threading
+from logging import getLogger
+from pathlib import Path
+from typing import Any, NamedTuple, Optional
+
+from s2gos.server.defaults import (
+    DEFAULT_RESULT_CACHE_MAX_DISK_SIZE,
+    DEFAULT_RESULT_CACHE_MAX_MEMORY,
+)
+
+logger = getLogger("s2gos")
+
+
+def get_result_key(
+    process_id: str, process_version: Optional[str], function_kwargs: dict[str, Any]
+) -> str:
+    """Get the key of the results of a deterministic process.
+
+    The key is a hash of the process identifier and version and of
+    the normalized inputs, so equal inputs given in a different
+    order have the same key.
+
+    Args:
+        process_id: The process identifier.
+        process_version: The process version.
+        function_kwargs: The user function's keyword arguments,
+            which must be JSON-serializable.
+    """
+    data = json.dumps(
+        [process_id, process_version, function_kwargs],
+        sort_keys=True,
+        separators=(",", ":"),
+        ensure_ascii=False,
+    )
+    return hashlib.sha256(data.encode("utf-8")).hexdigest()
+
+
+class ResultCacheStats(NamedTuple):
+    """The usage of a result cache."""
+
+    hits: int
+    """Number of lookups that found the results in memory."""
+    disk_hits: int
+    """Number of lookups that found the results on disk."""
+    misses: int
+    """Number of lookups that did not find the results."""
+    entries: int
+    """Number of results in memory."""
+    memory: int
+    """Size in bytes of the results in memory."""
+    disk_entries: int
+    """Number of results on disk."""
+    disk_size: int
+    """Size in bytes of the results on disk."""
+
+
+class ResultCache:
+    """Caches the JSON-encoded results of deterministic processes
+    by the keys computed by `get_result_key()`.
+
+    Results are kept in memory and evicted least recently used first,
+    once the memory limit is exceeded. If a cache directory is given,
+    results are written there too, so they outlive evictions and
+    restarts and are shared by the processes using the same directory.
+    The directory is limited likewise, the least recently used results
+    are deleted first.
+
+    Args:
+        max_memory: Maximum size in bytes of the results in memory.
+        cache_dir: Directory of the on-disk tier, if any.
+        max_disk_size: Maximum size in bytes of the results on disk,
+            `None` means no limit.
+    """
+
+    def __init__(
+        self,
+        max_memory: int = DEFAULT_RESULT_CACHE_MAX_MEMORY,
+        cache_dir: Optional[str] = None,
+        max_disk_size: Optional[int] = DEFAULT_RESULT_CACHE_MAX_DISK_SIZE,
+    ):
+        self.max_memory = max_memory
+        self.cache_dir = Path(cache_dir) if cache_dir else None
+        self.max_disk_size = max_disk_size
+        self._lock = threading.Lock()
+        # key --> results, least recently used first
+        self._items: collections.OrderedDict[str, bytes] = collections.OrderedDict()
+        self._memory = 0
+        # key --> size of results on disk, least recently used first
+        self._files: collections.OrderedDict[str, int] = collections.OrderedDict()
+        self._disk_size = 0
+        self._hits = 0
+        self._disk_hits = 0
+        self._misses = 0
+        if self.cache_dir is not None:
+            self._scan_cache_dir()
+
+    def get(self, key: str) -> Optional[bytes]:
+        """Get the results for the given key, if they are cached."""
+        with self._lock:
+            data = self._items.get(key)
+            if data is not None:
+                self._items.move_to_end(key)
+                self._hits += 1
+                return data
+        data = self._read_file(key)
+        with self._lock:
+            if data is None:
+                self._misses += 1
+                return None
+            self._disk_hits += 1
+            self._disk_size -= self._files.pop(key, 0)
+            self._files[key] = len(data)
+            self._disk_size += len(data)
+            self._put_item(key, data)
+        return data
+
+    def put(self, key: str, data: bytes):
+        """Cache the results for the given key."""
+        with self._lock:
+            self._put_item(key, data)
+        if self.cache_dir is not None:
+            self._write_file(key, data)
+
+    def get_stats(self) -> ResultCacheStats:
+        """Get the usage of this cache."""
+        with self._lock:
+            return ResultCacheStats(
+                hits=self._hits,
+                disk_hits=self._disk_hits,
+                misses=self._misses,
+                entries=len(self._items),
+                memory=self._memory,
+                disk_entries=len(self._files),
+                disk_size=self._disk_size,
+            )
+
+    def _put_item(self, key: str, data: bytes):
+        if len(data) > self.max_memory:
+            return
+        old_data = self._items.pop(key, None)
+        if old_data is not None:
+            self._memory -= len(old_data)
+        self._items[key] = data
+        self._memory += len(data)
+        while self._memory > self.max_memory:
+            _, evicted = self._items.popitem(last=False)
+            self._memory -= len(evicted)
+
+    def _get_path(self, key: str) -> Path:
+        return self.cache_dir / f"{key}.json"
+
+    def _read_file(self, key: str) -> Optional[bytes]:
+        if self.cache_dir is None:
+            return None
+        try:
+            # Other processes may have written it
+            return self._get_path(key).read_bytes()
+        except FileNotFoundError:
+            return None
+        except OSError as e:
+            logger.warning(f"Failed to read cached results {key!r}: {e}")
+            return None
+
+    def _write_file(self, key: str, data: bytes):
+        path = self._get_path(key)
+        temp_path: Optional[Path] = None
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            # Unique across the processes sharing the cache directory
+            with tempfile.NamedTemporaryFile(
+                dir=path.parent, prefix=f"{key}.", suffix=".tmp", delete=False
+            ) as temp_file:
+                temp_path = Path(temp_file.name)
+                temp_file.write(data)
+            # Readers never see partially written results
+            temp_path.replace(path)
+        except OSError as e:
+            logger.warning(f"Failed to write cached results {key!r}: {e}")
+            if temp_path is not None:
+                temp_path.unlink(missing_ok=True)
+            return
+        deleted: list[str] = []
+        with self._lock:
+            self._disk_size -= self._files.pop(key, 0)
+            self._files[key] = len(data)
+            self._disk_size += len(data)
+            if self.max_disk_size is not None:
+                while self._disk_size > self.max_disk_size and len(self._files) > 1:
+                    deleted_key, size = self._files.popitem(last=False)
+                    self._disk_size -= size
+                    deleted.append(deleted_key)
+        for deleted_key in deleted:
+            self._get_path(deleted_key).unlink(missing_ok=True)
+
+    def _scan_cache_dir(self):
+        try:
+            paths = sorted(
+                self.cache_dir.glob("*.json"), key=lambda p: p.stat().st_mtime
+            )
+            for path in paths:
+                size = path.stat().st_size
+                self._files[path.stem] = size
+                self._disk_size += size
+        except OSError as e:
+            logger.warning(f"Failed to scan result cache {self.cache_dir}: {e}")
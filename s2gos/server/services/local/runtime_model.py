@@ -0,0 +1,125 @@
+#  Copyright (c) 2025 by ESA DTE-S2GOS team and contributors
+#  Permissions are hereby granted under the terms of the Apache 2.0 License:
+#  https://opensource.org/license/apache-2-0.
+
+import math
+import threading
+from logging import getLogger
+from typing import Any, Callable, Optional, Sequence
+
+from s2gos.server.defaults import (
+    DEFAULT_RUNTIME_MODEL_FORGETTING_FACTOR,
+    DEFAULT_RUNTIME_MODEL_SMOOTHING,
+)
+
+logger = getLogger("s2gos")
+
+RuntimeFeatures = Sequence[str] | Callable[[dict[str, Any]], Sequence[float]]
+"""Either the names of numeric inputs or a function that computes
+numeric features from the inputs of a job.
+"""
+
+
+class RuntimeModel:
+    """An online model of the runtimes of a process' jobs.
+
+    Without features, the model estimates the geometric mean of the
+    recent runtimes. With features, it fits the runtime as a power law
+    of the features, that is, a linear model in log-log space, updated
+    by recursive least squares after each job. Recent jobs are weighted
+    higher than older ones, so the model follows changing conditions.
+
+    Args:
+        features: Optional names of numeric inputs or a function
+            that computes numeric features from the inputs of a job.
+        forgetting_factor: Weight of the previous runs in each update,
+            a value in the range 0 (exclusive) to 1.
+    """
+
+    def __init__(
+        self,
+        features: Optional[RuntimeFeatures] = None,
+        forgetting_factor: float = DEFAULT_RUNTIME_MODEL_FORGETTING_FACTOR,
+    ):
+        self.features = features
+        self.forgetting_factor = forgetting_factor
+        self._lock = threading.Lock()
+        self._count = 0
+        # Smoothed mean of the log runtimes, used without features
+        # or while there are too few samples for the regression
+        self._mean: Optional[float] = None
+        self._weights: Optional[list[float]] = None
+        self._covariance: Optional[list[list[float]]] = None
+
+    @property
+    def count(self) -> int:
+        """The number of observed runtimes."""
+        return self._count
+
+    def estimate(self, inputs: dict[str, Any]) -> Optional[float]:
+        """Estimate the runtime in seconds of a job with the given inputs.
+
+        Returns:
+            The estimated runtime, or `None` if no runtime
+            has been observed yet.
+        """
+        x = self._get_features(inputs)
+        with self._lock:
+            if self._mean is None:
+                return None
+            if x is None or self._weights is None or self._count <= len(x):
+                return math.exp(self._mean)
+            return math.exp(_dot(self._weights, x))
+
+    def update(self, inputs: dict[str, Any], runtime: float):
+        """Update the model with the observed runtime
+        in seconds of a job with the given inputs.
+        """
+        y = math.log(max(runtime, 1e-3))
+        x = self._get_features(inputs)
+        with self._lock:
+            self._count += 1
+            if self._mean is None:
+                self._mean = y
+            else:
+                self._mean += DEFAULT_RUNTIME_MODEL_SMOOTHING * (y - self._mean)
+            if x is not None:
+                self._update_regression(x, y)
+
+    def _update_regression(self, x: list[float], y: float):
+        size = len(x)
+        if self._weights is None or len(self._weights) != size:
+            self._weights = [0.0] * size
+            # Large initial covariance, as nothing is known yet
+            self._covariance = [
+                [1000.0 if i == j else 0.0 for j in range(size)] for i in range(size)
+            ]
+        lam = self.forgetting_factor
+        p = self._covariance
+        px = [_dot(row, x) for row in p]
+        gain_denominator = lam + _dot(x, px)
+        gain = [v / gain_denominator for v in px]
+        error = y - _dot(self._weights, x)
+        self._weights = [w + g * error for w, g in zip(self._weights, gain)]
+        self._covariance = [
+            [(p[i][j] - gain[i] * px[j]) / lam for j in range(size)]
+            for i in range(size)
+        ]
+
+    def _get_features(self, inputs: dict[str, Any]) -> Optional[list[float]]:
+        if not self.features:
+            return None
+        try:
+            if callable(self.features):
+                values = self.features(inputs)
+            else:
+                values = [inputs[name] for name in self.features]
+            # Intercept and log features, so runtimes may be power laws
+            return [1.0, *(math.log(max(float(v), 1e-3)) for v in values)]
+        except Exception as e:
+            logger.debug(f"Failed to compute runtime features: {e}")
+            return None
+
+
+def _dot(a: Sequence[float], b: Sequence[float]) -> float:
+    return sum(u * v for u, v in zip(a, b))
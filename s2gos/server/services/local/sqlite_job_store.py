@@ -0,0 +1,587 @@
+#  Copyright (c) 2025 by ESA DTE-S2GOS team and contributors
+#  Permissions are hereby granted under the terms of the Apache 2.0 License:
+#  https://opensource.org/license/apache-2-0.
+
+import atexit
+import datetime
+import json
+import os
+import sqlite3
+import threading
+import time
+import uuid
+from logging import getLogger
+from pathlib import Path
+from typing import Any, Callable, Iterable, Optional
+
+from s2gos.common.models import JobInfo, JobResults, StatusCode, Subscriber
+from s2gos.server.defaults import (
+    DEFAULT_JOB_STORE_FLUSH_INTERVAL,
+    DEFAULT_JOB_STORE_HEARTBEAT_INTERVAL,
+    DEFAULT_JOB_STORE_HEARTBEAT_TIMEOUT,
+    DEFAULT_JOB_STORE_MAX_CLAIMS,
+)
+
+from .job_index import TimeInterval, get_update_time
+from .job_store import JobRecord, JobRequest, JobStore
+
+logger = getLogger("s2gos")
+
+ACTIVE_STATUS_CODES = (StatusCode.accepted.value, StatusCode.running.value)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS job_ids (
+    seq INTEGER PRIMARY KEY AUTOINCREMENT
+);
+CREATE TABLE IF NOT EXISTS jobs (
+    seq INTEGER PRIMARY KEY AUTOINCREMENT,
+    job_id TEXT NOT NULL UNIQUE,
+    process_id TEXT,
+    status TEXT NOT NULL,
+    created REAL NOT NULL,
+    updated REAL NOT NULL,
+    version INTEGER NOT NULL,
+    worker TEXT,
+    cancel_requested INTEGER NOT NULL DEFAULT 0,
+    info TEXT NOT NULL,
+    request TEXT,
+    results TEXT
+);
+CREATE INDEX IF NOT EXISTS jobs_status ON jobs (status);
+CREATE INDEX IF NOT EXISTS jobs_process_id ON jobs (process_id);
+CREATE INDEX IF NOT EXISTS jobs_created ON jobs (created);
+CREATE INDEX IF NOT EXISTS jobs_updated ON jobs (updated);
+CREATE INDEX IF NOT EXISTS jobs_worker ON jobs (worker, status);
+CREATE TABLE IF NOT EXISTS idempotency_keys (
+    key TEXT PRIMARY KEY,
+    job_id TEXT NOT NULL,
+    fingerprint TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idempotency_keys_job_id ON idempotency_keys (job_id);
+CREATE TABLE IF NOT EXISTS workers (
+    worker TEXT PRIMARY KEY,
+    heartbeat REAL NOT NULL
+);
+"""
+
+_INSERT = """
+INSERT INTO jobs (
+    job_id, process_id, status, created, updated, version, worker, info, request
+)
+VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+_UPSERT = """
+INSERT INTO jobs (job_id, process_id, status, created, updated, version, worker, info)
+VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+ON CONFLICT (job_id) DO UPDATE SET
+    status = excluded.status,
+    updated = excluded.updated,
+    version = excluded.version,
+    worker = excluded.worker,
+    info = excluded.info
+WHERE excluded.version > jobs.version
+"""
+
+# Deferred updates never insert, so they cannot resurrect removed jobs
+_UPDATE = """
+UPDATE jobs SET status = ?, updated = ?, version = ?, worker = ?, info = ?
+WHERE job_id = ? AND version < ?
+"""
+
+
+class SQLiteJobStore(JobStore):
+    """A job store that keeps jobs in an SQLite database file.
+
+    The database is used in WAL mode, so that multiple worker
+    processes can read and write the same job table concurrently.
+
+    Progress updates are deferred and written in batches by a
+    background thread, which also maintains a heartbeat of the
+    current worker process. Running jobs of worker processes whose
+    heartbeat timed out, e.g., because they crashed, are marked
+    as failed, and their accepted jobs are submitted again.
+
+    The executor is the worker process that holds the executor lease
+    in the database. The lease is taken over by another worker process
+    once the executor's heartbeat timed out. The executor's background
+    thread claims the jobs submitted by other worker processes.
+
+    Args:
+        path: Path of the database file.
+        flush_interval: Interval in seconds in which deferred
+            progress updates are written and submitted jobs
+            are claimed.
+        heartbeat_interval: Interval in seconds in which the
+            worker's heartbeat is written and orphaned jobs
+            are recovered.
+        heartbeat_timeout: Time in seconds after which
+            a worker without heartbeat is considered dead.
+    """
+
+    def __init__(
+        self,
+        path: str | Path,
+        flush_interval: float = DEFAULT_JOB_STORE_FLUSH_INTERVAL,
+        heartbeat_interval: float = DEFAULT_JOB_STORE_HEARTBEAT_INTERVAL,
+        heartbeat_timeout: float = DEFAULT_JOB_STORE_HEARTBEAT_TIMEOUT,
+    ):
+        self.path = str(path)
+        self.flush_interval = flush_interval
+        self.heartbeat_interval = heartbeat_interval
+        self.heartbeat_timeout = heartbeat_timeout
+        self.worker_id = f"{os.getpid()}-{uuid.uuid4().hex[:8]}"
+        self._local = threading.local()
+        self._connections: list[sqlite3.Connection] = []
+        self._lock = threading.Lock()
+        self._pending: dict[str, tuple[JobInfo, int]] = {}
+        self._cancellation_handler: Optional[Callable[[str], None]] = None
+        self._submission_handler: Optional[Callable[[JobRequest], None]] = None
+        self._is_executor = False
+        self._closed = threading.Event()
+
+        self._connection.executescript(_SCHEMA)
+        with self._transaction() as connection:
+            connection.execute(
+                "INSERT OR IGNORE INTO meta (key, value) VALUES ('uid', ?)",
+                (uuid.uuid4().hex[:12],),
+            )
+        self._uid = self._connection.execute(
+            "SELECT value FROM meta WHERE key = 'uid'"
+        ).fetchone()[0]
+        self._heartbeat()
+        self.recover()
+        self._acquire_executor_lease()
+
+        self._thread = threading.Thread(
+            target=self._run, name="s2gos-job-store", daemon=True
+        )
+        self._thread.start()
+        atexit.register(self.close)
+
+    @property
+    def uid(self) -> str:
+        return self._uid
+
+    @property
+    def is_executor(self) -> bool:
+        return self._is_executor
+
+    def new_job_id(self) -> str:
+        with self._transaction() as connection:
+            cursor = connection.execute("INSERT INTO job_ids DEFAULT VALUES")
+            seq = cursor.lastrowid
+            connection.execute("DELETE FROM job_ids WHERE seq < ?", (seq,))
+        return f"job_{seq}"
+
+    def submit(self, request: JobRequest) -> bool:
+        claimed = self._is_executor
+        job_id, process_id, status, created, updated, _, worker, info = (
+            self._get_upsert_params(request.job_info, 0)
+        )
+        with self._transaction() as connection:
+            connection.execute(
+                _INSERT,
+                (
+                    job_id,
+                    process_id,
+                    status,
+                    created,
+                    updated,
+                    0,
+                    worker if claimed else None,
+                    info,
+                    _encode_request(request),
+                ),
+            )
+        return claimed
+
+    def set_submission_handler(self, handler: Callable[[JobRequest], None]) -> None:
+        self._submission_handler = handler
+
+    def put(self, job_info: JobInfo, version: int) -> None:
+        with self._lock:
+            pending = self._pending.get(job_info.jobID)
+            if pending is not None and pending[1] <= version:
+                del self._pending[job_info.jobID]
+        with self._transaction() as connection:
+            connection.execute(_UPSERT, self._get_upsert_params(job_info, version))
+
+    def put_progress(self, job_info: JobInfo, version: int) -> None:
+        # Take a snapshot, as the job changes its status in place
+        with self._lock:
+            self._pending[job_info.jobID] = (job_info.model_copy(), version)
+
+    def get(self, job_id: str) -> Optional[JobRecord]:
+        row = self._connection.execute(
+            "SELECT info, version FROM jobs WHERE job_id = ?", (job_id,)
+        ).fetchone()
+        if row is None:
+            return None
+        return JobRecord(JobInfo.model_validate_json(row[0]), row[1])
+
+    def remove(self, job_id: str) -> None:
+        with self._lock:
+            self._pending.pop(job_id, None)
+        with self._transaction() as connection:
+            connection.execute("DELETE FROM jobs WHERE job_id = ?", (job_id,))
+            connection.execute(
+                "DELETE FROM idempotency_keys WHERE job_id = ?", (job_id,)
+            )
+
+    def query(
+        self,
+        offset: int = 0,
+        limit: Optional[int] = None,
+        statuses: Optional[Iterable[StatusCode]] = None,
+        process_ids: Optional[Iterable[str]] = None,
+        created: Optional[TimeInterval] = None,
+        updated: Optional[TimeInterval] = None,
+    ) -> tuple[list[JobInfo], bool]:
+        conditions: list[str] = []
+        params: list[Any] = []
+        if statuses is not None:
+            _add_in_condition(
+                conditions, params, "status", [StatusCode(s).value for s in statuses]
+            )
+        if process_ids is not None:
+            _add_in_condition(conditions, params, "process_id", list(process_ids))
+        if created is not None:
+            _add_interval_condition(conditions, params, "created", created)
+        if updated is not None:
+            _add_interval_condition(conditions, params, "updated", updated)
+        sql = "SELECT info FROM jobs"
+        if conditions:
+            sql += " WHERE " + " AND ".join(conditions)
+        sql += " ORDER BY seq LIMIT ? OFFSET ?"
+        params.extend([-1 if limit is None else limit + 1, offset])
+        rows = self._connection.execute(sql, params).fetchall()
+        job_infos = [JobInfo.model_validate_json(row[0]) for row in rows]
+        if limit is not None and len(job_infos) > limit:
+            return job_infos[:limit], True
+        return job_infos, False
+
+    def put_results(self, job_id: str, results: JobResults) -> None:
+        with self._transaction() as connection:
+            connection.execute(
+                "UPDATE jobs SET results = ? WHERE job_id = ?",
+                (results.model_dump_json(by_alias=True), job_id),
+            )
+
+    def get_results(self, job_id: str) -> Optional[JobResults]:
+        row = self._connection.execute(
+            "SELECT results FROM jobs WHERE job_id = ?", (job_id,)
+        ).fetchone()
+        if row is None or row[0] is None:
+            return None
+        return JobResults.model_validate_json(row[0])
+
+    def claim_idempotency_key(
+        self, key: str, job_id: str, fingerprint: str
+    ) -> tuple[str, str]:
+        with self._transaction() as connection:
+            connection.execute(
+                "INSERT OR IGNORE INTO idempotency_keys (key, job_id, fingerprint)"
+                " VALUES (?, ?, ?)",
+                (key, job_id, fingerprint),
+            )
+            row = connection.execute(
+                "SELECT job_id, fingerprint FROM idempotency_keys WHERE key = ?",
+                (key,),
+            ).fetchone()
+        return row[0], row[1]
+
+    def release_idempotency_key(self, key: str, job_id: str) -> None:
+        with self._transaction() as connection:
+            connection.execute(
+                "DELETE FROM idempotency_keys WHERE key = ? AND job_id = ?",
+                (key, job_id),
+            )
+
+    def request_cancellation(self, job_id: str) -> None:
+        with self._transaction() as connection:
+            connection.execute(
+                "UPDATE jobs SET cancel_requested = 1 WHERE job_id = ?", (job_id,)
+            )
+
+    def set_cancellation_handler(self, handler: Callable[[str], None]) -> None:
+        self._cancellation_handler = handler
+
+    def flush(self) -> None:
+        with self._lock:
+            pending = self._pending
+            self._pending = {}
+        if not pending:
+            return
+        params = []
+        for job_info, version in pending.values():
+            job_id, _, status, _, updated, _, worker, info = self._get_upsert_params(
+                job_info, version
+            )
+            params.append((status, updated, version, worker, info, job_id, version))
+        with self._transaction() as connection:
+            connection.executemany(_UPDATE, params)
+
+    def close(self) -> None:
+        if self._closed.is_set():
+            return
+        self._closed.set()
+        self._thread.join()
+        self.flush()
+        # Running jobs of this worker will never finish,
+        # accepted ones are left to the next executor
+        self._recover_jobs("worker = ?", (self.worker_id,), "Server has been stopped")
+        with self._transaction() as connection:
+            connection.execute(
+                "DELETE FROM meta WHERE key = 'executor' AND value = ?",
+                (self.worker_id,),
+            )
+            connection.execute(
+                "DELETE FROM workers WHERE worker = ?", (self.worker_id,)
+            )
+        self._is_executor = False
+        with self._lock:
+            connections = self._connections
+            self._connections = []
+        for connection in connections:
+            connection.close()
+        atexit.unregister(self.close)
+
+    def recover(self) -> int:
+        """Mark the running jobs of worker processes whose heartbeat
+        timed out as failed and submit their accepted jobs again.
+
+        Returns:
+            The number of recovered jobs.
+        """
+        return self._recover_jobs(
+            "worker NOT IN (SELECT worker FROM workers WHERE heartbeat >= ?)",
+            (time.time() - self.heartbeat_timeout,),
+            "Server worker process terminated while the job was running",
+        )
+
+    @property
+    def _connection(self) -> sqlite3.Connection:
+        connection: Optional[sqlite3.Connection] = getattr(
+            self._local, "connection", None
+        )
+        if connection is None:
+            connection = sqlite3.connect(
+                self.path, isolation_level=None, check_same_thread=False
+            )
+            connection.execute("PRAGMA journal_mode = WAL")
+            connection.execute("PRAGMA synchronous = NORMAL")
+            connection.execute("PRAGMA busy_timeout = 10000")
+            self._local.connection = connection
+            with self._lock:
+                self._connections.append(connection)
+        return connection
+
+    def _transaction(self) -> "_Transaction":
+        return _Transaction(self._connection)
+
+    def _get_upsert_params(self, job_info: JobInfo, version: int) -> tuple:
+        return (
+            job_info.jobID,
+            job_info.processID,
+            StatusCode(job_info.status).value,
+            (job_info.created or datetime.datetime.now()).timestamp(),
+            get_update_time(job_info).timestamp(),
+            version,
+            self.worker_id,
+            job_info.model_dump_json(by_alias=True, exclude_none=True),
+        )
+
+    def _recover_jobs(self, condition: str, params: tuple, message: str) -> int:
+        with self._transaction() as connection:
+            rows = connection.execute(
+                f"SELECT info, version FROM jobs WHERE status = ? AND {condition}",
+                (StatusCode.running.value, *params),
+            ).fetchall()
+            for info, version in rows:
+                self._finish_job(connection, info, version, StatusCode.failed, message)
+            num_requeued = connection.execute(
+                "UPDATE jobs SET worker = NULL"
+                f" WHERE status = ? AND request IS NOT NULL AND {condition}",
+                (StatusCode.accepted.value, *params),
+            ).rowcount
+        if rows:
+            logger.warning(f"Marked {len(rows)} orphaned job(s) as failed")
+        if num_requeued:
+            logger.warning(f"Submitted {num_requeued} orphaned job(s) again")
+        return len(rows) + num_requeued
+
+    def _finish_job(
+        self,
+        connection: sqlite3.Connection,
+        info: str,
+        version: int,
+        status: StatusCode,
+        message: str,
+    ):
+        job_info = JobInfo.model_validate_json(info)
+        job_info.status = status
+        job_info.message = message
+        job_info.finished = datetime.datetime.now()
+        connection.execute(_UPSERT, self._get_upsert_params(job_info, version + 1))
+
+    def _acquire_executor_lease(self):
+        with self._transaction() as connection:
+            row = connection.execute(
+                "SELECT value FROM meta WHERE key = 'executor'"
+            ).fetchone()
+            executor = row[0] if row is not None else None
+            if executor != self.worker_id and (
+                executor is None
+                or connection.execute(
+                    "SELECT 1 FROM workers WHERE worker = ? AND heartbeat >= ?",
+                    (executor, time.time() - self.heartbeat_timeout),
+                ).fetchone()
+                is None
+            ):
+                connection.execute(
+                    "INSERT OR REPLACE INTO meta (key, value) VALUES ('executor', ?)",
+                    (self.worker_id,),
+                )
+                executor = self.worker_id
+        if executor == self.worker_id and not self._is_executor:
+            logger.info(f"Worker {self.worker_id} is the job executor")
+        self._is_executor = executor == self.worker_id
+
+    def _claim_submissions(self):
+        handler = self._submission_handler
+        if handler is None or not self._is_executor:
+            return
+        with self._transaction() as connection:
+            rows = connection.execute(
+                "SELECT job_id, info, version, request, cancel_requested FROM jobs"
+                " WHERE status = ? AND worker IS NULL ORDER BY seq LIMIT ?",
+                (StatusCode.accepted.value, DEFAULT_JOB_STORE_MAX_CLAIMS),
+            ).fetchall()
+            connection.executemany(
+                "UPDATE jobs SET worker = ? WHERE job_id = ?",
+                [(self.worker_id, row[0]) for row in rows],
+            )
+            requests = []
+            for job_id, info, version, request, cancel_requested in rows:
+                if cancel_requested:
+                    self._finish_job(
+                        connection,
+                        info,
+                        version,
+                        StatusCode.dismissed,
+                        "Job has been cancelled before it started",
+                    )
+                else:
+                    requests.append(
+                        _decode_request(JobInfo.model_validate_json(info), request)
+                    )
+        for request in requests:
+            try:
+                handler(request)
+            except Exception as e:
+                logger.error(f"Failed to execute job {request.job_info.jobID!r}: {e}")
+
+    def _heartbeat(self):
+        with self._transaction() as connection:
+            connection.execute(
+                "INSERT OR REPLACE INTO workers (worker, heartbeat) VALUES (?, ?)",
+                (self.worker_id, time.time()),
+            )
+
+    def _poll_cancellations(self):
+        handler = self._cancellation_handler
+        if handler is None:
+            return
+        rows = self._connection.execute(
+            "SELECT job_id FROM jobs"
+            " WHERE worker = ? AND status IN (?, ?) AND cancel_requested = 1",
+            (self.worker_id, *ACTIVE_STATUS_CODES),
+        ).fetchall()
+        for (job_id,) in rows:
+            handler(job_id)
+
+    def _run(self):
+        next_heartbeat = time.monotonic() + self.heartbeat_interval
+        while not self._closed.wait(self.flush_interval):
+            try:
+                self.flush()
+                self._poll_cancellations()
+                self._claim_submissions()
+                if time.monotonic() >= next_heartbeat:
+                    next_heartbeat = time.monotonic() + self.heartbeat_interval
+                    self._heartbeat()
+                    self.recover()
+                    self._acquire_executor_lease()
+            except sqlite3.Error as e:
+                logger.error(f"Failed to update job store: {e}")
+
+
+class _Transaction:
+    """Runs the statements of a `with` block in a single
+    transaction that acquires the database's write lock upfront.
+    """
+
+    def __init__(self, connection: sqlite3.Connection):
+        self.connection = connection
+
+    def __enter__(self) -> sqlite3.Connection:
+        self.connection.execute("BEGIN IMMEDIATE")
+        return self.connection
+
+    def __exit__(self, exc_type, *args):
+        self.connection.execute("ROLLBACK" if exc_type is not None else "COMMIT")
+
+
+def _encode_request(request: JobRequest) -> str:
+    subscriber = request.subscriber
+    return json.dumps(
+        {
+            "inputs": request.function_kwargs,
+            "subscriber": (
+                subscriber.model_dump(mode="json", by_alias=True, exclude_none=True)
+                if subscriber is not None
+                else None
+            ),
+            "priority": request.priority,
+            "userName": request.user_name,
+        }
+    )
+
+
+def _decode_request(job_info: JobInfo, request: str) -> JobRequest:
+    request_dict = json.loads(request)
+    subscriber = request_dict.get("subscriber")
+    return JobRequest(
+        job_info,
+        request_dict.get("inputs") or {},
+        Subscriber.model_validate(subscriber) if subscriber is not None else None,
+        request_dict.get("priority") or 0,
+        request_dict.get("userName"),
+    )
+
+
+def _add_in_condition(
+    conditions: list[str], params: list[Any], column: str, values: list[Any]
+):
+    if not values:
+        conditions.append("0")
+    else:
+        conditions.append(f"{column} IN ({', '.join('?' * len(values))})")
+        params.extend(values)
+
+
+def _add_interval_condition(
+    conditions: list[str], params: list[Any], column: str, interval: TimeInterval
+):
+    start, end = interval
+    if start is not None:
+        conditions.append(f"{column} >= ?")
+        params.append(start.timestamp())
+    if end is not None:
+        conditions.append(f"{column} <= ?")
+        params.append(end.timestamp())
@@ -17,9 +17,26 @@ service = LocalService(
 )
 
 
+def get_datacube_size(inputs: dict) -> list[float]:
+    """Get the number of cells of a datacube, used to learn
+    the runtimes of `create_datacube`.
+    """
+    x1, y1, x2, y2 = inputs.get("bbox") or (-180, -90, 180, 90)
+    resolution = inputs.get("resolution") or 0.5
+    start_date = datetime.date.fromisoformat(inputs.get("start_date") or "2025-01-01")
+    end_date = datetime.date.fromisoformat(inputs.get("end_date") or "2025-02-01")
+    periodicity = inputs.get("periodicity") or 1
+    var_names = (inputs.get("var_names") or "a, b, c").split(",")
+    time_size = (end_date - start_date).days / periodicity
+    return [len(var_names) * time_size * (x2 - x1) * (y2 - y1) / resolution**2]
+
+
 @service.process(
     id="create_datacube",
     title="Generate a dummy datacube for testing",
+    runtime_features=get_datacube_size,
+    cpus=4,
+    memory="8GB",
     description=(
         "Creates an xarray dataset and writes it as Zarr into a temporary location. "
         "Requires installed dask, xarray, and zarr packages."
@@ -133,6 +150,9 @@ def create_datacube(
         "Fails on purpose if `fail` is `True`. "
         "Returns the effective amount of sleep in seconds."
     ),
+    runtime_features=["duration"],
+    # Sleeping doesn't keep a CPU core busy
+    cpus=0,
 )
 def sleep_a_while(
     duration: float = 10.0,
@@ -155,6 +175,8 @@ def sleep_a_while(
     description=(
         "Returns the list of prime numbers between a `min_val` and `max_val`. "
     ),
+    cpus=1,
+    deterministic=True,
 )
 def primes_between(min_val: int, max_val: int) -> list[int]:
     ctx = get_job_context()
@@ -1,14 +1,28 @@
 #  Copyright (c) 2025 by ESA DTE-S2GOS team and contributors
 #  Permissions are hereby granted under the terms of the Apache 2.0 License:
 #  https://opensource.org/license/apache-2-0.
-from typing import Any, Literal
+import threading
+import time
+from typing import Any, Callable, Iterator, Literal
 from unittest import TestCase
 
+import requests
+
 from s2gos.client.gui import Client as GuiClient
 from s2gos.client.gui.jobs_form import JobsForm
 from s2gos.client.gui.processes_form import ProcessesForm
 from s2gos.client.transport import Transport
-from s2gos.common.models import JobList, ProcessList
+from s2gos.common.models import (
+    ApiError,
+    JobBatchItem,
+    JobBatchResponse,
+    JobIdList,
+    JobInfo,
+    JobList,
+    ProcessList,
+    StatusCode,
+    Type,
+)
 
 
 class ClientTest(TestCase):
@@ -45,3 +59,138 @@ class ClientTest(TestCase):
         client = GuiClient(_transport=_MockTransport())
         jobs_form = client.show_jobs()
         self.assertIsInstance(jobs_form, JobsForm)
+
+    def test_batch_job_actions(self):
+        calls = []
+
+        class _MockTransport(Transport):
+            def call(
+                self,
+                path: str,
+                method: Literal["get", "post", "put", "delete"],
+                *args,
+                **kwargs,
+            ) -> Any:
+                calls.append((method, path, kwargs.get("request")))
+                if (method, path) == ("delete", "/jobs"):
+                    return JobBatchResponse(
+                        jobs=[
+                            JobBatchItem(
+                                jobID="job_1",
+                                jobInfo=JobInfo(
+                                    type=Type.process,
+                                    jobID="job_1",
+                                    status=StatusCode.successful,
+                                ),
+                            ),
+                            JobBatchItem(
+                                jobID="job_2",
+                                error=ApiError(type="error", status=404),
+                            ),
+                        ]
+                    )
+                return None
+
+        client = GuiClient(_transport=_MockTransport())
+        client._job_infos = {"job_1": None, "job_2": None, "job_3": None}
+        response = client._delete_jobs(["job_1", "job_2"])
+        self.assertIsInstance(response, JobBatchResponse)
+        self.assertEqual(
+            [("delete", "/jobs", JobIdList(jobIds=["job_1", "job_2"]))], calls
+        )
+        self.assertEqual({"job_2", "job_3"}, set(client._job_infos.keys()))
+
+
+class _MockJobsForm:
+    def __init__(self):
+        self.job_lists: list[JobList] = []
+
+    def set_job_list(self, job_list: JobList, _error: Any):
+        self.job_lists.append(job_list)
+
+
+def _job_info(job_id: str, status: StatusCode) -> JobInfo:
+    return JobInfo(type=Type.process, jobID=job_id, status=status)
+
+
+class ClientUpdaterTest(TestCase):
+    def test_event_updater_drops_dismissed_jobs(self):
+        class _MockTransport(Transport):
+            def call(self, path: str, method: str, *args, **kwargs) -> Any:
+                return JobList(
+                    jobs=[
+                        _job_info("job_1", StatusCode.running),
+                        _job_info("job_2", StatusCode.running),
+                    ],
+                    links=[],
+                )
+
+            def stream(self, *args, **kwargs) -> Iterator[Any]:
+                yield _job_info("job_1", StatusCode.successful)
+                yield _job_info("job_2", StatusCode.dismissed)
+
+        client = GuiClient(_transport=_MockTransport())
+        jobs_form = _MockJobsForm()
+        client._jobs_form = jobs_form
+        client._run_event_updater(threading.Event())
+        self.assertEqual(
+            [
+                {"job_1": StatusCode.successful, "job_2": StatusCode.running},
+                {"job_1": StatusCode.successful},
+            ],
+            [{j.jobID: j.status for j in jl.jobs} for jl in jobs_form.job_lists],
+        )
+        self.assertEqual({"job_1"}, set(client._job_infos.keys()))
+
+    def test_updater_reconnects_after_transport_errors(self):
+        stream_calls = []
+
+        class _MockTransport(Transport):
+            def call(self, path: str, method: str, *args, **kwargs) -> Any:
+                return JobList(jobs=[], links=[])
+
+            def stream(self, *args, **kwargs) -> Iterator[Any]:
+                stream_calls.append(kwargs.get("path"))
+                if len(stream_calls) == 1:
+                    raise requests.ConnectionError("connection refused")
+                yield _job_info("job_1", StatusCode.running)
+                # Idle stream
+                raise requests.ReadTimeout("read timed out")
+
+        client = GuiClient(update_interval=0.01, _transport=_MockTransport())
+        jobs_form = _MockJobsForm()
+        client._jobs_form = jobs_form
+        stop_event = threading.Event()
+        thread = threading.Thread(target=client._run_updater, args=(stop_event,))
+        thread.start()
+        try:
+            self.assertTrue(_wait_until(lambda: len(stream_calls) >= 3))
+        finally:
+            stop_event.set()
+            thread.join(timeout=5.0)
+        self.assertFalse(thread.is_alive())
+        self.assertEqual(["/jobs/events"] * len(stream_calls), stream_calls)
+        self.assertTrue(len(jobs_form.job_lists) >= 2)
+        self.assertEqual(["job_1"], [j.jobID for j in jobs_form.job_lists[0].jobs])
+
+    def test_stop_updating_ends_polling_updater(self):
+        class _MockTransport(Transport):
+            def call(self, path: str, method: str, *args, **kwargs) -> Any:
+                return JobList(jobs=[], links=[])
+
+        client = GuiClient(update_interval=0.01, _transport=_MockTransport())
+        client.show_jobs()
+        thread = client._update_thread
+        self.assertTrue(thread.is_alive())
+        client.stop_updating()
+        thread.join(timeout=5.0)
+        self.assertFalse(thread.is_alive())
+
+
+def _wait_until(condition: Callable[[], bool], timeout: float = 5.0) -> bool:
+    end_time = time.monotonic() + timeout
+    while not condition():
+        if time.monotonic() >= end_time:
+            return False
+        time.sleep(0.01)
+    return True
@@ -2,11 +2,11 @@
 #  Permissions are hereby granted under the terms of the Apache 2.0 License:
 #  https://opensource.org/license/apache-2-0.
 
-from typing import Any, Literal
+from typing import Any, AsyncIterator, Iterator, Literal, Optional
 
 from pydantic import BaseModel
 
-from s2gos.client.transport import Transport
+from s2gos.client.transport import AsyncTransport, Transport
 
 
 class MockTransport(Transport):  # pragma: no cover
@@ -26,6 +26,7 @@ class MockTransport(Transport):  # pragma: no cover
         request: BaseModel | None,
         return_types: dict[str, type | None],
         error_types: dict[str, type | None],
+        header_params: Optional[dict[str, Any]] = None,
     ) -> Any:
         self._call_stack.append(
             dict(
@@ -33,6 +34,7 @@ class MockTransport(Transport):  # pragma: no cover
                 method=method,
                 path_params=path_params,
                 query_params=query_params,
+                header_params=header_params,
                 request=request,
                 return_types=return_types,
                 error_types=error_types,
@@ -41,3 +43,22 @@ class MockTransport(Transport):  # pragma: no cover
         return_type = return_types.get("200", return_types.get("201"))
         # noinspection PyTypeChecker
         return object.__new__(return_type) if return_type is not None else None
+
+    def stream(self, *args, **kwargs) -> Iterator[Any]:
+        yield self.call(*args, **kwargs)
+
+
+class MockAsyncTransport(AsyncTransport):  # pragma: no cover
+    def __init__(self):
+        self._transport = MockTransport()
+
+    @property
+    def call_stack(self) -> list[dict]:
+        return self._transport.call_stack
+
+    async def call(self, *args, **kwargs) -> Any:
+        return self._transport.call(*args, **kwargs)
+
+    async def stream(self, *args, **kwargs) -> AsyncIterator[Any]:
+        for item in self._transport.stream(*args, **kwargs):
+            yield item
@@ -0,0 +1,103 @@
+#  Copyright (c) 2025 by ESA DTE-S2GOS team and contributors
+#  Permissions are hereby granted under the terms of the Apache 2.0 License:
+#  https://opensource.org/license/apache-2-0.
+
+from unittest import IsolatedAsyncioTestCase
+
+from s2gos.client import AsyncClient
+from s2gos.client.transport import DefaultAsyncTransport
+from s2gos.common.models import (
+    Capabilities,
+    ConformanceDeclaration,
+    JobBatchResponse,
+    JobIdList,
+    JobInfo,
+    JobList,
+    JobResults,
+    ProcessDescription,
+    ProcessList,
+    ProcessRequest,
+)
+from tests.client.helpers import MockAsyncTransport
+
+
+class AsyncClientTest(IsolatedAsyncioTestCase):
+    def setUp(self):
+        self.transport = MockAsyncTransport()
+        self.client = AsyncClient(_transport=self.transport)
+
+    async def test_get_capabilities(self):
+        result = await self.client.get_capabilities()
+        self.assertIsInstance(result, Capabilities)
+
+    async def test_get_conformance(self):
+        result = await self.client.get_conformance()
+        self.assertIsInstance(result, ConformanceDeclaration)
+
+    async def test_get_processes(self):
+        result = await self.client.get_processes()
+        self.assertIsInstance(result, ProcessList)
+
+    async def test_get_process(self):
+        result = await self.client.get_process(process_id="gobabeb_1")
+        self.assertIsInstance(result, ProcessDescription)
+
+    async def test_execute_process(self):
+        result = await self.client.execute_process(
+            process_id="gobabeb_1",
+            request=ProcessRequest(inputs={"bbox": [10, 20, 30, 40]}, outputs={}),
+        )
+        self.assertIsInstance(result, JobResults)
+        self.assertEqual(
+            {
+                "path": "/processes/{processID}/execution",
+                "method": "post",
+                "path_params": {"processID": "gobabeb_1"},
+            },
+            {
+                k: v
+                for k, v in self.transport.call_stack[-1].items()
+                if k in ("path", "method", "path_params")
+            },
+        )
+
+    async def test_get_jobs(self):
+        result = await self.client.get_jobs()
+        self.assertIsInstance(result, JobList)
+
+    async def test_get_job(self):
+        result = await self.client.get_job("job_12")
+        self.assertIsInstance(result, JobInfo)
+
+    async def test_get_job_events(self):
+        results = [r async for r in self.client.get_job_events(process_id="p1")]
+        self.assertEqual(1, len(results))
+        self.assertIsInstance(results[0], JobInfo)
+
+    async def test_dismiss_job(self):
+        result = await self.client.dismiss_job("job_12")
+        self.assertIsInstance(result, JobInfo)
+
+    async def test_get_job_statuses(self):
+        result = await self.client.get_job_statuses(
+            JobIdList(jobIds=["job_1", "job_2"])
+        )
+        self.assertIsInstance(result, JobBatchResponse)
+
+    async def test_dismiss_jobs(self):
+        result = await self.client.dismiss_jobs(JobIdList(jobIds=["job_1", "job_2"]))
+        self.assertIsInstance(result, JobBatchResponse)
+
+    async def test_get_job_results(self):
+        result = await self.client.get_job_results("job_12")
+        self.assertIsInstance(result, JobResults)
+
+    async def test_default_transport(self):
+        async with AsyncClient(
+            server_url="https://api.example.com", pool_maxsize=50, http2=True
+        ) as client:
+            # noinspection PyUnresolvedReferences
+            transport = client._transport
+            self.assertIsInstance(transport, DefaultAsyncTransport)
+            self.assertEqual(50, transport.pool_maxsize)
+            self.assertEqual(True, transport.http2)
@@ -0,0 +1,185 @@
+#  Copyright (c) 2025 by ESA DTE-S2GOS team and contributors
+#  Permissions are hereby granted under the terms of the Apache 2.0 License:
+#  https://opensource.org/license/apache-2-0.
+
+import threading
+import time
+from typing import Any
+from unittest import IsolatedAsyncioTestCase, TestCase
+
+from s2gos.client import AsyncClient, Client, ClientException
+from s2gos.client.bulk import BackPressure
+from s2gos.client.transport import AsyncTransport, Transport
+from s2gos.common.models import JobInfo, ProcessRequest, StatusCode
+
+
+class _OverloadedTransport(Transport):
+    """Rejects every 3rd call with status 503,
+    fails process "fail" with status 404.
+    """
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.num_calls = 0
+        self.num_rejected = 0
+        self.concurrency = 0
+        self.max_concurrency = 0
+
+    def call(self, path: str, method: str, path_params: dict, *args, **kwargs) -> Any:
+        with self.lock:
+            self.num_calls += 1
+            num_calls = self.num_calls
+            self.concurrency += 1
+            self.max_concurrency = max(self.max_concurrency, self.concurrency)
+        try:
+            time.sleep(0.001)
+            process_id = path_params["processID"]
+            if process_id == "fail":
+                raise ClientException(404, "Not Found")
+            if num_calls % 3 == 0:
+                with self.lock:
+                    self.num_rejected += 1
+                raise ClientException(503, "Service Unavailable", retry_after=0.01)
+            return JobInfo(
+                type="process",
+                processID=process_id,
+                jobID=f"job_{num_calls}",
+                status=StatusCode.accepted,
+            )
+        finally:
+            with self.lock:
+                self.concurrency -= 1
+
+
+class _AsyncOverloadedTransport(AsyncTransport):
+    def __init__(self):
+        self.transport = _OverloadedTransport()
+
+    async def call(self, *args, **kwargs) -> Any:
+        return self.transport.call(*args, **kwargs)
+
+
+def _new_items() -> list[tuple[str, ProcessRequest]]:
+    items = [(f"p_{i}", ProcessRequest()) for i in range(20)]
+    items[7] = ("fail", ProcessRequest())
+    return items
+
+
+class ExecuteManyTest(TestCase):
+    def test_execute_many(self):
+        transport = _OverloadedTransport()
+        client = Client(_transport=transport)
+        results = client.execute_many(_new_items(), max_concurrency=4)
+        self.assertEqual(20, len(results))
+        for i, result in enumerate(results):
+            if i == 7:
+                self.assertIsInstance(result, ClientException)
+                self.assertEqual(404, result.status_code)
+            else:
+                self.assertIsInstance(result, JobInfo)
+                self.assertEqual(f"p_{i}", result.processID)
+        self.assertTrue(transport.num_rejected > 0)
+        self.assertEqual(20 + transport.num_rejected, transport.num_calls)
+        self.assertTrue(transport.max_concurrency <= 4)
+
+    def test_execute_many_max_retries(self):
+        class _AlwaysOverloadedTransport(Transport):
+            num_calls = 0
+
+            def call(self, *args, **kwargs) -> Any:
+                self.num_calls += 1
+                raise ClientException(429, "Too Many Requests", retry_after=0)
+
+        transport = _AlwaysOverloadedTransport()
+        client = Client(_transport=transport)
+        results = client.execute_many(
+            [("p", ProcessRequest())], max_retries=2, retry_delay=0
+        )
+        self.assertEqual(1, len(results))
+        self.assertIsInstance(results[0], ClientException)
+        self.assertEqual(429, results[0].status_code)
+        self.assertEqual(3, transport.num_calls)
+
+    def test_execute_many_retries_with_same_idempotency_key(self):
+        class _OnceOverloadedTransport(Transport):
+            def __init__(self):
+                self.keys: list[tuple[str, str]] = []
+
+            def call(self, path, method, path_params, *args, **kwargs) -> Any:
+                process_id = path_params["processID"]
+                self.keys.append(
+                    (process_id, kwargs["header_params"]["Idempotency-Key"])
+                )
+                if len(self.keys) == 1:
+                    raise ClientException(503, "Service Unavailable", retry_after=0)
+                return JobInfo(
+                    type="process",
+                    processID=process_id,
+                    jobID=f"job_{len(self.keys)}",
+                    status=StatusCode.accepted,
+                )
+
+        transport = _OnceOverloadedTransport()
+        client = Client(_transport=transport)
+        client.execute_many([("p_0", ProcessRequest())], max_concurrency=1)
+        client.execute_many([("p_1", ProcessRequest())], max_concurrency=1)
+        (p_0, key_0), (p_0_retry, key_0_retry), (p_1, key_1) = transport.keys
+        self.assertEqual(("p_0", "p_0", "p_1"), (p_0, p_0_retry, p_1))
+        self.assertEqual(key_0, key_0_retry)
+        self.assertNotEqual(key_0, key_1)
+
+    def test_execute_many_retries_requests_in_progress(self):
+        class _InProgressTransport(Transport):
+            def __init__(self, retry_after: float | None):
+                self.retry_after = retry_after
+                self.num_calls = 0
+
+            def call(self, path, method, path_params, *args, **kwargs) -> Any:
+                self.num_calls += 1
+                if self.num_calls == 1:
+                    raise ClientException(409, "Conflict", retry_after=self.retry_after)
+                return JobInfo(
+                    type="process",
+                    processID=path_params["processID"],
+                    jobID="job_1",
+                    status=StatusCode.accepted,
+                )
+
+        transport = _InProgressTransport(retry_after=0)
+        client = Client(_transport=transport)
+        results = client.execute_many([("p", ProcessRequest())])
+        self.assertIsInstance(results[0], JobInfo)
+        self.assertEqual(2, transport.num_calls)
+
+        # Without "Retry-After", the conflict is not expected to resolve
+        transport = _InProgressTransport(retry_after=None)
+        client = Client(_transport=transport)
+        results = client.execute_many([("p", ProcessRequest())])
+        self.assertIsInstance(results[0], ClientException)
+        self.assertEqual(409, results[0].status_code)
+        self.assertEqual(1, transport.num_calls)
+
+
+class AsyncExecuteManyTest(IsolatedAsyncioTestCase):
+    async def test_execute_many(self):
+        transport = _AsyncOverloadedTransport()
+        client = AsyncClient(_transport=transport)
+        results = await client.execute_many(_new_items(), max_concurrency=4)
+        self.assertEqual(20, len(results))
+        for i, result in enumerate(results):
+            if i == 7:
+                self.assertIsInstance(result, ClientException)
+            else:
+                self.assertIsInstance(result, JobInfo)
+                self.assertEqual(f"p_{i}", result.processID)
+        self.assertTrue(transport.transport.num_rejected > 0)
+
+
+class BackPressureTest(TestCase):
+    def test_pause(self):
+        back_pressure = BackPressure(retry_delay=10)
+        self.assertEqual(0.0, back_pressure.get_delay())
+        back_pressure.pause(ClientException(503, "", retry_after=5), 0)
+        self.assertTrue(4 < back_pressure.get_delay() <= 5)
+        back_pressure.pause(ClientException(503, ""), 1)
+        self.assertTrue(19 < back_pressure.get_delay() <= 20)
@@ -8,6 +8,8 @@ from s2gos.client import Client
 from s2gos.common.models import (
     Capabilities,
     ConformanceDeclaration,
+    JobBatchResponse,
+    JobIdList,
     JobInfo,
     JobList,
     JobResults,
@@ -56,7 +58,23 @@ class ClientTest(TestCase):
                 outputs={},
             ),
         )
-        self.assertIsInstance(result, JobInfo)
+        # The mock transport returns the type of synchronous results
+        self.assertIsInstance(result, JobResults)
+        self.assertEqual(
+            {"Prefer": None, "Idempotency-Key": None},
+            self.transport.call_stack[-1]["header_params"],
+        )
+
+        self.client.execute_process(
+            process_id="gobabeb_1",
+            request=ProcessRequest(),
+            prefer="respond-sync",
+            idempotency_key="k1",
+        )
+        self.assertEqual(
+            {"Prefer": "respond-sync", "Idempotency-Key": "k1"},
+            self.transport.call_stack[-1]["header_params"],
+        )
 
     def test_get_jobs(self):
         result = self.client.get_jobs()
@@ -70,6 +88,37 @@ class ClientTest(TestCase):
         result = self.client.get_job("job_12")
         self.assertIsInstance(result, JobInfo)
 
+    def test_get_job_events(self):
+        results = list(self.client.get_job_events(job_ids="job_12,job_13"))
+        self.assertEqual(1, len(results))
+        self.assertIsInstance(results[0], JobInfo)
+        self.assertEqual(
+            {"jobIds": "job_12,job_13", "processID": None},
+            self.transport.call_stack[-1]["query_params"],
+        )
+
+    def test_get_job_statuses(self):
+        result = self.client.get_job_statuses(JobIdList(jobIds=["job_1", "job_2"]))
+        self.assertIsInstance(result, JobBatchResponse)
+
+    def test_dismiss_jobs(self):
+        result = self.client.dismiss_jobs(JobIdList(jobIds=["job_1", "job_2"]))
+        self.assertIsInstance(result, JobBatchResponse)
+
     def test_get_job_results(self):
         result = self.client.get_job_results("job_12")
         self.assertIsInstance(result, JobResults)
+
+    def test_transport_config(self):
+        client = Client(
+            server_url="https://api.example.com",
+            pool_maxsize=4,
+            read_timeout=20.0,
+            keep_alive=False,
+        )
+        with client:
+            self.assertEqual(4, client.config.pool_maxsize)
+            self.assertEqual(20.0, client.config.read_timeout)
+            self.assertEqual(False, client.config.keep_alive)
+            # noinspection PyUnresolvedReferences
+            self.assertEqual(4, client._transport.pool_maxsize)
@@ -0,0 +1,173 @@
+#  Copyright (c) 2025 by ESA DTE-S2GOS team and contributors
+#  Permissions are hereby granted under the terms of the Apache 2.0 License:
+#  https://opensource.org/license/apache-2-0.
+
+import threading
+from typing import Any
+from unittest import TestCase
+
+import pytest
+
+from s2gos.client import Client, ClientException, JobFailedException, JobFuture
+from s2gos.client.futures import JobPoller, as_completed, wait
+from s2gos.client.transport import Transport
+from s2gos.common.models import JobInfo, JobResults, StatusCode
+
+
+class _JobServerTransport(Transport):
+    """Simulates a server whose jobs advance by one step per poll.
+    Jobs named "fail_*" fail, jobs named "slow_*" never finish.
+    """
+
+    def __init__(self, num_steps: int = 3):
+        self.num_steps = num_steps
+        self.lock = threading.Lock()
+        self.polls: dict[str, int] = {}
+        self.dismissed: set[str] = set()
+        self.num_calls = 0
+
+    def call(self, path: str, method: str, path_params: dict, *args, **kwargs) -> Any:
+        with self.lock:
+            self.num_calls += 1
+            if path == "/processes/{processID}/execution":
+                return self.new_job_info(path_params["processID"], 0)
+            job_id = path_params["jobId"]
+            if job_id == "missing":
+                raise ClientException(404, "Not Found")
+            if (method, path) == ("get", "/jobs/{jobId}/results"):
+                return JobResults({"result": job_id})
+            if method == "delete":
+                self.dismissed.add(job_id)
+            step = self.polls.get(job_id, 0) + 1
+            self.polls[job_id] = step
+            return self.new_job_info(job_id, step)
+
+    def new_job_info(self, job_id: str, step: int) -> JobInfo:
+        if job_id in self.dismissed:
+            status = StatusCode.dismissed
+        elif step == 0:
+            status = StatusCode.accepted
+        elif step < self.num_steps or job_id.startswith("slow_"):
+            status = StatusCode.running
+        elif job_id.startswith("fail_"):
+            status = StatusCode.failed
+        else:
+            status = StatusCode.successful
+        return JobInfo(
+            type="process",
+            jobID=job_id,
+            status=status,
+            progress=min(100, 100 * step // self.num_steps),
+            message="Oops" if status == StatusCode.failed else None,
+        )
+
+
+class JobFutureTest(TestCase):
+    def setUp(self):
+        self.transport = _JobServerTransport()
+        self.client = Client(_transport=self.transport)
+        self.poller = JobPoller(
+            self.client, rate=1000, min_interval=0.001, max_interval=0.01
+        )
+
+    def tearDown(self):
+        self.poller.close()
+
+    def add_job(self, job_id: str) -> JobFuture:
+        return self.poller.add(self.transport.new_job_info(job_id, 0))
+
+    def test_result(self):
+        future = self.add_job("job_1")
+        self.assertIsInstance(future, JobFuture)
+        self.assertEqual("job_1", future.job_id)
+        results = future.result(timeout=5)
+        self.assertIsInstance(results, JobResults)
+        self.assertEqual({"result": "job_1"}, results.model_dump(mode="json"))
+        self.assertTrue(future.done())
+        self.assertEqual(StatusCode.successful, future.job_info.status)
+        self.assertEqual(0, self.poller.num_pending)
+
+    def test_connection_error(self):
+        call = self.transport.call
+        failures = []
+
+        def call_once_failing(path: str, *args, **kwargs) -> Any:
+            if not failures and path == "/jobs/{jobId}":
+                failures.append(path)
+                raise ConnectionError("Connection refused")
+            return call(path, *args, **kwargs)
+
+        self.transport.call = call_once_failing
+        with self.assertLogs("s2gos", level="WARNING") as cm:
+            future = self.add_job("job_1")
+            results = future.result(timeout=5)
+        self.assertEqual({"result": "job_1"}, results.model_dump(mode="json"))
+        self.assertEqual(["/jobs/{jobId}"], failures)
+        self.assertIn("Connection refused", cm.output[0])
+
+    def test_same_job_same_future(self):
+        self.assertIs(self.add_job("job_1"), self.add_job("job_1"))
+
+    def test_failed(self):
+        future = self.add_job("fail_1")
+        with pytest.raises(JobFailedException, match="Job 'fail_1' failed: Oops"):
+            future.result(timeout=5)
+        self.assertIsInstance(future.exception(), JobFailedException)
+
+    def test_missing(self):
+        future = self.add_job("missing")
+        with pytest.raises(ClientException):
+            future.result(timeout=5)
+
+    def test_cancel(self):
+        future = self.add_job("slow_1")
+        self.assertTrue(future.cancel())
+        self.assertTrue(future.cancelled())
+        self.assertIn("slow_1", self.transport.dismissed)
+        # Already done
+        self.assertTrue(future.cancel())
+        done_future = self.add_job("job_2")
+        done_future.result(timeout=5)
+        self.assertFalse(done_future.cancel())
+
+    def test_add_done_callback(self):
+        event = threading.Event()
+        done_futures = []
+
+        def callback(f):
+            done_futures.append(f)
+            event.set()
+
+        future = self.add_job("job_1")
+        future.add_done_callback(callback)
+        self.assertTrue(event.wait(timeout=5))
+        self.assertEqual([future], done_futures)
+
+    def test_wait_and_as_completed(self):
+        futures = [self.add_job(f"job_{i}") for i in range(20)]
+        futures.append(self.add_job("fail_1"))
+        done, not_done = wait(futures, timeout=10)
+        self.assertEqual(21, len(done))
+        self.assertEqual(0, len(not_done))
+        self.assertEqual(set(futures), set(as_completed(futures, timeout=10)))
+
+    def test_request_volume_is_bounded(self):
+        poller = JobPoller(self.client, rate=50, min_interval=0.001)
+        try:
+            for i in range(100):
+                poller.add(self.transport.new_job_info(f"slow_{i}", 0))
+            threading.Event().wait(0.2)
+        finally:
+            poller.close()
+        # 50 requests per second for 0.2 seconds, with some tolerance
+        self.assertTrue(self.transport.num_calls <= 15, self.transport.num_calls)
+
+
+class ClientSubmitTest(TestCase):
+    def test_submit(self):
+        transport = _JobServerTransport(num_steps=1)
+        with Client(_transport=transport) as client:
+            future = client.submit("job_1", request=None)
+            self.assertIsInstance(future, JobFuture)
+            self.assertIs(future, client.get_job_future("job_1"))
+            self.assertIsInstance(future.result(timeout=5), JobResults)
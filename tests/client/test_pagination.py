@@ -0,0 +1,81 @@
+#  Copyright (c) 2025 by ESA DTE-S2GOS team and contributors
+#  Permissions are hereby granted under the terms of the Apache 2.0 License:
+#  https://opensource.org/license/apache-2-0.
+
+from unittest import IsolatedAsyncioTestCase, TestCase
+from unittest.mock import AsyncMock, Mock
+
+from s2gos.client import AsyncClient, Client
+from s2gos.client.pagination import get_next_page_kwargs
+from s2gos.common.models import JobInfo, JobList, Link, StatusCode, Type
+from tests.client.helpers import MockAsyncTransport, MockTransport
+
+
+def new_job_list(job_ids: list[str], next_href: str | None = None) -> JobList:
+    links = [Link(href="/jobs?limit=2&offset=0", rel="self")]
+    if next_href:
+        links.append(Link(href=next_href, rel="next"))
+    return JobList(
+        jobs=[
+            JobInfo(type=Type.process, jobID=job_id, status=StatusCode.successful)
+            for job_id in job_ids
+        ],
+        links=links,
+    )
+
+
+PAGES = [
+    new_job_list(["job_0", "job_1"], "/jobs?limit=2&offset=2&processID=p1"),
+    new_job_list(["job_2", "job_3"], "/jobs?limit=2&offset=4&processID=p1"),
+    new_job_list(["job_4"]),
+]
+
+
+class GetNextPageKwargsTest(TestCase):
+    def test_next_page(self):
+        self.assertEqual(
+            dict(limit=2, offset=2, process_id="p1"), get_next_page_kwargs(PAGES[0])
+        )
+        self.assertEqual(
+            dict(
+                limit=10,
+                offset=20,
+                status="running,accepted",
+                created="2025-06-01T00:00:00/..",
+            ),
+            get_next_page_kwargs(
+                new_job_list(
+                    [],
+                    "http://localhost:8008/jobs?limit=10&offset=20"
+                    "&status=running%2Caccepted&created=2025-06-01T00%3A00%3A00%2F.."
+                    "&unknown=1",
+                )
+            ),
+        )
+
+    def test_no_next_page(self):
+        self.assertIsNone(get_next_page_kwargs(PAGES[2]))
+
+
+class IterJobsTest(TestCase):
+    def test_iter_jobs(self):
+        client = Client(_transport=MockTransport())
+        client.get_jobs = Mock(side_effect=PAGES)
+        job_iter = client.iter_jobs(page_size=2, process_id="p1")
+        self.assertEqual(0, client.get_jobs.call_count)
+        self.assertEqual("job_0", next(job_iter).jobID)
+        self.assertEqual(1, client.get_jobs.call_count)
+        self.assertEqual(
+            ["job_1", "job_2", "job_3", "job_4"], [j.jobID for j in job_iter]
+        )
+        self.assertEqual(3, client.get_jobs.call_count)
+        client.get_jobs.assert_called_with(limit=2, offset=4, process_id="p1")
+
+
+class AsyncIterJobsTest(IsolatedAsyncioTestCase):
+    async def test_iter_jobs(self):
+        client = AsyncClient(_transport=MockAsyncTransport())
+        client.get_jobs = AsyncMock(side_effect=PAGES)
+        job_ids = [j.jobID async for j in client.iter_jobs(process_id="p1")]
+        self.assertEqual(["job_0", "job_1", "job_2", "job_3", "job_4"], job_ids)
+        self.assertEqual(3, client.get_jobs.await_count)
@@ -2,14 +2,33 @@
 #  Permissions are hereby granted under the terms of the Apache 2.0 License:
 #  https://opensource.org/license/apache-2-0.
 
-from unittest import TestCase
-from unittest.mock import Mock, patch
+import threading
+from unittest import IsolatedAsyncioTestCase, TestCase
+from unittest.mock import AsyncMock, MagicMock, Mock, patch
 
+import httpx
 import pytest
 
 from s2gos.client.exceptions import ClientException
-from s2gos.client.transport import DefaultTransport
-from s2gos.common.models import ApiError, ConformanceDeclaration
+from s2gos.client.transport import (
+    DefaultAsyncTransport,
+    DefaultTransport,
+    ValidatorCache,
+    _parse_events,
+    _parse_retry_after,
+)
+from s2gos.common.models import ApiError, ConformanceDeclaration, JobInfo, JobList
+
+EVENT_STREAM = (
+    ": keep-alive\n"
+    "\n"
+    "event: job\n"
+    'data: {"type": "process", "jobID": "job_1", "status": "running"}\n'
+    "\n"
+    "event: job\n"
+    'data: {"type": "process", "jobID": "job_1", "status": "successful"}\n'
+    "\n"
+)
 
 
 class DefaultTransportTest(TestCase):
@@ -21,7 +40,8 @@ class DefaultTransportTest(TestCase):
 
         transport = DefaultTransport(server_url="https://api.example.com", debug=True)
         with patch(
-            "s2gos.client.transport.requests.request", return_value=mock_response
+            "s2gos.client.transport.requests.Session.request",
+            return_value=mock_response,
         ) as mock_request:
             result = transport.call(
                 path="/conformance",
@@ -37,6 +57,7 @@ class DefaultTransportTest(TestCase):
                 "https://api.example.com/conformance",
                 params={},
                 json=None,
+                timeout=(10.0, None),
             )
 
         self.assertIsInstance(result, ConformanceDeclaration)
@@ -49,7 +70,8 @@ class DefaultTransportTest(TestCase):
 
         transport = DefaultTransport(server_url="https://api.example.com", debug=True)
         with patch(
-            "s2gos.client.transport.requests.request", return_value=mock_response
+            "s2gos.client.transport.requests.Session.request",
+            return_value=mock_response,
         ) as mock_request:
             result = transport.call(
                 path="/conformance",
@@ -65,10 +87,44 @@ class DefaultTransportTest(TestCase):
                 "https://api.example.com/conformance",
                 params={},
                 json=None,
+                timeout=(10.0, None),
             )
 
         self.assertIsInstance(result, ConformanceDeclaration)
 
+    def test_call_with_header_params(self):
+        mock_response = Mock()
+        mock_response.status_code = 201
+        mock_response.json.return_value = {
+            "type": "process",
+            "jobID": "job_1",
+            "status": "accepted",
+        }
+
+        transport = DefaultTransport(server_url="https://api.example.com")
+        with patch(
+            "s2gos.client.transport.requests.Session.request",
+            return_value=mock_response,
+        ) as mock_request:
+            transport.call(
+                path="/processes/{processID}/execution",
+                method="post",
+                path_params={"processID": "p1"},
+                query_params={},
+                request=None,
+                return_types={"201": JobInfo},
+                error_types={},
+                header_params={"Idempotency-Key": "k1", "Prefer": None},
+            )
+            mock_request.assert_called_once_with(
+                "POST",
+                "https://api.example.com/processes/p1/execution",
+                params={},
+                json=None,
+                timeout=(10.0, None),
+                headers={"Idempotency-Key": "k1"},
+            )
+
     def test_call_success_no_return_type(self):
         mock_response = Mock()
         mock_response.status_code = 200
@@ -77,7 +133,8 @@ class DefaultTransportTest(TestCase):
 
         transport = DefaultTransport(server_url="https://api.example.com", debug=True)
         with patch(
-            "s2gos.client.transport.requests.request", return_value=mock_response
+            "s2gos.client.transport.requests.Session.request",
+            return_value=mock_response,
         ) as mock_request:
             result = transport.call(
                 path="/conformance",
@@ -93,6 +150,7 @@ class DefaultTransportTest(TestCase):
                 "https://api.example.com/conformance",
                 params={},
                 json=None,
+                timeout=(10.0, None),
             )
             self.assertEqual({"conformsTo": ["Hello", "World"]}, result)
 
@@ -107,7 +165,8 @@ class DefaultTransportTest(TestCase):
 
         transport = DefaultTransport(server_url="https://api.example.com", debug=True)
         with patch(
-            "s2gos.client.transport.requests.request", return_value=mock_response
+            "s2gos.client.transport.requests.Session.request",
+            return_value=mock_response,
         ):
             with pytest.raises(ClientException, match="Conformance not found"):
                 transport.call(
@@ -119,3 +178,352 @@ class DefaultTransportTest(TestCase):
                     return_types={"200": ConformanceDeclaration},
                     error_types={"401": ApiError},
                 )
+
+    def test_session_is_pooled_per_thread(self):
+        transport = DefaultTransport(server_url="https://api.example.com")
+        session = transport.session
+        self.assertIs(session, transport.session)
+
+        other_sessions = []
+        thread = threading.Thread(
+            target=lambda: other_sessions.append(transport.session)
+        )
+        thread.start()
+        thread.join()
+        self.assertEqual(1, len(other_sessions))
+        self.assertIsNot(session, other_sessions[0])
+        # All sessions share the same connection pool
+        self.assertIs(
+            session.get_adapter("https://api.example.com"),
+            other_sessions[0].get_adapter("https://api.example.com"),
+        )
+
+    def test_pool_config(self):
+        transport = DefaultTransport(
+            server_url="https://api.example.com",
+            pool_connections=3,
+            pool_maxsize=7,
+            connect_timeout=2.5,
+            read_timeout=30,
+            keep_alive=False,
+        )
+        self.assertEqual((2.5, 30), transport.timeout)
+        adapter = transport.session.get_adapter("https://api.example.com")
+        self.assertEqual(7, adapter._pool_maxsize)
+        self.assertEqual(3, adapter._pool_connections)
+        self.assertEqual("close", transport.session.headers.get("Connection"))
+
+    def test_close(self):
+        transport = DefaultTransport(server_url="https://api.example.com")
+        session = transport.session
+        transport.close()
+        self.assertIsNot(session, transport.session)
+
+    def test_stream(self):
+        mock_response = MagicMock()
+        mock_response.__enter__.return_value = mock_response
+        mock_response.status_code = 200
+        mock_response.ok = True
+        mock_response.iter_lines.return_value = iter(EVENT_STREAM.split("\n"))
+
+        transport = DefaultTransport(server_url="https://api.example.com")
+        with patch(
+            "s2gos.client.transport.requests.Session.request",
+            return_value=mock_response,
+        ) as mock_request:
+            results = list(
+                transport.stream(
+                    path="/jobs/events",
+                    method="get",
+                    path_params={},
+                    query_params={"jobIds": "job_1"},
+                    request=None,
+                    return_types={"200": JobInfo},
+                    error_types={},
+                )
+            )
+            mock_request.assert_called_once_with(
+                "GET",
+                "https://api.example.com/jobs/events",
+                params={"jobIds": "job_1"},
+                json=None,
+                headers={"Accept": "text/event-stream"},
+                timeout=(10.0, 60.0),
+                stream=True,
+            )
+        self.assertEqual(2, len(results))
+        self.assertIsInstance(results[0], JobInfo)
+        self.assertEqual(["running", "successful"], [r.status.value for r in results])
+
+    def test_stream_fail(self):
+        mock_response = MagicMock()
+        mock_response.__enter__.return_value = mock_response
+        mock_response.status_code = 404
+        mock_response.ok = False
+        mock_response.reason = "Not Found"
+        mock_response.headers = {}
+        mock_response.content = b'{"detail": "Job \'job_1\' does not exist"}'
+
+        transport = DefaultTransport(server_url="https://api.example.com")
+        with patch(
+            "s2gos.client.transport.requests.Session.request",
+            return_value=mock_response,
+        ):
+            with pytest.raises(ClientException, match="Not Found"):
+                list(
+                    transport.stream(
+                        path="/jobs/events",
+                        method="get",
+                        path_params={},
+                        query_params={},
+                        request=None,
+                        return_types={"200": JobInfo},
+                        error_types={},
+                    )
+                )
+
+    def test_conditional_call(self):
+        etag = '"abc-1"'
+        responses = [
+            Mock(
+                status_code=200,
+                ok=True,
+                headers={"ETag": etag},
+                json=Mock(return_value={"conformsTo": ["Hello"]}),
+            ),
+            Mock(status_code=304, ok=False, headers={"ETag": etag}),
+        ]
+        transport = DefaultTransport(server_url="https://api.example.com")
+        with patch(
+            "s2gos.client.transport.requests.Session.request",
+            side_effect=responses,
+        ) as mock_request:
+            kwargs = dict(
+                path="/conformance",
+                method="get",
+                path_params={},
+                query_params={},
+                request=None,
+                return_types={"200": ConformanceDeclaration},
+                error_types={},
+            )
+            result_1 = transport.call(**kwargs)
+            result_2 = transport.call(**kwargs)
+            self.assertNotIn("headers", mock_request.call_args_list[0].kwargs)
+            self.assertEqual(
+                {"If-None-Match": etag},
+                mock_request.call_args_list[1].kwargs["headers"],
+            )
+        self.assertEqual(["Hello"], result_2.conformsTo)
+        self.assertEqual(result_1, result_2)
+        self.assertIsNot(result_1, result_2)
+
+    def test_conditional_call_disabled(self):
+        transport = DefaultTransport(
+            server_url="https://api.example.com", validator_cache_size=0
+        )
+        key, entry = transport.validator_cache.lookup("get", "https://x", {})
+        self.assertIsNone(key)
+        self.assertIsNone(entry)
+
+
+class ValidatorCacheTest(TestCase):
+    def test_lookup_and_update(self):
+        cache = ValidatorCache(max_size=2)
+        key, entry = cache.lookup("get", "https://x/jobs", {"limit": 10, "a": None})
+        self.assertEqual(("https://x/jobs", (("limit", "10"),)), key)
+        self.assertIsNone(entry)
+
+        value = ConformanceDeclaration(conformsTo=["a"])
+        cache.update(key, {"ETag": '"1"', "Last-Modified": "today"}, value)
+        _, entry = cache.lookup("get", "https://x/jobs", {"limit": 10})
+        self.assertEqual(
+            {"If-None-Match": '"1"', "If-Modified-Since": "today"},
+            entry.get_request_headers(),
+        )
+        self.assertEqual(value, entry.get_value())
+        self.assertIsNot(value, entry.get_value())
+
+        # Responses without validators are removed
+        cache.update(key, {}, value)
+        self.assertEqual(0, len(cache))
+
+    def test_only_get_is_cached(self):
+        cache = ValidatorCache()
+        self.assertEqual((None, None), cache.lookup("post", "https://x/jobs", {}))
+        cache.update(None, {"ETag": '"1"'}, {})
+        self.assertEqual(0, len(cache))
+
+    def test_lru_eviction(self):
+        cache = ValidatorCache(max_size=2)
+        for path in ("a", "b"):
+            key, _ = cache.lookup("get", path, {})
+            cache.update(key, {"ETag": '"1"'}, path)
+        cache.lookup("get", "a", {})
+        key, _ = cache.lookup("get", "c", {})
+        cache.update(key, {"ETag": '"1"'}, "c")
+        self.assertEqual(2, len(cache))
+        self.assertIsNone(cache.lookup("get", "b", {})[1])
+        self.assertEqual("a", cache.lookup("get", "a", {})[1].get_value())
+        cache.clear()
+        self.assertEqual(0, len(cache))
+
+
+class DefaultAsyncTransportTest(IsolatedAsyncioTestCase):
+    async def test_call_success_200(self):
+        transport = DefaultAsyncTransport(server_url="https://api.example.com")
+        mock_response = httpx.Response(200, json={"conformsTo": ["Hello", "World"]})
+        with patch.object(
+            httpx.AsyncClient, "request", AsyncMock(return_value=mock_response)
+        ) as mock_request:
+            result = await transport.call(
+                path="/conformance",
+                method="get",
+                path_params={},
+                query_params={},
+                request=None,
+                return_types={"200": ConformanceDeclaration},
+                error_types={"401": ApiError},
+            )
+            mock_request.assert_awaited_once_with(
+                "GET",
+                "https://api.example.com/conformance",
+                params={},
+                json=None,
+            )
+        self.assertIsInstance(result, ConformanceDeclaration)
+        await transport.close()
+
+    async def test_call_fail(self):
+        transport = DefaultAsyncTransport(server_url="https://api.example.com")
+        mock_response = httpx.Response(401, json={"detail": "So sorry"})
+        with patch.object(
+            httpx.AsyncClient, "request", AsyncMock(return_value=mock_response)
+        ):
+            with pytest.raises(ClientException, match="Unauthorized"):
+                await transport.call(
+                    path="/conformance",
+                    method="get",
+                    path_params={},
+                    query_params={},
+                    request=None,
+                    return_types={"200": ConformanceDeclaration},
+                    error_types={"401": ApiError},
+                )
+        await transport.close()
+
+    async def test_call_drops_none_query_params(self):
+        def handle(request: httpx.Request) -> httpx.Response:
+            self.assertEqual(b"limit=10", request.url.query)
+            return httpx.Response(200, json={"jobs": [], "links": []})
+
+        transport = DefaultAsyncTransport(server_url="https://api.example.com")
+        transport._client = httpx.AsyncClient(transport=httpx.MockTransport(handle))
+        result = await transport.call(
+            path="/jobs",
+            method="get",
+            path_params={},
+            query_params={"limit": 10, "status": None, "processID": None},
+            request=None,
+            return_types={"200": JobList},
+            error_types={},
+        )
+        self.assertEqual([], result.jobs)
+        await transport.close()
+
+    async def test_client_is_pooled(self):
+        transport = DefaultAsyncTransport(
+            server_url="https://api.example.com", http2=True
+        )
+        client = transport.client
+        self.assertIs(client, transport.client)
+        await transport.close()
+        self.assertIsNot(client, transport.client)
+        await transport.close()
+
+    async def test_stream(self):
+        def handle(request: httpx.Request) -> httpx.Response:
+            self.assertEqual("/jobs/events", request.url.path)
+            self.assertEqual(b"processID=p1", request.url.query)
+            return httpx.Response(
+                200,
+                content=EVENT_STREAM.encode(),
+                headers={"Content-Type": "text/event-stream"},
+            )
+
+        transport = DefaultAsyncTransport(server_url="https://api.example.com")
+        transport._client = httpx.AsyncClient(transport=httpx.MockTransport(handle))
+        results = [
+            r
+            async for r in transport.stream(
+                path="/jobs/events",
+                method="get",
+                path_params={},
+                query_params={"jobIds": None, "processID": "p1"},
+                request=None,
+                return_types={"200": JobInfo},
+                error_types={},
+            )
+        ]
+        self.assertEqual(["running", "successful"], [r.status.value for r in results])
+        await transport.close()
+
+    async def test_conditional_call(self):
+        etag = '"abc-1"'
+
+        def handle(request: httpx.Request) -> httpx.Response:
+            if request.headers.get("If-None-Match") == etag:
+                return httpx.Response(304, headers={"ETag": etag})
+            return httpx.Response(
+                200, json={"conformsTo": ["Hello"]}, headers={"ETag": etag}
+            )
+
+        transport = DefaultAsyncTransport(server_url="https://api.example.com")
+        transport._client = httpx.AsyncClient(transport=httpx.MockTransport(handle))
+        kwargs = dict(
+            path="/conformance",
+            method="get",
+            path_params={},
+            query_params={},
+            request=None,
+            return_types={"200": ConformanceDeclaration},
+            error_types={},
+        )
+        result_1 = await transport.call(**kwargs)
+        result_2 = await transport.call(**kwargs)
+        self.assertEqual(["Hello"], result_2.conformsTo)
+        self.assertEqual(result_1, result_2)
+        self.assertEqual(1, len(transport.validator_cache))
+        await transport.close()
+
+
+class ParseEventsTest(TestCase):
+    def test_parse_events(self):
+        self.assertEqual(
+            ['{"a": 1}', "line 1\nline 2", "last"],
+            list(
+                _parse_events(
+                    [
+                        ": comment",
+                        "",
+                        'data: {"a": 1}\r',
+                        "",
+                        "event: job",
+                        "data: line 1",
+                        "data:line 2",
+                        "id: 7",
+                        "",
+                        "",
+                        "data: last",
+                    ]
+                )
+            ),
+        )
+
+
+class ParseRetryAfterTest(TestCase):
+    def test_parse_retry_after(self):
+        self.assertEqual(None, _parse_retry_after(None))
+        self.assertEqual(None, _parse_retry_after("soon"))
+        self.assertEqual(120.0, _parse_retry_after("120"))
+        self.assertEqual(0.0, _parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT"))
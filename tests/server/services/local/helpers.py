@@ -0,0 +1,42 @@
+#  Copyright (c) 2025 by ESA DTE-S2GOS team and contributors
+#  Permissions are hereby granted under the terms of the Apache 2.0 License:
+#  https://opensource.org/license/apache-2-0.
+
+import datetime
+import time
+from typing import Callable, Optional
+
+from s2gos.common.models import JobInfo, StatusCode, Type
+
+T0 = datetime.datetime(2025, 6, 1, 12, 0, 0)
+
+
+def new_job_info(
+    i: int,
+    process_id: str = "p",
+    status: StatusCode = StatusCode.accepted,
+    progress: Optional[int] = None,
+) -> JobInfo:
+    """Create the status of job "job_<i>", created `i` minutes after `T0`."""
+    return JobInfo(
+        type=Type.process,
+        jobID=f"job_{i}",
+        processID=process_id,
+        status=status,
+        created=T0 + datetime.timedelta(minutes=i),
+        progress=progress,
+    )
+
+
+def wait_for(condition: Callable[[], bool], timeout: float = 5.0) -> bool:
+    """Wait until `condition()` is true.
+
+    Returns:
+        `False` if the condition is still false after `timeout` seconds.
+    """
+    end_time = time.monotonic() + timeout
+    while not condition():
+        if time.monotonic() >= end_time:
+            return False
+        time.sleep(0.01)
+    return True
@@ -0,0 +1,52 @@
+#  Copyright (c) 2025 by ESA DTE-S2GOS team and contributors
+#  Permissions are hereby granted under the terms of the Apache 2.0 License:
+#  https://opensource.org/license/apache-2-0.
+
+import asyncio
+import threading
+from concurrent.futures import CancelledError
+from unittest import TestCase
+
+import pytest
+
+from s2gos.server.services.local.async_executor import AsyncExecutor
+
+
+async def get_thread_name(delay: float = 0.0) -> str:
+    await asyncio.sleep(delay)
+    return threading.current_thread().name
+
+
+class AsyncExecutorTest(TestCase):
+    def test_submit(self):
+        executor = AsyncExecutor()
+        self.addCleanup(executor.shutdown)
+        futures = [executor.submit(get_thread_name, delay=0.05) for _ in range(100)]
+        # All tasks run concurrently in the same thread
+        self.assertEqual(
+            {"s2gos-async-jobs"}, {future.result(timeout=2) for future in futures}
+        )
+
+    def test_max_workers(self):
+        self.assertEqual(1000, AsyncExecutor()._max_workers)
+        self.assertEqual(10, AsyncExecutor(max_workers=10)._max_workers)
+
+    def test_shutdown_waits_for_tasks(self):
+        executor = AsyncExecutor()
+        future = executor.submit(get_thread_name, 0.05)
+        executor.shutdown()
+        self.assertTrue(future.done())
+        with pytest.raises(RuntimeError, match="after shutdown"):
+            executor.submit(get_thread_name)
+
+    def test_shutdown_cancels_tasks(self):
+        executor = AsyncExecutor()
+        future = executor.submit(asyncio.sleep, 10)
+        executor.shutdown(cancel_futures=True)
+        with pytest.raises(CancelledError):
+            future.result(timeout=0)
+
+    def test_shutdown_unused(self):
+        executor = AsyncExecutor()
+        executor.shutdown()
+        self.assertIsNone(executor._loop)
@@ -0,0 +1,276 @@
+#  Copyright (c) 2025 by ESA DTE-S2GOS team and contributors
+#  Permissions are hereby granted under the terms of the Apache 2.0 License:
+#  https://opensource.org/license/apache-2-0.
+
+import asyncio
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest import TestCase
+
+from s2gos.common.models import (
+    ProcessRequest,
+    StatusCode,
+    Subscriber,
+)
+from s2gos.server.services.local import LocalService, get_job_context
+from s2gos.server.services.local.callbacks import CallbackDispatcher
+from tests.server.services.local.helpers import new_job_info
+
+
+class Receiver:
+    """A local HTTP server that records the notifications it receives."""
+
+    def __init__(self, delay: float = 0.0, failures: int = 0):
+        self.delay = delay
+        self.failures = failures
+        self.requests: list[tuple[str, dict]] = []
+        self.concurrency = 0
+        self.max_concurrency = 0
+        self._lock = threading.Lock()
+        receiver = self
+
+        class Handler(BaseHTTPRequestHandler):
+            # noinspection PyPep8Naming
+            def do_POST(self):
+                length = int(self.headers["Content-Length"])
+                body = json.loads(self.rfile.read(length))
+                with receiver._lock:
+                    receiver.concurrency += 1
+                    receiver.max_concurrency = max(
+                        receiver.max_concurrency, receiver.concurrency
+                    )
+                    fail = receiver.failures > 0
+                    if fail:
+                        receiver.failures -= 1
+                    else:
+                        receiver.requests.append((self.path, body))
+                time.sleep(receiver.delay)
+                with receiver._lock:
+                    receiver.concurrency -= 1
+                self.send_response(503 if fail else 200)
+                self.send_header("Content-Length", "0")
+                self.end_headers()
+
+            def log_message(self, *args):
+                pass
+
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.url = f"http://127.0.0.1:{self.server.server_address[1]}"
+        self.thread = threading.Thread(
+            target=self.server.serve_forever, args=(0.01,), daemon=True
+        )
+
+    def __enter__(self) -> "Receiver":
+        self.thread.start()
+        return self
+
+    def __exit__(self, *args):
+        self.server.shutdown()
+        self.server.server_close()
+
+
+class CallbackDispatcherTest(TestCase):
+    def test_notify(self):
+        dispatcher = CallbackDispatcher()
+        with Receiver() as receiver:
+            dispatcher.notify(
+                "job_1",
+                f"{receiver.url}/done",
+                new_job_info(1, status=StatusCode.running, progress=100),
+            )
+            dispatcher.close(timeout=5)
+        self.assertEqual(
+            [
+                (
+                    "/done",
+                    {
+                        "type": "process",
+                        "jobID": "job_1",
+                        "processID": "p",
+                        "status": "running",
+                        "created": "2025-06-01T12:01:00",
+                        "progress": 100,
+                    },
+                )
+            ],
+            receiver.requests,
+        )
+        self.assertEqual(1, dispatcher.num_delivered)
+
+    def test_progress_is_batched(self):
+        dispatcher = CallbackDispatcher(progress_interval=0.2)
+        with Receiver() as receiver:
+            for progress in range(100):
+                dispatcher.notify_progress(
+                    f"{receiver.url}/progress",
+                    new_job_info(1, status=StatusCode.running, progress=progress),
+                )
+                dispatcher.notify_progress(
+                    f"{receiver.url}/progress",
+                    new_job_info(2, status=StatusCode.running, progress=progress),
+                )
+            dispatcher.close(timeout=5)
+        self.assertEqual(
+            [("job_1", 99), ("job_2", 99)],
+            sorted((body["jobID"], body["progress"]) for _, body in receiver.requests),
+        )
+
+    def test_final_notification_discards_progress(self):
+        dispatcher = CallbackDispatcher(progress_interval=10)
+        with Receiver() as receiver:
+            dispatcher.notify_progress(
+                f"{receiver.url}/progress",
+                new_job_info(1, status=StatusCode.running, progress=50),
+            )
+            dispatcher.notify(
+                "job_1",
+                f"{receiver.url}/done",
+                new_job_info(1, status=StatusCode.running, progress=100),
+            )
+            dispatcher.close(timeout=5)
+        self.assertEqual(["/done"], [path for path, _ in receiver.requests])
+
+    def test_retries(self):
+        dispatcher = CallbackDispatcher(max_retries=2, retry_delay=0.01)
+        with Receiver(failures=2) as receiver:
+            dispatcher.notify(
+                "job_1",
+                receiver.url,
+                new_job_info(1, status=StatusCode.running, progress=100),
+            )
+            dispatcher.close(timeout=5)
+        self.assertEqual(1, len(receiver.requests))
+        self.assertEqual(1, dispatcher.num_delivered)
+        self.assertEqual(0, dispatcher.num_failed)
+
+    def test_gives_up(self):
+        dispatcher = CallbackDispatcher(max_retries=1, retry_delay=0.01)
+        with Receiver(failures=5) as receiver:
+            dispatcher.notify(
+                "job_1",
+                receiver.url,
+                new_job_info(1, status=StatusCode.running, progress=100),
+            )
+            dispatcher.close(timeout=5)
+        self.assertEqual(0, len(receiver.requests))
+        self.assertEqual(0, dispatcher.num_delivered)
+        self.assertEqual(1, dispatcher.num_failed)
+
+    def test_unreachable_endpoint(self):
+        dispatcher = CallbackDispatcher(max_retries=1, retry_delay=0.01)
+        with Receiver() as receiver:
+            url = receiver.url
+        dispatcher.notify(
+            "job_1", url, new_job_info(1, status=StatusCode.running, progress=100)
+        )
+        dispatcher.close(timeout=5)
+        self.assertEqual(1, dispatcher.num_failed)
+
+    def test_per_endpoint_concurrency(self):
+        dispatcher = CallbackDispatcher(
+            max_concurrency=8, max_concurrency_per_endpoint=2
+        )
+        with Receiver(delay=0.05) as receiver:
+            for i in range(10):
+                dispatcher.notify(
+                    f"job_{i}",
+                    receiver.url,
+                    new_job_info(i, status=StatusCode.running, progress=0),
+                )
+            dispatcher.close(timeout=5)
+        self.assertEqual(10, len(receiver.requests))
+        self.assertEqual(2, receiver.max_concurrency)
+
+    def test_queue_is_bounded(self):
+        dispatcher = CallbackDispatcher(queue_size=2, max_concurrency=1)
+        with Receiver(delay=0.1) as receiver:
+            for i in range(5):
+                dispatcher.notify(
+                    f"job_{i}",
+                    receiver.url,
+                    new_job_info(i, status=StatusCode.running, progress=0),
+                )
+            dispatcher.close(timeout=5)
+        self.assertTrue(dispatcher.num_dropped >= 1)
+        self.assertEqual(5, dispatcher.num_delivered + dispatcher.num_dropped)
+
+    def test_notify_does_not_block(self):
+        dispatcher = CallbackDispatcher()
+        with Receiver(delay=0.2) as receiver:
+            t0 = time.monotonic()
+            for i in range(10):
+                dispatcher.notify(
+                    f"job_{i}",
+                    receiver.url,
+                    new_job_info(i, status=StatusCode.running, progress=0),
+                )
+            self.assertLess(time.monotonic() - t0, 0.2)
+            dispatcher.close(timeout=5)
+
+
+def fn_with_progress(steps: int) -> int:
+    ctx = get_job_context()
+    for i in range(steps):
+        ctx.report_progress(progress=int(100 * (i + 1) / steps))
+    return 2 * steps
+
+
+# noinspection PyUnusedLocal
+def fn_failing(steps: int) -> int:
+    raise ValueError("Out of steps")
+
+
+class LocalServiceCallbacksTest(TestCase):
+    def setUp(self):
+        self.service = LocalService(
+            title="Test Service",
+            callbacks=CallbackDispatcher(progress_interval=0.05),
+        )
+        self.service.register_process(fn_with_progress, id="progress")
+        self.service.register_process(fn_failing, id="failing")
+
+    def execute(self, process_id: str, receiver: Receiver) -> str:
+        request = ProcessRequest(
+            inputs={"steps": 5},
+            subscriber=Subscriber(
+                successUri=f"{receiver.url}/success",
+                inProgressUri=f"{receiver.url}/progress",
+                failedUri=f"{receiver.url}/failed",
+            ),
+        )
+        response = asyncio.run(self.service.execute_process(process_id, request))
+        job_id = json.loads(response.body)["jobID"]
+        self.service.jobs[job_id].future.exception(timeout=5)
+        self.service.callbacks.close(timeout=5)
+        return job_id
+
+    def test_conformance(self):
+        conformance = asyncio.run(self.service.get_conformance())
+        self.assertIn(
+            "http://www.opengis.net/spec/ogcapi-processes-1/1.0/conf/callback",
+            conformance.conformsTo,
+        )
+
+    def test_success(self):
+        with Receiver() as receiver:
+            job_id = self.execute("progress", receiver)
+        paths = [path for path, _ in receiver.requests]
+        self.assertIn("/success", paths)
+        self.assertNotIn("/failed", paths)
+        self.assertEqual({"result": 10}, dict(receiver.requests)["/success"])
+        for path, body in receiver.requests:
+            if path == "/progress":
+                self.assertEqual(job_id, body["jobID"])
+
+    def test_failure(self):
+        with Receiver() as receiver:
+            job_id = self.execute("failing", receiver)
+        paths = [path for path, _ in receiver.requests]
+        self.assertIn("/failed", paths)
+        self.assertNotIn("/success", paths)
+        failed = dict(receiver.requests)["/failed"]
+        self.assertEqual(job_id, failed["jobID"])
+        self.assertEqual("failed", failed["status"])
+        self.assertEqual("Out of steps", failed["message"])
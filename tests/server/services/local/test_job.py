@@ -2,13 +2,21 @@
 #  Permissions are hereby granted under the terms of the Apache 2.0 License:
 #  https://opensource.org/license/apache-2-0.
 
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from unittest import TestCase
 
 import pytest
 
 from s2gos.common.models import StatusCode
-from s2gos.server.services.local import Job, JobCancelledException, get_job_context
-from s2gos.server.services.local.job import NullJobContext
+from s2gos.server.services.local import (
+    Job,
+    JobCancelledException,
+    get_job_context,
+    with_job_context,
+)
+from s2gos.server.services.local.job import NullJobContext, ProgressThrottle
 
 
 def fn_success(x: int, y: int) -> int:
@@ -123,20 +131,171 @@ class JobTest(TestCase):
         self.assertEqual(StatusCode.dismissed, job.status_info.status)
 
 
+async def fn_async_success_report(x: int, y: int) -> int:
+    ctx = get_job_context()
+    ctx.report_progress(progress=50, message="Almost done")
+    await asyncio.sleep(0)
+    return x * y
+
+
+async def fn_async_wait(started: asyncio.Event) -> int:
+    started.set()
+    await asyncio.sleep(10)
+    return 0
+
+
+async def fn_async_exc() -> int:
+    raise OSError("File not found")
+
+
+class JobRunAsyncTest(TestCase):
+    def test_run_success(self):
+        job = Job(
+            process_id="process_8",
+            job_id="job_41",
+            function=fn_async_success_report,
+            function_kwargs={"x": 3, "y": 9},
+        )
+        result = asyncio.run(job.run_async())
+        self.assertEqual(27, result)
+        self.assertEqual(27, job.result)
+        self.assertEqual(StatusCode.successful, job.status_info.status)
+        self.assertEqual(50, job.status_info.progress)
+        self.assertEqual("Almost done", job.status_info.message)
+
+    def test_run_exc(self):
+        job = Job(
+            process_id="process_8",
+            job_id="job_41",
+            function=fn_async_exc,
+            function_kwargs={},
+        )
+        self.assertEqual(None, asyncio.run(job.run_async()))
+        self.assertEqual(StatusCode.failed, job.status_info.status)
+        self.assertEqual("File not found", job.status_info.message)
+
+    def test_cancel_task(self):
+        async def run() -> Job:
+            started = asyncio.Event()
+            job = Job(
+                process_id="process_8",
+                job_id="job_41",
+                function=fn_async_wait,
+                function_kwargs={"started": started},
+            )
+            task = asyncio.create_task(job.run_async())
+            await started.wait()
+            job.cancel()
+            await asyncio.wait_for(task, timeout=5)
+            return job
+
+        job = asyncio.run(run())
+        self.assertEqual(StatusCode.dismissed, job.status_info.status)
+        self.assertIsNone(job._task)
+
+    def test_cancel_before_run(self):
+        job = Job(
+            process_id="process_8",
+            job_id="job_41",
+            function=fn_async_exc,
+            function_kwargs={},
+        )
+        job.cancel()
+        asyncio.run(job.run_async())
+        self.assertEqual(StatusCode.dismissed, job.status_info.status)
+
+
 class GetJobContextTest(TestCase):
     def test_null(self):
         job_context = get_job_context()
         self.assertIsInstance(job_context, NullJobContext)
 
     def test_valid(self):
-        __job_context__ = Job(  # noqa: F841
+        job = Job(
+            process_id="a",
+            job_id="b",
+            function=get_job_context,
+            function_kwargs={},
+        )
+        self.assertIs(job, job.run())
+        # The job context is reset after the job ran
+        self.assertIsInstance(get_job_context(), NullJobContext)
+
+    def test_concurrent_jobs(self):
+        barrier = threading.Barrier(2)
+
+        def get_context():
+            barrier.wait(timeout=5)
+            return get_job_context()
+
+        jobs = [
+            Job(
+                process_id="a",
+                job_id=f"job_{i}",
+                function=get_context,
+                function_kwargs={},
+            )
+            for i in range(2)
+        ]
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            results = list(executor.map(lambda job: job.run(), jobs))
+        self.assertIs(jobs[0], results[0])
+        self.assertIs(jobs[1], results[1])
+
+    def test_asyncio_tasks_inherit_context(self):
+        async def get_context():
+            return await asyncio.create_task(asyncio.to_thread(get_job_context))
+
+        job = Job(
             process_id="a",
             job_id="b",
-            function=lambda x: 2 * x,
-            function_kwargs={"x": 4},
+            function=lambda: asyncio.run(get_context()),
+            function_kwargs={},
         )
-        value = get_job_context()
-        self.assertIs(__job_context__, value)
+        self.assertIs(job, job.run())
+
+    def test_with_job_context(self):
+        def get_context_in_thread(wrap: bool):
+            results = []
+
+            def target():
+                results.append(get_job_context())
+
+            thread = threading.Thread(
+                target=with_job_context(target) if wrap else target
+            )
+            thread.start()
+            thread.join()
+            return results[0]
+
+        job = Job(
+            process_id="a",
+            job_id="b",
+            function=get_context_in_thread,
+            function_kwargs={"wrap": True},
+        )
+        self.assertIs(job, job.run())
+        job.function_kwargs = {"wrap": False}
+        self.assertIsInstance(job.run(), NullJobContext)
+
+    def test_with_job_context_called_concurrently(self):
+        barrier = threading.Barrier(4)
+
+        def get_context(_i: int):
+            barrier.wait(timeout=5)
+            return get_job_context()
+
+        def map_in_threads():
+            with ThreadPoolExecutor(max_workers=4) as executor:
+                return list(executor.map(with_job_context(get_context), range(4)))
+
+        job = Job(
+            process_id="a",
+            job_id="b",
+            function=map_in_threads,
+            function_kwargs={},
+        )
+        self.assertEqual([job] * 4, job.run())
 
 
 class NullJobContextTest(TestCase):
@@ -145,3 +304,106 @@ class NullJobContextTest(TestCase):
         self.assertFalse(job_context.report_progress(progress=85))
         self.assertFalse(job_context.is_cancelled())
         self.assertFalse(job_context.check_cancelled())
+
+
+class JobListenerTest(TestCase):
+    def test_listeners_are_notified(self):
+        job = Job(
+            process_id="process_8",
+            job_id="job_41",
+            function=fn_success_report,
+            function_kwargs={"path": "memory://"},
+        )
+        statuses = []
+        job.add_listener(
+            lambda j: statuses.append((j.status_info.status, j.status_info.progress))
+        )
+        job.run()
+        self.assertEqual(
+            [
+                (StatusCode.running, None),
+                (StatusCode.running, 0),
+                (StatusCode.running, 50),
+                (StatusCode.running, 100),
+                (StatusCode.successful, 100),
+            ],
+            statuses,
+        )
+
+
+def fn_count(n: int, message: str = None) -> int:
+    ctx = get_job_context()
+    for i in range(n + 1):
+        ctx.report_progress(progress=i, message=message)
+    return n
+
+
+class ProgressThrottleTest(TestCase):
+    def run_job(self, **kwargs) -> list[tuple[StatusCode, int]]:
+        job = Job(
+            process_id="process_8",
+            job_id="job_41",
+            function=fn_count,
+            function_kwargs={"n": 100},
+            **kwargs,
+        )
+        statuses = []
+        job.add_listener(
+            lambda j: statuses.append((j.status_info.status, j.status_info.progress))
+        )
+        job.run()
+        return statuses
+
+    def test_not_throttled(self):
+        statuses = self.run_job()
+        self.assertEqual(103, len(statuses))
+
+    def test_interval(self):
+        statuses = self.run_job(progress_interval=3600)
+        # The final progress is flushed with the final status
+        self.assertEqual(
+            [
+                (StatusCode.running, None),
+                (StatusCode.running, 0),
+                (StatusCode.successful, 100),
+            ],
+            statuses,
+        )
+
+    def test_delta(self):
+        statuses = self.run_job(progress_delta=25)
+        self.assertEqual(
+            [
+                (StatusCode.running, None),
+                (StatusCode.running, 0),
+                (StatusCode.running, 25),
+                (StatusCode.running, 50),
+                (StatusCode.running, 75),
+                (StatusCode.running, 100),
+                (StatusCode.successful, 100),
+            ],
+            statuses,
+        )
+
+    def test_message_changes_are_published(self):
+        throttle = ProgressThrottle(delta=10)
+        self.assertTrue(throttle.update(1, "a"))
+        self.assertFalse(throttle.update(2, "a"))
+        self.assertTrue(throttle.update(3, "b"))
+        self.assertFalse(throttle.update(None, "b"))
+        self.assertTrue(throttle.pending)
+        self.assertTrue(throttle.flush())
+        self.assertFalse(throttle.flush())
+        self.assertEqual((3, "b"), (throttle.progress, throttle.message))
+
+    def test_cancelled(self):
+        job = Job(
+            process_id="process_8",
+            job_id="job_41",
+            function=fn_count,
+            function_kwargs={"n": 100},
+            progress_interval=3600,
+        )
+        job.cancel()
+        with pytest.raises(JobCancelledException):
+            job.report_progress(progress=1)
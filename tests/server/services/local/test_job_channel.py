@@ -0,0 +1,149 @@
+#  Copyright (c) 2025 by ESA DTE-S2GOS team and contributors
+#  Permissions are hereby granted under the terms of the Apache 2.0 License:
+#  https://opensource.org/license/apache-2-0.
+
+import asyncio
+import json
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from unittest import TestCase
+
+from s2gos.common.models import ProcessRequest, StatusCode
+from s2gos.server.services.local import LocalService, get_job_context
+from s2gos.server.services.local.job import Job
+from s2gos.server.services.local.job_channel import JobChannel
+from tests.server.services.local.helpers import wait_for
+
+
+def get_pid(steps: int) -> int:
+    ctx = get_job_context()
+    for i in range(steps):
+        ctx.report_progress(progress=100 * (i + 1) // steps, message=f"step {i + 1}")
+    return os.getpid()
+
+
+def wait_for_cancellation(timeout: float) -> bool:
+    ctx = get_job_context()
+    end_time = time.monotonic() + timeout
+    while time.monotonic() < end_time:
+        ctx.report_progress(message="waiting")
+        time.sleep(0.01)
+    return False
+
+
+def fail() -> None:
+    raise ValueError("expected failure")
+
+
+class JobChannelTest(TestCase):
+    def setUp(self):
+        self.executor = ProcessPoolExecutor(max_workers=2)
+        self.channel = JobChannel()
+
+    def tearDown(self):
+        self.executor.shutdown(wait=True)
+        self.channel.close()
+
+    def new_job(self, function, **kwargs) -> Job:
+        job = Job(
+            process_id=function.__name__,
+            job_id=f"job-{function.__name__}",
+            function=function,
+            function_kwargs=kwargs,
+        )
+        self.statuses: list[StatusCode] = []
+        job.add_listener(lambda j: self.statuses.append(j.status_info.status))
+        return job
+
+    def test_success(self):
+        job = self.new_job(get_pid, steps=3)
+        future = self.channel.submit(job, self.executor.submit)
+        pid = future.result(timeout=10)
+        self.assertNotEqual(os.getpid(), pid)
+        self.assertEqual(pid, job.result)
+        job_info = job.status_info
+        self.assertEqual(StatusCode.successful, job_info.status)
+        self.assertIsNotNone(job_info.started)
+        self.assertIsNotNone(job_info.finished)
+        self.assertEqual(StatusCode.running, self.statuses[0])
+        self.assertEqual(StatusCode.successful, self.statuses[-1])
+
+    def test_progress_and_cancellation(self):
+        job = self.new_job(wait_for_cancellation, timeout=10)
+        future = self.channel.submit(job, self.executor.submit)
+        self.assertTrue(wait_for(lambda: job.status_info.message == "waiting"))
+        self.assertEqual(StatusCode.running, job.status_info.status)
+        job.cancel()
+        self.channel.cancel(job.status_info.jobID)
+        self.assertIsNone(future.result(timeout=10))
+        self.assertEqual(StatusCode.dismissed, job.status_info.status)
+
+    def test_listeners_may_call_channel(self):
+        job = self.new_job(wait_for_cancellation, timeout=10)
+        job_id = job.status_info.jobID
+        # Would deadlock, if listeners were called while holding the lock
+        job.add_listener(
+            lambda j: (
+                self.channel.cancel(job_id)
+                if j.status_info.message == "waiting"
+                else None
+            )
+        )
+        future = self.channel.submit(job, self.executor.submit)
+        future.add_done_callback(lambda _f: self.channel.cancel(job_id))
+        self.assertIsNone(future.result(timeout=10))
+        self.assertEqual(StatusCode.dismissed, job.status_info.status)
+
+    def test_cancelled_before_started(self):
+        job = self.new_job(wait_for_cancellation, timeout=10)
+        job.cancel()
+        self.channel.submit(job, self.executor.submit).result(timeout=10)
+        self.assertEqual(StatusCode.dismissed, job.status_info.status)
+
+    def test_failure(self):
+        job = self.new_job(fail)
+        self.channel.submit(job, self.executor.submit).result(timeout=10)
+        job_info = job.status_info
+        self.assertEqual(StatusCode.failed, job_info.status)
+        self.assertEqual("expected failure", job_info.message)
+        self.assertIn("ValueError: expected failure\n", job_info.traceback)
+
+    def test_unpicklable_function(self):
+        job = self.new_job(lambda: 42)
+        self.channel.submit(job, self.executor.submit).result(timeout=10)
+        self.assertEqual(StatusCode.failed, job.status_info.status)
+
+
+class LocalServiceProcessPoolTest(TestCase):
+    def test_jobs_run_in_worker_processes(self):
+        service = LocalService(
+            title="OGC API - Processes - Test Service",
+            executor=ProcessPoolExecutor(max_workers=2),
+        )
+        service.register_process(get_pid, id="get_pid")
+        service.register_process(wait_for_cancellation, id="wait")
+        try:
+            response = asyncio.run(
+                service.execute_process("get_pid", ProcessRequest(inputs={"steps": 2}))
+            )
+            job = service.jobs[json.loads(response.body)["jobID"]]
+            self.assertNotEqual(os.getpid(), job.future.result(timeout=10))
+            self.assertEqual(StatusCode.successful, job.status_info.status)
+            self.assertEqual(100, job.status_info.progress)
+            results = asyncio.run(service.get_job_results(job.status_info.jobID))
+            self.assertEqual([job.result], [v.root.root for v in results.root.values()])
+
+            response = asyncio.run(
+                service.execute_process("wait", ProcessRequest(inputs={"timeout": 10}))
+            )
+            job = service.jobs[json.loads(response.body)["jobID"]]
+            self.assertTrue(
+                wait_for(lambda: job.status_info.status == StatusCode.running)
+            )
+            asyncio.run(service.dismiss_job(job.status_info.jobID))
+            job.future.result(timeout=10)
+            self.assertEqual(StatusCode.dismissed, job.status_info.status)
+        finally:
+            service.executor.shutdown(wait=True)
+            service.job_channel.close()
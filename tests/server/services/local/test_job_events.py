@@ -0,0 +1,132 @@
+#  Copyright (c) 2025 by ESA DTE-S2GOS team and contributors
+#  Permissions are hereby granted under the terms of the Apache 2.0 License:
+#  https://opensource.org/license/apache-2-0.
+
+import asyncio
+import json
+import threading
+from unittest import IsolatedAsyncioTestCase
+
+import pytest
+from fastapi.responses import StreamingResponse
+
+from s2gos.common.models import JobInfo, ProcessRequest, StatusCode
+from s2gos.server.exceptions import JSONContentException
+from s2gos.server.services.local import LocalService, get_job_context
+from s2gos.server.services.local.job_events import JobEventHub, format_event
+from tests.server.services.local.helpers import new_job_info
+
+
+class JobEventHubTest(IsolatedAsyncioTestCase):
+    async def test_publish_is_filtered(self):
+        hub = JobEventHub()
+        sub_all = hub.subscribe()
+        sub_job = hub.subscribe(job_ids={"job_2"})
+        sub_process = hub.subscribe(process_id="p2")
+        self.assertEqual(3, hub.num_subscriptions)
+
+        hub.publish(new_job_info(1, "p1"))
+        hub.publish(new_job_info(2, "p2"))
+
+        self.assertEqual(
+            ["job_1", "job_2"], [j.jobID for j in await sub_all.get(timeout=1)]
+        )
+        self.assertEqual(["job_2"], [j.jobID for j in await sub_job.get(timeout=1)])
+        self.assertEqual(["job_2"], [j.jobID for j in await sub_process.get(timeout=1)])
+
+        hub.unsubscribe(sub_all)
+        hub.unsubscribe(sub_job)
+        hub.unsubscribe(sub_process)
+        self.assertEqual(0, hub.num_subscriptions)
+
+    async def test_changes_are_coalesced(self):
+        hub = JobEventHub()
+        subscription = hub.subscribe()
+
+        def publish():
+            for progress in range(10):
+                hub.publish(new_job_info(1, progress=progress))
+
+        thread = threading.Thread(target=publish)
+        thread.start()
+        thread.join()
+
+        job_infos = await subscription.get(timeout=1)
+        self.assertEqual(1, len(job_infos))
+        self.assertEqual(9, job_infos[0].progress)
+        self.assertEqual([], await subscription.get(timeout=0.01))
+
+    async def test_published_job_infos_are_snapshots(self):
+        hub = JobEventHub()
+        subscription = hub.subscribe()
+        job_info = new_job_info(1, progress=10)
+        hub.publish(job_info)
+        job_info.progress = 20
+        job_infos = await subscription.get(timeout=1)
+        self.assertEqual(10, job_infos[0].progress)
+
+    async def test_poll_runs_outside_event_loop(self):
+        hub = JobEventHub()
+        subscription = hub.subscribe(job_ids={"job_1"})
+        poll_threads = []
+
+        def poll() -> list[JobInfo]:
+            poll_threads.append(threading.current_thread())
+            return [new_job_info(1, status=StatusCode.successful)]
+
+        events = [
+            event
+            async for event in hub.stream(
+                subscription, [new_job_info(1)], poll=poll, poll_interval=0.01
+            )
+        ]
+        self.assertEqual(2, len(events))
+        self.assertEqual(1, len(poll_threads))
+        self.assertIsNot(threading.current_thread(), poll_threads[0])
+
+    def test_format_event(self):
+        event = format_event(new_job_info(1))
+        self.assertTrue(event.startswith("event: job\ndata: {"))
+        self.assertTrue(event.endswith("}\n\n"))
+
+
+def fn_with_progress(steps: int) -> int:
+    ctx = get_job_context()
+    for i in range(steps):
+        ctx.report_progress(progress=int(100 * (i + 1) / steps))
+    return steps
+
+
+class LocalServiceJobEventsTest(IsolatedAsyncioTestCase):
+    def setUp(self):
+        self.service = LocalService(title="Test Service")
+        self.service.register_process(fn_with_progress, id="progress")
+
+    async def test_stream_ends_when_jobs_finished(self):
+        response = await self.service.execute_process(
+            "progress", ProcessRequest(inputs={"steps": 3})
+        )
+        job_id = json.loads(response.body)["jobID"]
+
+        response = await self.service.get_job_events(job_ids=job_id)
+        self.assertIsInstance(response, StreamingResponse)
+        self.assertEqual("text/event-stream", response.media_type)
+
+        job_infos = await asyncio.wait_for(self.collect(response), timeout=5)
+        self.assertTrue(len(job_infos) >= 1)
+        self.assertEqual({job_id}, {j.jobID for j in job_infos})
+        self.assertEqual(StatusCode.successful, job_infos[-1].status)
+        self.assertEqual(0, self.service.job_events.num_subscriptions)
+
+    async def test_unknown_job(self):
+        with pytest.raises(JSONContentException):
+            await self.service.get_job_events(job_ids="job_99")
+
+    @staticmethod
+    async def collect(response: StreamingResponse) -> list[JobInfo]:
+        job_infos = []
+        async for chunk in response.body_iterator:
+            for line in chunk.split("\n"):
+                if line.startswith("data: "):
+                    job_infos.append(JobInfo.model_validate_json(line[6:]))
+        return job_infos
@@ -0,0 +1,136 @@
+#  Copyright (c) 2025 by ESA DTE-S2GOS team and contributors
+#  Permissions are hereby granted under the terms of the Apache 2.0 License:
+#  https://opensource.org/license/apache-2-0.
+
+import datetime
+from unittest import TestCase
+
+import pytest
+
+from s2gos.common.models import StatusCode
+from s2gos.server.services.local.job_index import JobIndex, parse_interval
+from tests.server.services.local.helpers import T0, new_job_info
+
+
+class JobIndexTest(TestCase):
+    def setUp(self):
+        self.index = JobIndex()
+        for i in range(10):
+            self.index.update(
+                new_job_info(
+                    i,
+                    "p_even" if i % 2 == 0 else "p_odd",
+                    StatusCode.accepted,
+                )
+            )
+
+    def test_paging(self):
+        self.assertEqual(10, len(self.index))
+        self.assertEqual(
+            (["job_0", "job_1", "job_2"], True), self.index.query(offset=0, limit=3)
+        )
+        self.assertEqual(
+            (["job_6", "job_7", "job_8"], True), self.index.query(offset=6, limit=3)
+        )
+        self.assertEqual((["job_9"], False), self.index.query(offset=9, limit=3))
+        self.assertEqual(([], False), self.index.query(offset=12, limit=3))
+        self.assertEqual(10, len(self.index.query()[0]))
+
+    def test_filter_by_status(self):
+        for i in (1, 4, 7):
+            job_info = new_job_info(i, "p", StatusCode.running)
+            job_info.started = job_info.created + datetime.timedelta(hours=1)
+            self.index.update(job_info)
+        self.assertEqual(
+            (["job_1", "job_4", "job_7"], False),
+            self.index.query(statuses=[StatusCode.running]),
+        )
+        self.assertEqual(
+            (["job_1", "job_4"], True),
+            self.index.query(limit=2, statuses=[StatusCode.running]),
+        )
+        self.assertEqual(7, len(self.index.query(statuses=[StatusCode.accepted])[0]))
+        self.assertEqual(
+            10,
+            len(
+                self.index.query(statuses=[StatusCode.accepted, StatusCode.running])[0]
+            ),
+        )
+        self.assertEqual(([], False), self.index.query(statuses=[StatusCode.failed]))
+
+    def test_filter_by_process(self):
+        self.assertEqual(
+            (["job_1", "job_3", "job_5", "job_7", "job_9"], False),
+            self.index.query(process_ids=["p_odd"]),
+        )
+        self.assertEqual(
+            (["job_4", "job_6"], True),
+            self.index.query(offset=2, limit=2, process_ids=["p_even"]),
+        )
+        self.assertEqual(([], False), self.index.query(process_ids=["p_none"]))
+
+    def test_filter_by_created(self):
+        start = T0 + datetime.timedelta(minutes=3)
+        end = T0 + datetime.timedelta(minutes=5)
+        self.assertEqual(
+            (["job_3", "job_4", "job_5"], False),
+            self.index.query(created=(start, end)),
+        )
+        self.assertEqual(
+            (["job_3", "job_5"], False),
+            self.index.query(created=(start, end), process_ids=["p_odd"]),
+        )
+        self.assertEqual(
+            (["job_0", "job_1", "job_2", "job_3"], False),
+            self.index.query(created=(None, start)),
+        )
+        self.assertEqual(
+            (["job_8", "job_9"], False),
+            self.index.query(created=(T0 + datetime.timedelta(minutes=8), None)),
+        )
+
+    def test_filter_by_updated(self):
+        job_info = new_job_info(2, "p_even", StatusCode.successful)
+        job_info.finished = T0 + datetime.timedelta(days=1)
+        self.index.update(job_info)
+        self.assertEqual(
+            (["job_2"], False),
+            self.index.query(updated=(T0 + datetime.timedelta(hours=1), None)),
+        )
+
+    def test_remove(self):
+        self.index.remove("job_3")
+        self.index.remove("job_4")
+        self.index.remove("job_10")
+        self.assertEqual(8, len(self.index))
+        self.assertEqual(
+            (["job_2", "job_5"], True), self.index.query(offset=2, limit=2)
+        )
+        self.assertEqual(
+            (["job_5", "job_7"], True),
+            self.index.query(limit=2, process_ids=["p_odd"], offset=1),
+        )
+        start = T0 + datetime.timedelta(minutes=2)
+        end = T0 + datetime.timedelta(minutes=5)
+        self.assertEqual(
+            (["job_2", "job_5"], False), self.index.query(created=(start, end))
+        )
+        for i in range(10):
+            self.index.remove(f"job_{i}")
+        self.assertEqual(0, len(self.index))
+        self.assertEqual(([], False), self.index.query(created=(start, end)))
+
+
+class ParseIntervalTest(TestCase):
+    def test_parse_interval(self):
+        self.assertEqual(
+            (T0, datetime.datetime(2025, 6, 2)),
+            parse_interval("2025-06-01T12:00:00/2025-06-02"),
+        )
+        self.assertEqual((None, T0), parse_interval("../2025-06-01T12:00:00"))
+        self.assertEqual((T0, None), parse_interval("2025-06-01T12:00:00/.."))
+        self.assertEqual((T0, T0), parse_interval("2025-06-01T12:00:00"))
+        with pytest.raises(ValueError):
+            parse_interval("yesterday/today")
+        with pytest.raises(ValueError):
+            parse_interval("..")
@@ -0,0 +1,76 @@
+#  Copyright (c) 2025 by ESA DTE-S2GOS team and contributors
+#  Permissions are hereby granted under the terms of the Apache 2.0 License:
+#  https://opensource.org/license/apache-2-0.
+
+from unittest import TestCase
+
+import pytest
+
+from s2gos.server.defaults import DEFAULT_QUEUE_RETRY_AFTER
+from s2gos.server.services.local.job_queue import DrainRate, JobQueue, QueueFullError
+
+
+class DrainRateTest(TestCase):
+    def test_unknown(self):
+        self.assertIsNone(DrainRate().get())
+
+    def test_rate(self):
+        drain_rate = DrainRate(window=60)
+        for t in range(10):
+            drain_rate.record(100.0 + t)
+        self.assertAlmostEqual(1.0, drain_rate.get(now=110.0))
+        # Decays while no jobs leave the queue
+        self.assertAlmostEqual(0.5, drain_rate.get(now=120.0))
+        # Samples outside the window are dropped
+        self.assertIsNone(drain_rate.get(now=200.0))
+
+
+class JobQueueTest(TestCase):
+    def test_positions(self):
+        queue = JobQueue()
+        self.assertEqual(0, queue.put("job_0", "p").depth)
+        self.assertEqual(1, queue.put("job_1", "p").depth)
+        self.assertEqual(2, queue.put("job_2", "q").depth)
+        self.assertEqual(3, len(queue))
+        self.assertEqual(2, queue.get_size("p"))
+        # No job started yet, so the wait time is unknown
+        self.assertIsNone(queue.get_position("job_2").wait_time)
+
+        queue.remove("job_0")
+        queue.remove("job_0")
+        self.assertIsNone(queue.get_position("job_0"))
+        self.assertEqual(0, queue.get_position("job_1").depth)
+        self.assertEqual(1, queue.get_position("job_2").depth)
+        self.assertIsNotNone(queue.get_position("job_2").wait_time)
+        self.assertEqual(2, len(queue))
+        self.assertEqual(1, queue.get_size("p"))
+
+    def test_max_size(self):
+        queue = JobQueue(max_size=2)
+        queue.put("job_0", "p")
+        queue.put("job_1", "p")
+        with pytest.raises(QueueFullError, match="Too many jobs queued") as e:
+            queue.put("job_2", "p")
+        self.assertEqual(DEFAULT_QUEUE_RETRY_AFTER, e.value.retry_after)
+        self.assertEqual(2, len(queue))
+        # Accepted jobs are always added
+        queue.put("job_2", "p", force=True)
+        self.assertEqual(3, len(queue))
+
+    def test_max_process_size(self):
+        queue = JobQueue()
+        queue.put("job_0", "p", max_process_size=1)
+        with pytest.raises(QueueFullError, match="process 'p'"):
+            queue.put("job_1", "p", max_process_size=1)
+        queue.put("job_1", "q", max_process_size=1)
+
+    def test_retry_after_from_drain_rate(self):
+        queue = JobQueue(max_size=1)
+        for i in range(10):
+            queue.put(f"job_{i}", "p")
+            queue.remove(f"job_{i}")
+        queue.put("job_10", "p")
+        with pytest.raises(QueueFullError) as e:
+            queue.put("job_11", "p")
+        # Jobs left the queue at a high rate
+        self.assertEqual(1, e.value.retry_after)
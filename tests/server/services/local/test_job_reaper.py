@@ -0,0 +1,156 @@
+#  Copyright (c) 2025 by ESA DTE-S2GOS team and contributors
+#  Permissions are hereby granted under the terms of the Apache 2.0 License:
+#  https://opensource.org/license/apache-2-0.
+
+import asyncio
+import json
+import tempfile
+from pathlib import Path
+from typing import Optional
+from unittest import TestCase
+
+from s2gos.common.models import ProcessRequest
+from s2gos.server.exceptions import JSONContentException
+from s2gos.server.services.local import LocalService
+from s2gos.server.services.local.job_reaper import (
+    JobReaper,
+    RetentionPolicy,
+    RetentionUsage,
+)
+from tests.server.services.local.helpers import wait_for
+
+
+class JobReaperTest(TestCase):
+    def setUp(self):
+        self.removed: list[str] = []
+        self.released: list[str] = []
+        self.results: dict[str, bytes] = {}
+
+    def new_reaper(self, **policy_kwargs) -> JobReaper:
+        policy_kwargs = {
+            "max_age": None,
+            "max_jobs": None,
+            "max_result_memory": None,
+            **policy_kwargs,
+        }
+        reaper = JobReaper(
+            RetentionPolicy(**policy_kwargs),
+            remove_job=self.removed.append,
+            release_results=self.released.append,
+            get_results_json=self.get_results_json,
+            interval=0.01,
+        )
+        self.addCleanup(reaper.close)
+        return reaper
+
+    def get_results_json(self, job_id: str) -> Optional[bytes]:
+        return self.results.get(job_id)
+
+    def test_no_limits(self):
+        reaper = self.new_reaper()
+        for i in range(10):
+            reaper.add(f"job_{i}", result_size=100)
+        self.assertEqual([], self.removed)
+        self.assertEqual([], self.released)
+        self.assertEqual(RetentionUsage(10, 10, 1000, 0, 0), reaper.get_usage())
+
+    def test_max_age(self):
+        reaper = self.new_reaper(max_age=0.05)
+        reaper.add("job_0", result_size=100)
+        reaper.add("job_1")
+        self.assertEqual([], self.removed)
+        self.assertTrue(wait_for(lambda: len(self.removed) == 2))
+        self.assertEqual(["job_0", "job_1"], self.removed)
+        self.assertEqual(RetentionUsage(0, 0, 0, 0, 0), reaper.get_usage())
+
+    def test_max_jobs(self):
+        reaper = self.new_reaper(max_jobs=3)
+        for i in range(5):
+            reaper.add(f"job_{i}")
+        self.assertEqual(["job_0", "job_1"], self.removed)
+        self.assertEqual(3, reaper.get_usage().jobs)
+
+    def test_max_jobs_per_user(self):
+        reaper = self.new_reaper(max_jobs_per_user=2)
+        for i in range(4):
+            reaper.add(f"bibi_{i}", user="bibi")
+        reaper.add("pippo_0", user="pippo")
+        reaper.add("anon_0")
+        self.assertEqual(["bibi_0", "bibi_1"], self.removed)
+        self.assertEqual(4, reaper.get_usage().jobs)
+
+    def test_max_result_memory(self):
+        reaper = self.new_reaper(max_result_memory=250)
+        for i in range(4):
+            reaper.add(f"job_{i}", result_size=100)
+        reaper.add("job_4")
+        # Jobs are kept, only their results are released
+        self.assertEqual([], self.removed)
+        self.assertEqual(["job_0", "job_1"], self.released)
+        self.assertEqual(RetentionUsage(5, 2, 200, 0, 0), reaper.get_usage())
+
+    def test_spill_dir(self):
+        with tempfile.TemporaryDirectory() as spill_dir:
+            reaper = self.new_reaper(max_result_memory=100, spill_dir=spill_dir)
+            self.results = {"job_0": b'{"a": 1}', "job_1": b'{"b": 2}'}
+            reaper.add("job_0", result_size=100)
+            reaper.add("job_1", result_size=100)
+            self.assertEqual(["job_0"], self.released)
+            self.assertEqual(RetentionUsage(2, 1, 100, 1, 8), reaper.get_usage())
+            self.assertEqual(b'{"a": 1}', reaper.load_spilled_results("job_0"))
+            self.assertIsNone(reaper.load_spilled_results("job_1"))
+
+            reaper.discard("job_0")
+            self.assertIsNone(reaper.load_spilled_results("job_0"))
+            self.assertEqual([], list(Path(spill_dir).iterdir()))
+            self.assertEqual(RetentionUsage(1, 1, 100, 0, 0), reaper.get_usage())
+
+    def test_removed_jobs_are_logged(self):
+        reaper = self.new_reaper(max_jobs=1)
+        reaper.add("job_0")
+        with self.assertLogs("s2gos", level="INFO") as cm:
+            reaper.add("job_1")
+        self.assertIn("Removed 1 finished job(s)", cm.output[0])
+
+
+def add(a: int, b: int) -> int:
+    return a + b
+
+
+class LocalServiceRetentionTest(TestCase):
+    def setUp(self):
+        self.spill_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.spill_dir.cleanup)
+        self.service = LocalService(
+            title="OGC API - Processes - Test Service",
+            retention=RetentionPolicy(
+                max_jobs=3, max_result_memory=1, spill_dir=self.spill_dir.name
+            ),
+        )
+        self.service.register_process(add, id="add")
+
+    def execute(self, a: int) -> str:
+        response = asyncio.run(
+            self.service.execute_process("add", ProcessRequest(inputs={"a": a, "b": 1}))
+        )
+        job_id = json.loads(response.body)["jobID"]
+        # Finished jobs are added to the reaper after their status is stored
+        self.assertTrue(wait_for(lambda: job_id in self.service.job_reaper._jobs))
+        return job_id
+
+    def test_finished_jobs_are_removed(self):
+        job_ids = [self.execute(i) for i in range(5)]
+        self.assertTrue(wait_for(lambda: len(self.service.jobs) == 3))
+        self.assertEqual(job_ids[2:], list(self.service.jobs))
+        with self.assertRaises(JSONContentException) as cm:
+            asyncio.run(self.service.get_job(job_ids[0]))
+        self.assertEqual(404, cm.exception.status_code)
+
+    def test_evicted_results_are_spilled(self):
+        job_id = self.execute(41)
+        reaper = self.service.job_reaper
+        self.assertTrue(wait_for(lambda: reaper.get_usage().spilled_results == 1))
+        self.assertTrue(self.service.jobs[job_id].results_released)
+        self.assertEqual(0, reaper.get_usage().results)
+        results = asyncio.run(self.service.get_job_results(job_id))
+        self.assertEqual([42], [v.root.root for v in results.root.values()])
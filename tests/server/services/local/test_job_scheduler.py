@@ -0,0 +1,252 @@
+#  Copyright (c) 2025 by ESA DTE-S2GOS team and contributors
+#  Permissions are hereby granted under the terms of the Apache 2.0 License:
+#  https://opensource.org/license/apache-2-0.
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from unittest import TestCase
+
+import pytest
+
+from s2gos.server.services.local.job_scheduler import JobScheduler
+from s2gos.server.services.local.resources import Resources
+from tests.server.services.local.helpers import wait_for
+
+GB = 1000**3
+
+
+class JobSchedulerTest(TestCase):
+    def setUp(self):
+        self.executor = ThreadPoolExecutor(max_workers=1)
+        self.scheduler = JobScheduler(self.executor)
+        self.release_event = threading.Event()
+        self.started: list[str] = []
+
+    def tearDown(self):
+        self.release_event.set()
+        self.executor.shutdown(wait=True)
+
+    def block(self):
+        """Occupy the only worker until released."""
+        return self.scheduler.submit(lambda: self.release_event.wait(timeout=5))
+
+    def submit(self, name: str, **kwargs):
+        return self.scheduler.submit(lambda: self.started.append(name), **kwargs)
+
+    def test_max_concurrency(self):
+        self.assertEqual(1, self.scheduler.max_concurrency)
+        self.assertEqual(
+            2, JobScheduler(self.executor, max_concurrency=2).max_concurrency
+        )
+
+    def test_result_and_exception(self):
+        self.assertEqual(42, self.scheduler.submit(lambda: 42).result(timeout=5))
+        with pytest.raises(ZeroDivisionError):
+            self.scheduler.submit(lambda: 1 / 0).result(timeout=5)
+        self.assertEqual(0, self.scheduler.num_running)
+
+    def test_jobs_wait_in_scheduler(self):
+        self.block()
+        self.submit("a")
+        self.submit("b")
+        self.assertEqual(1, self.scheduler.num_running)
+        self.assertEqual(2, self.scheduler.num_pending)
+        self.release_event.set()
+        self.submit("c").result(timeout=5)
+        self.assertEqual(["a", "b", "c"], self.started)
+        self.assertEqual(0, self.scheduler.num_pending)
+
+    def test_priority(self):
+        self.block()
+        self.submit("low", priority=-1)
+        self.submit("normal")
+        last = self.submit("high", priority=10)
+        self.release_event.set()
+        last.result(timeout=5)
+        self.executor.shutdown(wait=True)
+        self.assertEqual(["high", "normal", "low"], self.started)
+
+    def test_fair_share(self):
+        self.block()
+        futures = [self.submit(f"a{i}", user="a") for i in range(5)]
+        futures += [self.submit(f"b{i}", user="b") for i in range(2)]
+        self.release_event.set()
+        for future in futures:
+            future.result(timeout=5)
+        # User b is served in turn, although user a submitted first
+        self.assertEqual(["a0", "b0", "a1", "b1", "a2", "a3", "a4"], self.started)
+
+    def test_cancelled_before_started(self):
+        self.block()
+        future = self.submit("a")
+        self.assertTrue(future.cancel())
+        self.submit("b")
+        self.release_event.set()
+        self.submit("c").result(timeout=5)
+        self.assertEqual(["b", "c"], self.started)
+
+
+class JobSchedulerPolicyTest(TestCase):
+    def setUp(self):
+        self.release_event = threading.Event()
+        self.started: list[str] = []
+        self.executor = ThreadPoolExecutor(max_workers=1)
+
+    def tearDown(self):
+        self.release_event.set()
+        self.executor.shutdown(wait=True)
+
+    def run_jobs(self, scheduler: JobScheduler, runtimes: dict[str, float]):
+        scheduler.submit(lambda: self.release_event.wait(timeout=5))
+        futures = [
+            scheduler.submit(lambda n=name: self.started.append(n), runtime=runtime)
+            for name, runtime in runtimes.items()
+        ]
+        self.release_event.set()
+        for future in futures:
+            future.result(timeout=5)
+
+    def test_sjf(self):
+        self.run_jobs(
+            JobScheduler(self.executor, policy="sjf"),
+            {"long": 100.0, "short": 1.0, "medium": 10.0},
+        )
+        self.assertEqual(["short", "medium", "long"], self.started)
+
+    def test_edf(self):
+        self.run_jobs(
+            JobScheduler(self.executor, policy="edf"),
+            {"long": 100.0, "short": 1.0, "medium": 10.0},
+        )
+        self.assertEqual(["short", "medium", "long"], self.started)
+
+    def test_invalid_policy(self):
+        with pytest.raises(ValueError, match="unknown scheduling policy"):
+            # noinspection PyTypeChecker
+            JobScheduler(self.executor, policy="lifo")
+
+
+class JobSchedulerProcessConcurrencyTest(TestCase):
+    def test_process_concurrency(self):
+        executor = ThreadPoolExecutor(max_workers=4)
+        scheduler = JobScheduler(executor)
+        scheduler.set_process_concurrency("p", 1)
+        lock = threading.Lock()
+        running = {"p": 0, "q": 0}
+        max_running = {"p": 0, "q": 0}
+
+        def run(process_id: str):
+            with lock:
+                running[process_id] += 1
+                max_running[process_id] = max(
+                    max_running[process_id], running[process_id]
+                )
+            time.sleep(0.01)
+            with lock:
+                running[process_id] -= 1
+
+        futures = [
+            scheduler.submit(lambda p=process_id: run(p), process_id=process_id)
+            for process_id in ["p", "q"] * 4
+        ]
+        for future in futures:
+            future.result(timeout=5)
+        executor.shutdown()
+        self.assertEqual(1, max_running["p"])
+        self.assertGreater(max_running["q"], 1)
+
+
+class JobSchedulerResourcesTest(TestCase):
+    def setUp(self):
+        self.executor = ThreadPoolExecutor(max_workers=8)
+        self.release_events: dict[str, threading.Event] = {}
+        self.started: list[str] = []
+
+    def tearDown(self):
+        for event in self.release_events.values():
+            event.set()
+        self.executor.shutdown(wait=True)
+
+    def submit(self, scheduler: JobScheduler, name: str, resources: Resources):
+        event = self.release_events[name] = threading.Event()
+
+        def run():
+            self.started.append(name)
+            event.wait(timeout=5)
+
+        return scheduler.submit(run, resources=resources)
+
+    def test_memory_heavy_jobs_are_not_co_scheduled(self):
+        scheduler = JobScheduler(self.executor, capacity=Resources(8, 16 * GB))
+        lock = threading.Lock()
+        allocated = [0]
+        max_allocated = [0]
+
+        def run():
+            with lock:
+                allocated[0] += 10 * GB
+                max_allocated[0] = max(max_allocated[0], allocated[0])
+            time.sleep(0.01)
+            with lock:
+                allocated[0] -= 10 * GB
+
+        futures = [
+            scheduler.submit(run, resources=Resources(1, 10 * GB)) for _ in range(4)
+        ]
+        for future in futures:
+            future.result(timeout=5)
+        self.assertEqual(10 * GB, max_allocated[0])
+        self.assertEqual(Resources(0, 0), scheduler.allocated)
+
+    def test_small_jobs_fill_gaps(self):
+        scheduler = JobScheduler(self.executor, capacity=Resources(8, 16 * GB))
+        self.submit(scheduler, "big-1", Resources(6, 8 * GB))
+        big_2 = self.submit(scheduler, "big-2", Resources(6, 8 * GB))
+        small_1 = self.submit(scheduler, "small-1", Resources(1, GB))
+        small_2 = self.submit(scheduler, "small-2", Resources(1, GB))
+        self.release_events["small-1"].set()
+        self.release_events["small-2"].set()
+        small_1.result(timeout=5)
+        small_2.result(timeout=5)
+        self.assertEqual({"big-1", "small-1", "small-2"}, set(self.started))
+        self.assertFalse(big_2.done())
+        self.assertEqual(1, scheduler.num_pending)
+        self.assertEqual(Resources(6, 8 * GB), scheduler.allocated)
+        self.release_events["big-1"].set()
+        self.release_events["big-2"].set()
+        big_2.result(timeout=5)
+        self.assertEqual(Resources(0, 0), scheduler.allocated)
+
+    def test_reservation(self):
+        scheduler = JobScheduler(
+            self.executor, capacity=Resources(4, 0), reservation_timeout=0
+        )
+        self.submit(scheduler, "medium", Resources(2, 0))
+        big = self.submit(scheduler, "big", Resources(4, 0))
+        small = self.submit(scheduler, "small", Resources(1, 0))
+        # The small job would fit, but the big one waits too long already
+        self.assertEqual(1, scheduler.num_running)
+        self.assertEqual(2, scheduler.num_pending)
+        self.release_events["medium"].set()
+        self.assertTrue(wait_for(lambda: "big" in self.started))
+        self.assertEqual(1, scheduler.num_pending)
+        self.release_events["big"].set()
+        self.release_events["small"].set()
+        big.result(timeout=5)
+        small.result(timeout=5)
+        self.assertEqual(["medium", "big", "small"], self.started)
+
+    def test_oversized_jobs_run_alone(self):
+        scheduler = JobScheduler(self.executor, capacity=Resources(4, 16 * GB))
+        future = scheduler.submit(lambda: 42, resources=Resources(16, 64 * GB))
+        self.assertEqual(42, future.result(timeout=5))
+
+    def test_no_capacity(self):
+        scheduler = JobScheduler(self.executor)
+        futures = [
+            scheduler.submit(lambda: 42, resources=Resources(100, 100 * GB))
+            for _ in range(3)
+        ]
+        for future in futures:
+            self.assertEqual(42, future.result(timeout=5))
@@ -0,0 +1,496 @@
+#  Copyright (c) 2025 by ESA DTE-S2GOS team and contributors
+#  Permissions are hereby granted under the terms of the Apache 2.0 License:
+#  https://opensource.org/license/apache-2-0.
+
+import asyncio
+import datetime
+import json
+import tempfile
+import threading
+import time
+from pathlib import Path
+from unittest import TestCase
+
+import pytest
+
+from s2gos.common.models import (
+    JobResults,
+    ProcessRequest,
+    StatusCode,
+    Subscriber,
+)
+from s2gos.server.exceptions import JSONContentException
+from s2gos.server.services.local import LocalService, get_job_context
+from s2gos.server.services.local.job_store import (
+    JobRequest,
+    JobStore,
+    MemoryJobStore,
+    create_job_store,
+)
+from s2gos.server.services.local.sqlite_job_store import SQLiteJobStore
+from tests.server.services.local.helpers import T0, new_job_info, wait_for
+
+
+class JobStoreTestMixin:
+    def new_store(self) -> JobStore:
+        raise NotImplementedError
+
+    def test_new_job_id(self):
+        store = self.new_store()
+        job_ids = {store.new_job_id() for _ in range(10)}
+        self.assertEqual(10, len(job_ids))
+
+    def test_put_and_get(self):
+        store = self.new_store()
+        self.assertIsNone(store.get("job_0"))
+        store.put(new_job_info(0), 1)
+        record = store.get("job_0")
+        self.assertEqual("job_0", record.job_info.jobID)
+        self.assertEqual(StatusCode.accepted, record.job_info.status)
+        self.assertEqual(1, record.version)
+
+        store.put(new_job_info(0, status=StatusCode.running), 2)
+        self.assertEqual(StatusCode.running, store.get("job_0").job_info.status)
+        # Older versions are ignored
+        store.put(new_job_info(0, status=StatusCode.accepted), 1)
+        self.assertEqual(StatusCode.running, store.get("job_0").job_info.status)
+        self.assertEqual(2, store.get("job_0").version)
+
+        store.remove("job_0")
+        self.assertIsNone(store.get("job_0"))
+
+    def test_query(self):
+        store = self.new_store()
+        for i in range(10):
+            store.put(
+                new_job_info(
+                    i,
+                    "p_even" if i % 2 == 0 else "p_odd",
+                    StatusCode.successful if i < 5 else StatusCode.running,
+                ),
+                1,
+            )
+
+        def query(**kwargs):
+            job_infos, has_more = store.query(**kwargs)
+            return [job_info.jobID for job_info in job_infos], has_more
+
+        self.assertEqual((["job_0", "job_1", "job_2"], True), query(limit=3))
+        self.assertEqual((["job_9"], False), query(offset=9, limit=3))
+        self.assertEqual(
+            (["job_5", "job_7", "job_9"], False),
+            query(statuses=[StatusCode.running], process_ids=["p_odd"]),
+        )
+        self.assertEqual(
+            (["job_2", "job_3"], False),
+            query(
+                created=(
+                    T0 + datetime.timedelta(minutes=2),
+                    T0 + datetime.timedelta(minutes=3),
+                )
+            ),
+        )
+        self.assertEqual(([], False), query(statuses=[]))
+
+    def test_submit(self):
+        store = self.new_store()
+        self.assertTrue(store.is_executor)
+        self.assertTrue(store.submit(JobRequest(new_job_info(0), {"x": 1})))
+        record = store.get("job_0")
+        self.assertEqual(StatusCode.accepted, record.job_info.status)
+        self.assertEqual(0, record.version)
+
+    def test_results(self):
+        store = self.new_store()
+        store.put(new_job_info(0, status=StatusCode.successful), 1)
+        self.assertIsNone(store.get_results("job_0"))
+        store.put_results("job_0", JobResults({"result": 42}))
+        self.assertEqual(
+            {"result": 42}, store.get_results("job_0").model_dump(mode="json")
+        )
+
+    def test_idempotency_keys(self):
+        store = self.new_store()
+        self.assertEqual(
+            ("job_0", "h0"), store.claim_idempotency_key("k", "job_0", "h0")
+        )
+        self.assertEqual(
+            ("job_0", "h0"), store.claim_idempotency_key("k", "job_1", "h1")
+        )
+        # Only released for the job it is associated with
+        store.release_idempotency_key("k", "job_1")
+        self.assertEqual(
+            ("job_0", "h0"), store.claim_idempotency_key("k", "job_1", "h1")
+        )
+        store.release_idempotency_key("k", "job_0")
+        self.assertEqual(
+            ("job_1", "h1"), store.claim_idempotency_key("k", "job_1", "h1")
+        )
+        # Removed with the job
+        store.put(new_job_info(1), 1)
+        store.remove("job_1")
+        self.assertEqual(
+            ("job_2", "h2"), store.claim_idempotency_key("k", "job_2", "h2")
+        )
+
+    def test_idempotency_keys_of_same_job(self):
+        store = self.new_store()
+        # Requests with other keys may attach to an active job
+        store.claim_idempotency_key("k1", "job_0", "h0")
+        store.claim_idempotency_key("k2", "job_0", "h0")
+        store.put(new_job_info(0), 1)
+        store.remove("job_0")
+        for key in ("k1", "k2"):
+            self.assertEqual(
+                ("job_1", "h1"), store.claim_idempotency_key(key, "job_1", "h1")
+            )
+
+
+class MemoryJobStoreTest(JobStoreTestMixin, TestCase):
+    def new_store(self) -> JobStore:
+        return MemoryJobStore()
+
+    def test_index_is_updated_in_order_of_versions(self):
+        store = self.new_store()
+        index_update = store._index.update
+        entered = threading.Event()
+
+        def slow_index_update(job_info):
+            if job_info.status == StatusCode.running:
+                entered.set()
+                time.sleep(0.1)
+            index_update(job_info)
+
+        store._index.update = slow_index_update
+        thread = threading.Thread(
+            target=store.put, args=(new_job_info(0, status=StatusCode.running), 1)
+        )
+        thread.start()
+        self.assertTrue(entered.wait(timeout=5))
+        store.put(new_job_info(0, status=StatusCode.successful), 2)
+        thread.join()
+        self.assertEqual(StatusCode.successful, store.get("job_0").job_info.status)
+        self.assertEqual([], store.query(statuses=[StatusCode.running])[0])
+
+
+class SQLiteJobStoreTest(JobStoreTestMixin, TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.path = Path(self.temp_dir.name) / "jobs.db"
+        self.stores: list[SQLiteJobStore] = []
+
+    def tearDown(self):
+        for store in self.stores:
+            store.close()
+        self.temp_dir.cleanup()
+
+    def new_store(self, **kwargs) -> SQLiteJobStore:
+        store = SQLiteJobStore(self.path, **kwargs)
+        self.stores.append(store)
+        return store
+
+    def test_wal_mode(self):
+        store = self.new_store()
+        # noinspection PyProtectedMember
+        mode = store._connection.execute("PRAGMA journal_mode").fetchone()[0]
+        self.assertEqual("wal", mode)
+
+    def test_shared_by_workers(self):
+        store_1 = self.new_store()
+        store_2 = self.new_store()
+        self.assertEqual(store_1.uid, store_2.uid)
+        self.assertNotEqual(store_1.new_job_id(), store_2.new_job_id())
+        store_1.put(new_job_info(0), 1)
+        self.assertEqual("job_0", store_2.get("job_0").job_info.jobID)
+
+    def test_progress_is_batched(self):
+        store = self.new_store(flush_interval=60)
+        store.put(new_job_info(0, status=StatusCode.running), 1)
+        for version in range(2, 10):
+            job_info = new_job_info(0, status=StatusCode.running)
+            job_info.progress = 10 * version
+            store.put_progress(job_info, version)
+        self.assertEqual(1, store.get("job_0").version)
+        store.flush()
+        self.assertEqual(9, store.get("job_0").version)
+        self.assertEqual(90, store.get("job_0").job_info.progress)
+
+    def test_final_status_supersedes_progress(self):
+        store = self.new_store(flush_interval=60)
+        store.put(new_job_info(0, status=StatusCode.running), 1)
+        store.put_progress(new_job_info(0, status=StatusCode.running), 2)
+        store.put(new_job_info(0, status=StatusCode.successful), 3)
+        store.flush()
+        self.assertEqual(StatusCode.successful, store.get("job_0").job_info.status)
+
+    def test_progress_does_not_resurrect_removed_jobs(self):
+        store = self.new_store(flush_interval=60)
+        store.put(new_job_info(0, status=StatusCode.running), 1)
+        store.put_progress(new_job_info(0, status=StatusCode.running), 2)
+        # noinspection PyProtectedMember
+        pending = dict(store._pending)
+        store.remove("job_0")
+        # noinspection PyProtectedMember
+        store._pending = pending
+        store.flush()
+        self.assertIsNone(store.get("job_0"))
+
+    def test_recover_orphaned_jobs(self):
+        store_1 = self.new_store(heartbeat_timeout=0.1)
+        store_1.put(new_job_info(0, status=StatusCode.running), 1)
+        store_1.put(new_job_info(1, status=StatusCode.successful), 1)
+        # Simulate a crash of the first worker
+        # noinspection PyProtectedMember
+        store_1._closed.set()
+        time.sleep(0.2)
+
+        store_2 = self.new_store(heartbeat_timeout=0.1)
+        record = store_2.get("job_0")
+        self.assertEqual(StatusCode.failed, record.job_info.status)
+        self.assertIsNotNone(record.job_info.finished)
+        self.assertEqual(2, record.version)
+        self.assertEqual(StatusCode.successful, store_2.get("job_1").job_info.status)
+
+    def test_live_workers_are_not_recovered(self):
+        store_1 = self.new_store()
+        store_1.put(new_job_info(0, status=StatusCode.running), 1)
+        store_2 = self.new_store()
+        self.assertEqual(0, store_2.recover())
+        self.assertEqual(StatusCode.running, store_2.get("job_0").job_info.status)
+
+    def test_close_fails_active_jobs(self):
+        store_1 = self.new_store()
+        store_1.put(new_job_info(0, status=StatusCode.running), 1)
+        store_1.close()
+        store_2 = self.new_store()
+        self.assertEqual(StatusCode.failed, store_2.get("job_0").job_info.status)
+
+    def test_cancellation(self):
+        store_1 = self.new_store(flush_interval=0.01)
+        store_2 = self.new_store(flush_interval=0.01)
+        cancelled = []
+        store_1.set_cancellation_handler(cancelled.append)
+        store_1.put(new_job_info(0, status=StatusCode.running), 1)
+        store_2.request_cancellation("job_0")
+        for _ in range(100):
+            if cancelled:
+                break
+            time.sleep(0.01)
+        self.assertIn("job_0", cancelled)
+
+    def test_executor_lease(self):
+        store_1 = self.new_store()
+        store_2 = self.new_store()
+        self.assertTrue(store_1.is_executor)
+        self.assertFalse(store_2.is_executor)
+        store_1.close()
+        self.assertFalse(store_1.is_executor)
+        # noinspection PyProtectedMember
+        store_2._acquire_executor_lease()
+        self.assertTrue(store_2.is_executor)
+
+    def test_executor_lease_of_terminated_executor(self):
+        store_1 = self.new_store(heartbeat_timeout=0.1)
+        # Simulate a crash of the executor
+        # noinspection PyProtectedMember
+        store_1._closed.set()
+        time.sleep(0.2)
+        store_2 = self.new_store(heartbeat_timeout=0.1)
+        self.assertTrue(store_2.is_executor)
+
+    def test_submitted_jobs_are_claimed_by_executor(self):
+        store_1 = self.new_store(flush_interval=0.01)
+        store_2 = self.new_store(flush_interval=0.01)
+        requests: list[JobRequest] = []
+        store_1.set_submission_handler(requests.append)
+        subscriber = Subscriber(successUri="http://localhost:9090/success")
+        self.assertFalse(
+            store_2.submit(JobRequest(new_job_info(0), {"x": 1}, subscriber, 5, "bibo"))
+        )
+        self.assertTrue(wait_for(lambda: len(requests) == 1))
+        request = requests[0]
+        self.assertEqual("job_0", request.job_info.jobID)
+        self.assertEqual(T0, request.job_info.created)
+        self.assertEqual({"x": 1}, request.function_kwargs)
+        self.assertEqual(subscriber, request.subscriber)
+        self.assertEqual(5, request.priority)
+        self.assertEqual("bibo", request.user_name)
+        # Claimed jobs are not claimed again
+        time.sleep(0.05)
+        self.assertEqual(1, len(requests))
+
+    def test_submitted_jobs_cancelled_before_claimed(self):
+        store_1 = self.new_store(flush_interval=0.01)
+        store_2 = self.new_store(flush_interval=0.01)
+        store_2.submit(JobRequest(new_job_info(0), {}))
+        store_2.request_cancellation("job_0")
+        requests: list[JobRequest] = []
+        store_1.set_submission_handler(requests.append)
+        self.assertTrue(
+            wait_for(
+                lambda: store_2.get("job_0").job_info.status == StatusCode.dismissed
+            )
+        )
+        self.assertEqual([], requests)
+
+    def test_recover_submitted_jobs(self):
+        store_1 = self.new_store(heartbeat_timeout=0.1)
+        self.assertTrue(store_1.submit(JobRequest(new_job_info(0), {"x": 1})))
+        # Simulate a crash of the executor before the job started
+        # noinspection PyProtectedMember
+        store_1._closed.set()
+        time.sleep(0.2)
+
+        store_2 = self.new_store(heartbeat_timeout=0.1, flush_interval=0.01)
+        self.assertTrue(store_2.is_executor)
+        requests: list[JobRequest] = []
+        store_2.set_submission_handler(requests.append)
+        self.assertTrue(wait_for(lambda: len(requests) == 1))
+        self.assertEqual({"x": 1}, requests[0].function_kwargs)
+        self.assertEqual(StatusCode.accepted, store_2.get("job_0").job_info.status)
+
+
+class CreateJobStoreTest(TestCase):
+    def test_create_job_store(self):
+        self.assertIsInstance(create_job_store(), MemoryJobStore)
+        self.assertIsInstance(create_job_store("memory"), MemoryJobStore)
+        with tempfile.TemporaryDirectory() as temp_dir:
+            store = create_job_store(f"sqlite:///{temp_dir}/jobs.db")
+            self.assertIsInstance(store, SQLiteJobStore)
+            store.close()
+        with pytest.raises(ValueError, match="unsupported job store URL"):
+            create_job_store("redis://localhost")
+
+
+def fn_with_progress(steps: int, delay: float = 0.0) -> int:
+    ctx = get_job_context()
+    for i in range(steps):
+        time.sleep(delay)
+        ctx.report_progress(progress=int(100 * (i + 1) / steps))
+    return 2 * steps
+
+
+class LocalServiceSQLiteJobStoreTest(TestCase):
+    """Two services sharing the same job table,
+    like the worker processes of a server.
+    """
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        path = Path(self.temp_dir.name) / "jobs.db"
+        self.services = [
+            LocalService(
+                title="Test Service",
+                job_store=SQLiteJobStore(path, flush_interval=0.01),
+            )
+            for _ in range(2)
+        ]
+        for service in self.services:
+            service.register_process(fn_with_progress, id="progress")
+
+    def tearDown(self):
+        for service in self.services:
+            service.job_store.close()
+        self.temp_dir.cleanup()
+
+    def execute(self, service: LocalService, **inputs) -> str:
+        response = asyncio.run(
+            service.execute_process("progress", ProcessRequest(inputs=inputs))
+        )
+        return json.loads(response.body)["jobID"]
+
+    def test_jobs_are_shared(self):
+        service_1, service_2 = self.services
+        job_id = self.execute(service_1, steps=3)
+        service_1.jobs[job_id].future.result(timeout=5)
+
+        response = asyncio.run(service_2.get_job(job_id))
+        self.assertEqual("successful", json.loads(response.body)["status"])
+        results = asyncio.run(service_2.get_job_results(job_id))
+        self.assertEqual({"result": 6}, results.model_dump(mode="json"))
+        job_list = asyncio.run(service_2.get_jobs())
+        self.assertEqual([job_id], [job.jobID for job in job_list.jobs])
+
+        asyncio.run(service_2.dismiss_job(job_id))
+        with pytest.raises(JSONContentException):
+            asyncio.run(service_1.get_job(job_id))
+
+    def test_jobs_are_executed_by_executor(self):
+        service_1, service_2 = self.services
+        job_id = self.execute(service_2, steps=3)
+        self.assertNotIn(job_id, service_2.jobs)
+        self.assertTrue(
+            wait_for(
+                lambda: job_id in service_1.jobs
+                and service_1.jobs[job_id].future is not None
+            )
+        )
+        service_1.jobs[job_id].future.result(timeout=5)
+        response = asyncio.run(service_2.get_job(job_id))
+        self.assertEqual("successful", json.loads(response.body)["status"])
+        results = asyncio.run(service_2.get_job_results(job_id))
+        self.assertEqual({"result": 6}, results.model_dump(mode="json"))
+
+    def test_idempotency_keys_are_shared(self):
+        service_1, service_2 = self.services
+        responses = [
+            asyncio.run(
+                service.execute_process(
+                    "progress",
+                    ProcessRequest(inputs={"steps": 3}),
+                    idempotency_key="k1",
+                )
+            )
+            for service in self.services
+        ]
+        job_ids = [json.loads(response.body)["jobID"] for response in responses]
+        self.assertEqual(job_ids[0], job_ids[1])
+        self.assertEqual("true", responses[1].headers["Idempotent-Replayed"])
+        # The store must not be closed while the job writes to it
+        service_1.jobs[job_ids[0]].future.result(timeout=5)
+
+    def test_etags_are_shared(self):
+        service_1, service_2 = self.services
+        job_id = self.execute(service_1, steps=3)
+        service_1.jobs[job_id].future.result(timeout=5)
+        response_1 = asyncio.run(service_1.get_job(job_id))
+        response_2 = asyncio.run(service_2.get_job(job_id))
+        self.assertEqual(response_1.headers["ETag"], response_2.headers["ETag"])
+
+    def test_job_events_of_other_worker(self):
+        service_1, service_2 = self.services
+
+        async def collect(job_id: str, **params) -> list[dict]:
+            # Streams of given jobs end once they are finished
+            response = await service_2.get_job_events(**params)
+            events = []
+            async for chunk in response.body_iterator:
+                for line in chunk.splitlines():
+                    if line.startswith("data: "):
+                        event = json.loads(line[len("data: ") :])
+                        if event["jobID"] == job_id:
+                            events.append(event)
+                if "process_id" in params and events[-1:]:
+                    if events[-1]["status"] == "successful":
+                        break
+            return events
+
+        job_id = self.execute(service_2, steps=3, delay=0.05)
+        events = asyncio.run(
+            asyncio.wait_for(collect(job_id, job_ids=job_id), timeout=5)
+        )
+        self.assertEqual("successful", events[-1]["status"])
+
+        job_id = self.execute(service_2, steps=3, delay=0.05)
+        events = asyncio.run(
+            asyncio.wait_for(collect(job_id, process_id="progress"), timeout=5)
+        )
+        self.assertEqual("successful", events[-1]["status"])
+
+    def test_cancel_job_of_other_worker(self):
+        service_1, service_2 = self.services
+        job_id = self.execute(service_1, steps=1000, delay=0.01)
+        asyncio.run(service_2.dismiss_job(job_id))
+        service_1.jobs[job_id].future.result(timeout=5)
+        response = asyncio.run(service_2.get_job(job_id))
+        self.assertEqual("dismissed", json.loads(response.body)["status"])
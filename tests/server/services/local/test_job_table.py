@@ -0,0 +1,151 @@
+#  Copyright (c) 2025 by ESA DTE-S2GOS team and contributors
+#  Permissions are hereby granted under the terms of the Apache 2.0 License:
+#  https://opensource.org/license/apache-2-0.
+
+import asyncio
+import json
+import random
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from unittest import TestCase
+
+from s2gos.common.models import JobInfo, ProcessRequest, StatusCode
+from s2gos.server.exceptions import JSONContentException
+from s2gos.server.services.local import Job, LocalService, get_job_context
+from s2gos.server.services.local.job_table import JobTable
+
+
+def new_job(job_id: str) -> Job:
+    return Job(process_id="p", job_id=job_id, function=lambda: 0, function_kwargs={})
+
+
+class JobTableTest(TestCase):
+    def test_put_get_pop(self):
+        table = JobTable()
+        job = new_job("j1")
+        table.put(job)
+        self.assertEqual(1, len(table))
+        self.assertIn("j1", table)
+        self.assertIs(job, table["j1"])
+        self.assertIs(job, table.get("j1"))
+        self.assertIsNone(table.get("j2"))
+        self.assertEqual(["j1"], list(table))
+        self.assertEqual([job], list(table.values()))
+        self.assertIs(job, table.pop("j1"))
+        self.assertIsNone(table.pop("j1"))
+        self.assertEqual(0, len(table))
+
+    def test_iteration_while_changed(self):
+        table = JobTable()
+        for i in range(10):
+            table.put(new_job(f"j{i}"))
+        job_ids = []
+        for job_id, job in table.items():
+            # Readers iterate the table at the time they started
+            table.pop(job_id)
+            table.put(new_job(f"k{job_id}"))
+            job_ids.append(job.status_info.jobID)
+        self.assertEqual([f"j{i}" for i in range(10)], job_ids)
+        self.assertEqual(10, len(table))
+
+
+class JobSnapshotTest(TestCase):
+    def test_snapshots(self):
+        job = Job(process_id="p", job_id="j1", function=lambda: 42, function_kwargs={})
+        snapshot = job.snapshot
+        self.assertEqual(0, snapshot.version)
+        self.assertEqual(StatusCode.accepted, snapshot.status_info.status)
+        self.assertIsNot(job.status_info, snapshot.status_info)
+        job.run()
+        self.assertEqual(StatusCode.successful, job.snapshot.status_info.status)
+        self.assertEqual(job.version, job.snapshot.version)
+        # Published snapshots are never changed
+        self.assertEqual(StatusCode.accepted, snapshot.status_info.status)
+
+
+def count(steps: int) -> int:
+    ctx = get_job_context()
+    for i in range(steps):
+        ctx.report_progress(progress=100 * i // steps, message=f"step {i}")
+    return steps
+
+
+class LocalServiceStressTest(TestCase):
+    def assert_consistent(self, job_info: JobInfo):
+        """Assert that a status has not been torn by concurrent changes."""
+        status = job_info.status
+        if status == StatusCode.accepted:
+            self.assertIsNone(job_info.started)
+            self.assertIsNone(job_info.finished)
+        elif status == StatusCode.running:
+            self.assertIsNotNone(job_info.started)
+            self.assertIsNone(job_info.finished)
+        else:
+            self.assertIsNotNone(job_info.started)
+            self.assertIsNotNone(job_info.finished)
+            self.assertIsNone(job_info.eta)
+
+    def test_concurrent_submit_poll_dismiss(self):
+        service = LocalService(
+            title="OGC API - Processes - Test Service",
+            executor=ThreadPoolExecutor(max_workers=4),
+            progress_interval=0,
+        )
+        service.register_process(count, id="count")
+        job_ids: list[str] = []
+        errors: list[BaseException] = []
+        stop = threading.Event()
+
+        def guard(function):
+            def run():
+                try:
+                    while not stop.is_set():
+                        function()
+                except BaseException as e:
+                    errors.append(e)
+                    stop.set()
+
+            return run
+
+        def submit():
+            response = asyncio.run(
+                service.execute_process(
+                    "count", ProcessRequest(inputs={"steps": random.randint(1, 200)})
+                )
+            )
+            job_ids.append(json.loads(response.body)["jobID"])
+
+        def poll():
+            job_list = asyncio.run(service.get_jobs(limit=1000))
+            for job_info in job_list.jobs:
+                self.assert_consistent(job_info)
+            if job_ids:
+                try:
+                    response = asyncio.run(service.get_job(random.choice(job_ids)))
+                    self.assert_consistent(JobInfo(**json.loads(response.body)))
+                except JSONContentException as e:
+                    # Dismissed meanwhile
+                    self.assertEqual(404, e.status_code)
+
+        def dismiss():
+            if job_ids:
+                try:
+                    asyncio.run(service.dismiss_job(random.choice(job_ids)))
+                except JSONContentException as e:
+                    self.assertEqual(404, e.status_code)
+
+        threads = [
+            threading.Thread(target=guard(function))
+            for function in (submit, submit, poll, poll, poll, dismiss)
+        ]
+        for thread in threads:
+            thread.start()
+        stop.wait(timeout=2)
+        stop.set()
+        for thread in threads:
+            thread.join(timeout=10)
+        service.executor.shutdown(wait=True)
+        self.assertEqual([], errors)
+        self.assertGreater(len(job_ids), 10)
+        for job in service.jobs.values():
+            self.assert_consistent(job.snapshot.status_info)
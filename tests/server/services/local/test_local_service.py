@@ -2,10 +2,31 @@
 #  Permissions are hereby granted under the terms of the Apache 2.0 License:
 #  https://opensource.org/license/apache-2-0.
 
+import asyncio
+import json
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from unittest import TestCase
 
-from s2gos.common.models import ProcessDescription
-from s2gos.server.services.local import LocalService, ProcessRegistry
+import pytest
+from fastapi.responses import JSONResponse
+from fastapi.testclient import TestClient
+
+import s2gos.server.routes  # noqa: F401
+from s2gos.common.models import (
+    JobIdList,
+    ProcessDescription,
+    ProcessRequest,
+    StatusCode,
+)
+from s2gos.server.app import app
+from s2gos.server.exceptions import JSONContentException
+from s2gos.server.provider import ServiceProvider
+from s2gos.server.services.local import LocalService, ProcessRegistry, get_job_context
+from s2gos.server.services.local.async_executor import AsyncExecutor
+from s2gos.server.services.local.local_service import _parse_prefer
+from s2gos.server.services.local.resources import Resources
 
 
 class LocalServiceTest(TestCase):
@@ -29,3 +50,624 @@ class LocalServiceTest(TestCase):
         self.assertIsInstance(foo_process, ProcessDescription)
         self.assertEqual("foo", foo_process.id)
         self.assertEqual("1.4.2", foo_process.version)
+
+
+def add(a: int, b: int) -> int:
+    return a + b
+
+
+def mul(a: int, b: int) -> int:
+    return a * b
+
+
+class LocalServiceJobListTest(TestCase):
+    def setUp(self):
+        self.service = LocalService(title="OGC API - Processes - Test Service")
+        self.service.register_process(add, id="add")
+        self.service.register_process(mul, id="mul")
+        for i in range(25):
+            self.execute("add" if i % 5 else "mul")
+        for job in self.service.jobs.values():
+            job.future.result(timeout=5)
+
+    def execute(self, process_id: str):
+        asyncio.run(
+            self.service.execute_process(
+                process_id, ProcessRequest(inputs={"a": 1, "b": 2})
+            )
+        )
+
+    def test_paging(self):
+        job_list = asyncio.run(self.service.get_jobs())
+        self.assertEqual([f"job_{i}" for i in range(10)], self.job_ids(job_list))
+        self.assertEqual(
+            {"self": "/jobs?limit=10&offset=0", "next": "/jobs?limit=10&offset=10"},
+            self.links(job_list),
+        )
+
+        job_list = asyncio.run(self.service.get_jobs(limit=10, offset=10))
+        self.assertEqual([f"job_{i}" for i in range(10, 20)], self.job_ids(job_list))
+        self.assertEqual(
+            {
+                "self": "/jobs?limit=10&offset=10",
+                "next": "/jobs?limit=10&offset=20",
+                "prev": "/jobs?limit=10&offset=0",
+            },
+            self.links(job_list),
+        )
+
+        job_list = asyncio.run(self.service.get_jobs(limit=10, offset=20))
+        self.assertEqual([f"job_{i}" for i in range(20, 25)], self.job_ids(job_list))
+        self.assertNotIn("next", self.links(job_list))
+
+    def test_filters(self):
+        job_list = asyncio.run(
+            self.service.get_jobs(
+                limit=2, offset=0, process_id="mul", status="successful"
+            )
+        )
+        self.assertEqual(["job_0", "job_5"], self.job_ids(job_list))
+        self.assertEqual(
+            "/jobs?limit=2&offset=2&status=successful&processID=mul",
+            self.links(job_list)["next"],
+        )
+
+        job_list = asyncio.run(self.service.get_jobs(status="running,failed"))
+        self.assertEqual([], self.job_ids(job_list))
+
+        job_list = asyncio.run(
+            self.service.get_jobs(limit=100, created="../2000-01-01T00:00:00")
+        )
+        self.assertEqual([], self.job_ids(job_list))
+        job_list = asyncio.run(
+            self.service.get_jobs(limit=100, updated="2000-01-01T00:00:00Z/..")
+        )
+        self.assertEqual(25, len(job_list.jobs))
+
+    def test_invalid_params(self):
+        for kwargs in (
+            dict(limit=0),
+            dict(limit=10001),
+            dict(offset=-1),
+            dict(status="done"),
+            dict(created="yesterday"),
+        ):
+            with pytest.raises(JSONContentException):
+                asyncio.run(self.service.get_jobs(**kwargs))
+
+    def test_dismissed_jobs_are_removed(self):
+        asyncio.run(self.service.dismiss_job("job_3"))
+        self.execute("add")
+        job_list = asyncio.run(self.service.get_jobs(limit=100))
+        job_ids = self.job_ids(job_list)
+        self.assertEqual(25, len(job_ids))
+        self.assertNotIn("job_3", job_ids)
+        self.assertEqual("job_25", job_ids[-1])
+
+    def test_get_job_statuses(self):
+        response = asyncio.run(
+            self.service.get_job_statuses(JobIdList(jobIds=["job_1", "job_99"]))
+        )
+        self.assertEqual(["job_1", "job_99"], [item.jobID for item in response.jobs])
+        self.assertEqual(StatusCode.successful, response.jobs[0].jobInfo.status)
+        self.assertIsNone(response.jobs[0].error)
+        self.assertIsNone(response.jobs[1].jobInfo)
+        self.assertEqual(404, response.jobs[1].error.status)
+        self.assertEqual("Job 'job_99' does not exist", response.jobs[1].error.detail)
+
+    def test_dismiss_jobs(self):
+        response = asyncio.run(
+            self.service.dismiss_jobs(
+                JobIdList(jobIds=["job_1", "job_2", "job_99", "job_1"])
+            )
+        )
+        self.assertEqual(
+            ["job_1", "job_2", "job_99", "job_1"],
+            [item.jobID for item in response.jobs],
+        )
+        self.assertEqual(
+            [True, True, False, False],
+            [item.error is None for item in response.jobs],
+        )
+        self.assertNotIn("job_1", self.service.jobs)
+        self.assertNotIn("job_2", self.service.jobs)
+        self.assertEqual(23, len(asyncio.run(self.service.get_jobs(limit=100)).jobs))
+
+    @staticmethod
+    def job_ids(job_list) -> list[str]:
+        return [job.jobID for job in job_list.jobs]
+
+    @staticmethod
+    def links(job_list) -> dict[str, str]:
+        return {link.rel: link.href for link in job_list.links}
+
+
+release_event = threading.Event()
+
+
+def wait_for_release() -> bool:
+    return release_event.wait(timeout=5)
+
+
+class LocalServiceAdmissionTest(TestCase):
+    def setUp(self):
+        release_event.clear()
+        self.service = LocalService(
+            title="OGC API - Processes - Test Service",
+            executor=ThreadPoolExecutor(max_workers=1),
+            max_queue_size=2,
+        )
+        self.service.register_process(wait_for_release, id="wait")
+        self.service.register_process(add, id="add", max_queue_size=1)
+
+    def tearDown(self):
+        release_event.set()
+        self.service.executor.shutdown(wait=True)
+
+    def execute(self, process_id: str) -> dict:
+        response = asyncio.run(
+            self.service.execute_process(
+                process_id, ProcessRequest(inputs={"a": 1, "b": 2})
+            )
+        )
+        self.assertEqual(201, response.status_code)
+        return json.loads(response.body)
+
+    def get_job(self, job_id: str) -> dict:
+        return json.loads(asyncio.run(self.service.get_job(job_id)).body)
+
+    def test_queue_is_bounded(self):
+        running_job_id = self.execute("wait")["jobID"]
+        for _ in range(100):
+            if self.get_job(running_job_id)["status"] == "running":
+                break
+            release_event.wait(0.01)
+        job_infos = [self.execute("wait"), self.execute("wait")]
+        self.assertEqual([0, 1], [job_info["queueDepth"] for job_info in job_infos])
+        self.assertEqual(1, self.get_job(job_infos[1]["jobID"])["queueDepth"])
+
+        with pytest.raises(JSONContentException) as e:
+            self.execute("wait")
+        self.assertEqual(503, e.value.status_code)
+        # The first job left the queue just now
+        self.assertEqual({"Retry-After": "1"}, e.value.headers)
+
+        release_event.set()
+        for job in self.service.jobs.values():
+            job.future.result(timeout=5)
+        self.assertEqual(0, len(self.service.job_queue))
+        job_info = self.get_job(job_infos[1]["jobID"])
+        self.assertEqual("successful", job_info["status"])
+        self.assertIsNone(job_info["queueDepth"])
+        self.assertGreaterEqual(job_info["waitTime"], 0.0)
+        # Queue accepts jobs again
+        self.execute("wait")
+
+    def test_process_queue_is_bounded(self):
+        self.execute("wait")
+        self.execute("add")
+        with pytest.raises(JSONContentException, match="process 'add'"):
+            self.execute("add")
+
+
+class LocalServiceSchedulingTest(TestCase):
+    def setUp(self):
+        release_event.clear()
+        self.service = LocalService(
+            title="OGC API - Processes - Test Service",
+            executor=ThreadPoolExecutor(max_workers=1),
+        )
+        self.service.register_process(wait_for_release, id="wait")
+        self.service.register_process(add, id="add", max_concurrency=1)
+        self.service.register_process(mul, id="mul")
+
+    def tearDown(self):
+        release_event.set()
+        self.service.executor.shutdown(wait=True)
+
+    def execute(self, process_id: str, **kwargs) -> str:
+        response = asyncio.run(
+            self.service.execute_process(
+                process_id, ProcessRequest(inputs={"a": 1, "b": 2}, **kwargs)
+            )
+        )
+        return json.loads(response.body)["jobID"]
+
+    def test_process_concurrency(self):
+        self.assertEqual(
+            1, self.service.process_registry.get_entry("add").max_concurrency
+        )
+        self.assertIsNone(
+            self.service.process_registry.get_entry("mul").max_concurrency
+        )
+
+    def test_priority_and_fair_share(self):
+        self.execute("wait")
+        job_ids = [
+            self.execute("add", userName="a"),
+            self.execute("add", userName="a"),
+            self.execute("mul", userName="b"),
+            self.execute("mul", userName="b", priority=1),
+        ]
+        self.assertEqual(4, self.service.scheduler.num_pending)
+        release_event.set()
+        for job in self.service.jobs.values():
+            job.future.result(timeout=5)
+        started = sorted(
+            job_ids, key=lambda job_id: self.service.jobs[job_id].status_info.started
+        )
+        self.assertEqual([job_ids[3], job_ids[0], job_ids[2], job_ids[1]], started)
+
+
+def sleep_a_while(duration: float) -> float:
+    time.sleep(duration)
+    return duration
+
+
+class LocalServiceRuntimeModelTest(TestCase):
+    def test_eta(self):
+        service = LocalService(title="OGC API - Processes - Test Service")
+        service.register_process(
+            sleep_a_while, id="sleep", runtime_features=["duration"]
+        )
+
+        def execute(duration: float) -> dict:
+            response = asyncio.run(
+                service.execute_process(
+                    "sleep", ProcessRequest(inputs={"duration": duration})
+                )
+            )
+            job_info = json.loads(response.body)
+            service.jobs[job_info["jobID"]].future.result(timeout=5)
+            return json.loads(asyncio.run(service.get_job(job_info["jobID"])).body)
+
+        job_info = execute(0.01)
+        self.assertIsNone(job_info["eta"])
+        self.assertEqual(
+            1, service.process_registry.get_entry("sleep").runtime_model.count
+        )
+        job = service.jobs[execute(0.01)["jobID"]]
+        self.assertIsNotNone(job.expected_runtime)
+        # ETA is removed once the job finished
+        self.assertIsNone(job.status_info.eta)
+
+
+class LocalServiceResourcesTest(TestCase):
+    def setUp(self):
+        release_event.clear()
+        self.service = LocalService(
+            title="OGC API - Processes - Test Service",
+            capacity=Resources(4, 16 * 1000**3),
+        )
+        self.service.register_process(wait_for_release, id="wait", cpus=2, memory="8GB")
+        self.service.register_process(add, id="add", cpus=1, memory="1GB")
+
+    def tearDown(self):
+        release_event.set()
+        self.service.executor.shutdown(wait=True)
+
+    def execute(self, process_id: str) -> str:
+        response = asyncio.run(
+            self.service.execute_process(
+                process_id, ProcessRequest(inputs={"a": 1, "b": 2})
+            )
+        )
+        return json.loads(response.body)["jobID"]
+
+    def test_capacity(self):
+        self.assertEqual(Resources(4, 16 * 1000**3), self.service.scheduler.capacity)
+        # Resources rather than the number of workers limit the concurrency
+        self.assertGreater(self.service.scheduler.max_concurrency, 4)
+
+    def test_jobs_are_packed(self):
+        for _ in range(3):
+            self.execute("wait")
+        job_id = self.execute("add")
+        # Two jobs of "wait" fill the memory, so "add" has to wait too
+        self.assertEqual(2, self.service.scheduler.num_running)
+        self.assertEqual(2, self.service.scheduler.num_pending)
+        release_event.set()
+        for job in self.service.jobs.values():
+            job.future.result(timeout=5)
+        self.assertEqual(
+            StatusCode.successful, self.service.jobs[job_id].status_info.status
+        )
+
+    def test_oversized_process_is_logged(self):
+        with self.assertLogs("s2gos", level="WARNING") as cm:
+            self.service.register_process(mul, id="mul", cpus=8)
+        self.assertIn("more than the node capacity", cm.output[0])
+
+
+def wait_for_release_of(x: int) -> int:
+    release_event.wait(timeout=5)
+    return x
+
+
+class LocalServiceIdempotencyTest(TestCase):
+    def setUp(self):
+        release_event.clear()
+        self.service = LocalService(
+            title="OGC API - Processes - Test Service",
+            executor=ThreadPoolExecutor(max_workers=1),
+        )
+        self.service.register_process(wait_for_release_of, id="wait")
+        self.service.register_process(
+            wait_for_release_of, id="wait_one", max_queue_size=1
+        )
+        self.service.register_process(
+            wait_for_release_of, id="wait_det", deterministic=True
+        )
+
+    def tearDown(self):
+        release_event.set()
+        self.service.executor.shutdown(wait=True)
+
+    def execute(self, process_id: str, x: int = 1, **kwargs) -> JSONResponse:
+        return asyncio.run(
+            self.service.execute_process(
+                process_id, ProcessRequest(inputs={"x": x}), **kwargs
+            )
+        )
+
+    def job_id(self, response: JSONResponse) -> str:
+        return json.loads(response.body)["jobID"]
+
+    def test_repeated_key_returns_job(self):
+        response_1 = self.execute("wait", idempotency_key="k1")
+        response_2 = self.execute("wait", idempotency_key="k1")
+        self.assertEqual(201, response_2.status_code)
+        self.assertEqual(self.job_id(response_1), self.job_id(response_2))
+        self.assertEqual("true", response_2.headers["Idempotent-Replayed"])
+        self.assertEqual(1, len(self.service.jobs))
+        self.assertNotEqual(
+            self.job_id(response_1), self.job_id(self.execute("wait", x=2))
+        )
+
+    def test_repeated_key_of_other_request(self):
+        self.execute("wait", idempotency_key="k1")
+        with pytest.raises(JSONContentException) as e:
+            self.execute("wait", x=2, idempotency_key="k1")
+        self.assertEqual(422, e.value.status_code)
+
+    def test_key_of_rejected_request_is_released(self):
+        self.execute("wait")
+        self.execute("wait_one")
+        with pytest.raises(JSONContentException) as e:
+            self.execute("wait_one", x=2, idempotency_key="k1")
+        self.assertEqual(503, e.value.status_code)
+        release_event.set()
+        for job in self.service.jobs.values():
+            job.future.result(timeout=5)
+        response = self.execute("wait_one", x=2, idempotency_key="k1")
+        self.assertNotIn("Idempotent-Replayed", response.headers)
+
+    def test_key_is_removed_with_job(self):
+        job_id = self.job_id(self.execute("wait", idempotency_key="k1"))
+        release_event.set()
+        self.service.jobs[job_id].future.result(timeout=5)
+        asyncio.run(self.service.dismiss_job(job_id))
+        self.assertNotEqual(
+            job_id, self.job_id(self.execute("wait", idempotency_key="k1"))
+        )
+
+    def test_equal_requests_attach_to_active_job(self):
+        job_id = self.job_id(self.execute("wait_det"))
+        self.assertEqual(job_id, self.job_id(self.execute("wait_det")))
+        self.assertNotEqual(job_id, self.job_id(self.execute("wait_det", x=2)))
+        # Not deterministic
+        self.assertNotEqual(job_id, self.job_id(self.execute("wait")))
+        release_event.set()
+        self.service.jobs[job_id].future.result(timeout=5)
+        # Results are taken from the cache now
+        response = self.execute("wait_det")
+        self.assertNotEqual(job_id, self.job_id(response))
+        self.assertEqual("successful", json.loads(response.body)["status"])
+        self.assertEqual({}, self.service._inflight_jobs)
+
+    def test_header_is_passed(self):
+        ServiceProvider.set_instance(self.service)
+        client = TestClient(app)
+        responses = [
+            client.post(
+                "/processes/wait/execution",
+                json={"inputs": {"x": 1}},
+                headers={"Idempotency-Key": "k1"},
+            )
+            for _ in range(2)
+        ]
+        self.assertEqual([201, 201], [r.status_code for r in responses])
+        self.assertEqual(responses[0].json()["jobID"], responses[1].json()["jobID"])
+
+
+def fail(x: int) -> int:
+    raise ValueError(f"Failed with {x}")
+
+
+class LocalServiceSyncExecutionTest(TestCase):
+    def setUp(self):
+        release_event.clear()
+        self.service = LocalService(title="OGC API - Processes - Test Service")
+        self.service.register_process(add, id="add")
+        self.service.register_process(fail, id="fail")
+        self.service.register_process(wait_for_release_of, id="wait")
+        self.service.register_process(
+            add, id="add_sync", jobControlOptions=["sync-execute"]
+        )
+
+    def tearDown(self):
+        release_event.set()
+
+    def execute(
+        self, process_id: str, prefer: str | None = None, **inputs
+    ) -> JSONResponse:
+        return asyncio.run(
+            self.service.execute_process(
+                process_id, ProcessRequest(inputs=inputs), prefer=prefer
+            )
+        )
+
+    def test_respond_sync(self):
+        response = self.execute("add", "respond-sync", a=1, b=2)
+        self.assertEqual(200, response.status_code)
+        self.assertEqual({"result": 3}, json.loads(response.body))
+        self.assertEqual("respond-sync", response.headers["Preference-Applied"])
+
+    def test_respond_async(self):
+        for prefer in (None, "respond-async", "wait=5"):
+            response = self.execute("add", prefer, a=1, b=2)
+            self.assertEqual(201, response.status_code)
+            self.assertNotIn("Preference-Applied", response.headers)
+
+    def test_sync_only_process(self):
+        response = self.execute("add_sync", a=1, b=2)
+        self.assertEqual(200, response.status_code)
+        self.assertEqual({"result": 3}, json.loads(response.body))
+        response = self.execute("add_sync", "respond-async", a=1, b=2)
+        self.assertEqual(201, response.status_code)
+
+    def test_deadline_passed(self):
+        t0 = time.monotonic()
+        response = self.execute("wait", "respond-sync, wait=0.1", x=1)
+        self.assertLess(time.monotonic() - t0, 2.0)
+        self.assertEqual(201, response.status_code)
+        job_info = json.loads(response.body)
+        self.assertIn(job_info["status"], ("accepted", "running"))
+        release_event.set()
+        self.service.jobs[job_info["jobID"]].future.result(timeout=5)
+
+    def test_job_store_is_read_outside_event_loop(self):
+        threads = []
+        find_job_record = self.service._find_job_record
+
+        def _find_job_record(job_id: str):
+            threads.append(threading.current_thread())
+            return find_job_record(job_id)
+
+        self.service._find_job_record = _find_job_record
+        response = self.execute("add", "respond-sync", a=1, b=2)
+        self.assertEqual(200, response.status_code)
+        self.assertTrue(len(threads) >= 1)
+        self.assertNotIn(threading.current_thread(), threads)
+
+    def test_failed_job(self):
+        response = self.execute("fail", "respond-sync", x=1)
+        self.assertEqual(201, response.status_code)
+        self.assertEqual("failed", json.loads(response.body)["status"])
+
+    def test_header_is_passed(self):
+        ServiceProvider.set_instance(self.service)
+        client = TestClient(app)
+        response = client.post(
+            "/processes/add/execution",
+            json={"inputs": {"a": 1, "b": 2}},
+            headers={"Prefer": "respond-sync"},
+        )
+        self.assertEqual(200, response.status_code)
+        self.assertEqual({"result": 3}, response.json())
+
+
+class ParsePreferTest(TestCase):
+    def test_parse_prefer(self):
+        self.assertEqual({}, _parse_prefer(None))
+        self.assertEqual({"respond-sync": None}, _parse_prefer("respond-sync"))
+        self.assertEqual(
+            {"respond-async": None, "wait": "10", "handling": "lenient"},
+            _parse_prefer('Respond-Async; x=1, wait="10",handling=lenient,wait=5'),
+        )
+
+
+async def fetch(x: int) -> int:
+    get_job_context().report_progress(message="Fetching")
+    await asyncio.sleep(0.2)
+    return x
+
+
+async def fetch_forever(x: int) -> int:
+    await asyncio.sleep(60)
+    return x
+
+
+class LocalServiceAsyncProcessTest(TestCase):
+    def setUp(self):
+        self.service = LocalService(
+            title="OGC API - Processes - Test Service",
+            executor=ThreadPoolExecutor(max_workers=1),
+            async_executor=AsyncExecutor(),
+        )
+        self.service.register_process(fetch, id="fetch")
+        self.service.register_process(fetch_forever, id="fetch_forever")
+
+    def tearDown(self):
+        self.service.async_scheduler.executor.shutdown(cancel_futures=True)
+        self.service.executor.shutdown(wait=True)
+
+    def execute(self, process_id: str, x: int = 1) -> str:
+        response = asyncio.run(
+            self.service.execute_process(process_id, ProcessRequest(inputs={"x": x}))
+        )
+        return json.loads(response.body)["jobID"]
+
+    def test_process_is_async(self):
+        self.assertTrue(self.service.process_registry.get_entry("fetch").is_async)
+
+    def test_jobs_run_concurrently(self):
+        t0 = time.monotonic()
+        job_ids = [self.execute("fetch", x=i) for i in range(100)]
+        for job_id in job_ids:
+            self.service.jobs[job_id].future.result(timeout=5)
+        # Run one after the other, they would take 20 seconds
+        self.assertLess(time.monotonic() - t0, 5.0)
+        results = asyncio.run(self.service.get_job_results(job_ids[42]))
+        self.assertEqual({"result": 42}, results.model_dump(mode="json"))
+        job_info = self.service.jobs[job_ids[42]].snapshot.status_info
+        self.assertEqual(StatusCode.successful, job_info.status)
+        self.assertEqual("Fetching", job_info.message)
+
+    def test_dismiss_job(self):
+        job_id = self.execute("fetch_forever")
+        job = self.service.jobs[job_id]
+        t0 = time.monotonic()
+        while job.snapshot.status_info.status != StatusCode.running:
+            self.assertLess(time.monotonic() - t0, 5.0)
+            time.sleep(0.01)
+        asyncio.run(self.service.dismiss_job(job_id))
+        job.future.result(timeout=5)
+        self.assertEqual(StatusCode.dismissed, job.snapshot.status_info.status)
+
+
+class LocalServiceCloseTest(TestCase):
+    def setUp(self):
+        self.service = LocalService(title="OGC API - Processes - Test Service")
+        self.service.register_process(add, id="add")
+        self.service.register_process(fetch, id="fetch")
+
+    def execute(self, process_id: str, **inputs) -> str:
+        response = asyncio.run(
+            self.service.execute_process(process_id, ProcessRequest(inputs=inputs))
+        )
+        return json.loads(response.body)["jobID"]
+
+    def test_close_awaits_running_jobs(self):
+        job_ids = [self.execute("add", a=1, b=2), self.execute("fetch", x=1)]
+        self.service.close()
+        for job_id in job_ids:
+            self.assertTrue(self.service.jobs[job_id].future.done())
+            self.assertEqual(
+                StatusCode.successful,
+                self.service.jobs[job_id].snapshot.status_info.status,
+            )
+        with pytest.raises(RuntimeError):
+            self.service.executor.submit(add, 1, 2)
+        with pytest.raises(RuntimeError):
+            self.service.async_scheduler.executor.submit(fetch, 1)
+        self.assertIsNone(self.service.callbacks._thread)
+
+    def test_close_on_app_shutdown(self):
+        closed = []
+        self.service.close = lambda: closed.append(True)
+        ServiceProvider.set_instance(self.service)
+        with TestClient(app) as client:
+            self.assertEqual(200, client.get("/").status_code)
+            self.assertEqual([], closed)
+        self.assertEqual([True], closed)
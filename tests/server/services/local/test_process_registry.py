@@ -4,6 +4,8 @@
 
 from unittest import TestCase
 
+import pytest
+
 from s2gos.common.models import (
     InputDescription,
     OutputDescription,
@@ -12,6 +14,7 @@ from s2gos.common.models import (
     Type1,
 )
 from s2gos.server.services.local import ProcessRegistry
+from s2gos.server.services.local.resources import Resources
 from tests.helpers import BaseModelMixin
 
 
@@ -113,6 +116,25 @@ class ProcessRegistryTest(BaseModelMixin, TestCase):
         self.assertIsInstance(p1.inputs, dict)
         self.assertIsInstance(p1.outputs, dict)
 
+    def test_register_f1_with_resources(self):
+        registry = ProcessRegistry()
+
+        e1 = registry.register_function(f1, id="foo")
+        self.assertEqual(Resources(1, 0), e1.resources)
+        e2 = registry.register_function(f1, id="bar", cpus=4, memory="8GB")
+        self.assertEqual(Resources(4, 8 * 1000**3), e2.resources)
+        self.assertNotIn("cpus", e2.process.model_dump())
+        with pytest.raises(ValueError, match="invalid memory size"):
+            registry.register_function(f1, id="baz", memory="lots")
+
+    def test_register_f1_deterministic(self):
+        registry = ProcessRegistry()
+
+        self.assertFalse(registry.register_function(f1, id="foo").deterministic)
+        e2 = registry.register_function(f1, id="bar", deterministic=True)
+        self.assertTrue(e2.deterministic)
+        self.assertNotIn("deterministic", e2.process.model_dump())
+
     def test_register_multiple(self):
         registry = ProcessRegistry()
 
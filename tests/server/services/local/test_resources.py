@@ -0,0 +1,77 @@
+#  Copyright (c) 2025 by ESA DTE-S2GOS team and contributors
+#  Permissions are hereby granted under the terms of the Apache 2.0 License:
+#  https://opensource.org/license/apache-2-0.
+
+from unittest import TestCase
+
+import pytest
+
+from s2gos.server.services.local.resources import (
+    NO_RESOURCES,
+    Resources,
+    get_capacity,
+    get_node_capacity,
+    parse_memory,
+)
+
+GB = 1000**3
+
+
+class ResourcesTest(TestCase):
+    def test_defaults(self):
+        self.assertEqual(Resources(1.0, 0), Resources())
+        self.assertEqual(Resources(0.0, 0), NO_RESOURCES)
+
+    def test_arithmetic(self):
+        self.assertEqual(Resources(3, 10), Resources(1, 4) + Resources(2, 6))
+        self.assertEqual(Resources(1, 4), Resources(3, 10) - Resources(2, 6))
+
+    def test_fits(self):
+        capacity = Resources(4, 16 * GB)
+        self.assertTrue(Resources(4, 16 * GB).fits(capacity))
+        self.assertFalse(Resources(5, 1 * GB).fits(capacity))
+        self.assertFalse(Resources(1, 17 * GB).fits(capacity))
+        # Zero memory capacity means unlimited memory
+        self.assertTrue(Resources(1, 100 * GB).fits(Resources(4, 0)))
+
+    def test_clip(self):
+        capacity = Resources(4, 16 * GB)
+        self.assertEqual(Resources(4, 16 * GB), Resources(8, 32 * GB).clip(capacity))
+        self.assertEqual(Resources(1, 1 * GB), Resources(1, 1 * GB).clip(capacity))
+        self.assertEqual(
+            Resources(4, 32 * GB), Resources(8, 32 * GB).clip(Resources(4, 0))
+        )
+
+
+class ParseMemoryTest(TestCase):
+    def test_numbers(self):
+        self.assertEqual(1024, parse_memory(1024))
+        self.assertEqual(1500, parse_memory(1500.5))
+
+    def test_strings(self):
+        self.assertEqual(512, parse_memory("512"))
+        self.assertEqual(512 * 1000**2, parse_memory("512MB"))
+        self.assertEqual(8 * GB, parse_memory("8G"))
+        self.assertEqual(4 * 1024**3, parse_memory("4GiB"))
+        self.assertEqual(1536 * 1000**2, parse_memory(" 1.536 gb "))
+
+    def test_invalid(self):
+        for value in (-1, "", "GB", "8 XB", "-8GB", None, True):
+            with pytest.raises(ValueError):
+                # noinspection PyTypeChecker
+                parse_memory(value)
+
+
+class CapacityTest(TestCase):
+    def test_node_capacity(self):
+        capacity = get_node_capacity()
+        self.assertGreaterEqual(capacity.cpus, 1)
+        self.assertGreaterEqual(capacity.memory, 0)
+
+    def test_get_capacity(self):
+        self.assertIsNone(get_capacity())
+        self.assertEqual(Resources(8, 16 * GB), get_capacity("8", "16GB"))
+        self.assertEqual(Resources(2, get_node_capacity().memory), get_capacity(cpus=2))
+        self.assertEqual(
+            Resources(get_node_capacity().cpus, GB), get_capacity(memory="1GB")
+        )
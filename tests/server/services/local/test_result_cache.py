@@ -0,0 +1,139 @@
+#  Copyright (c) 2025 by ESA DTE-S2GOS team and contributors
+#  Permissions are hereby granted under the terms of the Apache 2.0 License:
+#  https://opensource.org/license/apache-2-0.
+
+import asyncio
+import json
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from unittest import TestCase
+
+from s2gos.common.models import ProcessRequest
+from s2gos.server.services.local import LocalService
+from s2gos.server.services.local.result_cache import (
+    ResultCache,
+    ResultCacheStats,
+    get_result_key,
+)
+
+
+class GetResultKeyTest(TestCase):
+    def test_normalized(self):
+        key = get_result_key("p", "1.0.0", {"a": 1, "b": [1, 2]})
+        self.assertEqual(64, len(key))
+        self.assertEqual(key, get_result_key("p", "1.0.0", {"b": [1, 2], "a": 1}))
+        self.assertNotEqual(key, get_result_key("p", "1.0.0", {"a": 2, "b": [1, 2]}))
+        self.assertNotEqual(key, get_result_key("p", "1.0.1", {"a": 1, "b": [1, 2]}))
+        self.assertNotEqual(key, get_result_key("q", "1.0.0", {"a": 1, "b": [1, 2]}))
+
+
+class ResultCacheTest(TestCase):
+    def test_lru(self):
+        cache = ResultCache(max_memory=20)
+        self.assertIsNone(cache.get("k1"))
+        cache.put("k1", b"1" * 8)
+        cache.put("k2", b"2" * 8)
+        self.assertEqual(b"1" * 8, cache.get("k1"))
+        # k2 is the least recently used
+        cache.put("k3", b"3" * 8)
+        self.assertIsNone(cache.get("k2"))
+        self.assertEqual(b"1" * 8, cache.get("k1"))
+        self.assertEqual(b"3" * 8, cache.get("k3"))
+        # Too large to be kept in memory
+        cache.put("k4", b"4" * 21)
+        self.assertIsNone(cache.get("k4"))
+        self.assertEqual(ResultCacheStats(3, 0, 3, 2, 16, 0, 0), cache.get_stats())
+
+    def test_disk_tier(self):
+        with tempfile.TemporaryDirectory() as cache_dir:
+            cache = ResultCache(max_memory=10, cache_dir=cache_dir, max_disk_size=20)
+            cache.put("k1", b"1" * 8)
+            cache.put("k2", b"2" * 8)
+            # Evicted from memory, but found on disk
+            self.assertEqual(b"1" * 8, cache.get("k1"))
+            self.assertEqual(ResultCacheStats(0, 1, 0, 1, 8, 2, 16), cache.get_stats())
+            # k2 is the least recently used on disk
+            cache.put("k3", b"3" * 8)
+            self.assertIsNone(cache.get("k2"))
+            self.assertEqual(
+                ["k1.json", "k3.json"],
+                sorted(p.name for p in Path(cache_dir).iterdir()),
+            )
+
+            # Results on disk outlive the cache
+            cache = ResultCache(cache_dir=cache_dir, max_disk_size=20)
+            self.assertEqual(2, cache.get_stats().disk_entries)
+            self.assertEqual(b"3" * 8, cache.get("k3"))
+            self.assertEqual(ResultCacheStats(0, 1, 0, 1, 8, 2, 16), cache.get_stats())
+
+    def test_disk_tier_shared_by_caches(self):
+        with tempfile.TemporaryDirectory() as cache_dir:
+            caches = [ResultCache(max_memory=0, cache_dir=cache_dir) for _ in range(2)]
+            data = [bytes([65 + i]) * 100_000 for i in range(8)]
+
+            def put(i: int):
+                caches[i % 2].put("k1", data[i])
+
+            with ThreadPoolExecutor(max_workers=8) as executor:
+                list(executor.map(put, range(8)))
+            # A complete entry written by one of the caches
+            self.assertIn(caches[0].get("k1"), data)
+            self.assertEqual(["k1.json"], [p.name for p in Path(cache_dir).iterdir()])
+
+
+calls: list[int] = []
+
+
+def add(a: int, b: int) -> int:
+    calls.append(a)
+    return a + b
+
+
+class LocalServiceResultCacheTest(TestCase):
+    def setUp(self):
+        calls.clear()
+        self.service = LocalService(title="OGC API - Processes - Test Service")
+        self.service.register_process(add, id="add", deterministic=True)
+        self.service.register_process(add, id="add_2")
+
+    def execute(self, process_id: str, inputs: dict) -> dict:
+        response = asyncio.run(
+            self.service.execute_process(process_id, ProcessRequest(inputs=inputs))
+        )
+        job_info = json.loads(response.body)
+        self.service.jobs[job_info["jobID"]].future.result(timeout=5)
+        return job_info
+
+    def get_results(self, job_id: str) -> list:
+        results = asyncio.run(self.service.get_job_results(job_id))
+        return [v.root.root for v in results.root.values()]
+
+    def test_results_are_reused(self):
+        job_info_1 = self.execute("add", {"a": 1, "b": 2})
+        job_info_2 = self.execute("add", {"b": 2, "a": 1})
+        self.assertEqual([1], calls)
+        self.assertEqual("successful", job_info_2["status"])
+        self.assertEqual("Results taken from cache", job_info_2["message"])
+        self.assertNotEqual(job_info_1["jobID"], job_info_2["jobID"])
+        self.assertEqual([3], self.get_results(job_info_2["jobID"]))
+        response = asyncio.run(self.service.get_job(job_info_2["jobID"]))
+        self.assertEqual("successful", json.loads(response.body)["status"])
+
+        self.execute("add", {"a": 2, "b": 2})
+        self.assertEqual([1, 2], calls)
+        stats = self.service.result_cache.get_stats()
+        self.assertEqual((1, 2), (stats.hits, stats.misses))
+
+    def test_cached_jobs_do_not_update_runtime_model(self):
+        runtime_model = self.service.process_registry.get_entry("add").runtime_model
+        self.execute("add", {"a": 1, "b": 2})
+        self.assertEqual(1, runtime_model.count)
+        self.execute("add", {"a": 1, "b": 2})
+        self.assertEqual(1, runtime_model.count)
+
+    def test_other_processes_are_not_cached(self):
+        self.execute("add_2", {"a": 1, "b": 2})
+        self.execute("add_2", {"a": 1, "b": 2})
+        self.assertEqual([1, 1], calls)
+        self.assertEqual(0, self.service.result_cache.get_stats().entries)
@@ -0,0 +1,49 @@
+#  Copyright (c) 2025 by ESA DTE-S2GOS team and contributors
+#  Permissions are hereby granted under the terms of the Apache 2.0 License:
+#  https://opensource.org/license/apache-2-0.
+
+import random
+from unittest import TestCase
+
+from s2gos.server.services.local.runtime_model import RuntimeModel
+
+
+class RuntimeModelTest(TestCase):
+    def test_unknown(self):
+        model = RuntimeModel(["duration"])
+        self.assertEqual(0, model.count)
+        self.assertIsNone(model.estimate({"duration": 1.0}))
+
+    def test_without_features(self):
+        model = RuntimeModel()
+        model.update({}, 10.0)
+        self.assertAlmostEqual(10.0, model.estimate({}))
+        for _ in range(50):
+            model.update({}, 20.0)
+        self.assertAlmostEqual(20.0, model.estimate({}), places=3)
+        self.assertEqual(51, model.count)
+
+    def test_power_law(self):
+        model = RuntimeModel(["duration"])
+        rng = random.Random(42)
+        for _ in range(100):
+            duration = rng.uniform(1, 1000)
+            model.update({"duration": duration}, 2 * duration)
+        for duration in (5.0, 50.0, 500.0):
+            self.assertAlmostEqual(
+                2 * duration,
+                model.estimate({"duration": duration}),
+                delta=0.1 * duration,
+            )
+
+    def test_feature_function(self):
+        model = RuntimeModel(lambda inputs: [inputs["w"] * inputs["h"]])
+        for size in range(1, 30):
+            model.update({"w": size, "h": size}, 0.01 * size * size)
+        self.assertAlmostEqual(4.0, model.estimate({"w": 20, "h": 20}), delta=0.4)
+
+    def test_invalid_features(self):
+        model = RuntimeModel(["duration"])
+        model.update({}, 3.0)
+        # Falls back to the mean runtime
+        self.assertAlmostEqual(3.0, model.estimate({"duration": "long"}))
@@ -0,0 +1,151 @@
+#  Copyright (c) 2025 by ESA DTE-S2GOS team and contributors
+#  Permissions are hereby granted under the terms of the Apache 2.0 License:
+#  https://opensource.org/license/apache-2-0.
+
+import datetime
+from unittest import TestCase
+
+from fastapi.testclient import TestClient
+
+import s2gos.server.routes  # noqa: F401
+from s2gos.server.app import app
+from s2gos.server.conditional import (
+    format_http_date,
+    get_not_modified_headers,
+    is_not_modified,
+)
+from s2gos.server.provider import ServiceProvider
+from s2gos.server.services.local import LocalService, get_job_context
+
+LAST_MODIFIED = "Sat, 18 Oct 2025 10:00:00 GMT"
+
+
+class ConditionalTest(TestCase):
+    def test_format_http_date(self):
+        dt = datetime.datetime(2025, 10, 18, 10, 0, 0, tzinfo=datetime.timezone.utc)
+        self.assertEqual(LAST_MODIFIED, format_http_date(dt))
+
+    def test_if_none_match(self):
+        response_headers = {"ETag": '"abc-1"', "Last-Modified": LAST_MODIFIED}
+        self.assertTrue(is_not_modified({"If-None-Match": '"abc-1"'}, response_headers))
+        self.assertTrue(
+            is_not_modified({"If-None-Match": 'W/"abc-0", "abc-1"'}, response_headers)
+        )
+        self.assertTrue(is_not_modified({"If-None-Match": "*"}, response_headers))
+        self.assertFalse(
+            is_not_modified({"If-None-Match": '"abc-0"'}, response_headers)
+        )
+        # If-Modified-Since is ignored if If-None-Match is given
+        self.assertFalse(
+            is_not_modified(
+                {"If-None-Match": '"abc-0"', "If-Modified-Since": LAST_MODIFIED},
+                response_headers,
+            )
+        )
+        self.assertFalse(is_not_modified({"If-None-Match": '"abc-1"'}, {}))
+
+    def test_if_modified_since(self):
+        response_headers = {"Last-Modified": LAST_MODIFIED}
+        self.assertTrue(
+            is_not_modified({"If-Modified-Since": LAST_MODIFIED}, response_headers)
+        )
+        self.assertTrue(
+            is_not_modified(
+                {"If-Modified-Since": "Sat, 18 Oct 2025 10:00:01 GMT"},
+                response_headers,
+            )
+        )
+        self.assertFalse(
+            is_not_modified(
+                {"If-Modified-Since": "Sat, 18 Oct 2025 09:59:59 GMT"},
+                response_headers,
+            )
+        )
+        self.assertFalse(
+            is_not_modified({"If-Modified-Since": "yesterday"}, response_headers)
+        )
+        self.assertFalse(is_not_modified({}, response_headers))
+
+    def test_get_not_modified_headers(self):
+        self.assertEqual(
+            {"ETag": '"abc-1"', "Last-Modified": LAST_MODIFIED},
+            get_not_modified_headers(
+                {
+                    "ETag": '"abc-1"',
+                    "Last-Modified": LAST_MODIFIED,
+                    "Content-Length": "10",
+                }
+            ),
+        )
+
+
+def fn_with_progress(steps: int) -> int:
+    ctx = get_job_context()
+    for i in range(steps):
+        ctx.report_progress(progress=i)
+    return steps
+
+
+# noinspection PyUnusedLocal
+def fn_other(x: int) -> int:
+    return x
+
+
+class ConditionalRequestTest(TestCase):
+    def setUp(self):
+        # Publish each progress update, so the test can change jobs at will
+        self.service = LocalService(title="Test Service", progress_interval=0)
+        self.service.register_process(fn_with_progress, id="progress")
+        ServiceProvider.set_instance(self.service)
+        self.client = TestClient(app)
+
+    def assert_revalidated(self, path: str) -> str:
+        response = self.client.get(path)
+        self.assertEqual(200, response.status_code)
+        etag = response.headers["ETag"]
+        response = self.client.get(path, headers={"If-None-Match": etag})
+        self.assertEqual(304, response.status_code)
+        self.assertEqual(b"", response.content)
+        self.assertEqual(etag, response.headers["ETag"])
+        return etag
+
+    def test_processes(self):
+        etag = self.assert_revalidated("/processes")
+        process_etag = self.assert_revalidated("/processes/progress")
+
+        self.service.register_process(fn_other, id="other")
+        response = self.client.get("/processes", headers={"If-None-Match": etag})
+        self.assertEqual(200, response.status_code)
+        self.assertNotEqual(etag, response.headers["ETag"])
+        self.assertEqual(2, len(response.json()["processes"]))
+        # Other processes are unchanged
+        response = self.client.get(
+            "/processes/progress", headers={"If-None-Match": process_etag}
+        )
+        self.assertEqual(304, response.status_code)
+
+    def test_job(self):
+        response = self.client.post(
+            "/processes/progress/execution", json={"inputs": {"steps": 3}}
+        )
+        job_id = response.json()["jobID"]
+        self.service.jobs[job_id].future.result(timeout=5)
+
+        etag = self.assert_revalidated(f"/jobs/{job_id}")
+        response = self.client.get(f"/jobs/{job_id}")
+        self.assertEqual("successful", response.json()["status"])
+        last_modified = response.headers["Last-Modified"]
+        response = self.client.get(
+            f"/jobs/{job_id}", headers={"If-Modified-Since": last_modified}
+        )
+        self.assertEqual(304, response.status_code)
+
+        self.service.jobs[job_id].report_progress(message="Done")
+        response = self.client.get(f"/jobs/{job_id}", headers={"If-None-Match": etag})
+        self.assertEqual(200, response.status_code)
+        self.assertEqual("Done", response.json()["message"])
+
+    def test_unconditional_endpoints(self):
+        response = self.client.get("/jobs", headers={"If-None-Match": "*"})
+        self.assertEqual(200, response.status_code)
+        self.assertNotIn("ETag", response.headers)
@@ -0,0 +1,116 @@
+#  Copyright (c) 2025 by ESA DTE-S2GOS team and contributors
+#  Permissions are hereby granted under the terms of the Apache 2.0 License:
+#  https://opensource.org/license/apache-2-0.
+
+import asyncio
+import gc
+from unittest import TestCase
+
+from fastapi.responses import JSONResponse
+from fastapi.testclient import TestClient
+
+import s2gos.server.routes  # noqa: F401
+from s2gos.common.models import ConformanceDeclaration
+from s2gos.server.app import app, resource_cache
+from s2gos.server.provider import ServiceProvider
+from s2gos.server.resource_cache import EncodedJSONResponse, ResourceCache
+from s2gos.server.services.local import LocalService
+
+
+class ResourceCacheTest(TestCase):
+    def test_get(self):
+        cache = ResourceCache()
+        model = ConformanceDeclaration(conformsTo=["a", "b"])
+        resource = cache.get(model)
+        self.assertEqual(b'{"conformsTo":["a","b"]}', resource.content)
+        self.assertTrue(resource.etag.startswith('"'))
+        self.assertIs(resource, cache.get(model))
+
+        # Equal models have equal entity tags
+        other_resource = cache.get(ConformanceDeclaration(conformsTo=["a", "b"]))
+        self.assertIsNot(resource, other_resource)
+        self.assertEqual(resource, other_resource)
+        self.assertNotEqual(
+            resource.etag, cache.get(ConformanceDeclaration(conformsTo=["a"])).etag
+        )
+
+    def test_encodings_are_dropped_with_models(self):
+        cache = ResourceCache()
+        model = ConformanceDeclaration(conformsTo=["a"])
+        cache.get(model)
+        self.assertEqual(1, len(cache._items))
+        del model
+        gc.collect()
+        self.assertEqual(0, len(cache._items))
+
+    def test_get_response(self):
+        cache = ResourceCache()
+        model = ConformanceDeclaration(conformsTo=["a"])
+        response = cache.get_response(model)
+        self.assertIsInstance(response, JSONResponse)
+        self.assertEqual(200, response.status_code)
+        self.assertEqual("application/json", response.media_type)
+        self.assertEqual(b'{"conformsTo":["a"]}', response.body)
+        self.assertEqual(cache.get(model).etag, response.headers["ETag"])
+
+    def test_encoded_response_is_sent_as_is(self):
+        response = EncodedJSONResponse(b'{"a":1}')
+        self.assertEqual(b'{"a":1}', response.body)
+        self.assertEqual("7", response.headers["content-length"])
+
+
+# noinspection PyUnusedLocal
+def f1(x: int) -> int:
+    return x
+
+
+# noinspection PyUnusedLocal
+def f2(y: str) -> str:
+    return y
+
+
+class CachedResourceRouteTest(TestCase):
+    def setUp(self):
+        self.service = LocalService(title="Test Service")
+        self.service.register_process(f1, id="f1")
+        ServiceProvider.set_instance(self.service)
+        self.client = TestClient(app)
+
+    def test_models_are_unchanged_until_registration(self):
+        processes = asyncio.run(self.service.get_processes())
+        self.assertIs(processes, asyncio.run(self.service.get_processes()))
+        self.service.register_process(f2, id="f2")
+        self.assertIsNot(processes, asyncio.run(self.service.get_processes()))
+
+    def test_processes_are_invalidated_on_registration(self):
+        response = self.client.get("/processes")
+        self.assertEqual(["f1"], [p["id"] for p in response.json()["processes"]])
+        self.service.register_process(f2, id="f2")
+        response = self.client.get("/processes")
+        self.assertEqual(["f1", "f2"], [p["id"] for p in response.json()["processes"]])
+
+    def test_process_is_invalidated_on_registration(self):
+        response = self.client.get("/processes/f1")
+        self.assertEqual(["x"], list(response.json()["inputs"]))
+        self.service.register_process(f2, id="f1")
+        response = self.client.get("/processes/f1")
+        self.assertEqual(["y"], list(response.json()["inputs"]))
+
+    def test_encoding_matches_model(self):
+        entry = self.service.process_registry.get_entry("f1")
+        response = self.client.get("/processes/f1")
+        self.assertEqual(
+            entry.process.model_dump(mode="json", by_alias=True), response.json()
+        )
+        self.assertEqual(
+            resource_cache.get(entry.process).etag, response.headers["ETag"]
+        )
+        response = self.client.get("/")
+        self.assertEqual(
+            self.service.capabilities.model_dump(mode="json", by_alias=True),
+            response.json(),
+        )
+
+    def test_unknown_process(self):
+        response = self.client.get("/processes/f9")
+        self.assertEqual(404, response.status_code)